@@ -109,6 +109,30 @@ def is_overload(func: ast.FunctionDef | ast.AsyncFunctionDef) -> bool:
     return False
 
 
+def is_async_context_manager(func: ast.FunctionDef | ast.AsyncFunctionDef) -> bool:
+    """Return True if this function is decorated with @asynccontextmanager."""
+    for deco in func.decorator_list:
+        if isinstance(deco, ast.Name) and deco.id == "asynccontextmanager":
+            return True
+        if isinstance(deco, ast.Attribute) and deco.attr == "asynccontextmanager":
+            return True
+    return False
+
+
+def is_async_generator(func: ast.AsyncFunctionDef) -> bool:
+    """Return True if this ``async def`` yields, i.e. is an async generator rather than a coroutine."""
+    nodes: list[ast.AST] = list(func.body)
+    while nodes:
+        node = nodes.pop()
+        if isinstance(node, ast.Yield | ast.YieldFrom):
+            return True
+        # A yield inside a nested function or lambda belongs to that function, not this one.
+        if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef | ast.Lambda | ast.ClassDef):
+            continue
+        nodes.extend(ast.iter_child_nodes(node))
+    return False
+
+
 def format_signature_and_call(func: ast.FunctionDef | ast.AsyncFunctionDef) -> tuple[str, str]:
     """Return (signature_source, call_arguments_source) for a function.
 
@@ -300,12 +324,20 @@ def is_wrappable(node: ast.stmt) -> TypeGuard[ast.FunctionDef | ast.AsyncFunctio
 
     Matches both classic ``async def`` methods and plain ``def`` methods whose return
     annotation is a ``Coroutine[...]`` subscript (the de-asynced form introduced in
-    design/071). Excludes overloads, Resource lifecycle hooks, and underscore-prefixed
+    design/071). Excludes overloads, Resource lifecycle hooks, underscore-prefixed
     methods (private registration helpers like ``Bus._on_internal`` must not leak onto
-    the facade).
+    the facade), ``@asynccontextmanager`` methods such as ``Api.batch``, which a sync
+    caller cannot enter, and async generators such as ``Api.iter_history``, which a sync
+    caller cannot iterate.
     """
     if isinstance(node, ast.AsyncFunctionDef):
-        return not is_overload(node) and node.name not in LIFECYCLE_METHODS and not node.name.startswith("_")
+        return (
+            not is_overload(node)
+            and not is_async_context_manager(node)
+            and not is_async_generator(node)
+            and node.name not in LIFECYCLE_METHODS
+            and not node.name.startswith("_")
+        )
     if isinstance(node, ast.FunctionDef):
         return (
             not is_overload(node)
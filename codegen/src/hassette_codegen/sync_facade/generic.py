@@ -30,7 +30,7 @@ from whenever import Date, PlainDateTime, ZonedDateTime
 
 from hassette.api.sync_helpers import HelperClientSyncFacade
 from hassette.const.misc import FalseySentinel
-from hassette.models.history import HistoryEntry
+from hassette.models.history import HistoryColumns, HistoryEntry
 from hassette.models.services import ServiceResponse
 from hassette.resources.base import Resource
 from hassette.resources.lifecycle import mark_ready
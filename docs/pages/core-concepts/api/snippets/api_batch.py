@@ -0,0 +1,11 @@
+from hassette import App
+
+ROOM_LIGHTS = ["light.desk", "light.ceiling", "light.floor_lamp", "light.shelf"]
+
+
+class GoodnightApp(App):
+    async def on_initialize(self):
+        async with self.api.batch():
+            for light in ROOM_LIGHTS:
+                await self.api.turn_off(light)
+        # Sent as one light.turn_off call targeting all four lights
@@ -0,0 +1,23 @@
+import math
+
+from hassette import App
+
+SENSORS = ["sensor.living_room_temperature", "sensor.office_temperature"]
+
+
+class HistoryReportApp(App):
+    async def on_initialize(self):
+        start = self.now().subtract(days=30)
+
+        # One chunk of at most 1000 entries in memory at a time
+        changes = 0
+        async for _entity_id, entries in self.api.iter_history(SENSORS, start_time=start):
+            changes += len(entries)
+
+        # Compact float arrays for numeric analysis
+        columns = await self.api.get_history_columns(SENSORS, start_time=start)
+        for entity_id, col in columns.items():
+            readings = [v for v in col.values if not math.isnan(v)]
+            if readings:
+                mean = sum(readings) / len(readings)
+                self.logger.info("%s: mean %.1f over %d readings", entity_id, mean, len(readings))
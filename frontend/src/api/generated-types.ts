@@ -1219,6 +1219,12 @@ export interface components {
             min_duration_ms?: number | null;
             /** Max Duration Ms */
             max_duration_ms?: number | null;
+            /** P50 Duration Ms */
+            p50_duration_ms?: number | null;
+            /** P90 Duration Ms */
+            p90_duration_ms?: number | null;
+            /** P99 Duration Ms */
+            p99_duration_ms?: number | null;
             /** @default single */
             mode: components["schemas"]["ExecutionMode"];
             /**
@@ -1297,6 +1303,12 @@ export interface components {
             min_duration_ms?: number | null;
             /** Max Duration Ms */
             max_duration_ms?: number | null;
+            /** P50 Duration Ms */
+            p50_duration_ms?: number | null;
+            /** P90 Duration Ms */
+            p90_duration_ms?: number | null;
+            /** P99 Duration Ms */
+            p99_duration_ms?: number | null;
             /**
              * Total Duration Ms
              * @default 0
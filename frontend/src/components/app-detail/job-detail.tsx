@@ -165,6 +165,9 @@ function buildJobStatsCells(job: JobData, lastExecutedLabel: string, nextRunText
     total: job.total_executions,
     failed: job.failed,
     avgDurationMs: job.avg_duration_ms,
+    p50DurationMs: job.p50_duration_ms,
+    p90DurationMs: job.p90_duration_ms,
+    p99DurationMs: job.p99_duration_ms,
     lastLabel: statusText ?? nextRunText ?? (job.last_executed_at ? lastExecutedLabel || "—" : "—"),
     lastFieldLabel: statusText ? "Schedule" : nextRunText ? "Next" : "Last",
     timedOut: job.timed_out,
@@ -50,6 +50,9 @@ function buildListenerStatsCells(listener: ListenerData, lastInvokedLabel: strin
     total: listener.total_invocations,
     failed: listener.failed,
     avgDurationMs: listener.avg_duration_ms,
+    p50DurationMs: listener.p50_duration_ms,
+    p90DurationMs: listener.p90_duration_ms,
+    p99DurationMs: listener.p99_duration_ms,
     lastLabel: listener.last_invoked_at ? lastInvokedLabel || "—" : "—",
     timedOut: listener.timed_out,
     cancelled: listener.cancelled,
@@ -160,4 +160,25 @@ describe("buildCommonStatCells", () => {
       expect(cells.map((c) => c.label)).not.toContain("Skipped");
     });
   });
+
+  describe("percentile cells", () => {
+    it("appends p50, p90 and p99 after the conditional cells when p99 is known", () => {
+      const cells = buildCommonStatCells(
+        baseInput({ droppedCount: 1, p50DurationMs: 12, p90DurationMs: 40, p99DurationMs: 1800 }),
+      );
+
+      expect(cells.slice(5)).toEqual([
+        { label: "Dropped", value: 1, tone: "warn" },
+        { label: "p50", value: "12.0ms" },
+        { label: "p90", value: "40.0ms" },
+        { label: "p99", value: "1.8s" },
+      ]);
+    });
+
+    it("omits the percentile cells when p99 is null", () => {
+      const cells = buildCommonStatCells(baseInput({ p99DurationMs: null }));
+
+      expect(cells.map((c) => c.label)).not.toContain("p99");
+    });
+  });
 });
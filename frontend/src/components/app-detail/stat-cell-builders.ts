@@ -17,6 +17,10 @@ export interface CommonStatInput {
   threadLeaked: number;
   suppressedCount: number;
   droppedCount: number;
+  /** Duration percentiles from the persisted latency histograms; the cells render only when p99 is known. */
+  p50DurationMs?: number | null;
+  p90DurationMs?: number | null;
+  p99DurationMs?: number | null;
   /**
    * Extra cell placed right after "Cancelled" if it renders, else right after
    * "Timed Out" if it renders, else at the start of the conditional zone.
@@ -56,5 +60,12 @@ export function buildCommonStatCells(input: CommonStatInput): DetailStatsCell[]
   if (input.threadLeaked > 0) cells.push({ label: "Thread Leaked", value: input.threadLeaked, tone: "warn" });
   if (input.suppressedCount > 0) cells.push({ label: "Suppressed", value: input.suppressedCount, tone: "mute" });
   if (input.droppedCount > 0) cells.push({ label: "Dropped", value: input.droppedCount, tone: "warn" });
+  if (input.p99DurationMs != null) {
+    cells.push(
+      { label: "p50", value: formatDurationOrDash(input.p50DurationMs) },
+      { label: "p90", value: formatDurationOrDash(input.p90DurationMs) },
+      { label: "p99", value: formatDurationOrDash(input.p99DurationMs) },
+    );
+  }
   return cells;
 }
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Benchmark debounce task churn under a steady high-rate event stream.
+
+Feeds a debounced ``RateLimiter`` one call per tick at ``--rate`` Hz for ``--seconds`` seconds
+in bursts separated by quiet gaps longer than the debounce window, the shape of a chatty sensor
+behind a debounced listener. For each strategy it counts tasks created on the loop, timers
+armed, and handler runs:
+
+- timer: ``RateLimiter.debounced_call`` (one rescheduled loop timer, a task only on fire)
+- task_per_call: the cancel-and-respawn approach, one sleeping task per call
+
+Usage:
+    python scripts/bench_debounce.py [--rate 100] [--seconds 5] [--debounce 0.5] [--burst 1.0]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from collections.abc import Awaitable, Callable, Coroutine
+from typing import Any
+
+from hassette.bus.rate_limiter import RateLimiter
+
+
+class CountingBucket:
+    """Stand-in for ``TaskBucket.spawn``; the benchmark needs no Hassette instance."""
+
+    def spawn(self, coro: Coroutine[Any, Any, Any], *, name: str | None = None) -> asyncio.Task[Any]:
+        return asyncio.get_running_loop().create_task(coro, name=name)
+
+
+class TaskPerCall:
+    """Debounce that cancels the previous sleeping task and spawns a new one per call."""
+
+    def __init__(self, debounce: float) -> None:
+        self.debounce = debounce
+        self.task: asyncio.Task[None] | None = None
+
+    async def call(self, handler: Callable[[], Awaitable[None]]) -> None:
+        if self.task is not None and not self.task.done():
+            self.task.cancel()
+
+        async def delayed() -> None:
+            try:
+                await asyncio.sleep(self.debounce)
+            except asyncio.CancelledError:  # noqa: ASYNC103 — debounce reset
+                return  # noqa: ASYNC104
+            await handler()
+
+        self.task = asyncio.get_running_loop().create_task(delayed())
+
+
+async def drive(
+    call: Callable[[Callable[[], Awaitable[None]]], Awaitable[None]], rate: float, seconds: float, burst: float
+) -> tuple[int, int, int]:
+    """Call ``call`` at ``rate`` Hz in ``burst``-second bursts for ``seconds``.
+
+    Returns (calls, handler runs, driver sleeps); each driver sleep arms one loop timer of its own.
+    """
+    calls = runs = sleeps = 0
+
+    async def handler() -> None:
+        nonlocal runs
+        runs += 1
+
+    interval = 1 / rate
+    loop = asyncio.get_running_loop()
+    end = loop.time() + seconds
+    burst_end = loop.time() + burst
+    while loop.time() < end:
+        sleeps += 1
+        if loop.time() >= burst_end:
+            await asyncio.sleep(burst)  # quiet gap: lets the debounce window close
+            burst_end = loop.time() + burst
+            continue
+        await call(handler)
+        calls += 1
+        await asyncio.sleep(interval)
+    return calls, runs, sleeps
+
+
+async def measure(name: str, call_factory: Callable[[], Any], args: argparse.Namespace) -> None:
+    loop = asyncio.get_running_loop()
+    counts = {"tasks": 0, "timers": 0}
+    original_call_at = loop.call_at
+
+    def task_factory(loop: asyncio.AbstractEventLoop, coro: Coroutine[Any, Any, Any], **kwargs: Any) -> asyncio.Task:
+        counts["tasks"] += 1
+        return asyncio.Task(coro, loop=loop, **kwargs)
+
+    def counting_call_at(
+        when: float, callback: Callable[..., object], *cb_args: Any, **kwargs: Any
+    ) -> asyncio.TimerHandle:
+        counts["timers"] += 1
+        return original_call_at(when, callback, *cb_args, **kwargs)
+
+    call = call_factory()
+    loop.set_task_factory(task_factory)  # pyright: ignore[reportArgumentType]
+    loop.call_at = counting_call_at  # pyright: ignore[reportAttributeAccessIssue]
+    started = time.perf_counter()
+    try:
+        calls, runs, sleeps = await drive(call, args.rate, args.seconds, args.burst)
+        await asyncio.sleep(args.debounce * 2)
+        sleeps += 1
+    finally:
+        loop.set_task_factory(None)
+        del loop.call_at  # restore the class method
+    elapsed = time.perf_counter() - started
+    print(
+        f"  {name:>13}: {calls:5d} calls  {counts['tasks']:5d} tasks  {counts['timers'] - sleeps:5d} timers"
+        f"  {runs:3d} handler runs  {elapsed:6.2f} s"
+    )
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    bucket = CountingBucket()
+    print(f"{args.rate:g} Hz for {args.seconds:g} s, {args.burst:g} s bursts, debounce {args.debounce:g} s")
+    await measure(
+        "timer",
+        lambda: RateLimiter(bucket, debounce=args.debounce, handler_name="bench").call,  # pyright: ignore[reportArgumentType]
+        args,
+    )
+    await measure("task_per_call", lambda: TaskPerCall(args.debounce).call, args)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rate", type=float, default=100.0, help="events per second during a burst")
+    parser.add_argument("--seconds", type=float, default=5.0, help="total stream duration")
+    parser.add_argument("--debounce", type=float, default=0.5, help="debounce window in seconds")
+    parser.add_argument("--burst", type=float, default=1.0, help="burst length; each is followed by an equal gap")
+    asyncio.run(main_async(parser.parse_args(argv)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Benchmark the scheduler's job-queue backends on synthetic high-cardinality workloads.
+
+Builds N real ``Job`` objects due over the next minute (the shape of many sub-minute ``Every``
+jobs and ``run_in`` timers across many app instances) and times, for each backend of
+``scheduler.queue_backend``:
+
+- push: enqueue every job
+- cancel: remove 10% of the jobs one at a time
+- reload: remove one owner's jobs (one app instance reloading)
+- drain: advance the clock a second at a time, popping everything due
+
+Usage:
+    python scripts/bench_scheduler_queue.py [--jobs 10000 100000] [--owners N] [--tick-ms N]
+"""
+
+import argparse
+import random
+import sys
+import time
+from collections.abc import Callable
+from functools import partial
+
+from whenever import ZonedDateTime
+
+from hassette.core.scheduler_service import HeapQueue, _job_fire_ns, _job_owner
+from hassette.core.timing_wheel import TimingWheel
+from hassette.scheduler.classes import Job
+from hassette.test_utils.factories import make_scheduled_job
+
+HORIZON_SECONDS = 60
+SECOND_NS = 1_000_000_000
+
+
+def make_jobs(count: int, owners: int, start: ZonedDateTime) -> list[Job]:
+    """Build ``count`` scheduled jobs spread over ``owners`` owners and the next minute."""
+    rng = random.Random(count)  # noqa: S311 — reproducible workload, not security
+    jobs: list[Job] = []
+    for i in range(count):
+        job = make_scheduled_job(
+            name=f"job_{i}",
+            owner_id=f"app_{i % owners}",
+            next_run=start.add(seconds=rng.randrange(1, HORIZON_SECONDS)),
+        )
+        # sub-second spread, as jitter would give
+        job.sort_index = (job.sort_index[0] + rng.randrange(SECOND_NS), id(job))
+        jobs.append(job)
+    return jobs
+
+
+def drain_heap(queue: "HeapQueue[Job]", start_ns: int) -> int:
+    """Pop due jobs a second at a time, the way ``_ScheduledJobQueue`` drains the heap."""
+    popped = 0
+    for second in range(HORIZON_SECONDS + 2):
+        reference = start_ns + second * SECOND_NS
+        while (head := queue.peek()) is not None and head.sort_index[0] <= reference:
+            queue.pop()
+            popped += 1
+    return popped
+
+
+def drain_wheel(queue: "TimingWheel[Job]", start_ns: int) -> int:
+    """Pop due jobs a second at a time, one ``pop_due`` call per wake-up."""
+    popped = 0
+    for second in range(HORIZON_SECONDS + 2):
+        popped += len(queue.pop_due(start_ns + second * SECOND_NS))
+    return popped
+
+
+def timed(fn: Callable[[], object]) -> float:
+    started = time.perf_counter()
+    fn()
+    return time.perf_counter() - started
+
+
+def run(queue: "HeapQueue[Job] | TimingWheel[Job]", jobs: list[Job], drain: Callable[[], int]) -> dict[str, float]:
+    """Time each phase of the workload against ``queue``; returns seconds per phase."""
+    results = {
+        "push": timed(lambda: [queue.push(job) for job in jobs]),
+        "cancel": timed(lambda: [queue.remove_item(job) for job in jobs[::10]]),
+        "reload": timed(lambda: queue.remove_group("app_0")),
+    }
+    remaining = len(queue)
+    popped: list[int] = []
+    results["drain"] = timed(lambda: popped.append(drain()))
+    if popped != [remaining]:
+        raise RuntimeError(f"drain popped {popped[0]} of {remaining} jobs")
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, nargs="+", default=[10_000, 100_000], help="workload sizes")
+    parser.add_argument("--owners", type=int, default=50, help="app instances the jobs are spread across")
+    parser.add_argument("--tick-ms", type=int, default=100, help="timing wheel tick (timing_wheel_tick_milliseconds)")
+    args = parser.parse_args(argv)
+
+    start = ZonedDateTime.now("UTC")
+    start_ns = start.timestamp_nanos()
+    for count in args.jobs:
+        jobs = make_jobs(count, args.owners, start)
+        heap: HeapQueue[Job] = HeapQueue(group_key=_job_owner)
+        wheel: TimingWheel[Job] = TimingWheel(
+            fire_key=_job_fire_ns, tick_ns=args.tick_ms * 1_000_000, group_key=_job_owner
+        )
+        wheel.pop_due(start_ns)
+
+        print(f"{count} jobs, {args.owners} owners, {args.tick_ms} ms tick")
+        for name, queue, drain in (
+            ("heap", heap, partial(drain_heap, heap, start_ns)),
+            ("timing_wheel", wheel, partial(drain_wheel, wheel, start_ns)),
+        ):
+            results = run(queue, jobs, drain)
+            print(f"  {name:>12}: " + "  ".join(f"{op} {elapsed * 1e3:8.2f} ms" for op, elapsed in results.items()))
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
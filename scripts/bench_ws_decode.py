@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Benchmark the websocket JSON decoders on recorded Home Assistant traffic.
+
+Replays the event frames in tests/data/events/*.jsonl through every decoder in
+``hassette.core.ws_json.WS_JSON_DECODERS``. Decoders with ``decode_text=True``
+are timed including the UTF-8 bytes → str step aiohttp performs before handing
+them the frame, so the numbers compare the full per-frame cost on the recv path.
+
+Usage:
+    python scripts/bench_ws_decode.py [--rounds N] [--repeat N]
+"""
+
+import argparse
+import sys
+import timeit
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from hassette.core.ws_json import WS_JSON_DECODERS, WsJsonDecoder
+
+EVENTS_DIR = Path(__file__).resolve().parent.parent / "tests" / "data" / "events"
+
+
+def load_frames(events_dir: Path) -> list[bytes]:
+    """Return every recorded event envelope as the raw UTF-8 bytes of one websocket frame."""
+    frames: list[bytes] = []
+    for path in sorted(events_dir.glob("*.jsonl")):
+        for line in path.read_text().splitlines():
+            line = line.strip().rstrip(",")
+            if line:
+                frames.append(line.encode())
+    return frames
+
+
+def make_workload(decoder: WsJsonDecoder, frames: list[bytes]) -> Callable[[], Any]:
+    """Build a zero-arg callable that decodes every frame the way the recv loop would."""
+    loads = decoder.loads
+    if decoder.decode_text:
+
+        def run() -> None:
+            for frame in frames:
+                loads(frame.decode("utf-8"))
+
+    else:
+
+        def run() -> None:
+            for frame in frames:
+                loads(frame)
+
+    return run
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=200, help="passes over the recorded frames per timing")
+    parser.add_argument("--repeat", type=int, default=5, help="timings per decoder; the best is reported")
+    args = parser.parse_args(argv)
+
+    frames = load_frames(EVENTS_DIR)
+    if not frames:
+        print(f"No recorded frames found under {EVENTS_DIR}", file=sys.stderr)
+        return 1
+
+    # Every decoder must agree before its speed means anything.
+    reference = [WS_JSON_DECODERS["json"].loads(frame.decode("utf-8")) for frame in frames]
+    total_frames = len(frames) * args.rounds
+    total_bytes = sum(len(frame) for frame in frames) * args.rounds
+    print(f"{len(frames)} recorded frames, {total_frames} decodes per timing\n")
+
+    results: dict[str, float] = {}
+    for name, decoder in WS_JSON_DECODERS.items():
+        if [decoder.loads(frame) for frame in frames] != reference:
+            print(f"{name}: output differs from the stdlib decoder", file=sys.stderr)
+            return 1
+        workload = make_workload(decoder, frames)
+        best = min(timeit.repeat(workload, number=args.rounds, repeat=args.repeat))
+        results[name] = best
+        print(
+            f"{name:>8}: {best / total_frames * 1e6:8.2f} us/frame  "
+            f"{total_bytes / best / 1e6:8.1f} MB/s  (decode_text={decoder.decode_text})"
+        )
+
+    baseline = results["json"]
+    for name, elapsed in results.items():
+        if name != "json":
+            print(f"\n{name} is {baseline / elapsed:.2f}x the stdlib decoder's throughput")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -162,8 +162,8 @@ Examples:
 """
 
 import typing
-from collections.abc import Coroutine  # noqa: TC003 — needed at runtime for annotation inspection
-from contextlib import suppress
+from collections.abc import AsyncIterator, Coroutine  # runtime imports: needed for annotation inspection
+from contextlib import asynccontextmanager
 from enum import StrEnum
 from http import HTTPStatus
 from typing import Any, Literal, overload
@@ -171,6 +171,7 @@ from typing import Any, Literal, overload
 import aiohttp
 from whenever import Date, PlainDateTime, ZonedDateTime
 
+from hassette.api.coalescing import ACTIVE_BATCH, ServiceCallBatch, ServiceCallCoalescer, coalesce_key
 from hassette.const.misc import FalseySentinel
 from hassette.event_handling.accessors import get_path
 from hassette.exceptions import (
@@ -178,10 +179,9 @@ from hassette.exceptions import (
     ConnectionClosedError,
     EntityNotFoundError,
     FailedMessageError,
-    UnableToConvertStateError,
 )
 from hassette.models.entities import BaseEntity
-from hassette.models.history import HistoryEntry
+from hassette.models.history import HISTORY_CHUNK_SIZE, HistoryColumns, HistoryEntry
 from hassette.models.services import ServiceResponse
 from hassette.resources.base import Resource
 from hassette.resources.lifecycle import mark_ready
@@ -310,9 +310,13 @@ class Api(Resource):
     _api_service: "ApiResource"
     """Internal API service instance."""
 
+    _coalescer: ServiceCallCoalescer
+    """Holds mergeable ``call_service`` calls for ``call_service_coalesce_window_seconds``."""
+
     def __init__(self, hassette: "Hassette", *, parent: Resource | None = None) -> None:
         super().__init__(hassette, parent=parent)
         self._api_service = self.hassette.api_service
+        self._coalescer = ServiceCallCoalescer(self.ws_send_json, self.task_bucket.spawn)
         # helpers must be constructed before sync — ApiSyncFacade.__init__ reads
         # self._api.helpers to wire its own nested HelperClientSyncFacade.
         self.helpers = self.add_child(HelperClient, api=self)
@@ -321,6 +325,10 @@ class Api(Resource):
     async def on_initialize(self) -> None:
         mark_ready(self, reason="API initialized")
 
+    async def on_shutdown(self) -> None:
+        # Calls still inside their coalescing window are sent rather than dropped.
+        await self._coalescer.flush_all()
+
     @property
     def config_log_level(self) -> LOG_LEVEL_TYPE:
         """Return the log level from the config for this resource."""
@@ -418,7 +426,8 @@ class Api(Resource):
         """Get all entities in Home Assistant, converted to their appropriate state types.
 
         If a state fails to convert, it is skipped with an error logged. If there is no registered
-        state class for a domain, the generic BaseState is used.
+        state class for a domain, the generic BaseState is used. States are validated in bulk, one
+        Pydantic call per state class.
 
         Returns:
             A list of states, converted to their appropriate state types.
@@ -426,15 +435,8 @@ class Api(Resource):
         val = await self.get_states_raw()
 
         self.logger.debug("Converting states to specific state types")
-        converted: list[BaseState] = []
-
-        for raw_state in val:
-            # the conversion method will handle logging any conversion errors
-            with suppress(UnableToConvertStateError):
-                state = self.hassette.state_registry.try_convert_state(raw_state)
-                converted.append(state)
-
-        return converted
+        # the conversion method will handle logging any conversion errors
+        return self.hassette.state_registry.try_convert_states(val)
 
     async def get_config(self) -> dict[str, Any]:
         """Get the Home Assistant configuration.
@@ -601,9 +603,74 @@ class Api(Resource):
             resp = await self.ws_send_and_wait(**payload)
             return ServiceResponse(**resp)
 
+        batch = ACTIVE_BATCH.get()
+        if batch is not None and batch.owner is self and not batch.closed:
+            batch.add(payload)
+            return None
+
+        window = self.hassette.config.call_service_coalesce_window_seconds
+        if window > 0 and (key := coalesce_key(payload)) is not None:
+            await self._coalescer.submit(key, payload, window)
+            return None
+
         await self.ws_send_json(**payload)
         return None
 
+    @asynccontextmanager
+    async def batch(self) -> AsyncIterator[None]:
+        """Queue fire-and-forget service calls made in the block and send them together on exit.
+
+        Inside the block, ``call_service`` and its shortcuts (``turn_on``, ``turn_off``, ``toggle``,
+        ``notify``) return as soon as the call is queued. On exit, calls with the same domain,
+        service, and service data that target only entity IDs are merged into one message whose
+        ``target.entity_id`` lists every entity. Other calls are sent unchanged. Messages go out in
+        the order of their first call. Calls with ``return_response=True`` are not queued and run
+        immediately.
+
+        Send failures are raised when the block exits, after every queued message has been
+        attempted: a single failure as is, several as an ``ExceptionGroup``. If the block itself
+        raises, queued calls are still sent and the block's exception propagates. Nested blocks
+        join the outermost one.
+
+        Examples:
+            ```python
+            async with self.api.batch():
+                for light in self.room_lights:
+                    await self.api.turn_off(light)
+            # one light/turn_off message targeting every light in the room
+            ```
+        """
+        current = ACTIVE_BATCH.get()
+        if current is not None and current.owner is self and not current.closed:
+            yield
+            return
+
+        batch = ServiceCallBatch(self)
+        token = ACTIVE_BATCH.set(batch)
+        try:
+            yield
+        except BaseException:
+            await self._send_batch(batch, raise_errors=False)
+            raise
+        finally:
+            ACTIVE_BATCH.reset(token)
+        await self._send_batch(batch, raise_errors=True)
+
+    async def _send_batch(self, batch: ServiceCallBatch, *, raise_errors: bool) -> None:
+        """Send the calls queued by ``batch`` and surface send failures."""
+        if batch.calls:
+            self.logger.debug("Sending %d batched service calls as %d messages", batch.calls, batch.messages)
+        errors = await batch.send(self.ws_send_json)
+        if not errors:
+            return
+        if not raise_errors:
+            for exc in errors:
+                self.logger.error("Batched service call failed while the batch block was raising: %s", exc)
+            return
+        if len(errors) == 1:
+            raise errors[0]
+        raise ExceptionGroup("batched service calls failed", errors)
+
     def turn_on(self, entity_id: str | StrEnum, domain: str | None = None, **data: Any) -> "Coroutine[Any, Any, None]":
         """Turn on a specific entity in Home Assistant.
 
@@ -905,6 +972,122 @@ class Api(Resource):
 
         return converted
 
+    async def iter_history_raw(
+        self,
+        entity_ids: str | list[str],
+        start_time: PlainDateTime | ZonedDateTime | Date | str,
+        end_time: PlainDateTime | ZonedDateTime | Date | str | None = None,
+        significant_changes_only: bool = False,
+        minimal_response: bool = False,
+        no_attributes: bool = False,
+        chunk_size: int = HISTORY_CHUNK_SIZE,
+    ) -> AsyncIterator[tuple[str, list[dict[str, Any]]]]:
+        """Stream the history of one or more entities as normalized raw dictionaries.
+
+        The response is decoded as it arrives, so long ranges can be processed without holding
+        the whole response in memory.
+
+        Args:
+            entity_ids: The ID, or list of IDs, of the entities to get the history for.
+            start_time: The start time for the history range.
+            end_time: The end time for the history range.
+            significant_changes_only: Whether to only include significant changes.
+            minimal_response: Whether to request a minimal response.
+            no_attributes: Whether to exclude attributes from the response.
+            chunk_size: The maximum number of entries per yielded chunk.
+
+        Yields:
+            ``(entity_id, entries)`` chunks in response order. One entity's history may span
+            several consecutive chunks.
+        """
+        entity_id = entity_ids if isinstance(entity_ids, str) else ",".join(entity_ids)
+        async for chunk in self._api_service.iter_history_raw(
+            entity_id=entity_id,
+            start_time=start_time,
+            end_time=end_time,
+            significant_changes_only=significant_changes_only,
+            minimal_response=minimal_response,
+            no_attributes=no_attributes,
+            chunk_size=chunk_size,
+        ):
+            yield chunk
+
+    async def iter_history(
+        self,
+        entity_ids: str | list[str],
+        start_time: PlainDateTime | ZonedDateTime | Date | str,
+        end_time: PlainDateTime | ZonedDateTime | Date | str | None = None,
+        significant_changes_only: bool = False,
+        minimal_response: bool = False,
+        no_attributes: bool = False,
+        chunk_size: int = HISTORY_CHUNK_SIZE,
+    ) -> AsyncIterator[tuple[str, list[HistoryEntry]]]:
+        """Stream the history of one or more entities as `HistoryEntry` chunks.
+
+        Like `get_histories`, but entries are parsed and validated one chunk at a time, so memory
+        stays bounded by ``chunk_size`` entries however long the range is.
+
+        Args:
+            entity_ids: The ID, or list of IDs, of the entities to get the history for.
+            start_time: The start time for the history range.
+            end_time: The end time for the history range.
+            significant_changes_only: Whether to only include significant changes.
+            minimal_response: Whether to request a minimal response.
+            no_attributes: Whether to exclude attributes from the response.
+            chunk_size: The maximum number of entries per yielded chunk.
+
+        Yields:
+            ``(entity_id, entries)`` chunks in response order. One entity's history may span
+            several consecutive chunks.
+        """
+        async for entity_id, rows in self.iter_history_raw(
+            entity_ids,
+            start_time,
+            end_time,
+            significant_changes_only=significant_changes_only,
+            minimal_response=minimal_response,
+            no_attributes=no_attributes,
+            chunk_size=chunk_size,
+        ):
+            yield entity_id, [HistoryEntry.model_validate(row) for row in rows]
+
+    async def get_history_columns(
+        self,
+        entity_ids: str | list[str],
+        start_time: PlainDateTime | ZonedDateTime | Date | str,
+        end_time: PlainDateTime | ZonedDateTime | Date | str | None = None,
+        significant_changes_only: bool = False,
+    ) -> dict[str, HistoryColumns]:
+        """Get the history of numeric sensors as timestamp and value arrays.
+
+        Streams a minimal, attribute-free history and packs each entry into two float arrays,
+        which takes a fraction of the memory of `HistoryEntry` objects for long ranges.
+
+        Args:
+            entity_ids: The ID, or list of IDs, of the entities to get the history for.
+            start_time: The start time for the history range.
+            end_time: The end time for the history range.
+            significant_changes_only: Whether to only include significant changes.
+
+        Returns:
+            A dictionary mapping entity IDs to their history columns. Non-numeric states are NaN.
+        """
+        columns: dict[str, HistoryColumns] = {}
+        async for entity_id, rows in self.iter_history_raw(
+            entity_ids,
+            start_time,
+            end_time,
+            significant_changes_only=significant_changes_only,
+            minimal_response=True,
+            no_attributes=True,
+        ):
+            entity_columns = columns.get(entity_id)
+            if entity_columns is None:
+                entity_columns = columns[entity_id] = HistoryColumns(entity_id)
+            for row in rows:
+                entity_columns.append(row)
+        return columns
+
     async def get_logbook(
         self,
         entity_id: str,
@@ -0,0 +1,210 @@
+"""Merging of fire-and-forget ``call_service`` messages.
+
+Apps often call the same service for many entities in one burst, e.g. ``turn_off`` across every light
+in a room. Each call is a separate websocket message. Calls that share a domain, service, and service
+data, and that target only entity IDs, can be sent as one ``call_service`` message whose
+``target.entity_id`` lists every entity.
+
+Two entry points use the same merge:
+
+- ``ServiceCallCoalescer`` holds each mergeable call for ``call_service_coalesce_window_seconds``
+  (opt-in) and sends every call that shares its key in that window as one message. Each caller still
+  awaits its own call, and a failed send is raised to every caller in the merged message. Because
+  each caller waits out the window, only concurrent callers merge; sequential awaits do not.
+- ``ServiceCallBatch`` backs ``Api.batch()``. Fire-and-forget calls made inside the block are queued
+  and sent when the block exits, merged where possible and otherwise in call order.
+"""
+
+import asyncio
+import json
+from collections.abc import Awaitable, Callable, Coroutine
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+SendFn = Callable[..., Awaitable[None]]
+"""Sends one ``call_service`` payload as keyword arguments (``Api.ws_send_json``)."""
+
+SpawnFn = Callable[[Coroutine[Any, Any, None]], Any]
+"""Runs a flush coroutine as a tracked task (``TaskBucket.spawn``)."""
+
+CoalesceKey = tuple[str, str, str]
+"""``(domain, service, canonical service_data JSON)`` shared by every call in one merged message."""
+
+
+def coalesce_key(payload: dict[str, Any]) -> CoalesceKey | None:
+    """Return the merge key for a ``call_service`` payload, or None when it cannot be merged.
+
+    Only calls whose target is exactly ``{"entity_id": ...}`` and whose service data is
+    JSON-serializable are mergeable. Service data is compared by its sorted JSON encoding, so
+    key order does not matter but values must match exactly.
+    """
+    target = payload.get("target")
+    if not isinstance(target, dict) or target.keys() != {"entity_id"}:
+        return None
+    try:
+        data_key = json.dumps(payload.get("service_data", {}), sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+    return payload["domain"], payload["service"], data_key
+
+
+@dataclass(slots=True)
+class ServiceCallGroup:
+    """One outgoing ``call_service`` message and the callers waiting on it."""
+
+    payload: dict[str, Any]
+    """The first caller's payload; its ``target`` is rewritten from ``entity_ids`` on send."""
+
+    entity_ids: list[str] = field(default_factory=list)
+    """Every targeted entity in first-seen order, without duplicates."""
+
+    calls: int = 0
+    """Number of ``call_service`` calls merged into this message."""
+
+    future: "asyncio.Future[None] | None" = None
+    """Resolved once the message is sent; None for batched groups, whose errors surface at block exit."""
+
+    def add(self, payload: dict[str, Any]) -> None:
+        """Merge another call's targeted entities into this message."""
+        entity_id = payload["target"]["entity_id"]
+        for eid in [entity_id] if isinstance(entity_id, str) else entity_id:
+            if eid not in self.entity_ids:
+                self.entity_ids.append(eid)
+        self.calls += 1
+
+    def build_payload(self) -> dict[str, Any]:
+        """Return the payload to send, targeting every merged entity."""
+        if not self.entity_ids:
+            return self.payload
+        entity_id = self.entity_ids[0] if len(self.entity_ids) == 1 else list(self.entity_ids)
+        return {**self.payload, "target": {"entity_id": entity_id}}
+
+    async def send(self, send: SendFn) -> None:
+        """Send the message and settle the callers' future with the outcome."""
+        try:
+            await send(**self.build_payload())
+        except Exception as exc:
+            if self.future is not None and not self.future.done():
+                self.future.set_exception(exc)
+            raise
+        if self.future is not None and not self.future.done():
+            self.future.set_result(None)
+
+
+def new_group(
+    payload: dict[str, Any], *, mergeable: bool, future: "asyncio.Future[None] | None" = None
+) -> ServiceCallGroup:
+    """Start a group from its first call."""
+    group = ServiceCallGroup(payload, future=future)
+    if mergeable:
+        group.add(payload)
+    else:
+        group.calls = 1
+    return group
+
+
+class ServiceCallCoalescer:
+    """Hold mergeable calls for a short window and send each key's calls as one message.
+
+    The first call for a key arms one loop timer. Later calls with the same key join its group until
+    the timer fires, which spawns a task that sends the merged message. Callers await the group's
+    future through ``asyncio.shield``, so cancelling one caller does not cancel the send for the rest.
+    """
+
+    def __init__(self, send: SendFn, spawn: SpawnFn) -> None:
+        self._send = send
+        self._spawn = spawn
+        self._pending: dict[CoalesceKey, tuple[ServiceCallGroup, asyncio.Future[None], asyncio.TimerHandle]] = {}
+
+    @property
+    def pending(self) -> int:
+        """Number of merged messages waiting for their window to close."""
+        return len(self._pending)
+
+    async def submit(self, key: CoalesceKey, payload: dict[str, Any], window: float) -> None:
+        """Add a call to the group for ``key`` and wait until that group is sent."""
+        entry = self._pending.get(key)
+        if entry is None:
+            loop = asyncio.get_running_loop()
+            future: asyncio.Future[None] = loop.create_future()
+            group = new_group(payload, mergeable=True, future=future)
+            self._pending[key] = (group, future, loop.call_later(window, self._flush, key))
+        else:
+            group, future, _ = entry
+            group.add(payload)
+        await asyncio.shield(future)
+
+    def _flush(self, key: CoalesceKey) -> None:
+        """Timer callback: hand the group for ``key`` to a send task."""
+        group, _, _ = self._pending.pop(key)
+        self._spawn(self._send_group(group))
+
+    async def _send_group(self, group: ServiceCallGroup) -> None:
+        # The exception is already on the callers' future; re-raising here would only log it a
+        # second time as an unhandled task error.
+        try:
+            await group.send(self._send)
+        except Exception:
+            return
+
+    async def flush_all(self) -> None:
+        """Send every pending group now instead of waiting for its window to close."""
+        entries = list(self._pending.values())
+        self._pending.clear()
+        for group, _, handle in entries:
+            handle.cancel()
+            await self._send_group(group)
+
+
+class ServiceCallBatch:
+    """Fire-and-forget ``call_service`` calls queued by one ``Api.batch()`` block."""
+
+    def __init__(self, owner: object) -> None:
+        self.owner = owner
+        """The ``Api`` whose calls this batch collects; calls through other instances pass through."""
+
+        self.closed = False
+        """Set once the block exits; later calls (e.g. from tasks spawned inside it) are sent directly."""
+
+        self._groups: list[ServiceCallGroup] = []
+        self._by_key: dict[CoalesceKey, ServiceCallGroup] = {}
+
+    @property
+    def calls(self) -> int:
+        """Number of calls queued so far."""
+        return sum(group.calls for group in self._groups)
+
+    @property
+    def messages(self) -> int:
+        """Number of messages the queued calls will be sent as."""
+        return len(self._groups)
+
+    def add(self, payload: dict[str, Any]) -> None:
+        """Queue a call, merging it into an earlier queued call with the same key."""
+        key = coalesce_key(payload)
+        if key is not None and (group := self._by_key.get(key)) is not None:
+            group.add(payload)
+            return
+        group = new_group(payload, mergeable=key is not None)
+        self._groups.append(group)
+        if key is not None:
+            self._by_key[key] = group
+
+    async def send(self, send: SendFn) -> list[Exception]:
+        """Send every queued message in first-call order and return the send errors.
+
+        A failed message does not stop the rest of the batch from being sent.
+        """
+        self.closed = True
+        errors: list[Exception] = []
+        for group in self._groups:
+            try:
+                await group.send(send)
+            except Exception as exc:
+                errors.append(exc)
+        return errors
+
+
+ACTIVE_BATCH: ContextVar[ServiceCallBatch | None] = ContextVar("hassette_api_batch", default=None)
+"""The ``Api.batch()`` block enclosing the current task, if any."""
@@ -14,7 +14,7 @@ from whenever import Date, PlainDateTime, ZonedDateTime
 
 from hassette.api.sync_helpers import HelperClientSyncFacade
 from hassette.const.misc import FalseySentinel
-from hassette.models.history import HistoryEntry
+from hassette.models.history import HistoryColumns, HistoryEntry
 from hassette.models.services import ServiceResponse
 from hassette.resources.base import Resource
 from hassette.resources.lifecycle import mark_ready
@@ -134,7 +134,8 @@ class ApiSyncFacade(Resource):
         """Get all entities in Home Assistant, converted to their appropriate state types.
 
         If a state fails to convert, it is skipped with an error logged. If there is no registered
-        state class for a domain, the generic BaseState is used.
+        state class for a domain, the generic BaseState is used. States are validated in bulk, one
+        Pydantic call per state class.
 
         Returns:
             A list of states, converted to their appropriate state types.
@@ -419,6 +420,31 @@ class ApiSyncFacade(Resource):
             )
         )
 
+    def get_history_columns(
+        self,
+        entity_ids: str | list[str],
+        start_time: PlainDateTime | ZonedDateTime | Date | str,
+        end_time: PlainDateTime | ZonedDateTime | Date | str | None = None,
+        significant_changes_only: bool = False,
+    ) -> dict[str, HistoryColumns]:
+        """Get the history of numeric sensors as timestamp and value arrays.
+
+        Streams a minimal, attribute-free history and packs each entry into two float arrays,
+        which takes a fraction of the memory of `HistoryEntry` objects for long ranges.
+
+        Args:
+            entity_ids: The ID, or list of IDs, of the entities to get the history for.
+            start_time: The start time for the history range.
+            end_time: The end time for the history range.
+            significant_changes_only: Whether to only include significant changes.
+
+        Returns:
+            A dictionary mapping entity IDs to their history columns. Non-numeric states are NaN.
+        """
+        return self.task_bucket.run_sync(
+            self._api.get_history_columns(entity_ids, start_time, end_time, significant_changes_only)
+        )
+
     def get_logbook(
         self,
         entity_id: str,
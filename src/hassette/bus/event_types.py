@@ -0,0 +1,97 @@
+"""Map bus topics to the Home Assistant event types they can receive.
+
+Home Assistant events reach the bus on ``hass.event.<event_type>`` topics (plus the per-entity
+``hass.event.state_changed.<entity_id>`` expansion). ``EventTypeDemand`` keeps a reference count
+of the event types implied by the router's topic keys, so the websocket layer can subscribe to
+exactly those types instead of the whole HA event stream.
+"""
+
+from collections import Counter
+
+from hassette.utils.glob_utils import GLOB_CHARS, is_glob
+
+HASS_EVENT_TOPIC_PREFIX = "hass.event."
+"""Prefix shared by every topic carrying a Home Assistant event."""
+
+ALL_EVENT_TYPES = "*"
+"""Marker returned when a topic can match events of any type."""
+
+
+def topic_event_type(topic: str) -> str | None:
+    """Return the HA event type a listener on ``topic`` needs to receive.
+
+    The answer is conservative: whenever a glob could match more than one event type, the
+    topic demands ``ALL_EVENT_TYPES``.
+
+    Args:
+        topic: An exact topic or glob pattern, as registered with the router.
+
+    Returns:
+        The event type, ``ALL_EVENT_TYPES`` if the topic can match any HA event, or None if it
+        can never match an HA event topic.
+
+    Examples:
+        >>> topic_event_type("hass.event.state_changed.light.kitchen")
+        'state_changed'
+        >>> topic_event_type("hass.event.*")
+        '*'
+        >>> topic_event_type("hassette.event.app_state_changed") is None
+        True
+    """
+    glob_at = next((i for i, ch in enumerate(topic) if ch in GLOB_CHARS), len(topic))
+    literal = topic[:glob_at]
+
+    if not literal.startswith(HASS_EVENT_TOPIC_PREFIX):
+        # A glob whose literal part stops inside the prefix (e.g. "*" or "hass.*") can still
+        # expand into any "hass.event.<type>" topic, because fnmatch's "*" spans dots.
+        if glob_at < len(topic) and HASS_EVENT_TOPIC_PREFIX.startswith(literal):
+            return ALL_EVENT_TYPES
+        return None
+
+    event_type = topic[len(HASS_EVENT_TOPIC_PREFIX) :].split(".", 1)[0]
+    if is_glob(event_type):
+        return ALL_EVENT_TYPES
+    return event_type or None
+
+
+class EventTypeDemand:
+    """Reference-counted set of the HA event types demanded by a collection of topics.
+
+    ``revision`` increments whenever the demanded set changes (an event type gains its first
+    topic or loses its last one), so observers can cheaply tell whether anything moved.
+    """
+
+    __slots__ = ("_counts", "revision")
+
+    def __init__(self) -> None:
+        self._counts: Counter[str] = Counter()
+        self.revision = 0
+
+    def add(self, topic: str) -> None:
+        """Count ``topic`` towards the event type it demands. Non-HA topics are ignored."""
+        event_type = topic_event_type(topic)
+        if event_type is None:
+            return
+        self._counts[event_type] += 1
+        if self._counts[event_type] == 1:
+            self.revision += 1
+
+    def discard(self, topic: str) -> None:
+        """Release one count of the event type ``topic`` demands. No-op if it was never added."""
+        event_type = topic_event_type(topic)
+        if event_type is None or event_type not in self._counts:
+            return
+        self._counts[event_type] -= 1
+        if self._counts[event_type] <= 0:
+            del self._counts[event_type]
+            self.revision += 1
+
+    def demands(self, event_type: str) -> bool:
+        """Return True if some topic can receive events of ``event_type``."""
+        return event_type in self._counts or ALL_EVENT_TYPES in self._counts
+
+    def required(self) -> frozenset[str] | None:
+        """Return the demanded event types, or None when some topic needs every event type."""
+        if ALL_EVENT_TYPES in self._counts:
+            return None
+        return frozenset(self._counts)
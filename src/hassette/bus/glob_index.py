@@ -0,0 +1,150 @@
+import re
+from collections.abc import Callable, Iterator
+from fnmatch import translate
+
+from hassette.utils.glob_utils import is_glob
+
+_SEGMENT_SEP = "."
+
+GlobMatcher = Callable[[str], re.Match[str] | None]
+"""Compiled ``fnmatch`` pattern: returns a match object when the topic matches, else ``None``."""
+
+
+class _GlobNode:
+    """One dot-separated literal segment in the glob prefix trie."""
+
+    __slots__ = ("children", "patterns")
+
+    children: dict[str, "_GlobNode"]
+    """Child nodes keyed by the next literal segment."""
+
+    patterns: dict[str, GlobMatcher]
+    """Glob patterns whose literal prefix ends at this node, mapped to their compiled matcher."""
+
+    def __init__(self) -> None:
+        self.children = {}
+        self.patterns = {}
+
+
+def compile_glob(pattern: str) -> GlobMatcher:
+    """Compile ``pattern`` into a matcher with ``fnmatch.fnmatchcase`` semantics."""
+    return re.compile(translate(pattern)).match
+
+
+def literal_prefix_segments(pattern: str) -> list[str]:
+    """Return the leading dot-separated segments of ``pattern`` that contain no glob characters.
+
+    The final segment is never included, because a glob pattern always has at least one
+    segment with a glob character and every literal segment before it is followed by a dot.
+
+    Args:
+        pattern: The glob pattern to split.
+
+    Returns:
+        The literal segments, in order. Empty when the first segment already contains a glob.
+
+    Examples:
+        >>> literal_prefix_segments("hass.event.state_changed.light.*")
+        ['hass', 'event', 'state_changed', 'light']
+        >>> literal_prefix_segments("*")
+        []
+    """
+    segments: list[str] = []
+    for part in pattern.split(_SEGMENT_SEP):
+        if is_glob(part):
+            break
+        segments.append(part)
+    return segments
+
+
+class GlobIndex:
+    """Prefix trie of glob patterns keyed on their literal dot-separated segments.
+
+    Resolving a topic walks the trie one segment at a time and only runs the compiled
+    ``fnmatch`` regex for patterns whose literal prefix matches the topic, so a lookup costs
+    O(segments) plus the handful of patterns sharing that prefix — not O(all patterns).
+    Matching semantics are identical to ``fnmatch.fnmatchcase`` (``*`` still spans dots).
+    """
+
+    __slots__ = ("_count", "_root")
+
+    def __init__(self) -> None:
+        self._root = _GlobNode()
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, pattern: object) -> bool:
+        if not isinstance(pattern, str):
+            return False
+        node = self._find_node(literal_prefix_segments(pattern))
+        return node is not None and pattern in node.patterns
+
+    def __iter__(self) -> Iterator[str]:
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            yield from node.patterns
+            stack.extend(node.children.values())
+
+    def add(self, pattern: str) -> None:
+        """Index ``pattern``. Adding an already-indexed pattern is a no-op."""
+        node = self._root
+        for segment in literal_prefix_segments(pattern):
+            child = node.children.get(segment)
+            if child is None:
+                child = node.children[segment] = _GlobNode()
+            node = child
+        if pattern not in node.patterns:
+            node.patterns[pattern] = compile_glob(pattern)
+            self._count += 1
+
+    def discard(self, pattern: str) -> None:
+        """Remove ``pattern`` from the index, pruning trie nodes left empty. No-op if absent."""
+        path: list[tuple[_GlobNode, str]] = []
+        node = self._root
+        for segment in literal_prefix_segments(pattern):
+            child = node.children.get(segment)
+            if child is None:
+                return
+            path.append((node, segment))
+            node = child
+
+        if node.patterns.pop(pattern, None) is None:
+            return
+        self._count -= 1
+
+        for parent, segment in reversed(path):
+            child = parent.children[segment]
+            if child.patterns or child.children:
+                break
+            del parent.children[segment]
+
+    def match(self, topic: str) -> list[str]:
+        """Return every indexed pattern that matches ``topic``.
+
+        Patterns are returned shortest literal prefix first (least specific to most specific);
+        callers that need a different order must sort the result themselves.
+        """
+        matched: list[str] = []
+        node: _GlobNode | None = self._root
+        segments = iter(topic.split(_SEGMENT_SEP))
+        while node is not None:
+            for pattern, matcher in node.patterns.items():
+                if matcher(topic) is not None:
+                    matched.append(pattern)
+            segment = next(segments, None)
+            if segment is None:
+                break
+            node = node.children.get(segment)
+        return matched
+
+    def _find_node(self, segments: list[str]) -> _GlobNode | None:
+        node = self._root
+        for segment in segments:
+            child = node.children.get(segment)
+            if child is None:
+                return None
+            node = child
+        return node
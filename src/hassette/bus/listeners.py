@@ -271,11 +271,43 @@ class HandlerInvoker:
         """Set the closure that resolves the app-level error handler at dispatch time."""
         self.app_error_handler_resolver = resolver
 
-    async def dispatch(self, invoke_fn: Callable[[], Awaitable[None]]) -> None:
+    def admit(self, make_invoke_fn: Callable[[], Callable[[], Awaitable[None]]]) -> bool:
+        """Decide synchronously whether an event needs a dispatch task at all.
+
+        BusService calls this while matching listeners, before it takes a dispatch slot. Returns
+        False when the event is settled here without a task: the once-guard has already fired,
+        the throttle drops it, a busy ``single``-mode listener suppresses it, or debounce takes
+        it over (its timer spawns the handler once the window closes, building ``invoke_fn``
+        from ``make_invoke_fn`` at that point). Returns True when the caller should spawn a
+        dispatch task that calls ``dispatch(invoke_fn, admitted=True)``.
+
+        Same order as ``dispatch``: once-guard → rate limiter → mode guard. The once-guard is
+        only checked here; ``dispatch`` still marks it fired. Safe without a lock — nothing here
+        awaits.
+        """
+        if self.once and self.fired:
+            return False
+        if self.rate_limiter and not self.rate_limiter.admit(lambda: self.run_with_mode(make_invoke_fn())):
+            return False
+        return not (self.mode is ExecutionMode.SINGLE and self.guard.suppress_if_running())
+
+    def revert_admit(self) -> None:
+        """Undo the throttle window ``admit()`` opened for an event that is dropped before dispatch.
+
+        BusService calls this when a ``drop_newest`` listener's event is admitted but then shed
+        because dispatch is saturated. Debounce and the other guards hold no state for an admitted
+        event, so only the throttle needs rolling back.
+        """
+        if self.rate_limiter and self.rate_limiter.throttle is not None and self.rate_limiter.debounce is None:
+            self.rate_limiter.revert_throttle()
+
+    async def dispatch(self, invoke_fn: Callable[[], Awaitable[None]], *, admitted: bool = False) -> None:
         """Apply the once-guard, rate limiter, and overlap mode around the given invoke function.
 
         Order: once-guard → rate limiter (whether to start) → mode guard (overlap of started
         invocations). BusService builds ``invoke_fn`` (tracked telemetry); HandlerInvoker wraps it.
+        ``admitted=True`` skips the rate limiter because ``admit()`` has already applied it to
+        this event.
 
         Once-guard: if ``once=True`` and the invoker has already fired, returns immediately. Safe
         without a lock — no ``await`` between check-and-set.
@@ -292,7 +324,7 @@ class HandlerInvoker:
         if self.once:
             self.mark_fired()
 
-        if self.rate_limiter:
+        if self.rate_limiter and not admitted:
             await self.rate_limiter.call(lambda: self.run_with_mode(invoke_fn))
         else:
             await self.run_with_mode(invoke_fn)
@@ -17,7 +17,9 @@ class RateLimiter:
     """Handles rate limiting for handler calls using debounce or throttle strategies.
 
     Debounce: Delays execution until after a period of inactivity. When a new call
-    arrives during the debounce window, the previous timer is cancelled and restarted.
+    arrives during the debounce window, the window restarts and only the newest handler
+    is kept. The window is a single event-loop timer whose deadline moves forward; a
+    task is spawned only when the timer fires, not per call.
 
     Throttle: At most one execution per window. Calls arriving within the window are
     silently dropped (not queued). The handler executes outside any lock — no lock is
@@ -60,8 +62,12 @@ class RateLimiter:
         self._clock = clock or time.monotonic
 
         # Rate limiting state
+        self._debounce_handle: asyncio.TimerHandle | None = None
+        self._debounce_deadline = 0.0
+        self._debounce_handler: Callable[[], Awaitable[None]] | None = None
         self._debounce_task: asyncio.Task | None = None
         self._throttle_last_time: float | None = None
+        self._throttle_prev_time: float | None = None
         self._cancelled = False
 
     def clear_debounce_ref(self, task: "asyncio.Task[None]") -> None:
@@ -70,7 +76,7 @@ class RateLimiter:
             self._debounce_task = None
 
     def cancel(self) -> None:
-        """Cancel any pending debounce task.
+        """Cancel any pending debounce timer and debounced handler task.
 
         Called when a listener is removed to prevent dangling tasks from holding
         references to handler objects after the listener's lifecycle has ended.
@@ -78,6 +84,10 @@ class RateLimiter:
         This is a terminal operation -- the RateLimiter should not be reused after cancel().
         """
         self._cancelled = True
+        self._debounce_handler = None
+        if self._debounce_handle is not None:
+            self._debounce_handle.cancel()
+            self._debounce_handle = None
         if self._debounce_task and not self._debounce_task.done():
             self._debounce_task.cancel()
             self._debounce_task = None
@@ -89,64 +99,119 @@ class RateLimiter:
             handler: Zero-arg async callable.  ``Listener.dispatch()`` always passes a
                 closure that captures the event and error handling internally.
         """
+        if self.admit(handler):
+            await handler()
+
+    def admit(self, handler: "Callable[[], Awaitable[None]]") -> bool:
+        """Apply rate limiting to one call without awaiting anything.
+
+        Returns True when the caller should run ``handler`` itself now: no rate limit applies,
+        or the throttle window is open. Returns False when the call is settled here: dropped by
+        the throttle or after cancel(), or taken over by debounce, whose timer spawns
+        ``handler`` once the window closes.
+        """
         if self._cancelled:
-            return
+            return False
         if self.debounce is not None:
-            await self.debounced_call(handler)
-        elif self.throttle is not None:
-            await self.throttled_call(handler)
-        else:
-            await handler()
+            self.schedule_debounced(handler)
+            return False
+        if self.throttle is not None:
+            return self.admit_throttled()
+        return True
 
     async def debounced_call(self, handler: "Callable[[], Awaitable[None]]") -> None:
-        """Debounced version of the handler call.
+        """Debounced version of the handler call; see ``schedule_debounced``."""
+        self.schedule_debounced(handler)
+
+    def schedule_debounced(self, handler: "Callable[[], Awaitable[None]]") -> None:
+        """Make ``handler`` the call to run once the debounce window closes.
 
         Expects a fresh ``handler`` callable on each call.  BusService creates a new
         closure per dispatch that captures the current event, so the debounced handler
         always fires with the latest event data.  Callers must not reuse the same
-        callable with updated shared state — the cancel-then-create ordering below
-        discards the previous handler entirely.
+        callable with updated shared state — each call replaces the previous handler
+        entirely.
+
+        A call only stores ``handler`` and pushes the deadline forward; no task is created
+        until the window closes. The first call of a window arms one ``loop.call_at`` timer.
+        When it fires early because the deadline has moved since, it re-arms itself for the
+        new deadline, so a burst of N calls costs at most one timer per debounce interval
+        instead of N task spawns and cancellations.
         """
-        # Cancel previous debounce task BEFORE spawning the replacement.  This ordering
-        # is critical: the old task holds the old handler closure (with the old event),
-        # and the new task will hold the new handler closure (with the latest event).
+        # Local capture for type narrowing (admit() already guards for None)
+        debounce = self.debounce
+        if debounce is None:
+            raise ValueError("debounce must be set before calling schedule_debounced")
+
+        # A debounced handler already running belongs to an older event; the newer event supersedes
+        # it, as it would have superseded it while it was still waiting.
         if self._debounce_task and not self._debounce_task.done():
-            LOGGER.debug("Debounce reset for handler=%s (window=%.1fs)", self.handler_name, self.debounce)
             self._debounce_task.cancel()
 
-        # Local capture for the closure + type narrowing (call() already guards for None)
-        debounce = self.debounce
-        if debounce is None:
-            raise ValueError("debounce must be set before calling debounced_call")
-
-        async def delayed_call():
-            try:
-                await asyncio.sleep(debounce)
-            except asyncio.CancelledError:  # noqa: ASYNC103 — debounce reset: a new event superseded this one
-                return  # noqa: ASYNC104
-            # Guard: if cancel() was called while we were sleeping, don't fire the handler.
-            if self._cancelled:
-                return
-            # Handler runs outside the CancelledError catch — if the handler is cancelled
-            # (e.g., during shutdown), it propagates so telemetry can record it as 'cancelled'.
-            await handler()
+        loop = asyncio.get_running_loop()
+        self._debounce_handler = handler
+        self._debounce_deadline = loop.time() + debounce
+        if self._debounce_handle is None:
+            self._debounce_handle = loop.call_at(self._debounce_deadline, self.fire_debounce)
+        else:
+            LOGGER.debug("Debounce reset for handler=%s (window=%.1fs)", self.handler_name, debounce)
 
-        task = self.task_bucket.spawn(delayed_call(), name="handler:debounce")
+    def fire_debounce(self) -> None:
+        """Timer callback: spawn the latest handler once the debounce deadline has passed.
+
+        Re-arms the timer instead when calls since it was armed have pushed the deadline later.
+        """
+        armed_for = self._debounce_handle.when() if self._debounce_handle is not None else 0.0
+        self._debounce_handle = None
+        handler = self._debounce_handler
+        if handler is None or self._cancelled:
+            return
+        # Compare against the deadline this timer was armed for rather than loop.time(): the loop
+        # may run a timer up to one clock tick early, which must not count as "moved since".
+        if self._debounce_deadline > armed_for:
+            loop = asyncio.get_running_loop()
+            self._debounce_handle = loop.call_at(self._debounce_deadline, self.fire_debounce)
+            return
+        self._debounce_handler = None
+        task = self.task_bucket.spawn(self.run_debounced(handler), name="handler:debounce")
         task.add_done_callback(self.clear_debounce_ref)
         self._debounce_task = task
 
+    async def run_debounced(self, handler: "Callable[[], Awaitable[None]]") -> None:
+        """Run a debounced handler in its own task, unless cancel() was called since it was spawned."""
+        if self._cancelled:
+            return
+        # CancelledError from the handler (e.g., during shutdown) propagates so telemetry can
+        # record it as 'cancelled'.
+        await handler()
+
     async def throttled_call(self, handler: "Callable[[], Awaitable[None]]") -> None:
-        """Throttled version of the handler call.
+        """Throttled version of the handler call; see ``admit_throttled``."""
+        if self.admit_throttled():
+            await handler()
+
+    def admit_throttled(self) -> bool:
+        """Return whether the throttle window is open, starting a new window if so.
 
         At most one attempt per window. No lock needed — the check-and-set between
         ``self._clock()`` and ``self._throttle_last_time = now`` is atomic in asyncio's
         single-threaded event loop (no await point between them).
         """
         if self.throttle is None:
-            raise ValueError("throttle must be set before calling throttled_call")
+            raise ValueError("throttle must be set before calling admit_throttled")
         now = self._clock()
         if self._throttle_last_time is not None and now - self._throttle_last_time < self.throttle:
             LOGGER.debug("Throttle drop for handler=%s (window=%.1fs)", self.handler_name, self.throttle)
-            return
+            return False
+        self._throttle_prev_time = self._throttle_last_time
         self._throttle_last_time = now
-        await handler()
+        return True
+
+    def revert_throttle(self) -> None:
+        """Undo the window the last ``admit_throttled`` call opened.
+
+        For a caller that admitted a call but then dropped it without running the handler, so
+        the dropped call does not hold off the next one for a full window. Only valid right
+        after an admitting call, with no await in between.
+        """
+        self._throttle_last_time = self._throttle_prev_time
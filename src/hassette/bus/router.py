@@ -1,20 +1,44 @@
+import itertools
 from collections import defaultdict
 from collections.abc import Callable
-from fnmatch import fnmatch
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 
+from hassette.bus.event_types import EventTypeDemand
+from hassette.bus.glob_index import GlobIndex, compile_glob
 from hassette.utils.glob_utils import GLOB_CHARS
 
 if TYPE_CHECKING:
     from hassette.bus.listeners import Listener
 
+# Upper bound on memoized topic resolutions. Concrete topics are bounded by entity count in
+# practice, but an app emitting ad-hoc unique topics must not grow the cache without limit —
+# when the bound is hit the cache is dropped wholesale and rebuilt lazily.
+_TOPIC_CACHE_MAX_SIZE = 16_384
+
+
+class _DispatchPlan(NamedTuple):
+    """Memoized fan-out for one route tuple, valid while its topic snapshots are unchanged."""
+
+    snapshots: "tuple[tuple[Listener, ...], ...]"
+    """The per-route snapshots the plan was built from, compared by identity on lookup."""
+
+    entries: "tuple[tuple[str, Listener], ...]"
+    """``(route, listener)`` pairs, deduplicated across routes with the first route winning."""
+
 
 class Router:
     """Event router that maps topics to listeners using exact-match and glob-match buckets.
 
     Maintains three dictionaries: exact topic matches, glob pattern matches, and an
-    owner-to-listeners index for efficient cleanup. All operations are synchronous
-    in-memory mutations — no I/O, no locking, no async primitives.
+    owner-to-listeners index for efficient cleanup. Glob keys are additionally indexed in a
+    ``GlobIndex`` so resolving a topic costs O(segments) rather than one ``fnmatch`` per glob.
+
+    Each resolved concrete topic is memoized as an immutable, deduplicated, priority-sorted
+    tuple, built lazily on first lookup and dropped only when a route that could match it
+    changes. Multi-route dispatch plans are built on top of those snapshots and revalidated by
+    identity, so the hot path reuses one precomputed tuple per event instead of allocating and
+    sorting. All operations are synchronous in-memory mutations — no I/O, no locking, no async
+    primitives.
     """
 
     exact: dict[str, list["Listener"]]
@@ -25,6 +49,14 @@ class Router:
         self.exact = defaultdict(list)
         self.globs = defaultdict(list)  # keys contain glob chars
         self.owners = defaultdict(list)
+        self._glob_index = GlobIndex()
+        # Registration order of each glob key, so cached results keep the same tie-break order
+        # the old linear scan over ``self.globs`` produced.
+        self._glob_order: dict[str, int] = {}
+        self._glob_seq = itertools.count()
+        self._topic_cache: dict[str, tuple[Listener, ...]] = {}
+        self._plan_cache: dict[tuple[str, ...], _DispatchPlan] = {}
+        self._event_types = EventTypeDemand()
 
     def add_route(self, topic: str, listener: "Listener") -> None:
         """Add a listener to the appropriate route based on whether it contains glob characters.
@@ -34,11 +66,18 @@ class Router:
             listener: The listener to add.
         """
         if any(ch in topic for ch in GLOB_CHARS):
+            if topic not in self.globs:
+                self._glob_index.add(topic)
+                self._glob_order[topic] = next(self._glob_seq)
+                self._event_types.add(topic)
             self.globs[topic].append(listener)
         else:
+            if topic not in self.exact:
+                self._event_types.add(topic)
             self.exact[topic].append(listener)
 
         self.owners[listener.identity.owner_id].append(listener)
+        self._invalidate(topic)
 
     def remove_route(self, topic: str, predicate: Callable[["Listener"], bool]) -> None:
         """Remove a listener from the appropriate route based on whether it contains glob characters.
@@ -67,7 +106,8 @@ class Router:
         if kept:
             bucket[topic] = kept
         else:
-            bucket.pop(topic, None)
+            self._drop_bucket(bucket, topic)
+        self._invalidate(topic)
 
         removed_by_owner: dict[str, set[int]] = defaultdict(set)
         for listener in removed:
@@ -96,6 +136,24 @@ class Router:
 
         self.remove_route(topic, matches_listener)
 
+    @property
+    def event_types_revision(self) -> int:
+        """Counter that changes whenever ``required_event_types()`` would return a different set."""
+        return self._event_types.revision
+
+    def required_event_types(self) -> frozenset[str] | None:
+        """Return the Home Assistant event types the registered topics can receive.
+
+        Returns:
+            The event types, or None when at least one topic (e.g. ``"hass.event.*"``) can match
+            any event type.
+        """
+        return self._event_types.required()
+
+    def demands_event_type(self, event_type: str) -> bool:
+        """Return True if any registered topic can receive Home Assistant events of ``event_type``."""
+        return self._event_types.demands(event_type)
+
     def get_topic_listeners(self, topic: str) -> list["Listener"]:
         """Get all listeners that match the given topic.
 
@@ -105,12 +163,89 @@ class Router:
         Returns:
             A list of listeners that match the topic, sorted by priority (highest first).
         """
+        return list(self.topic_snapshot(topic))
+
+    def topic_snapshot(self, topic: str) -> tuple["Listener", ...]:
+        """Get the memoized, immutable listener snapshot for the given topic.
+
+        Same contents and order as ``get_topic_listeners`` without the defensive copy. The
+        tuple is shared across calls until a route that could match ``topic`` changes.
+
+        Args:
+            topic: The topic to match against.
+
+        Returns:
+            A tuple of listeners that match the topic, sorted by priority (highest first).
+        """
+        cached = self._topic_cache.get(topic)
+        if cached is None:
+            cached = tuple(self._resolve_topic(topic))
+            if len(self._topic_cache) >= _TOPIC_CACHE_MAX_SIZE:
+                self._topic_cache.clear()
+            self._topic_cache[topic] = cached
+        return cached
+
+    def dispatch_plan(self, routes: tuple[str, ...]) -> tuple[tuple[str, "Listener"], ...]:
+        """Get the memoized fan-out for an ordered tuple of routes.
+
+        Routes are ordered most specific to least; a listener reachable from several routes is
+        attributed to the first one only. The plan is reused as long as every route's topic
+        snapshot is the same object it was built from.
+
+        Args:
+            routes: The routes to resolve, most specific first.
+
+        Returns:
+            ``(route, listener)`` pairs, grouped by route in ``routes`` order and by priority
+            (highest first) within each route.
+        """
+        plan = self._plan_cache.get(routes)
+        if plan is not None:
+            for route, snapshot in zip(routes, plan.snapshots, strict=True):
+                if self._topic_cache.get(route) is not snapshot:
+                    break
+            else:
+                return plan.entries
+
+        snapshots = tuple(self.topic_snapshot(route) for route in routes)
+        seen: set[int] = set()
+        entries: list[tuple[str, Listener]] = []
+        for route, snapshot in zip(routes, snapshots, strict=True):
+            for listener in snapshot:
+                if listener.listener_id not in seen:
+                    seen.add(listener.listener_id)
+                    entries.append((route, listener))
+
+        if len(self._plan_cache) >= _TOPIC_CACHE_MAX_SIZE:
+            self._plan_cache.clear()
+        plan = self._plan_cache[routes] = _DispatchPlan(snapshots=snapshots, entries=tuple(entries))
+        return plan.entries
+
+    def _invalidate(self, topic: str) -> None:
+        """Drop memoized snapshots that a route change on ``topic`` could affect.
+
+        An exact route only affects its own topic; a glob route affects every cached topic it
+        matches. Dispatch plans need no bookkeeping here — they revalidate against the topic
+        snapshots by identity on their next lookup.
+        """
+        if not any(ch in topic for ch in GLOB_CHARS):
+            self._topic_cache.pop(topic, None)
+            return
+
+        matcher = compile_glob(topic)
+        stale = [cached_topic for cached_topic in self._topic_cache if matcher(cached_topic) is not None]
+        for cached_topic in stale:
+            del self._topic_cache[cached_topic]
+
+    def _resolve_topic(self, topic: str) -> list["Listener"]:
+        """Build the deduplicated, priority-sorted listener list for ``topic`` (cache miss path)."""
         out: list[Listener] = []
         out.extend(self.exact.get(topic, ()))
 
-        for k, listeners in self.globs.items():
-            if fnmatch(topic, k):
-                out.extend(listeners)
+        matched_globs = self._glob_index.match(topic)
+        matched_globs.sort(key=self._glob_order.__getitem__)
+        for pattern in matched_globs:
+            out.extend(self.globs[pattern])
 
         # de-dup preserving order
         seen: set[int] = set()
@@ -159,6 +294,15 @@ class Router:
             if remaining:
                 bucket[topic] = remaining
             else:
-                bucket.pop(topic, None)
+                self._drop_bucket(bucket, topic)
+            self._invalidate(topic)
 
         return owner_listeners
+
+    def _drop_bucket(self, bucket: dict[str, list["Listener"]], topic: str) -> None:
+        """Remove an emptied topic bucket, keeping the glob index in step with ``self.globs``."""
+        if bucket.pop(topic, None) is not None:
+            self._event_types.discard(topic)
+        if bucket is self.globs:
+            self._glob_index.discard(topic)
+            self._glob_order.pop(topic, None)
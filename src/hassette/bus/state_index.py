@@ -0,0 +1,212 @@
+"""Registration-time pre-indexing of ``state_changed`` listeners by their static constraints.
+
+Most listeners created through ``Bus.on_state_change`` carry a predicate of the shape
+``AllOf((EntityMatches(...), StateDidChange(), StateFrom(...), StateTo(...), <where>))``. The
+literal parts of that chain (a non-glob entity, a literal domain, a literal ``changed_to`` or
+``changed_from`` value) are necessary conditions: if an event fails one of them, the ``AllOf``
+evaluates to False. This module pulls those literals out once per listener and partitions a
+dispatch plan on ``(entity_id, new_state)``, so an event only evaluates the predicates of
+listeners whose static constraints can match. Listeners whose predicates are arbitrary
+callables have no static constraints and always stay candidates.
+
+The module deliberately works on plain values (entity_id, old/new state value) rather than
+event objects, keeping the bus kernel free of HA event type imports.
+"""
+
+import typing
+from collections import defaultdict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import Any
+
+from hassette.const import ANY_VALUE, NOT_PROVIDED
+from hassette.event_handling.predicates import AllOf, DomainMatches, EntityMatches, StateFrom, StateTo
+from hassette.utils.glob_utils import is_glob
+
+if typing.TYPE_CHECKING:
+    from hassette.bus.listeners import Listener
+    from hassette.types import Predicate
+
+DispatchEntries = tuple[tuple[str, "Listener"], ...]
+"""``(route, listener)`` pairs as produced by ``Router.dispatch_plan``."""
+
+# Upper bound on cached plan indexes, mirroring the router's own cache bound.
+_STATE_INDEX_CACHE_MAX_SIZE = 16_384
+
+
+@dataclass(frozen=True, slots=True)
+class StaticStateConstraints:
+    """Literal constraints a listener's predicate places on a ``state_changed`` event.
+
+    Any field left at its default is unconstrained. Values are only recorded when they are
+    compared by plain equality (``compare_value``'s non-callable path) and are hashable.
+    """
+
+    entity_id: str | None = None
+    """Exact (non-glob) entity_id the event must carry."""
+
+    domain: str | None = None
+    """Exact (non-glob) domain the event's entity must belong to."""
+
+    new_state: Hashable = NOT_PROVIDED
+    """Literal ``changed_to`` value the new state must equal."""
+
+    old_state: Hashable = NOT_PROVIDED
+    """Literal ``changed_from`` value the old state must equal."""
+
+    def admits(self, entity_id: str, old_state: Any, new_state: Any) -> bool:
+        """Return False only if the event is guaranteed to fail the listener's predicate."""
+        if self.entity_id is not None and self.entity_id != entity_id:
+            return False
+        if self.domain is not None and self.domain != entity_id.split(".", 1)[0]:
+            return False
+        if self.new_state is not NOT_PROVIDED and self.new_state != new_state:
+            return False
+        return self.old_state is NOT_PROVIDED or self.old_state == old_state
+
+
+UNCONSTRAINED = StaticStateConstraints()
+"""Constraints for a listener with no recognised static predicates."""
+
+
+def _literal_condition(condition: Any) -> Hashable:
+    """Return ``condition`` if it is an equality-compared hashable literal, else ``NOT_PROVIDED``."""
+    if condition is NOT_PROVIDED or condition is ANY_VALUE or callable(condition):
+        return NOT_PROVIDED
+    try:
+        hash(condition)
+    except TypeError:
+        return NOT_PROVIDED
+    return condition
+
+
+def _conjuncts(predicate: "Predicate") -> "list[Predicate]":
+    """Flatten nested ``AllOf`` combinators into the list of predicates that must all hold."""
+    if not isinstance(predicate, AllOf):
+        return [predicate]
+    out: list[Predicate] = []
+    for member in predicate.predicates:
+        out.extend(_conjuncts(member))
+    return out
+
+
+def extract_state_constraints(predicate: "Predicate | None") -> StaticStateConstraints:
+    """Derive the static constraints a listener predicate imposes on ``state_changed`` events.
+
+    Only top-level conjuncts are inspected — anything under ``AnyOf``/``Not`` or inside a custom
+    callable is opaque and leaves the corresponding field unconstrained. When a chain holds
+    several literals for the same field, the first one is recorded; the full predicate still runs
+    for every candidate, so a contradictory chain is rejected there.
+
+    Args:
+        predicate: The listener's normalized predicate, or None.
+
+    Returns:
+        The extracted constraints, or ``UNCONSTRAINED`` when nothing could be extracted.
+    """
+    if predicate is None:
+        return UNCONSTRAINED
+
+    entity_id: str | None = None
+    domain: str | None = None
+    new_state: Hashable = NOT_PROVIDED
+    old_state: Hashable = NOT_PROVIDED
+
+    for pred in _conjuncts(predicate):
+        if isinstance(pred, EntityMatches):
+            if entity_id is None and not is_glob(pred.entity_id):
+                entity_id = pred.entity_id
+        elif isinstance(pred, DomainMatches):
+            if domain is None and not is_glob(pred.domain):
+                domain = pred.domain
+        elif isinstance(pred, StateTo):
+            if new_state is NOT_PROVIDED:
+                new_state = _literal_condition(pred.condition)
+        elif isinstance(pred, StateFrom) and old_state is NOT_PROVIDED:
+            old_state = _literal_condition(pred.condition)
+
+    if entity_id is None and domain is None and new_state is NOT_PROVIDED and old_state is NOT_PROVIDED:
+        return UNCONSTRAINED
+    return StaticStateConstraints(entity_id=entity_id, domain=domain, new_state=new_state, old_state=old_state)
+
+
+class StatePlanIndex:
+    """One dispatch plan partitioned on the ``(entity_id, new_state)`` its listeners require.
+
+    Built lazily the first time a ``state_changed`` event resolves to the plan. ``candidates``
+    returns the subset of the plan's entries whose static constraints admit the event, in the
+    original plan order (route specificity, then priority).
+    """
+
+    __slots__ = ("_buckets", "_constraints", "entries")
+
+    entries: DispatchEntries
+    """The plan this index was built from; compared by identity to detect a stale index."""
+
+    def __init__(self, entries: DispatchEntries) -> None:
+        self.entries = entries
+        self._constraints = tuple(extract_state_constraints(listener.predicate) for _, listener in entries)
+        buckets: dict[tuple[str | None, Hashable], list[int]] = defaultdict(list)
+        for position, constraints in enumerate(self._constraints):
+            buckets[(constraints.entity_id, constraints.new_state)].append(position)
+        self._buckets = {key: tuple(positions) for key, positions in buckets.items()}
+
+    def candidates(self, entity_id: str, old_state: Any, new_state: Any) -> DispatchEntries:
+        """Return the plan entries whose static constraints admit the given state change.
+
+        Args:
+            entity_id: The entity the event is for.
+            old_state: The event's old state value (``MISSING_VALUE`` when absent).
+            new_state: The event's new state value (``MISSING_VALUE`` when absent).
+
+        Returns:
+            The admitted ``(route, listener)`` pairs, in plan order.
+        """
+        try:
+            hash(new_state)
+        except TypeError:
+            # An unhashable state value can only satisfy listeners without a new_state literal.
+            new_state_keys: tuple[Hashable, ...] = (NOT_PROVIDED,)
+        else:
+            new_state_keys = (new_state, NOT_PROVIDED)
+
+        positions: list[int] = []
+        for entity_key in (entity_id, None):
+            for state_key in new_state_keys:
+                bucket = self._buckets.get((entity_key, state_key))
+                if bucket is not None:
+                    positions.extend(bucket)
+
+        if len(positions) == len(self.entries):
+            return self.entries
+
+        positions.sort()
+        constraints = self._constraints
+        return tuple(
+            self.entries[position]
+            for position in positions
+            if constraints[position].admits(entity_id, old_state, new_state)
+        )
+
+
+class StateIndexCache:
+    """Memoizes a ``StatePlanIndex`` per route tuple, rebuilt whenever the router's plan changes."""
+
+    __slots__ = ("_indexes",)
+
+    def __init__(self) -> None:
+        self._indexes: dict[tuple[str, ...], StatePlanIndex] = {}
+
+    def candidates(
+        self, routes: tuple[str, ...], entries: DispatchEntries, entity_id: str, old_state: Any, new_state: Any
+    ) -> DispatchEntries:
+        """Narrow ``entries`` (the router's plan for ``routes``) to the listeners a state change can match."""
+        if not entries:
+            return entries
+
+        index = self._indexes.get(routes)
+        if index is None or index.entries is not entries:
+            if len(self._indexes) >= _STATE_INDEX_CACHE_MAX_SIZE:
+                self._indexes.clear()
+            index = self._indexes[routes] = StatePlanIndex(entries)
+        return index.candidates(entity_id, old_state, new_state)
@@ -1,7 +1,7 @@
 from contextlib import suppress
 from logging import getLogger
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 from zoneinfo import ZoneInfo
 
 from pydantic import AliasChoices, Field, PrivateAttr, SecretStr, field_validator, model_validator
@@ -143,6 +143,16 @@ class HassetteConfig(ExcludeExtrasMixin, BaseSettings):
     Passed to aiohttp as a :class:`aiohttp.ClientTimeout`. Override per call by passing a ``timeout=`` kwarg to
     :meth:`~hassette.core.api_resource.ApiResource.rest_request`."""
 
+    call_service_coalesce_window_seconds: float = Field(default=0.0, ge=0, allow_inf_nan=False)
+    """How long to hold a fire-and-forget ``call_service`` so concurrent calls arriving in the same
+    window can be merged. Calls with the same domain, service, and service data that target only
+    entity IDs are sent as one message whose ``target.entity_id`` lists every entity. Each caller's
+    ``await`` returns once the merged message is sent, and a failed send raises in every merged
+    caller. Only calls that are in flight together merge (separate tasks or ``asyncio.gather``): a
+    loop that awaits each call in turn sends one message per call and waits one window per call, so
+    use ``Api.batch()`` for those. ``0`` (default) disables coalescing. ``Api.batch()`` merges
+    explicitly regardless of this setting."""
+
     token: SecretStr | None = Field(
         default=None,
         validation_alias=AliasChoices("token", "hassette__token", "ha_token", "home_assistant_token"),
@@ -197,6 +207,15 @@ class HassetteConfig(ExcludeExtrasMixin, BaseSettings):
     disable_state_proxy_polling: bool = Field(default=False)
     """Whether to disable polling for the state proxy. Defaults to False."""
 
+    state_proxy_feed: Literal["state_changed", "subscribe_entities"] = Field(default="state_changed")
+    """How the state proxy keeps its cache current. ``"state_changed"`` listens to full
+    ``state_changed`` events and periodically polls ``get_states``. ``"subscribe_entities"`` uses
+    Home Assistant's compressed ``subscribe_entities`` diffs instead: the subscription's initial
+    snapshot replaces the REST resync, polling is skipped, and ``state_changed`` events are
+    synthesized from the diffs for bus listeners. Pair it with
+    ``websocket.event_subscription_mode = "per_event_type"`` so raw ``state_changed`` events are
+    not received at all."""
+
     bus_excluded_domains: tuple[str, ...] = Field(default_factory=tuple)
     """Domains whose events should be skipped by the bus; supports glob patterns (e.g. 'sensor', 'media_*')."""
 
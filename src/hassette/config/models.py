@@ -17,7 +17,7 @@ from hassette.config.classes import AppManifest, ExcludeExtrasMixin
 from hassette.config.defaults import AUTODETECT_EXCLUDE_DIRS_DEFAULT
 from hassette.config.helpers import coerce_log_level, log_level_default_factory
 from hassette.types.enums import BlockingIOBehavior
-from hassette.types.types import LOG_LEVEL_TYPE, RawAppDict
+from hassette.types.types import LOG_LEVEL_TYPE, RawAppDict, TelemetryMode, WsJsonDecoderName
 
 LOGGER = getLogger(__name__)
 APP_SHUTDOWN_TIMEOUT_SECONDS = 10
@@ -61,9 +61,34 @@ class DatabaseConfig(ExcludeExtrasMixin, BaseModel):
     under sustained I/O pressure. Fire-and-forget tasks are dropped on overflow; submit()
     callers block until space is available."""
 
+    write_group_max_items: int = Field(default=256, ge=1)
+    """Most queued writes the DatabaseService commits in one transaction once a backlog builds up.
+    Group sizes adapt below this cap; 1 commits every write on its own."""
+
+    write_group_target_ms: float = Field(default=50.0, gt=0)
+    """Group duration the adaptive sizing aims for. Groups that run longer halve the size limit;
+    groups that finish sooner while writes are still waiting double it."""
+
     telemetry_write_queue_max: int = Field(default=1000, ge=1)
     """Maximum pending records in the CommandExecutor write queue before records are dropped."""
 
+    telemetry_mode: TelemetryMode = Field(default="full")
+    """How app-tier handler invocations and job executions are recorded. ``"full"`` writes an
+    ``executions`` row for every execution. ``"sampled"`` writes one for ``telemetry_sample_percent``
+    of successes and counts the rest in per-minute ``execution_rollups`` buckets. ``"aggregated"``
+    counts every success in the buckets. Errors, timeouts and cancellations always get a row."""
+
+    framework_telemetry_mode: TelemetryMode = Field(default="full")
+    """``telemetry_mode`` for framework-tier handlers and jobs."""
+
+    telemetry_sample_percent: float = Field(default=10.0, ge=0, le=100)
+    """Percentage of successful executions that still get an ``executions`` row in ``"sampled"`` mode."""
+
+    telemetry_mode_overrides: dict[str, TelemetryMode] = Field(default_factory=dict)
+    """Telemetry modes for individual apps, listeners and jobs, taking precedence over the tier
+    defaults. Keys are an app key (``"my_app"``) or an app key and a listener or job name
+    (``"my_app:on_motion"``); the more specific key wins."""
+
     heartbeat_interval_seconds: int = Field(default=300, ge=10)
     """Interval in seconds between database heartbeat checks."""
 
@@ -92,6 +117,10 @@ class DatabaseConfig(ExcludeExtrasMixin, BaseModel):
     """Maximum seconds a record may sit in the CommandExecutor write queue before a
     time-based flush is forced, even if the batch size threshold has not been reached."""
 
+    latency_flush_interval_seconds: float = Field(default=60.0, ge=1.0)
+    """Seconds between writes of the in-memory per-listener/job latency histograms to the
+    database. Percentiles in the web UI and CLI lag the live histograms by up to this long."""
+
 
 class WebSocketConfig(ExcludeExtrasMixin, BaseModel):
     """WebSocket connection, retry, and recovery timing settings."""
@@ -138,6 +167,29 @@ class WebSocketConfig(ExcludeExtrasMixin, BaseModel):
     max_recovery_seconds: float = Field(default=300.0)
     """Maximum total wall-clock seconds to spend on all WebSocket recovery attempts before giving up."""
 
+    json_decoder: WsJsonDecoderName = Field(default="orjson")
+    """JSON decoder for incoming WebSocket frames. ``"orjson"`` parses the raw frame bytes directly;
+    ``"json"`` uses the standard library decoder on text frames."""
+
+    event_subscription_mode: Literal["all", "per_event_type"] = Field(default="all")
+    """How Hassette subscribes to the Home Assistant event stream. ``"all"`` opens one unfiltered
+    subscription. ``"per_event_type"`` subscribes only to the event types registered listeners
+    can receive (always including ``state_changed``), adding and dropping subscriptions as
+    listeners come and go; it falls back to an unfiltered subscription while any listener uses a
+    topic such as ``"hass.event.*"`` that matches every event type."""
+
+    max_inflight_commands: int = Field(default=64, ge=1)
+    """Maximum number of request/reply commands (``send_and_wait``, ``return_response`` service
+    calls, ``render_template``, ...) awaiting a Home Assistant response at once. Further commands
+    wait for a free slot, and the wait counts toward the command's response timeout. Connection
+    setup traffic bypasses the limit."""
+
+    coalesce_messages: bool = Field(default=True)
+    """Ask Home Assistant to pack several messages into one websocket frame (the
+    ``coalesce_messages`` supported feature), which cuts per-frame overhead during event and
+    result bursts. Batched frames are always accepted; this only controls whether Home Assistant
+    is asked to send them."""
+
 
 class LoggingConfig(ExcludeExtrasMixin, BaseModel):
     """Logging level, format, queue, persistence, and per-service log-level settings."""
@@ -535,6 +587,15 @@ class SchedulerConfig(ExcludeExtrasMixin, BaseModel):
     """Default timeout in seconds for scheduled job execution. ``None`` disables the default timeout.
     Individual jobs can override via ``timeout=`` or ``timeout_disabled=True``."""
 
+    queue_backend: Literal["heap", "timing_wheel"] = Field(default="heap")
+    """Data structure holding scheduled jobs until they are due. ``"heap"`` keeps jobs in exact
+    due order. ``"timing_wheel"`` buckets them into ticks of ``timing_wheel_tick_milliseconds``,
+    making adds and cancels O(1) and expiring each tick as one batch, at the cost of firing a job
+    up to one tick late; it suits many thousands of short-interval jobs."""
+
+    timing_wheel_tick_milliseconds: int = Field(default=100, gt=0)
+    """Tick length of the ``"timing_wheel"`` queue backend, in milliseconds."""
+
     @field_validator("job_timeout_seconds", mode="before")
     @classmethod
     def validate_timeouts(cls, value: Any) -> float | None:
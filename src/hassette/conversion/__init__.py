@@ -1,9 +1,11 @@
 from .annotation_converter import ANNOTATION_CONVERTER, AnnotationConverter
+from .state_cache import EVENT_STATE_CACHE, TYPED_STATE_CACHE, TypedStateCache
 from .state_registry import (
     STATE_REGISTRY,
     StateKey,
     StateRegistry,
     convert_state_dict_to_model,
+    convert_state_dicts_to_model,
     register_state_converter,
 )
 from .type_matcher import TYPE_MATCHER, TypeMatcher
@@ -18,7 +20,9 @@ from .validation import RegistryValidationIssue, validate_registries
 
 __all__ = [
     "ANNOTATION_CONVERTER",
+    "EVENT_STATE_CACHE",
     "STATE_REGISTRY",
+    "TYPED_STATE_CACHE",
     "TYPE_MATCHER",
     "TYPE_REGISTRY",
     "AnnotationConverter",
@@ -28,7 +32,9 @@ __all__ = [
     "TypeConverterEntry",
     "TypeMatcher",
     "TypeRegistry",
+    "TypedStateCache",
     "convert_state_dict_to_model",
+    "convert_state_dicts_to_model",
     "register_simple_type_converter",
     "register_state_converter",
     "register_type_converter_fn",
@@ -1,7 +1,8 @@
 from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Any, ClassVar, Literal, get_args, get_origin
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, cast, get_args, get_origin
 
+from hassette.conversion.state_cache import EVENT_STATE_CACHE
 from hassette.conversion.state_registry import convert_state_dict_to_model
 from hassette.conversion.type_matcher import TYPE_MATCHER
 from hassette.conversion.type_registry import TYPE_REGISTRY
@@ -10,6 +11,9 @@ from hassette.exceptions import UnableToConvertValueError
 from hassette.models.states.base import BaseState
 from hassette.utils.type_utils import is_union, normalize_annotation
 
+if TYPE_CHECKING:
+    from hassette.events import HassStateDict
+
 
 @dataclass(frozen=True)
 class ContainerConverterEntry:
@@ -162,6 +166,31 @@ def convert_tuple(converter: "AnnotationConverter", value: Any, tp: Any) -> Any:
     return tuple(converter.convert(v, elem_tp) for v, elem_tp in zip(value, args, strict=True))
 
 
+def _convert_event_state(converter: "AnnotationConverter", entity_id: str, state: Any, state_tp: Any) -> Any:
+    """Convert one side of a state change, sharing the result through ``EVENT_STATE_CACHE``.
+
+    Every listener typed on the same event converts the same dicts, so only the first of them
+    pays for the conversion. Entries match on dict identity: with ``state_proxy_feed =
+    "subscribe_entities"`` an event's ``old_state`` is the previous event's ``new_state`` dict and
+    hits too, but events decoded from ``state_changed`` frames carry fresh dicts and do not. No
+    ``StateProxy`` revision is known here, so the state's ``last_updated`` stands in for it. The
+    cache is separate from ``TYPED_STATE_CACHE`` so event bursts cannot evict the models state
+    reads share. Only a concrete state class is cached; unions and other annotations go straight
+    to the converter.
+    """
+    if not (isinstance(state, dict) and isinstance(state_tp, type) and issubclass(state_tp, BaseState)):
+        return converter.convert(state, state_tp)
+
+    state = cast("HassStateDict", state)
+    revision = state.get("last_updated")
+    cached = EVENT_STATE_CACHE.get(entity_id, revision, state_tp, state)
+    if cached is not None:
+        return cached
+    converted = converter.convert(state, state_tp)
+    EVENT_STATE_CACHE.put(entity_id, revision, state_tp, state, converted)
+    return converted
+
+
 @register_container_converter(TypedStateChangeEvent)
 def convert_typed_state_change_event(converter: "AnnotationConverter", value: Any, tp: Any) -> Any:
     # tp is TypedStateChangeEvent[StateT] (already normalized/constructible)
@@ -177,8 +206,12 @@ def convert_typed_state_change_event(converter: "AnnotationConverter", value: An
     # This automatically handles dict->BaseState and Optional states, etc.
     data = value.payload.data
     entity_id = data.entity_id
-    old_state_obj = None if data.old_state is None else converter.convert(data.old_state, state_tp)
-    new_state_obj = None if data.new_state is None else converter.convert(data.new_state, state_tp)
+    old_state_obj = (
+        None if data.old_state is None else _convert_event_state(converter, entity_id, data.old_state, state_tp)
+    )
+    new_state_obj = (
+        None if data.new_state is None else _convert_event_state(converter, entity_id, data.new_state, state_tp)
+    )
 
     data = TypedStateChangePayload(entity_id=entity_id, old_state=old_state_obj, new_state=new_state_obj)
     return TypedStateChangeEvent(
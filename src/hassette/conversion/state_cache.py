@@ -0,0 +1,125 @@
+"""Process-wide LRU of validated state models, shared by every app's state reads.
+
+Converting a raw state dict into a ``BaseState`` model runs value coercion and Pydantic
+validation. The same entity is typically read many times without changing — by each app's
+``self.states`` access — so the models are cached once for the whole process. There is one entry
+per ``(entity_id, model)``, holding the latest conversion: converting a newer state of the entity
+replaces its entry in place instead of leaving the older one behind until it is evicted.
+
+An entry records the revision ``StateProxy`` stamped on the state when it was stored; readers
+that do not track one pass None. A hit also requires the cached entry to have been built from the
+very same dict object: state dicts are never mutated once stored, so identity proves the model is
+current, and a revision that was read in a race with a write can only cause a miss, never a stale
+model.
+
+``TypedStateChangeEvent`` conversion has no revision and mostly sees fresh dicts, so it uses its
+own small ``EVENT_STATE_CACHE``, keyed per ``last_updated``: a burst of events can then never push
+the models ``DomainStates`` and ``StateManager.get`` rely on out of ``TYPED_STATE_CACHE``.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from hassette.events import HassStateDict
+    from hassette.models.states.base import BaseState
+
+TYPED_STATE_CACHE_MAX_SIZE = 8_192
+"""Default number of models ``TYPED_STATE_CACHE`` keeps before evicting the least recently used."""
+
+EVENT_STATE_CACHE_MAX_SIZE = 1_024
+"""Default number of models ``EVENT_STATE_CACHE`` keeps before evicting the least recently used."""
+
+TypedStateKey = tuple[str, "type[BaseState]"] | tuple[str, "int | str | None", "type[BaseState]"]
+"""``(entity_id, model)``, or ``(entity_id, revision, model)`` for a ``per_revision`` cache."""
+
+
+class _CachedModel(NamedTuple):
+    revision: "int | str | None"
+    state: "HassStateDict"
+    model: "BaseState"
+
+
+class TypedStateCache:
+    """Thread-safe LRU mapping ``(entity_id, model)`` to the latest validated model of that entity.
+
+    Sync apps read states from worker threads, so every operation takes a short lock. Models
+    are frozen, which is what makes sharing one instance between apps safe.
+    """
+
+    def __init__(self, maxsize: int = TYPED_STATE_CACHE_MAX_SIZE, *, per_revision: bool = False) -> None:
+        """Create an empty cache.
+
+        Args:
+            maxsize: Number of entries kept before the least recently used is evicted.
+            per_revision: Keep a separate entry per revision instead of one per entity, for callers
+                that convert several states of an entity at once (both sides of a state change).
+        """
+        self.maxsize = maxsize
+        self.per_revision = per_revision
+        self._entries: OrderedDict[TypedStateKey, _CachedModel] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _key(self, entity_id: str, revision: int | str | None, model: "type[BaseState]") -> TypedStateKey:
+        return (entity_id, revision, model) if self.per_revision else (entity_id, model)
+
+    def get(
+        self,
+        entity_id: str,
+        revision: int | str | None,
+        model: "type[BaseState]",
+        state: "HassStateDict",
+    ) -> "BaseState | None":
+        """Return the cached model for ``state``, or None if it has not been converted yet.
+
+        Args:
+            entity_id: The entity the state belongs to.
+            revision: The state's revision, its ``last_updated``, or None if the caller has neither.
+            model: The model class the state was converted to.
+            state: The raw state dict about to be converted.
+
+        Returns:
+            The cached model, only if it was built from ``state`` itself at ``revision``.
+        """
+        key = self._key(entity_id, revision, model)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.state is not state or entry.revision != revision:
+                return None
+            self._entries.move_to_end(key)
+            return entry.model
+
+    def put(
+        self,
+        entity_id: str,
+        revision: int | str | None,
+        model: "type[BaseState]",
+        state: "HassStateDict",
+        validated: "BaseState",
+    ) -> None:
+        """Cache ``validated`` as the conversion of ``state``, evicting the oldest entry if full.
+
+        Replaces the entity's previous entry for ``model``, unless the cache is ``per_revision``.
+        """
+        key = self._key(entity_id, revision, model)
+        with self._lock:
+            self._entries[key] = _CachedModel(revision, state, validated)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached model."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+TYPED_STATE_CACHE = TypedStateCache()
+"""The cache shared by ``DomainStates`` and ``StateManager.get``."""
+
+EVENT_STATE_CACHE = TypedStateCache(EVENT_STATE_CACHE_MAX_SIZE, per_revision=True)
+"""Models converted for ``TypedStateChangeEvent`` listeners, keyed on each state's ``last_updated``."""
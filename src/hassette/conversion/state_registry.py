@@ -1,9 +1,10 @@
 import typing
-from collections.abc import Hashable, Mapping
+from collections.abc import Hashable, Iterable, Mapping, Sequence
 from contextlib import suppress
+from functools import lru_cache
 from logging import getLogger
 
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from hassette.conversion.type_registry import TYPE_REGISTRY
 from hassette.exceptions import (
@@ -47,6 +48,7 @@ CONVERSION_FAIL_TEMPLATE = (
 )
 STATE_REPR_MAX_LENGTH = 200
 TRUNCATION_SUFFIX = "...[truncated]"
+LIST_ADAPTER_CACHE_MAX_SIZE = 256
 
 NARROWED_SENSOR_SHAPES: dict[type[BaseState], SensorShape] = {
     NumericSensorState: SensorShape.NUMERIC,
@@ -135,6 +137,51 @@ class StateRegistry:
 
         raise RuntimeError("Unreachable code reached in try_convert_state")
 
+    def try_convert_states(self, data: "Iterable[HassStateDict]") -> "list[BaseState]":
+        """Convert many raw HA state dicts, validating each resolved state class's group in one call.
+
+        Equivalent to calling `try_convert_state` on each dict in order and skipping those that
+        raise `UnableToConvertStateError` (which is logged), but the dicts are grouped by the
+        state class their domain resolves to and each group is validated by a single Pydantic
+        call. Only dicts that fail their group go through `try_convert_state` one at a time, with
+        its fallback to BaseState.
+
+        Args:
+            data: Dictionaries containing state data from Home Assistant.
+
+        Returns:
+            The converted states, in input order, without the ones that could not be converted.
+
+        Raises:
+            InvalidDataForStateConversionError: If any of the provided data is an event payload.
+            InvalidEntityIdError: If any entity_id is missing or malformed.
+        """
+        raw_states = list(data)
+        groups: dict[type[BaseState], list[int]] = {}
+        for i, raw_state in enumerate(raw_states):
+            entity_id = raw_state.get("entity_id")
+            # anything try_convert_state would reject is left to it, so it raises and logs as usual
+            if "event" in raw_state or not isinstance(entity_id, str) or "." not in entity_id:
+                continue
+            state_class = self.resolve(domain=entity_id.split(".", 1)[0]) or BaseState
+            groups.setdefault(state_class, []).append(i)
+
+        results: list[BaseState | None] = [None] * len(raw_states)
+        for state_class, indices in groups.items():
+            validated = convert_state_dicts_to_model([raw_states[i] for i in indices], state_class)
+            for i, state in zip(indices, validated, strict=True):
+                results[i] = state
+
+        converted: list[BaseState] = []
+        for raw_state, state in zip(raw_states, results, strict=True):
+            if state is None:
+                try:
+                    state = self.try_convert_state(raw_state)
+                except UnableToConvertStateError:
+                    continue
+            converted.append(state)
+        return converted
+
     @classmethod
     def register(cls, state_class: type["BaseState"], *, domain: Hashable) -> None:
         """Register a state class for a given domain.
@@ -266,22 +313,96 @@ def convert_state_dict_to_model(value: typing.Any, model: "type[BaseState]") ->
     if not isinstance(value, dict):
         raise TypeError(f"Cannot convert {type(value).__name__} to {model.__name__}, expected dict")
 
+    prepared = _prepare_state_dict(typing.cast("HassStateDict", value), model)
+
+    try:
+        return model.model_validate(prepared)
+    except ValidationError as exc:
+        entity_id = prepared.get("entity_id")
+        raw_attributes = prepared.get("attributes")
+        device_class = raw_attributes.get("device_class") if isinstance(raw_attributes, Mapping) else None
+        raise UnableToConvertAnnotatedStateError(
+            str(entity_id) if entity_id else "<unknown>", device_class, model
+        ) from exc
+
+
+def convert_state_dicts_to_model(
+    values: "Sequence[HassStateDict]", model: "type[BaseState]"
+) -> "list[BaseState | None]":
+    """Convert many raw HA state dicts to one typed state model with a single Pydantic call.
+
+    Applies the same preprocessing as `convert_state_dict_to_model` to every dict, then validates
+    the whole batch through a cached `TypeAdapter(list[model])`. When some entries fail, they are
+    dropped and the rest are validated again, so one bad state does not cost the batch.
+
+    Nothing is logged or raised for a failed entry: its slot is None, and the caller is expected to
+    convert it again through the single-state path, which reports the error.
+
+    Args:
+        values: The raw state dicts from Home Assistant.
+        model: The target state model class (e.g., LightState, SensorState).
+
+    Returns:
+        One entry per input, in order: the typed state model, or None if it failed to convert.
+    """
+    results: list[BaseState | None] = [None] * len(values)
+    pending: list[int] = []
+    prepared: list[dict[str, typing.Any]] = []
+    for i, value in enumerate(values):
+        if not isinstance(value, dict):
+            continue
+        try:
+            prepared.append(_prepare_state_dict(value, model))
+        except SensorShapeMismatchError:
+            continue
+        pending.append(i)
+
+    adapter = _list_adapter(model)
+    while pending:
+        try:
+            validated = adapter.validate_python(prepared)
+        except ValidationError as exc:
+            failed = {error["loc"][0] for error in exc.errors() if error["loc"]}
+            if not failed:
+                break
+            kept = [j for j in range(len(pending)) if j not in failed]
+            pending = [pending[j] for j in kept]
+            prepared = [prepared[j] for j in kept]
+            continue
+
+        for i, state in zip(pending, validated, strict=True):
+            results[i] = state
+        break
+
+    return results
+
+
+@lru_cache(maxsize=LIST_ADAPTER_CACHE_MAX_SIZE)
+def _list_adapter(model: "type[BaseState]") -> "TypeAdapter[list[BaseState]]":
+    """Return the `TypeAdapter` validating a list of `model`, built once per state class."""
+    return TypeAdapter(list[model])
+
+
+def _prepare_state_dict(value: "HassStateDict", model: "type[BaseState]") -> dict[str, typing.Any]:
+    """Return a copy of `value` preprocessed for validation against `model`.
+
+    Raises:
+        SensorShapeMismatchError: If `model` is a narrowed sensor shape class and the entity's
+            actual value shape disagrees with the shape `model` declares.
+    """
     prepared = dict(value)
 
     entity_id = prepared.get("entity_id")
     if entity_id:
         prepared["domain"] = str(entity_id).split(".", 1)[0]
 
-    entity_id_str = str(entity_id) if entity_id else "<unknown>"
     raw_attributes = prepared.get("attributes")
-    attributes = raw_attributes if isinstance(raw_attributes, Mapping) else {}
-    device_class = attributes.get("device_class")
-
     expected_shape = NARROWED_SENSOR_SHAPES.get(model)
     if expected_shape is not None and isinstance(raw_attributes, Mapping):
-        actual_shape = classify_sensor_shape(attributes)
+        actual_shape = classify_sensor_shape(raw_attributes)
         if actual_shape is not SensorShape.UNKNOWN and actual_shape is not expected_shape:
-            raise SensorShapeMismatchError(entity_id_str, device_class, model)
+            entity_id_str = str(entity_id) if entity_id else "<unknown>"
+            raise SensorShapeMismatchError(entity_id_str, raw_attributes.get("device_class"), model)
 
     if "state" in prepared:
         state = prepared["state"]
@@ -295,7 +416,4 @@ def convert_state_dict_to_model(value: typing.Any, model: "type[BaseState]") ->
         with suppress(UnableToConvertValueError):
             prepared["state"] = TYPE_REGISTRY.convert(state, model.value_type)
 
-    try:
-        return model.model_validate(prepared)
-    except ValidationError as exc:
-        raise UnableToConvertAnnotatedStateError(entity_id_str, device_class, model) from exc
+    return prepared
@@ -3,7 +3,7 @@ import asyncio
 import logging
 import typing
 from asyncio import CancelledError
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable
 from contextlib import AsyncExitStack
 from http import HTTPStatus
 from typing import Any, ClassVar
@@ -26,14 +26,18 @@ from hassette.exceptions import (
     InvalidAuthError,
     ResourceNotReadyError,
 )
-from hassette.models.history import normalize_history
+from hassette.models.history import HISTORY_CHUNK_SIZE, merge_history_entry, normalize_history
 from hassette.resources.base import Resource
 from hassette.resources.lifecycle import mark_ready
 from hassette.types.types import LOG_LEVEL_TYPE
+from hassette.utils.json_stream import iter_nested_array_rows
 from hassette.utils.request_utils import clean_kwargs, format_time_param, orjson_dump
 
 _SSL_SHUTDOWN_DELAY = 0.25
 
+HISTORY_READ_SIZE = 64 * 1024
+"""Bytes read from the history response body per network read while streaming."""
+
 if typing.TYPE_CHECKING:
     from hassette import Hassette
     from hassette.core.websocket_service import WebsocketService
@@ -193,20 +197,9 @@ class ApiResource(Resource):
         no_attributes: bool = False,
     ) -> list[list[dict[str, Any]]]:
         """Get the history of a specific entity."""
-        url = f"history/period/{format_time_param(start_time)}"
-
-        params = {
-            "filter_entity_id": entity_id,
-            "end_time": end_time,
-            "significant_changes_only": significant_changes_only,
-            "minimal_response": minimal_response,
-            "no_attributes": no_attributes,
-        }
-        # having parameters like `minimal_response` in the parameters changes the response format
-        # regardless of whether they are set to True or False
-        # so we remove them if they are False
-        params = {k: v for k, v in params.items() if v is not False}
-
+        url, params = _history_request(
+            entity_id, start_time, end_time, significant_changes_only, minimal_response, no_attributes
+        )
         response = await self.rest_request("GET", url, params=params)
 
         entries = await response.json()
@@ -214,3 +207,75 @@ class ApiResource(Resource):
         normalized = normalize_history(entries)
 
         return normalized
+
+    async def iter_history_raw(
+        self,
+        entity_id: str,
+        start_time: PlainDateTime | ZonedDateTime | Date | str,
+        end_time: PlainDateTime | ZonedDateTime | Date | str | None = None,
+        significant_changes_only: bool = False,
+        minimal_response: bool = False,
+        no_attributes: bool = False,
+        chunk_size: int = HISTORY_CHUNK_SIZE,
+    ) -> AsyncIterator[tuple[str, list[dict[str, Any]]]]:
+        """Stream the history of one or more comma-separated entities in chunks.
+
+        Same request and normalization as ``get_history_raw``, but the response body is decoded row
+        by row as it arrives instead of in one piece, so memory stays bounded by ``chunk_size`` rows.
+
+        Yields:
+            ``(entity_id, rows)`` pairs of at most ``chunk_size`` normalized rows. Chunks follow the
+            response order, so every chunk of one entity is yielded before the next entity's first.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+
+        url, params = _history_request(
+            entity_id, start_time, end_time, significant_changes_only, minimal_response, no_attributes
+        )
+        # The total timeout would also cover the time the caller spends between chunks; only bound
+        # how long each read may stall.
+        timeout = aiohttp.ClientTimeout(total=None, sock_read=self.hassette.config.rest_request_timeout_seconds)
+        response = await self.rest_request("GET", url, params=params, timeout=timeout)
+        try:
+            group = -1
+            base_entry: dict[str, Any] = {}
+            chunk: list[dict[str, Any]] = []
+            async for row_group, row in iter_nested_array_rows(response.content.iter_chunked(HISTORY_READ_SIZE)):
+                if row_group != group:
+                    if chunk:
+                        yield base_entry["entity_id"], chunk
+                        chunk = []
+                    group, base_entry = row_group, row
+                chunk.append(merge_history_entry(base_entry, row))
+                if len(chunk) >= chunk_size:
+                    yield base_entry["entity_id"], chunk
+                    chunk = []
+            if chunk:
+                yield base_entry["entity_id"], chunk
+        finally:
+            response.release()
+
+
+def _history_request(
+    entity_id: str,
+    start_time: PlainDateTime | ZonedDateTime | Date | str,
+    end_time: PlainDateTime | ZonedDateTime | Date | str | None,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+) -> tuple[str, dict[str, Any]]:
+    """Return the URL and query parameters of a history request."""
+    url = f"history/period/{format_time_param(start_time)}"
+
+    params = {
+        "filter_entity_id": entity_id,
+        "end_time": end_time,
+        "significant_changes_only": significant_changes_only,
+        "minimal_response": minimal_response,
+        "no_attributes": no_attributes,
+    }
+    # having parameters like `minimal_response` in the parameters changes the response format
+    # regardless of whether they are set to True or False
+    # so we remove them if they are False
+    return url, {k: v for k, v in params.items() if v is not False}
@@ -2,7 +2,8 @@ import asyncio
 import time
 import traceback
 import typing
-from collections import defaultdict
+from itertools import groupby
+from operator import itemgetter
 from typing import Any, ClassVar
 from uuid import uuid4
 
@@ -14,6 +15,7 @@ from hassette.bus.error_context import BusErrorContext
 from hassette.bus.invocation import build_tracked_invoke_fn
 from hassette.bus.listeners import DurationConfig, Listener, Subscription
 from hassette.bus.router import Router
+from hassette.bus.state_index import StateIndexCache
 from hassette.core.database_service import DatabaseService
 from hassette.core.event_filter import EventFilter
 from hassette.core.execution_record import ExecutionRecord
@@ -70,6 +72,9 @@ class BusService(Service):
     """Per-owner callbacks invoked when a listener is removed (via remove_listener or
     remove_listeners_by_owner)."""
 
+    _event_types_observers: "tuple[Callable[[], None], ...]"
+    """Callbacks invoked after a routing change alters ``required_event_types()``."""
+
     def __init__(
         self,
         hassette: "Hassette",
@@ -101,8 +106,8 @@ class BusService(Service):
         )
 
         # Lambda — must remain callable so hot-reload picks up config changes at fire time.
-        self._config_resolver: Callable[[], float | None] = (
-            lambda: self.hassette.config.lifecycle.event_handler_timeout_seconds
+        self._config_resolver: Callable[[], float | None] = lambda: (
+            self.hassette.config.lifecycle.event_handler_timeout_seconds
         )
 
         self._duration_hold = DurationHoldManager(
@@ -118,6 +123,9 @@ class BusService(Service):
         )
 
         self._removal_callbacks = {}
+        self._state_index = StateIndexCache()
+        self._event_types_observers = ()
+        self._notified_event_types_revision = self.router.event_types_revision
 
     @property
     def config_log_level(self) -> LOG_LEVEL_TYPE:
@@ -206,6 +214,7 @@ class BusService(Service):
 
         # Sync: insert route — listener is routable after DB registration.
         self.router.add_route(listener.topic, listener)
+        self._notify_event_types_changed()
 
         if listener.duration_config is not None and listener.duration_config.immediate:
             self._dispatch_pending += 1
@@ -320,6 +329,7 @@ class BusService(Service):
         """
         listener.cancel()
         self.router.remove_listener_by_id(listener.topic, listener.listener_id)
+        self._notify_event_types_changed()
         self.fire_removal_callback(listener)
 
     def remove_listeners_by_owner(self, owner: str) -> None:
@@ -332,6 +342,7 @@ class BusService(Service):
         that removes listeners without that pre-clear.
         """
         removed = self.router.clear_owner(owner)
+        self._notify_event_types_changed()
         for listener in removed:
             listener.cancel()
             self.fire_removal_callback(listener)
@@ -351,6 +362,50 @@ class BusService(Service):
         """Get all listeners owned by a specific owner."""
         return self.router.get_listeners_by_owner(owner)
 
+    def required_event_types(self) -> frozenset[str] | None:
+        """Return the Home Assistant event types registered listeners can receive.
+
+        Returns:
+            The event types, or None when some listener's topic matches every event type.
+        """
+        return self.router.required_event_types()
+
+    def demands_event_type(self, event_type: str) -> bool:
+        """Return True if any registered listener can receive Home Assistant events of ``event_type``."""
+        return self.router.demands_event_type(event_type)
+
+    def has_listeners(self, topic: str) -> bool:
+        """Return True if any registered listener matches ``topic`` exactly or by glob.
+
+        Reads the router's memoized topic snapshot, so repeated checks cost one dict lookup.
+        Publishers of internal events use it to skip building events nobody receives.
+        """
+        return bool(self.router.topic_snapshot(topic))
+
+    def add_event_types_observer(self, observer: "Callable[[], None]") -> None:
+        """Register a synchronous callback fired whenever ``required_event_types()`` changes.
+
+        Observers run inline with listener registration and removal, so they must not block —
+        schedule any I/O on a task.
+        """
+        if observer not in self._event_types_observers:
+            self._event_types_observers = (*self._event_types_observers, observer)
+
+    def remove_event_types_observer(self, observer: "Callable[[], None]") -> None:
+        """Unregister a callback added with ``add_event_types_observer``. No-op if absent."""
+        self._event_types_observers = tuple(item for item in self._event_types_observers if item != observer)
+
+    def _notify_event_types_changed(self) -> None:
+        revision = self.router.event_types_revision
+        if revision == self._notified_event_types_revision:
+            return
+        self._notified_event_types_revision = revision
+        for observer in self._event_types_observers:
+            try:
+                observer()
+            except Exception:
+                self.logger.exception("Event types observer failed")
+
     def should_log_event(self, event: "Event[Any]") -> bool:
         """Determine if an event should be logged based on its type."""
         if not event.payload:
@@ -380,59 +435,69 @@ class BusService(Service):
         if not chosen:
             return
 
-        listeners_by_route = self._group_by_route(chosen)
-
-        # loop over routes so we always log in order of specificity
-        for route in routes:
-            listeners = listeners_by_route.get(route)
-            if not listeners:
-                continue
-
+        # chosen is grouped by route in order of specificity, so we always log in that order
+        for route, matches in groupby(chosen, key=itemgetter(0)):
+            listeners = [listener for _, listener in matches]
             self.logger.debug("Dispatch fanout %s -> %s (%d listener(s))", base_topic, route, len(listeners))
             for listener in listeners:
                 await self._spawn_dispatch_task(route, event, listener)
 
-    def _match_listeners(self, routes: list[str], event: "Event[Any]") -> dict[int, tuple[str, Listener]]:
+    def _match_listeners(self, routes: tuple[str, ...], event: "Event[Any]") -> list[tuple[str, Listener]]:
         """Resolve the listeners that match ``event`` across ``routes``.
 
-        Routes first, then dedupes by "first match wins" because routes are ordered by
-        specificity (most specific -> least). A predicate that raises is recorded as a
-        failed execution via ``_record_predicate_failure`` and excluded from further routes
-        for this dispatch, but the listener itself is not removed from the router.
+        Walks the router's memoized dispatch plan, which is already deduplicated by "first
+        route wins" (routes are ordered most specific -> least) and priority-sorted within each
+        route, so each candidate's predicate runs at most once per event. For ``state_changed``
+        events the plan is first narrowed by ``StateIndexCache`` to listeners whose static
+        entity/state constraints can match. A predicate that raises is recorded as a failed
+        execution via ``_record_predicate_failure`` and skipped, but the listener itself is not
+        removed from the router.
+
+        A listener whose predicate passes is then offered the event through ``admit_listener``,
+        so throttle drops, busy ``single``-mode suppressions and debounce coalescing are settled
+        here, before a dispatch slot is taken or a dispatch task spawned.
 
         Returns:
-            A dict mapping ``listener_id`` to the ``(matched_route, listener)`` it matched on.
+            The ``(matched_route, listener)`` pairs that passed and still need a dispatch task,
+            in plan order.
         """
-        chosen: dict[int, tuple[str, Listener]] = {}  # listener_id -> (matched_route, listener)
-        failed: set[int] = set()  # listener_ids whose predicates raised (dedup across routes)
+        chosen: list[tuple[str, Listener]] = []
 
-        for route in routes:
-            listeners = self.router.get_topic_listeners(route)
-            for listener in listeners:
-                if listener.listener_id in chosen or listener.listener_id in failed:
-                    continue
-                predicate_start = time.time()
+        plan = self.router.dispatch_plan(routes)
+        if isinstance(event, RawStateChangeEvent):
+            data = event.payload.data
+            plan = self._state_index.candidates(
+                routes, plan, data.entity_id, data.old_state_value, data.new_state_value
+            )
+
+        for entry in plan:
+            route, listener = entry
+            predicate_start = time.time()
+            try:
+                matched = listener.matches(event)
+            except Exception as exc:
+                self.logger.exception("Predicate raised for %s; skipping this listener", listener)
                 try:
-                    matched = listener.matches(event)
-                except Exception as exc:
-                    failed.add(listener.listener_id)
-                    self.logger.exception("Predicate raised for %s; skipping this listener", listener)
-                    try:
-                        self._record_predicate_failure(listener, route, event, exc, predicate_start)
-                    except Exception:
-                        self.logger.exception("Failed to record predicate failure for %s", listener)
-                    continue
-                if matched:
-                    chosen[listener.listener_id] = (route, listener)
+                    self._record_predicate_failure(listener, route, event, exc, predicate_start)
+                except Exception:
+                    self.logger.exception("Failed to record predicate failure for %s", listener)
+                continue
+            if matched and self.admit_listener(route, event, listener):
+                chosen.append(entry)
 
         return chosen
 
-    def _group_by_route(self, chosen: dict[int, tuple[str, Listener]]) -> dict[str, list[Listener]]:
-        """Group matched listeners by the route they matched on, for ordered per-route logging."""
-        listeners_by_route: dict[str, list[Listener]] = defaultdict(list)
-        for route, listener in chosen.values():
-            listeners_by_route[route].append(listener)
-        return listeners_by_route
+    def admit_listener(self, route: str, event: "Event[Any]", listener: "Listener") -> bool:
+        """Return whether a matched listener needs a dispatch task for ``event``.
+
+        Delegates to ``HandlerInvoker.admit``. Duration listeners always get a task: their
+        handler runs from a hold timer, not on this event, so nothing can be decided here.
+        """
+        if listener.duration_config is not None and listener.duration_config.duration is not None:
+            return True
+        return listener.invoker.admit(
+            lambda: build_tracked_invoke_fn(listener, event, route, self._executor, self._config_resolver)
+        )
 
     async def _spawn_dispatch_task(self, route: str, event: "Event[Any]", listener: "Listener") -> None:
         """Acquire a dispatch slot for ``listener`` and spawn its handler task.
@@ -455,6 +520,10 @@ class BusService(Service):
                 # the increment — the same no-await window that makes the saturation check
                 # race-free. Do not insert an await (e.g. metrics emit) between them.
                 listener.invoker.backpressure_dropped += 1
+                # admit_listener() already opened a throttle window for this event; the event never
+                # runs, so give the window back rather than also dropping the next event.
+                if listener.duration_config is None or listener.duration_config.duration is None:
+                    listener.invoker.revert_admit()
                 self.logger.debug(
                     "backpressure drop_newest: skipping event for %s",
                     listener.identity.name or listener.identity.handler_short_name,
@@ -477,25 +546,25 @@ class BusService(Service):
         task.add_done_callback(self.release_dispatch_slot)
         task.add_done_callback(self.on_dispatch_done)
 
-    def expand_topics(self, topic: str, event: Event[Any]) -> list[str]:
+    def expand_topics(self, topic: str, event: Event[Any]) -> tuple[str, ...]:
         payload = event.payload
         if not isinstance(payload, HassPayload):
-            return [topic]
+            return (topic,)
 
         if payload.event_type != _HASS_EVENT_STATE_CHANGED:
-            return [topic]
+            return (topic,)
 
         entity_id = payload.entity_id
         if not valid_entity_id(entity_id):
             self.logger.debug("Cannot expand topics for invalid entity_id: %r", entity_id)
-            return [topic]
+            return (topic,)
 
         domain, _ = split_entity_id(entity_id)
-        return [
+        return (
             f"{topic}.{entity_id}",  # hass.event.state_changed.light.office
             f"{topic}.{domain}.*",  # hass.event.state_changed.light.*
             topic,  # hass.event.state_changed
-        ]
+        )
 
     def read_entity_state(self, entity_id: str) -> "HassStateDict | None":
         """Read entity state from StateProxy; returns None on any error.
@@ -618,9 +687,9 @@ class BusService(Service):
             self._duration_hold.start_duration_timer(listener, entity_id, duration_config, invoke_fn)
             return
 
-        # Non-duration path (unchanged behavior).
+        # Non-duration path. admit_listener() already applied the rate limiter while matching.
         try:
-            await listener.invoker.dispatch(invoke_fn)
+            await listener.invoker.dispatch(invoke_fn, admitted=True)
         finally:
             if listener.options.once:
                 self.remove_listener(listener)
@@ -2,6 +2,7 @@
 
 import asyncio
 import contextlib
+import random
 import sqlite3
 import time
 import traceback
@@ -9,8 +10,7 @@ import typing
 from collections.abc import Awaitable, Callable
 from contextvars import Token
 from dataclasses import dataclass, field
-from dataclasses import replace as dataclass_replace
-from typing import ClassVar
+from typing import ClassVar, Literal
 
 import structlog.contextvars
 import uuid_utils
@@ -24,6 +24,7 @@ from hassette.core.execution_record import SYNTHETIC_ORIGIN, ExecutionRecord
 from hassette.core.loop_watchdog import WatchdogEvent
 from hassette.core.registration import ListenerRegistration, ScheduledJobRegistration
 from hassette.core.sync_executor import SYNC_WORKER_HANDLE
+from hassette.core.telemetry.latency import LATENCY_PERIOD_SECONDS, LatencyHistogram
 from hassette.core.telemetry.repository import TelemetryRepository
 from hassette.error_context import ErrorContext
 from hassette.events.hassette import HassetteExecutionCompletedEvent
@@ -34,8 +35,8 @@ from hassette.resources.restart import RestartSpec
 from hassette.resources.service import Service
 from hassette.scheduler.error_context import SchedulerErrorContext
 from hassette.schemas.log_models import BlockingEvent
-from hassette.types.enums import RestartType
-from hassette.types.types import LOG_LEVEL_TYPE
+from hassette.types.enums import RestartType, Topic
+from hassette.types.types import LOG_LEVEL_TYPE, TelemetryMode
 from hassette.utils.execution import ExecutionResult, track_execution
 
 if typing.TYPE_CHECKING:
@@ -151,6 +152,18 @@ class CommandExecutor(Service):
     rate-limit checks.
     """
 
+    _latency: dict[tuple[Literal["handler", "job"], int], LatencyHistogram]
+    """Per-listener/job duration histograms not yet written to ``latency_histograms``.
+
+    Keyed by ``(kind, listener_id or job_id)``; swapped for an empty dict by ``flush_latency``.
+    """
+
+    _next_latency_flush: float
+    """Monotonic time after which ``flush_latency`` writes the histograms."""
+
+    _completion_observers: tuple[Callable[[list[ExecutionRecord]], None], ...]
+    """Callbacks handed each persisted batch of app-tier records by ``emit_completion_events``."""
+
     current_execution: ExecutionMarker | None = None
     """Thread-visible marker of the execution currently on the loop thread, or None when idle.
 
@@ -174,6 +187,9 @@ class CommandExecutor(Service):
         self._last_capacity_warn_ts = None
         self._last_unowned_warn_ts = None
         self._timeout_warn_timestamps = {}
+        self._latency = {}
+        self._next_latency_flush = time.monotonic() + hassette.config.database.latency_flush_interval_seconds
+        self._completion_observers = ()
 
     @property
     def config_log_level(self) -> LOG_LEVEL_TYPE:
@@ -219,6 +235,7 @@ class CommandExecutor(Service):
                             self._dropped_overflow,
                         )
                 await self.flush_queue()
+                await self.flush_latency(force=True)
                 return
 
             if get_fut in done and not get_fut.cancelled() and get_fut.exception() is None:
@@ -239,6 +256,55 @@ class CommandExecutor(Service):
                             "drain_and_persist failed (timer flush) — records from this batch may be dropped"
                         )
 
+            await self.flush_latency()
+
+    def record_latency(self, cmd: InvokeHandler | ExecuteJob, duration_ms: float) -> None:
+        """Add an execution's duration to its listener's or job's in-memory latency histogram.
+
+        Commands whose listener or job has no database id yet are not tracked, matching the
+        rollup rule in ``rolls_up``.
+        """
+        kind: Literal["handler", "job"]
+        if isinstance(cmd, InvokeHandler):
+            kind, entity_id = "handler", cmd.listener_id
+        else:
+            kind, entity_id = "job", cmd.job_db_id
+        if entity_id is None:
+            return
+        histogram = self._latency.get((kind, entity_id))
+        if histogram is None:
+            histogram = self._latency[(kind, entity_id)] = LatencyHistogram()
+        histogram.record(duration_ms)
+
+    async def flush_latency(self, *, force: bool = False) -> None:
+        """Write the in-memory latency histograms once ``latency_flush_interval_seconds`` has elapsed.
+
+        The histograms are swapped out before the write, so executions finishing meanwhile start
+        fresh ones. A failed write drops the swapped-out counts with a warning: percentiles are
+        best-effort telemetry, like the execution records behind them.
+
+        Args:
+            force: Write regardless of the interval (used on shutdown).
+        """
+        if not self._latency:
+            return
+        now = time.monotonic()
+        if not force and now < self._next_latency_flush:
+            return
+        self._next_latency_flush = now + self.hassette.config.database.latency_flush_interval_seconds
+        histograms, self._latency = self._latency, {}
+        period_start_ts = float(int(time.time()) // LATENCY_PERIOD_SECONDS * LATENCY_PERIOD_SECONDS)
+        try:
+            await self.hassette.database_service.submit(
+                self.repository.persist_latency_histograms(histograms, period_start_ts)
+            )
+        except Exception as exc:
+            self.logger.warning(
+                "Failed to persist latency histograms for %d listener(s)/job(s) — dropping: %s",
+                len(histograms),
+                exc,
+            )
+
     def get_drop_counters(self) -> tuple[int, int, int]:
         """Return (dropped_overflow, dropped_exhausted, dropped_shutdown) counters.
 
@@ -357,6 +423,7 @@ class CommandExecutor(Service):
         SYNC_WORKER_HANDLE.set(None)
         if result.is_error:
             log_error(result)
+        self.record_latency(cmd, result.duration_ms)
         self.enqueue_record(self.build_record(cmd, result, execution_start_ts, execution_id))
         return result
 
@@ -454,6 +521,7 @@ class CommandExecutor(Service):
             execution_id: UUIDv7 string for this execution instance.
         """
         session_id = self.hassette.try_session_id()
+        rollup = self.rolls_up(cmd, result.status)
 
         match cmd:
             case InvokeHandler():
@@ -476,6 +544,7 @@ class CommandExecutor(Service):
                     execution_id=execution_id,
                     trigger_context_id=None if cmd.is_synthetic else cmd.event.payload.event_id,
                     trigger_origin=SYNTHETIC_ORIGIN if cmd.is_synthetic else cmd.event.payload.origin,
+                    rollup=rollup,
                 )
             case ExecuteJob():
                 return ExecutionRecord(
@@ -496,8 +565,49 @@ class CommandExecutor(Service):
                     error_traceback=result.error_traceback,
                     execution_id=execution_id,
                     trigger_mode=cmd.trigger_mode,
+                    rollup=rollup,
                 )
 
+    def telemetry_mode(self, cmd: InvokeHandler | ExecuteJob) -> TelemetryMode:
+        """Return the telemetry mode for the listener or job behind a command.
+
+        ``database.telemetry_mode_overrides`` is consulted for ``"<app_key>:<name>"`` and then
+        ``"<app_key>"``; without a match the command's tier default applies. A listener's name is
+        its ``name=`` if one was given, otherwise its handler's short name.
+        """
+        config = self.hassette.config.database
+        overrides = config.telemetry_mode_overrides
+        if overrides:
+            match cmd:
+                case InvokeHandler():
+                    identity = cmd.listener.identity
+                    app_key, name = identity.app_key, identity.name or identity.handler_short_name
+                case ExecuteJob():
+                    app_key, name = cmd.job.app_key, cmd.job.name
+            mode = overrides.get(f"{app_key}:{name}") or overrides.get(app_key)
+            if mode is not None:
+                return mode
+        return config.telemetry_mode if cmd.source_tier == "app" else config.framework_telemetry_mode
+
+    def rolls_up(self, cmd: InvokeHandler | ExecuteJob, status: str) -> bool:
+        """Return True if an execution of ``cmd`` ending in ``status`` is counted in a rollup bucket.
+
+        Only successes of a registered listener or job roll up, in ``"aggregated"`` mode always and
+        in ``"sampled"`` mode unless picked for the ``database.telemetry_sample_percent`` sample.
+        """
+        if status != "success":
+            return False
+        entity_id = cmd.listener_id if isinstance(cmd, InvokeHandler) else cmd.job_db_id
+        if entity_id is None:
+            return False
+        mode = self.telemetry_mode(cmd)
+        if mode == "aggregated":
+            return True
+        if mode == "sampled":
+            sample_percent = self.hassette.config.database.telemetry_sample_percent
+            return random.random() * 100 >= sample_percent  # noqa: S311 — sampling, not security
+        return False
+
     def bind_execution_context(
         self,
         app_key: str | None,
@@ -734,6 +844,16 @@ class CommandExecutor(Service):
         """
         await self.hassette.database_service.submit(self.repository.mark_job_status(db_id, status, reason))
 
+    async def mark_job_statuses(self, updates: list[tuple[int, str, str | None]]) -> None:
+        """Persist several schedule-status transitions as one DB write.
+
+        Delegates to ``TelemetryRepository.mark_job_statuses`` via ``DatabaseService.submit``.
+
+        Args:
+            updates: ``(db_id, status, reason)`` tuples, as for ``mark_job_status``.
+        """
+        await self.hassette.database_service.submit(self.repository.mark_job_statuses(updates))
+
     async def mark_listener_cancelled(self, db_id: int) -> None:
         """Set ``removed_at`` on the listeners row to persist durable removal state.
 
@@ -901,15 +1021,11 @@ class CommandExecutor(Service):
             retry_count: The number of times this batch has already been retried.
         """
         # Drain-time session_id injection
-        # Records enqueued before session creation have session_id=None.
-        # Inject the real session_id now at persist time.
+        # Records enqueued before session creation have session_id=None. The session is
+        # resolved once here and filled in as each row is bound, without copying records.
         current_session_id = self.hassette.try_session_id()
 
-        if current_session_id is not None:
-            records = [
-                dataclass_replace(r, session_id=current_session_id) if r.session_id is None else r for r in records
-            ]
-        else:
+        if current_session_id is None:
             # Session still not ready — drop records with None session_id
             no_session = [r for r in records if r.session_id is None]
             if no_session:
@@ -923,7 +1039,9 @@ class CommandExecutor(Service):
             return
 
         try:
-            await self.hassette.database_service.submit(self.repository.persist_execution_batch(records))
+            await self.hassette.database_service.submit(
+                self.repository.persist_execution_batch(records, session_id=current_session_id)
+            )
             await self.emit_completion_events(records)
         except sqlite3.OperationalError as exc:
             # Retryable — transient DB error (disk I/O, locked, etc.)
@@ -964,7 +1082,7 @@ class CommandExecutor(Service):
 
         except sqlite3.IntegrityError:
             # FK violation — fall back to row-by-row INSERT
-            await self.handle_fk_violation(records)
+            await self.handle_fk_violation(records, session_id=current_session_id)
 
         except (sqlite3.DataError, sqlite3.ProgrammingError) as exc:
             # Non-retryable schema/data mismatch — this is a regression
@@ -985,15 +1103,31 @@ class CommandExecutor(Service):
                 exc,
             )
 
+    def add_completion_observer(self, observer: Callable[[list[ExecutionRecord]], None]) -> None:
+        """Register a synchronous callback handed every persisted batch of app-tier execution records.
+
+        This is the in-process completion channel for framework consumers: one call per batch,
+        no bus round trip. Observers run inline on the write pipeline, so they must not block —
+        schedule any I/O on a task.
+        """
+        if observer not in self._completion_observers:
+            self._completion_observers = (*self._completion_observers, observer)
+
+    def remove_completion_observer(self, observer: Callable[[list[ExecutionRecord]], None]) -> None:
+        """Unregister a callback added with ``add_completion_observer``. No-op if absent."""
+        self._completion_observers = tuple(item for item in self._completion_observers if item != observer)
+
     async def emit_completion_events(
         self,
         records: list[ExecutionRecord],
     ) -> None:
-        """Emit bus topic events for persisted execution records.
+        """Publish persisted execution records to completion observers and bus subscribers.
 
-        Fires ``HASSETTE_EVENT_EXECUTION_COMPLETED`` for each app-tier execution
-        (both handler and job kinds). The payload's ``kind`` field distinguishes
-        handler from job completions.
+        The app-tier records of the batch go to every completion observer in one call. A
+        ``HASSETTE_EVENT_EXECUTION_COMPLETED`` bus event is additionally fired per record (both
+        handler and job kinds, distinguished by the payload's ``kind``), but only while some
+        listener subscribes to that topic — otherwise the per-record events would travel the
+        whole dispatch path for nobody.
 
         Payloads include ``app_key`` and ``instance_index`` sourced directly from the
         in-memory record (populated at build time from the Listener/Job object).
@@ -1002,6 +1136,8 @@ class CommandExecutor(Service):
         """
         try:
             app_records = [r for r in records if r.source_tier == "app"]
+            if not app_records:
+                return
             # Regression guard: an app-tier completion should always carry an owner.
             # An empty app_key means registration misfired (e.g. an app reload racing
             # the meta lookup). Rate-limited since a sustained storm would otherwise
@@ -1018,6 +1154,13 @@ class CommandExecutor(Service):
                         "Emitting %d app-tier completion event(s) with empty app_key — telemetry will be unattributed",
                         unowned,
                     )
+            for observer in self._completion_observers:
+                try:
+                    observer(app_records)
+                except Exception:
+                    self.logger.exception("Completion observer failed")
+            if not self.hassette.bus_service.has_listeners(Topic.HASSETTE_EVENT_EXECUTION_COMPLETED):
+                return
             for record in app_records:
                 exec_event = HassetteExecutionCompletedEvent.from_record(
                     kind=record.kind,
@@ -1103,6 +1246,8 @@ class CommandExecutor(Service):
     async def handle_fk_violation(
         self,
         records: list[ExecutionRecord],
+        *,
+        session_id: int | None = None,
     ) -> None:
         """Handle an IntegrityError by re-inserting records with FK fallback.
 
@@ -1112,10 +1257,11 @@ class CommandExecutor(Service):
 
         Args:
             records: Unified execution records to insert individually.
+            session_id: Session recorded for records whose own session_id is None.
         """
         try:
             dropped = await self.hassette.database_service.submit(
-                self.repository.persist_execution_batch_with_fk_fallback(records)
+                self.repository.persist_execution_batch_with_fk_fallback(records, session_id=session_id)
             )
             if dropped > 0:
                 self._dropped_exhausted += dropped
@@ -1,4 +1,5 @@
 import asyncio
+import contextlib
 import sqlite3
 import time
 import typing
@@ -23,8 +24,11 @@ if typing.TYPE_CHECKING:
     from hassette.config.config import HassetteConfig
     from hassette.resources.base import Resource
 
-_WriteQueueItem = tuple[Coroutine[Any, Any, Any], asyncio.Future[Any] | None]
-"""Type alias for items placed on the DB write queue."""
+_WriteQueueItem = tuple[Coroutine[Any, Any, Any], asyncio.Future[Any] | None, bool]
+"""Type alias for items placed on the DB write queue: (coroutine, result future, exclusive)."""
+
+_WRITE_GROUP_START_ITEMS = 8
+"""Group size limit the write worker starts from before adapting to the observed group duration."""
 
 # Heartbeat interval: 5 minutes
 _HEARTBEAT_INTERVAL_SECONDS = 300
@@ -107,6 +111,27 @@ _RETENTION_TABLES: list[RetentionTarget] = [
         retention_days_getter=lambda cfg: cfg.database.retention_days,
         failsafe_label="execution records",
     ),
+    RetentionTarget(
+        table="execution_rollups",
+        timestamp_col="bucket_start_ts",
+        priority=1,
+        retention_days_getter=lambda cfg: cfg.database.retention_days,
+        failsafe_label="execution rollups",
+    ),
+    RetentionTarget(
+        table="execution_buckets",
+        timestamp_col="bucket_start_ts",
+        priority=1,
+        retention_days_getter=lambda cfg: cfg.database.retention_days,
+        failsafe_label="execution buckets",
+    ),
+    RetentionTarget(
+        table="latency_histograms",
+        timestamp_col="period_start_ts",
+        priority=1,
+        retention_days_getter=lambda cfg: cfg.database.retention_days,
+        failsafe_label="latency histograms",
+    ),
     RetentionTarget(
         table="blocking_events",
         timestamp_col="detected_ts",
@@ -132,6 +157,45 @@ async def _connect_daemon(database: str | Path, **kwargs: Any) -> aiosqlite.Conn
     return await conn
 
 
+class _GroupConnection:
+    """Write-connection stand-in handed to queued writes while the worker runs a write group.
+
+    The group already holds the connection's transaction, so a write's own ``BEGIN`` opens a
+    nested savepoint instead, and its ``commit()``/``rollback()`` release or roll back to that
+    savepoint. Everything else passes through to the real connection.
+    """
+
+    __slots__ = ("_conn", "_in_transaction")
+
+    def __init__(self, conn: aiosqlite.Connection) -> None:
+        self._conn = conn
+        self._in_transaction = False
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._conn, name)
+
+    def execute(self, sql: str, parameters: Any = None) -> Any:
+        if sql.lstrip().upper().startswith("BEGIN"):
+            self._in_transaction = True
+            return self._conn.execute("SAVEPOINT hassette_write_tx")
+        return self._conn.execute(sql, parameters)
+
+    async def commit(self) -> None:
+        if self._in_transaction:
+            self._in_transaction = False
+            await self._conn.execute("RELEASE hassette_write_tx")
+
+    async def rollback(self) -> None:
+        if self._in_transaction:
+            self._in_transaction = False
+            await self._conn.execute("ROLLBACK TO hassette_write_tx")
+            await self._conn.execute("RELEASE hassette_write_tx")
+
+    def reset(self) -> None:
+        """Forget a savepoint left open by a write; the worker has already released it."""
+        self._in_transaction = False
+
+
 class DatabaseService(Service):
     """Manages the SQLite database for operational telemetry.
 
@@ -168,6 +232,12 @@ class DatabaseService(Service):
     _consecutive_size_triggers: int
     """Counter for consecutive hourly size failsafe triggers; logged as a warning."""
 
+    _group_db: "_GroupConnection | None"
+    """Connection stand-in returned by ``db`` while the worker runs a write group; None otherwise."""
+
+    _write_group_limit: int
+    """Current maximum number of queued writes the worker commits in one transaction."""
+
     def __init__(self, hassette: "Hassette", *, parent: "Resource | None" = None) -> None:
         super().__init__(hassette, parent=parent)
         self._db = None
@@ -177,6 +247,8 @@ class DatabaseService(Service):
         self._consecutive_size_triggers = 0
         self._db_write_queue = None
         self._db_worker_task = None
+        self._group_db = None
+        self._write_group_limit = 1
 
     @property
     def config_log_level(self) -> LOG_LEVEL_TYPE:
@@ -199,11 +271,17 @@ class DatabaseService(Service):
     def db(self) -> aiosqlite.Connection:
         """Return the active write database connection.
 
+        While the write worker runs a group of queued writes in one transaction, this returns a
+        stand-in that turns the current write's own ``BEGIN``/``commit()``/``rollback()`` into a
+        nested savepoint (see ``run_write_group``).
+
         Raises:
             RuntimeError: If the database connection is not initialized.
         """
         if self._db is None:
             raise RuntimeError("Database connection is not initialized")
+        if self._group_db is not None:
+            return typing.cast("aiosqlite.Connection", self._group_db)
         return self._db
 
     @property
@@ -313,7 +391,7 @@ class DatabaseService(Service):
         closed = 0
         while True:
             try:
-                coro, future = queue.get_nowait()
+                coro, future, _ = queue.get_nowait()
             except asyncio.QueueEmpty:
                 break
             coro.close()
@@ -362,32 +440,156 @@ class DatabaseService(Service):
         await super().cleanup(timeout)
 
     async def db_write_worker(self) -> None:
-        """Drain _db_write_queue sequentially.
+        """Drain _db_write_queue, committing any backlog in groups.
 
-        Each item is a (coroutine, future) pair. If future is not None, the
-        coroutine's result (or exception) is delivered through it. If future is
-        None, any exception is logged and the worker continues.
+        Each item is a (coroutine, future, exclusive) triple. If future is not None, the
+        coroutine's result (or exception) is delivered through it. If future is None, any
+        exception is logged and the worker continues.
+
+        When more writes are already waiting behind the one just taken, the worker takes up to
+        ``_write_group_limit`` of them and runs them in a single transaction (see
+        ``run_write_group``), so a backlog costs one commit per group instead of one per write.
+        Exclusive items always run on their own. After each group the limit is halved if the
+        group took longer than ``write_group_target_ms``, or doubled (up to
+        ``write_group_max_items``) if it finished in time and writes are still waiting.
 
         The loop runs until cancelled by on_shutdown().
         """
         if self._db_write_queue is None:
             raise RuntimeError("db_write_worker() started before on_initialize() set _db_write_queue")
         queue = self._db_write_queue
-        while True:
-            coro, future = await queue.get()
-            try:
-                result = await coro
-                if future is not None and not future.done():
-                    future.set_result(result)
-            except Exception as exc:
-                if future is not None and not future.done():
-                    future.set_exception(exc)
+        config = self.hassette.config.database
+        max_items = config.write_group_max_items
+        target_seconds = config.write_group_target_ms / 1000
+        self._write_group_limit = min(_WRITE_GROUP_START_ITEMS, max_items)
+        held: _WriteQueueItem | None = None
+        try:
+            while True:
+                if held is not None:
+                    item, held = held, None
                 else:
-                    self.logger.exception("Unhandled error in enqueued DB write")
-            finally:
+                    item = await queue.get()
+                group = [item]
+                if not item[2]:
+                    while len(group) < self._write_group_limit:
+                        try:
+                            next_item = queue.get_nowait()
+                        except asyncio.QueueEmpty:
+                            break
+                        if next_item[2]:
+                            held = next_item
+                            break
+                        group.append(next_item)
+
+                if len(group) == 1:
+                    try:
+                        await self.run_write(item[0], item[1])
+                    finally:
+                        queue.task_done()
+                    continue
+
+                started = time.monotonic()
+                try:
+                    await self.run_write_group(group)
+                finally:
+                    for _ in group:
+                        queue.task_done()
+                if time.monotonic() - started > target_seconds:
+                    self._write_group_limit = max(2, self._write_group_limit // 2)
+                elif not queue.empty():
+                    self._write_group_limit = min(max_items, self._write_group_limit * 2)
+        finally:
+            if held is not None:
+                coro, future, _ = held
+                coro.close()
+                if future is not None and not future.done():
+                    future.cancel()
                 queue.task_done()
 
-    async def submit(self, coro: Coroutine[Any, Any, Any]) -> Any:
+    async def run_write(self, coro: Coroutine[Any, Any, Any], future: asyncio.Future[Any] | None) -> None:
+        """Run one queued write on the write connection and deliver its outcome."""
+        try:
+            result = await coro
+        except Exception as exc:
+            self.settle_write(future, exc, failed=True)
+        else:
+            self.settle_write(future, result, failed=False)
+
+    async def run_write_group(self, group: list[_WriteQueueItem]) -> None:
+        """Run several queued writes in one transaction, each under its own savepoint.
+
+        A write that raises is rolled back to its savepoint and the rest of the group still
+        commits. Futures are settled only once the group has committed; if the group fails to
+        commit, every write in it fails with that error. Falls back to running the writes one by
+        one when the group transaction cannot be opened.
+        """
+        db = self.db
+        try:
+            await db.execute("BEGIN IMMEDIATE")
+        except (sqlite3.Error, ValueError):
+            self.logger.warning(
+                "Could not open a transaction for %d grouped writes; running them individually",
+                len(group),
+                exc_info=True,
+            )
+            for index, (coro, future, _) in enumerate(group):
+                try:
+                    await self.run_write(coro, future)
+                except BaseException:
+                    self.discard_writes(group[index + 1 :])
+                    raise
+            return
+
+        outcomes: list[tuple[Any, bool]] = []
+        proxy = _GroupConnection(db)
+        self._group_db = proxy
+        try:
+            for coro, _future, _ in group:
+                await db.execute("SAVEPOINT hassette_write")
+                try:
+                    result = await coro
+                except Exception as exc:
+                    await db.execute("ROLLBACK TO hassette_write")
+                    outcomes.append((exc, True))
+                else:
+                    outcomes.append((result, False))
+                await db.execute("RELEASE hassette_write")
+                proxy.reset()
+            self._group_db = None
+            await db.commit()
+        except Exception as exc:
+            self._group_db = None
+            self.discard_writes(group[len(outcomes) :])
+            with contextlib.suppress(sqlite3.Error, ValueError):
+                await db.rollback()
+            self.logger.exception("Failed to commit a group of %d writes; rolled back", len(group))
+            outcomes = [(exc, True)] * len(group)
+        except BaseException:
+            self._group_db = None
+            self.discard_writes(group[len(outcomes) :])
+            raise
+
+        for (_coro, future, _), (value, failed) in zip(group, outcomes, strict=True):
+            self.settle_write(future, value, failed=failed)
+
+    def settle_write(self, future: asyncio.Future[Any] | None, value: Any, *, failed: bool) -> None:
+        """Deliver a write's result or exception to its future, or log the exception if nobody awaits it."""
+        if future is not None and not future.done():
+            if failed:
+                future.set_exception(value)
+            else:
+                future.set_result(value)
+        elif failed:
+            self.logger.error("Unhandled error in enqueued DB write", exc_info=value)
+
+    def discard_writes(self, items: list[_WriteQueueItem]) -> None:
+        """Close the coroutines of writes that never started and cancel their futures."""
+        for coro, future, _ in items:
+            coro.close()
+            if future is not None and not future.done():
+                future.cancel()
+
+    async def submit(self, coro: Coroutine[Any, Any, Any], *, exclusive: bool = False) -> Any:
         """Submit a coroutine for serialized execution and await its result.
 
         The coroutine is placed on the write queue and executed by the single-writer
@@ -395,6 +597,9 @@ class DatabaseService(Service):
 
         Args:
             coro: The coroutine to execute.
+            exclusive: Run the coroutine on its own instead of grouped into a shared
+                transaction with other queued writes. Needed for statements that cannot
+                run inside a transaction, such as ``wal_checkpoint`` or ``incremental_vacuum``.
 
         Returns:
             The return value of the coroutine.
@@ -407,14 +612,14 @@ class DatabaseService(Service):
             raise RuntimeError("DatabaseService.submit() called before on_initialize()")
         future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
         try:
-            await self._db_write_queue.put((coro, future))
+            await self._db_write_queue.put((coro, future, exclusive))
         except BaseException:
             coro.close()
             future.cancel()
             raise
         return await future
 
-    def enqueue(self, coro: Coroutine[Any, Any, Any]) -> bool:
+    def enqueue(self, coro: Coroutine[Any, Any, Any], *, exclusive: bool = False) -> bool:
         """Submit a coroutine for fire-and-forget execution.
 
         Returns immediately. The coroutine is placed on the write queue and
@@ -423,6 +628,8 @@ class DatabaseService(Service):
 
         Args:
             coro: The coroutine to execute.
+            exclusive: Run the coroutine on its own instead of grouped with other queued
+                writes; see ``submit()``.
 
         Returns:
             True if enqueued successfully, False if dropped due to a full queue.
@@ -431,7 +638,7 @@ class DatabaseService(Service):
             coro.close()
             raise RuntimeError("DatabaseService.enqueue() called before on_initialize()")
         try:
-            self._db_write_queue.put_nowait((coro, None))
+            self._db_write_queue.put_nowait((coro, None, exclusive))
         except asyncio.QueueFull:
             coro.close()
             self.logger.error(
@@ -624,7 +831,8 @@ class DatabaseService(Service):
             # Use the standard retention window for parent-guard deletes.
             cutoff = now - (config.database.retention_days * SECONDS_PER_DAY)
 
-            # Only delete retired listeners when ALL their child executions have also aged out.
+            # Only delete retired listeners when ALL their child executions (and rollup buckets,
+            # which cascade with the listener) have also aged out.
             # This prevents orphaning recent executions whose parent row would be
             # deleted because retired_at (set at restart time) diverges from last execution time.
             cursor_rl = await self.db.execute(
@@ -636,8 +844,13 @@ class DatabaseService(Service):
                       WHERE listener_id = listeners.id
                         AND execution_start_ts >= ?
                   )
+                  AND NOT EXISTS (
+                      SELECT 1 FROM execution_rollups
+                      WHERE listener_id = listeners.id
+                        AND bucket_start_ts >= ?
+                  )
                 """,
-                (cutoff, cutoff),
+                (cutoff, cutoff, cutoff),
             )
             # Same guard for scheduled_jobs.
             cursor_rj = await self.db.execute(
@@ -649,8 +862,13 @@ class DatabaseService(Service):
                       WHERE job_id = scheduled_jobs.id
                         AND execution_start_ts >= ?
                   )
+                  AND NOT EXISTS (
+                      SELECT 1 FROM execution_rollups
+                      WHERE job_id = scheduled_jobs.id
+                        AND bucket_start_ts >= ?
+                  )
                 """,
-                (cutoff, cutoff),
+                (cutoff, cutoff, cutoff),
             )
             await self.db.commit()
 
@@ -765,7 +983,8 @@ class DatabaseService(Service):
             return
         if self._db_write_queue is None:
             return
-        self.enqueue(self._check_size_failsafe())
+        # Exclusive: the failsafe checkpoints the WAL and vacuums, which cannot run inside a write group.
+        self.enqueue(self._check_size_failsafe(), exclusive=True)
 
     async def _insert_log_records(self, records: list[dict]) -> None:
         """Batch-insert log records into the log_records table.
@@ -0,0 +1,223 @@
+"""Decoding of Home Assistant ``subscribe_entities`` messages for ``StateProxy``.
+
+``subscribe_entities`` streams compressed entity state instead of full ``state_changed`` events.
+Every message holds up to three sections:
+
+- ``"a"`` (added): ``{entity_id: compressed_state}``. The first message of a subscription is a
+  full snapshot of every entity.
+- ``"c"`` (changed): ``{entity_id: {"+": additions, "-": removals}}``, a diff against the last
+  state delivered for that entity.
+- ``"r"`` (removed): ``[entity_id, ...]``.
+
+Compressed states use abbreviated keys: ``s`` (state), ``a`` (attributes), ``c`` (context, a
+bare id string or a partial context dict), ``lc`` (last_changed) and ``lu`` (last_updated,
+omitted when equal to ``lc``). Both timestamps are epoch floats. This module expands them back
+into the ``HassStateDict`` shape ``get_states`` and ``state_changed`` events use, so the rest of
+the cache code is feed-agnostic.
+"""
+
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import hassette.utils.date_utils as date_utils
+from hassette.events import RawStateChangeEvent
+from hassette.events.base import HassContext, HassPayload
+from hassette.events.hass.hass import RawStateChangePayload
+from hassette.types import Topic
+
+if TYPE_CHECKING:
+    from whenever import ZonedDateTime
+
+    from hassette.events import HassStateDict
+    from hassette.events.hass.raw import HassContextDict
+
+_STATE = "s"
+_ATTRIBUTES = "a"
+_CONTEXT = "c"
+_LAST_CHANGED = "lc"
+_LAST_UPDATED = "lu"
+
+_ENTITIES_ADDED = "a"
+_ENTITIES_CHANGED = "c"
+_ENTITIES_REMOVED = "r"
+_DIFF_ADDITIONS = "+"
+_DIFF_REMOVALS = "-"
+
+STATE_CHANGED_EVENT_TYPE = "state_changed"
+"""The HA event type ``make_state_change_event`` synthesizes."""
+
+
+class StateChange(NamedTuple):
+    """One entity's transition, as applied to an ``EntityDiffFeed`` mirror."""
+
+    entity_id: str
+    old_state: "HassStateDict | None"
+    new_state: "HassStateDict | None"
+
+
+def _timestamp_to_iso(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, tz=UTC).isoformat()
+
+
+def _expand_context(compressed: "str | dict[str, Any] | None", base: "HassContextDict | None") -> "HassContextDict":
+    context: HassContextDict = (
+        {"id": base["id"], "parent_id": base["parent_id"], "user_id": base["user_id"]}
+        if base is not None
+        else {"id": "", "parent_id": None, "user_id": None}
+    )
+    if isinstance(compressed, str):
+        context["id"] = compressed
+    elif compressed:
+        context.update(compressed)  # pyright: ignore[reportCallIssue, reportArgumentType]
+    return context
+
+
+def expand_compressed_state(entity_id: str, compressed: dict[str, Any]) -> "HassStateDict":
+    """Expand one compressed ``subscribe_entities`` state into a full state dict.
+
+    Args:
+        entity_id: The entity the state belongs to (compressed states do not repeat it).
+        compressed: The compressed state from an ``"a"`` section.
+
+    Returns:
+        The state in ``HassStateDict`` form.
+    """
+    last_changed = _timestamp_to_iso(compressed[_LAST_CHANGED])
+    last_updated = _timestamp_to_iso(compressed[_LAST_UPDATED]) if _LAST_UPDATED in compressed else last_changed
+    return {
+        "entity_id": entity_id,
+        "state": compressed[_STATE],
+        "attributes": dict(compressed.get(_ATTRIBUTES) or {}),
+        "context": _expand_context(compressed.get(_CONTEXT), None),
+        "last_changed": last_changed,
+        "last_updated": last_updated,
+    }
+
+
+def apply_state_diff(state: "HassStateDict", diff: dict[str, Any]) -> "HassStateDict":
+    """Return a new state dict with a ``subscribe_entities`` diff applied to ``state``.
+
+    ``state`` itself is never mutated: it may already be published in the cache or carried by
+    an event as ``old_state``. The attributes dict is only copied when the diff touches it.
+
+    Args:
+        state: The entity's previous full state.
+        diff: The ``{"+": additions, "-": removals}`` entry from a ``"c"`` section.
+
+    Returns:
+        The entity's new full state.
+    """
+    additions: dict[str, Any] = diff.get(_DIFF_ADDITIONS) or {}
+    removals: dict[str, Any] = diff.get(_DIFF_REMOVALS) or {}
+    new_state: HassStateDict = {**state}
+
+    if _STATE in additions:
+        new_state["state"] = additions[_STATE]
+
+    if _LAST_CHANGED in additions:
+        new_state["last_changed"] = new_state["last_updated"] = _timestamp_to_iso(additions[_LAST_CHANGED])
+    elif _LAST_UPDATED in additions:
+        new_state["last_updated"] = _timestamp_to_iso(additions[_LAST_UPDATED])
+
+    if _CONTEXT in additions:
+        new_state["context"] = _expand_context(additions[_CONTEXT], state.get("context"))
+
+    added_attributes = additions.get(_ATTRIBUTES)
+    removed_attributes = removals.get(_ATTRIBUTES)
+    if added_attributes or removed_attributes:
+        attributes = {**state.get("attributes", {}), **(added_attributes or {})}
+        for key in removed_attributes or ():
+            attributes.pop(key, None)
+        new_state["attributes"] = attributes
+
+    return new_state
+
+
+class EntityDiffFeed:
+    """Mirror of the entity states one ``subscribe_entities`` subscription has delivered.
+
+    Diffs are relative to what the subscription itself last sent, so they are applied to this
+    mirror rather than to ``StateProxy.states`` (which a concurrent synchronization may be
+    replacing). The resulting full states are then handed to the cache.
+    """
+
+    __slots__ = ("generation", "states", "subscription_id")
+
+    generation: int
+    """The websocket connection generation the subscription was opened on."""
+
+    states: dict[str, "HassStateDict"]
+    """Latest full state per entity, as delivered by this subscription."""
+
+    subscription_id: int | None
+    """The HA subscription id, once the subscribe request has been confirmed."""
+
+    def __init__(self, generation: int) -> None:
+        self.generation = generation
+        self.states = {}
+        self.subscription_id = None
+
+    def apply(self, message: dict[str, Any]) -> list[StateChange]:
+        """Apply one ``subscribe_entities`` message to the mirror.
+
+        Args:
+            message: The ``event`` body of the message.
+
+        Returns:
+            The resulting transitions, in message order (additions, changes, removals). Diffs for
+            entities the mirror has never seen are skipped.
+        """
+        changes: list[StateChange] = []
+
+        for entity_id, compressed in (message.get(_ENTITIES_ADDED) or {}).items():
+            new_state = expand_compressed_state(entity_id, compressed)
+            changes.append(StateChange(entity_id, self.states.get(entity_id), new_state))
+            self.states[entity_id] = new_state
+
+        for entity_id, diff in (message.get(_ENTITIES_CHANGED) or {}).items():
+            old_state = self.states.get(entity_id)
+            if old_state is None:
+                continue
+            new_state = apply_state_diff(old_state, diff)
+            changes.append(StateChange(entity_id, old_state, new_state))
+            self.states[entity_id] = new_state
+
+        for entity_id in message.get(_ENTITIES_REMOVED) or ():
+            old_state = self.states.pop(entity_id, None)
+            if old_state is not None:
+                changes.append(StateChange(entity_id, old_state, None))
+
+        return changes
+
+
+def make_state_change_event(change: StateChange, received_at: "ZonedDateTime | None" = None) -> RawStateChangeEvent:
+    """Synthesize the ``state_changed`` event HA would have sent for ``change``.
+
+    The event carries the entity's own context and uses ``last_updated`` as ``time_fired``. A
+    removal, or a new state without ``last_updated``, is stamped with ``received_at``, the time the
+    diff frame arrived (the current time when omitted).
+    """
+    last_updated = change.new_state.get("last_updated") if change.new_state is not None else None
+    if last_updated is not None:
+        time_fired = date_utils.convert_datetime_str_to_tz(last_updated)
+    else:
+        time_fired = received_at if received_at is not None else date_utils.now()
+
+    if change.new_state is not None:
+        context = change.new_state["context"]
+    else:
+        context = change.old_state["context"] if change.old_state is not None else None
+    return RawStateChangeEvent(
+        topic=Topic.HASS_EVENT_STATE_CHANGED,
+        payload=HassPayload(
+            event_type=STATE_CHANGED_EVENT_TYPE,
+            data=RawStateChangePayload(
+                entity_id=change.entity_id,
+                old_state=change.old_state,
+                new_state=change.new_state,
+            ),
+            origin="LOCAL",
+            time_fired=time_fired,
+            context=HassContext(**context) if context is not None else HassContext(id="", parent_id=None, user_id=None),
+        ),
+    )
@@ -0,0 +1,91 @@
+"""Bookkeeping for ``WebsocketService``'s per-event-type Home Assistant subscriptions.
+
+Used when ``websocket.event_subscription_mode`` is ``"per_event_type"``. Subscription changes
+are made add-first, retire-second, so there is never a gap in coverage. ``accepts`` drops the
+duplicates that briefly arrive while an old and a new subscription overlap.
+"""
+
+from collections.abc import Iterable
+
+EventTypeKey = str | None
+"""An HA event type, or None for the unfiltered (all event types) subscription."""
+
+
+def wanted_subscriptions(
+    required: frozenset[str] | None, baseline: Iterable[str], excluded: Iterable[str] = ()
+) -> frozenset[EventTypeKey]:
+    """Return the subscriptions that cover ``required`` event types.
+
+    Args:
+        required: Event types listeners need, or None when they need every event type.
+        baseline: Event types that are always subscribed in filtered mode.
+        excluded: Event types that are delivered some other way and never subscribed on their own.
+
+    Returns:
+        ``{None}`` for a single unfiltered subscription, otherwise one key per event type.
+    """
+    if required is None:
+        return frozenset({None})
+    return required.union(baseline).difference(excluded)
+
+
+def _sort_key(event_type: EventTypeKey) -> tuple[bool, str]:
+    return (event_type is not None, event_type or "")
+
+
+class EventTypeSubscriptions:
+    """Maps each subscribed event type (None for unfiltered) to its HA subscription id."""
+
+    __slots__ = ("_by_type", "_ids")
+
+    def __init__(self) -> None:
+        self._by_type: dict[EventTypeKey, int] = {}
+        self._ids: set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self._by_type)
+
+    @property
+    def event_types(self) -> frozenset[EventTypeKey]:
+        """The event types currently subscribed."""
+        return frozenset(self._by_type)
+
+    def diff(self, wanted: frozenset[EventTypeKey]) -> tuple[list[EventTypeKey], list[EventTypeKey]]:
+        """Return ``(to_subscribe, to_retire)`` to move from the current subscriptions to ``wanted``.
+
+        Both lists are sorted (unfiltered first, then alphabetically) so subscription traffic is
+        deterministic.
+        """
+        current = self._by_type.keys()
+        to_subscribe = sorted(wanted - current, key=_sort_key)
+        to_retire = sorted(current - wanted, key=_sort_key)
+        return to_subscribe, to_retire
+
+    def record(self, event_type: EventTypeKey, subscription_id: int) -> None:
+        """Record that ``event_type`` is now delivered by ``subscription_id``."""
+        self._by_type[event_type] = subscription_id
+        self._ids.add(subscription_id)
+
+    def retire(self, event_type: EventTypeKey) -> int | None:
+        """Forget ``event_type``'s subscription and return its id, or None if it was not subscribed."""
+        subscription_id = self._by_type.pop(event_type, None)
+        if subscription_id is not None:
+            self._ids.discard(subscription_id)
+        return subscription_id
+
+    def clear(self) -> None:
+        """Forget every subscription (the connection that owned them is gone)."""
+        self._by_type.clear()
+        self._ids.clear()
+
+    def accepts(self, subscription_id: object) -> bool:
+        """Return True if an event delivered on ``subscription_id`` should be dispatched.
+
+        While an unfiltered subscription is active it is the only accepted source, so the
+        per-type subscriptions it is replacing (or being replaced by) cannot double-deliver.
+        Events from retired subscriptions still in flight are dropped.
+        """
+        unfiltered_id = self._by_type.get(None)
+        if unfiltered_id is not None:
+            return subscription_id == unfiltered_id
+        return subscription_id in self._ids
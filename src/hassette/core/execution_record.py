@@ -9,7 +9,7 @@ SYNTHETIC_ORIGIN = "HASSETTE_SYNTHETIC"
 """trigger_origin value for immediate-fire synthetic events with no HA counterpart."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExecutionRecord:
     """Unified record of a single handler invocation or job execution.
 
@@ -117,3 +117,11 @@ class ExecutionRecord:
 
     kwargs_json: str = "{}"
     """JSON-encoded keyword arguments. '{}' for handler executions."""
+
+    # Telemetry mode
+    rollup: bool = False
+    """True when this success is counted in the per-minute ``execution_rollups`` buckets instead of
+    getting its own ``executions`` row (``"sampled"`` and ``"aggregated"`` telemetry modes).
+
+    Not a column: ``TelemetryRepository.persist_execution_batch`` routes the record by it.
+    """
@@ -32,7 +32,7 @@ from hassette.types.types import LOG_LEVEL_TYPE
 if TYPE_CHECKING:
     from hassette import Hassette
     from hassette.bus import Subscription
-    from hassette.events.hassette import ExecutionCompletedPayload
+    from hassette.core.execution_record import ExecutionRecord
 
 _WS_CLIENT_QUEUE_MAX = 256
 _WS_DROP_LOG_INTERVAL = 10.0
@@ -114,13 +114,9 @@ class RuntimeQueryService(Resource):
                 handler=self.on_ws_disconnected, name="hassette.rqs.on_ws_disconnected"
             )
         )
-        self._subscriptions.append(
-            await self.bus.on(
-                topic=Topic.HASSETTE_EVENT_EXECUTION_COMPLETED,
-                handler=self.on_execution_completed,
-                name="hassette.rqs.on_execution_completed",
-            )
-        )
+        # Completions arrive as whole persisted batches straight from the executor, not as one
+        # bus event per execution.
+        self.hassette.command_executor.add_completion_observer(self.on_executions_completed)
 
         # Wire up log capture handler for WS broadcast
         handler = self.hassette.logging_service.capture_handler
@@ -133,6 +129,8 @@ class RuntimeQueryService(Resource):
         mark_ready(self, reason="RuntimeQueryService initialized")
 
     async def on_shutdown(self) -> None:
+        self.hassette.command_executor.remove_completion_observer(self.on_executions_completed)
+
         # Remove bus listeners
         for sub in self._subscriptions:
             sub.cancel()
@@ -190,28 +188,28 @@ class RuntimeQueryService(Resource):
     async def on_ws_disconnected(self) -> None:
         await self.build_and_broadcast("connectivity", ConnectivityData(connected=False))
 
-    async def on_execution_completed(self, event: Event[Any]) -> None:
-        """Accumulate an execution completion (handler or job) into the pending batch for this drain tick."""
-        data: ExecutionCompletedPayload = event.payload.data
-        self._pending_completions.append(
+    def on_executions_completed(self, records: "list[ExecutionRecord]") -> None:
+        """Accumulate a persisted batch of app-tier executions (handlers and jobs) for this drain tick."""
+        self._pending_completions.extend(
             {
-                "kind": data.kind,
-                "app_key": data.app_key,
-                "instance_index": data.instance_index,
-                "status": data.status,
-                "duration_ms": data.duration_ms,
-                "error_type": data.error_type,
-                "listener_id": data.listener_id,
-                "job_id": data.job_id,
-                "thread_leaked": data.thread_leaked,
+                "kind": record.kind,
+                "app_key": record.app_key,
+                "instance_index": record.instance_index,
+                "status": record.status,
+                "duration_ms": record.duration_ms,
+                "error_type": record.error_type,
+                "listener_id": record.listener_id,
+                "job_id": record.job_id,
+                "thread_leaked": record.thread_leaked,
             }
+            for record in records
         )
-        await self.schedule_flush()
+        self.schedule_flush()
 
-    async def schedule_flush(self) -> None:
+    def schedule_flush(self) -> None:
         """Schedule a single flush task for the current event-loop tick if not already scheduled.
 
-        All completion events arriving within the same drain cycle are collected in
+        All completion batches arriving within the same drain cycle are collected in
         ``_pending_completions`` before a single WS message is broadcast -
         one message per ``drain_and_persist()`` cycle, not one per record.
         """
@@ -4,7 +4,7 @@ import random
 import time
 import traceback
 import typing
-from collections.abc import Callable, Iterator
+from collections.abc import Callable, Hashable, Iterator
 from dataclasses import dataclass, field
 from typing import ClassVar, Generic, TypeVar
 
@@ -18,6 +18,7 @@ from hassette.core.database_service import DatabaseService
 from hassette.core.execution_record import ExecutionRecord
 from hassette.core.registration import ScheduledJobRegistration
 from hassette.core.sync_executor_service import SyncExecutorService
+from hassette.core.timing_wheel import TimingWheel
 from hassette.exceptions import JobRemovedError
 from hassette.execution_mode import STALL_THRESHOLD_SECONDS, drain_pending_done, run_through_guard
 from hassette.resources.base import Resource
@@ -109,9 +110,10 @@ class SchedulerService(Service):
 
             due_jobs, next_run_time = await self._job_queue.pop_due_and_peek_next(date_utils.now())
 
-            if due_jobs:
-                for job in due_jobs:
-                    self.task_bucket.spawn(self.dispatch_and_log(job), name="scheduler:dispatch_scheduled_job")
+            if len(due_jobs) == 1:
+                self.task_bucket.spawn(self.dispatch_and_log(due_jobs[0]), name="scheduler:dispatch_scheduled_job")
+            elif due_jobs:
+                self.task_bucket.spawn(self.dispatch_due_jobs(due_jobs), name="scheduler:dispatch_due_jobs")
 
             await self.sleep(next_run_time)
 
@@ -124,6 +126,15 @@ class SchedulerService(Service):
         await self._job_queue.add(job)
         self.kick()
 
+    async def enqueue_jobs(self, jobs: "list[Job]") -> None:
+        """Push several jobs onto the queue under one lock acquisition and wake the scheduler once."""
+        if not jobs:
+            return
+        for job in jobs:
+            self.apply_jitter_to_heap(job)
+        await self._job_queue.add_many(jobs)
+        self.kick()
+
     async def reschedule_job(self, job: "Job", result: "ZonedDateTime | _WaitingSentinel") -> None:
         """Move a registered EntityTime job to a new concrete time, or to/from WAITING.
 
@@ -269,6 +280,26 @@ class SchedulerService(Service):
         reason = job.schedule_status_reason.value if job.schedule_status_reason is not None else None
         await self._executor.mark_job_status(job.db_id, job.schedule_status.value, reason)
 
+    async def persist_schedule_statuses(self, jobs: "list[Job]") -> None:
+        """Persist the current schedule status of several jobs as one DB write.
+
+        The batch form of ``persist_schedule_status``; jobs without a ``db_id`` are skipped.
+
+        Args:
+            jobs: The jobs whose current schedule status should be persisted.
+        """
+        updates = [
+            (
+                job.db_id,
+                job.schedule_status.value,
+                job.schedule_status_reason.value if job.schedule_status_reason is not None else None,
+            )
+            for job in jobs
+            if job.db_id is not None
+        ]
+        if updates:
+            await self._executor.mark_job_statuses(updates)
+
     async def sleep(self, next_run_time: ZonedDateTime | None = None) -> None:
         """Sleep until the next job is due or a kick is received.
 
@@ -410,82 +441,26 @@ class SchedulerService(Service):
         # already been cleared by the time it runs.
         dispatch_fire_at = job.fire_at
 
-        # Step 1: Compute the next schedule status and either enqueue the next occurrence or
-        # persist the new (non-heap) status. The current fire ALWAYS runs regardless of outcome.
-        if job.trigger is not None:
-            # Only a SCHEDULED job (concrete next_run) is ever popped for dispatch — the
-            # due-time heap enforces this. Asserted rather than silently skipped so a future
-            # caller violating that invariant fails loudly instead of dispatching bad state.
-            assert job.next_run is not None, "dispatch_and_log requires a job with a concrete next_run"
-            try:
-                if job._pending_entity_time_transition is not None:
-                    next_run = job._pending_entity_time_transition
-                    job._pending_entity_time_transition = None
-                else:
-                    next_run = job.trigger.next_run_time(job.next_run, date_utils.now())
-            except Exception:
-                self.logger.exception(
-                    "dispatch_and_log: trigger raised for db_id=%s callable=%s trigger=%r — "
-                    "running current fire then completing job",
-                    job.db_id,
-                    getattr(job.job, "__qualname__", str(job.job)),
-                    job.trigger,
-                )
-                job.transition_to(ScheduleStatus.COMPLETED, reason=ScheduleStatusReason.TRIGGER_ERROR)
-                await self.persist_schedule_status(job)
-            else:
-                if isinstance(next_run, _WaitingSentinel):
-                    # EntityTime's source has no usable time right now, mid-recurrence (the
-                    # third WAITING leg — registration-time and reconciliation-time waiting
-                    # are handled elsewhere). The job stays registered and watched, off the heap.
-                    job.transition_to(ScheduleStatus.WAITING)
-                    await self.persist_schedule_status(job)
-                    self.logger.debug("Job %s has no usable next occurrence right now — waiting", job)
-                elif next_run is not None:
-                    curr_next_run = job.next_run
-                    job.transition_to(ScheduleStatus.SCHEDULED, next_run=next_run)
-                    assert job.next_run is not None
-                    delta_to_now = (job.next_run - date_utils.now()).total("seconds")
-                    if delta_to_now <= 0:
-                        self.logger.warning(
-                            "Trigger produced non-future next_run (%.3fs in the past), advancing by 1s",
-                            -delta_to_now,
-                        )
-                        job.transition_to(ScheduleStatus.SCHEDULED, next_run=date_utils.now().add(seconds=1))
-                    await self.persist_schedule_status(job)
-                    self.logger.debug(
-                        "Rescheduling repeating job %s from %s to %s",
-                        job,
-                        curr_next_run,
-                        job.next_run,
-                    )
-                    # Enqueue next occurrence BEFORE running — enables overlap.
-                    # The in-lock _dequeued re-check inside _job_queue.add guards
-                    # against a cancel landing between here and the push.
-                    await self.enqueue_job(job)
-                    if job._pending_entity_time_transition is not None:
-                        pending_transition = job._pending_entity_time_transition
-                        job._pending_entity_time_transition = None
-                        await self.reschedule_job(job, pending_transition)
-                else:
-                    # next_run_time() returned None — trigger exhausted normally. The job
-                    # remains live and submit-capable; it just leaves the heap.
-                    job.transition_to(ScheduleStatus.COMPLETED)
-                    await self.persist_schedule_status(job)
+        # Step 1: Compute the next schedule status, persist it, and enqueue the next occurrence
+        # if there is one. The current fire ALWAYS runs regardless of outcome.
+        if self._advance_schedule(job):
+            await self.persist_schedule_status(job)
+            # Enqueue next occurrence BEFORE running — enables overlap.
+            # The in-lock _dequeued re-check inside _job_queue.add guards
+            # against a cancel landing between here and the push.
+            await self.enqueue_job(job)
+            await self._apply_pending_transition(job)
         else:
-            # No trigger, yet reached the heap — should never happen (manual-only jobs never
-            # enqueue), but complete defensively rather than leaving stale SCHEDULED timing.
-            job.transition_to(ScheduleStatus.COMPLETED)
             await self.persist_schedule_status(job)
 
         # A job that just transitioned away from SCHEDULED (COMPLETED via the trigger-raised,
-        # trigger-exhausted, or no-trigger branch above, or WAITING via the mid-recurrence
-        # branch) must not remain on the due-time heap. One check here — rather than a
-        # removal call inlined at each of those four transition sites — because the condition
-        # they all share is simply "did this dispatch leave the job off SCHEDULED", which is
-        # cheaper and less error-prone to ask once than to repeat at each call site. The
-        # recurring/re-enqueue branch is excluded because it leaves the job SCHEDULED with a
-        # freshly pushed heap entry that must stay. `job.trigger is not None` excludes the
+        # trigger-exhausted, or no-trigger branch of _advance_schedule, or WAITING via the
+        # mid-recurrence branch) must not remain on the due-time heap. One check here — rather
+        # than a removal call inlined at each of those four transition sites — because the
+        # condition they all share is simply "did this dispatch leave the job off SCHEDULED",
+        # which is cheaper and less error-prone to ask once than to repeat at each call site.
+        # The recurring/re-enqueue branch is excluded because it leaves the job SCHEDULED with
+        # a freshly pushed heap entry that must stay. `job.trigger is not None` excludes the
         # no-trigger branch for a different reason: a trigger-less job never reaches the heap
         # in the first place (manual-only jobs never call enqueue_job), so there is nothing to
         # remove — the check would be harmless either way, but this makes that explicit.
@@ -503,10 +478,123 @@ class SchedulerService(Service):
         if job.trigger is not None and job.schedule_status is not ScheduleStatus.SCHEDULED:
             await self._job_queue.remove_job(job)
 
-        # Step 2: Evaluate the job's predicate (if any) before running the handler.
-        # This must come after step 1 (next occurrence computed/enqueued/status persisted) so
-        # a skipped recurring job still continues its schedule, and before step 3
-        # (guard/execution) so a skip never invokes the handler.
+        await self._run_dispatched(job, dispatch_fire_at)
+
+    async def dispatch_due_jobs(self, jobs: "list[Job]") -> None:
+        """Dispatch a batch of jobs that fell due together.
+
+        Same per-job semantics as ``dispatch_and_log``, but the bookkeeping is shared: every
+        job's next schedule status is computed in one pass, all of the new statuses are
+        persisted as one DB write, and every recurring job's next occurrence is pushed under
+        a single queue-lock acquisition. Only then does each job's current fire run, in its
+        own task, so a slow handler never holds up the rest of the batch.
+
+        Every job here was just popped from the queue by ``serve``, so unlike
+        ``dispatch_and_log`` there is no stale heap entry to clean up for a job that left
+        ``SCHEDULED``.
+
+        Args:
+            jobs: The due jobs, as returned by ``pop_due_and_peek_next``.
+        """
+        dispatched: list[tuple[Job, ZonedDateTime | None]] = []
+        requeue: list[Job] = []
+        for job in jobs:
+            if job._dequeued:
+                self.logger.debug("Job %s was dequeued (cancelled between heap-pop and dispatch), skipping", job)
+                continue
+            self.logger.debug("Dispatching job: %s", job)
+            dispatched.append((job, job.fire_at))
+            if self._advance_schedule(job):
+                requeue.append(job)
+
+        try:
+            await self.persist_schedule_statuses([job for job, _fire_at in dispatched])
+        except Exception:
+            # Status rows are diagnostic; losing them must not strand the batch off the heap.
+            self.logger.exception("Failed to persist schedule status for %d dispatched jobs", len(dispatched))
+
+        await self.enqueue_jobs(requeue)
+        for job in requeue:
+            await self._apply_pending_transition(job)
+
+        for job, dispatch_fire_at in dispatched:
+            self.task_bucket.spawn(self._run_dispatched(job, dispatch_fire_at), name="scheduler:run_dispatched_job")
+
+    def _advance_schedule(self, job: "Job") -> bool:
+        """Transition a due job to its next schedule status, without persisting or enqueuing it.
+
+        Returns:
+            True if the job has a next occurrence and must go back on the queue.
+        """
+        if job.trigger is None:
+            # No trigger, yet reached the heap — should never happen (manual-only jobs never
+            # enqueue), but complete defensively rather than leaving stale SCHEDULED timing.
+            job.transition_to(ScheduleStatus.COMPLETED)
+            return False
+
+        # Only a SCHEDULED job (concrete next_run) is ever popped for dispatch — the
+        # due-time heap enforces this. Asserted rather than silently skipped so a future
+        # caller violating that invariant fails loudly instead of dispatching bad state.
+        assert job.next_run is not None, "dispatch requires a job with a concrete next_run"
+        try:
+            if job._pending_entity_time_transition is not None:
+                next_run = job._pending_entity_time_transition
+                job._pending_entity_time_transition = None
+            else:
+                next_run = job.trigger.next_run_time(job.next_run, date_utils.now())
+        except Exception:
+            self.logger.exception(
+                "scheduler dispatch: trigger raised for db_id=%s callable=%s trigger=%r — "
+                "running current fire then completing job",
+                job.db_id,
+                getattr(job.job, "__qualname__", str(job.job)),
+                job.trigger,
+            )
+            job.transition_to(ScheduleStatus.COMPLETED, reason=ScheduleStatusReason.TRIGGER_ERROR)
+            return False
+
+        if isinstance(next_run, _WaitingSentinel):
+            # EntityTime's source has no usable time right now, mid-recurrence (the
+            # third WAITING leg — registration-time and reconciliation-time waiting
+            # are handled elsewhere). The job stays registered and watched, off the heap.
+            job.transition_to(ScheduleStatus.WAITING)
+            self.logger.debug("Job %s has no usable next occurrence right now — waiting", job)
+            return False
+
+        if next_run is None:
+            # next_run_time() returned None — trigger exhausted normally. The job
+            # remains live and submit-capable; it just leaves the heap.
+            job.transition_to(ScheduleStatus.COMPLETED)
+            return False
+
+        curr_next_run = job.next_run
+        job.transition_to(ScheduleStatus.SCHEDULED, next_run=next_run)
+        assert job.next_run is not None
+        delta_to_now = (job.next_run - date_utils.now()).total("seconds")
+        if delta_to_now <= 0:
+            self.logger.warning(
+                "Trigger produced non-future next_run (%.3fs in the past), advancing by 1s",
+                -delta_to_now,
+            )
+            job.transition_to(ScheduleStatus.SCHEDULED, next_run=date_utils.now().add(seconds=1))
+        self.logger.debug("Rescheduling repeating job %s from %s to %s", job, curr_next_run, job.next_run)
+        return True
+
+    async def _apply_pending_transition(self, job: "Job") -> None:
+        """Apply an ``EntityTime`` move that arrived while ``job`` was being re-enqueued."""
+        if job._pending_entity_time_transition is not None:
+            pending_transition = job._pending_entity_time_transition
+            job._pending_entity_time_transition = None
+            await self.reschedule_job(job, pending_transition)
+
+    async def _run_dispatched(self, job: "Job", dispatch_fire_at: ZonedDateTime | None) -> None:
+        """Run a dispatched job's current fire: predicate check, then the mode guard.
+
+        Must come after the job's next occurrence was computed/enqueued/status persisted, so
+        a skipped recurring job still continues its schedule.
+        """
+        # Step 2: Evaluate the job's predicate (if any) before running the handler, so a
+        # skip never invokes the handler.
         if job.predicate is not None:
             predicate_start = time.time()
             try:
@@ -986,19 +1074,47 @@ class SchedulerService(Service):
         )
 
 
+def _job_owner(job: "Job") -> str:
+    """Group key for the job queue: jobs are removed per owner on every app reload."""
+    return job.owner_id
+
+
+def _check_enqueueable(job: "Job") -> None:
+    """Raise ValueError unless ``job`` is ``SCHEDULED`` with a concrete ``next_run``."""
+    if job.schedule_status is not ScheduleStatus.SCHEDULED or job.next_run is None:
+        raise ValueError(
+            f"Cannot enqueue job {job.name!r}: only SCHEDULED jobs with a concrete "
+            f"next_run may enter the heap (schedule_status={job.schedule_status!r}, "
+            f"next_run={job.next_run!r})"
+        )
+
+
+def _job_fire_ns(job: "Job") -> int:
+    """Expiry key for the timing wheel: the (jittered) fire time that also orders the heap."""
+    return job.sort_index[0]
+
+
 class _ScheduledJobQueue(Resource):
     """Encapsulates the scheduler heap with fair locking semantics."""
 
     _lock: FairAsyncRLock
     """Lock to protect access to the queue."""
 
-    _queue: "HeapQueue[Job]"
-    """The heap queue of scheduled jobs."""
+    _queue: "HeapQueue[Job] | TimingWheel[Job]"
+    """The scheduled jobs, in the backend selected by ``scheduler.queue_backend``."""
 
     def __init__(self, hassette: "Hassette", *, parent: Resource | None = None) -> None:
         super().__init__(hassette, parent=parent)
         self._lock = FairAsyncRLock()
-        self._queue = HeapQueue()
+        config = hassette.config.scheduler
+        if config.queue_backend == "timing_wheel":
+            self._queue = TimingWheel(
+                fire_key=_job_fire_ns,
+                tick_ns=config.timing_wheel_tick_milliseconds * 1_000_000,
+                group_key=_job_owner,
+            )
+        else:
+            self._queue = HeapQueue(group_key=_job_owner)
 
     async def on_initialize(self) -> None:
         mark_ready(self, reason="Queue ready")
@@ -1025,12 +1141,7 @@ class _ScheduledJobQueue(Resource):
             ValueError: If ``job.schedule_status`` is not ``SCHEDULED``, or ``job.next_run``
                 is ``None``.
         """
-        if job.schedule_status is not ScheduleStatus.SCHEDULED or job.next_run is None:
-            raise ValueError(
-                f"Cannot enqueue job {job.name!r}: only SCHEDULED jobs with a concrete "
-                f"next_run may enter the heap (schedule_status={job.schedule_status!r}, "
-                f"next_run={job.next_run!r})"
-            )
+        _check_enqueueable(job)
 
         async with self._lock:
             if job._dequeued:
@@ -1038,6 +1149,30 @@ class _ScheduledJobQueue(Resource):
                 return
             self._queue.push(job)
 
+        self._log_queued(job)
+
+    async def add_many(self, jobs: "list[Job]") -> None:
+        """Add several jobs to the queue under a single lock acquisition.
+
+        Same checks as ``add``, applied to every job before any is pushed.
+
+        Raises:
+            ValueError: If any job is not ``SCHEDULED`` or lacks a concrete ``next_run``.
+        """
+        for job in jobs:
+            _check_enqueueable(job)
+
+        async with self._lock:
+            pushed = [job for job in jobs if not job._dequeued]
+            for job in pushed:
+                self._queue.push(job)
+
+        if len(pushed) != len(jobs):
+            self.logger.debug("%d jobs were dequeued during re-enqueue window; skipped", len(jobs) - len(pushed))
+        for job in pushed:
+            self._log_queued(job)
+
+    def _log_queued(self, job: "Job") -> None:
         if job.fire_at != job.next_run:
             self.logger.debug(
                 "Queued job %s for next_run=%s (fire_at=%s, jitter=%ss)",
@@ -1050,35 +1185,49 @@ class _ScheduledJobQueue(Resource):
             self.logger.debug("Queued job %s for %s", job, job.next_run)
 
     async def pop_due_and_peek_next(self, reference_time: ZonedDateTime) -> tuple[list["Job"], ZonedDateTime | None]:
-        """Pop all due jobs and return the next run time in a single lock acquisition."""
-        due_jobs: list[Job] = []
+        """Pop all due jobs and return the next run time in a single lock acquisition.
 
+        With the timing-wheel backend the next run time is the end of the tick the next job
+        falls in (or the time the wheel must next cascade), not a job's exact ``fire_at``.
+        """
         async with self._lock:
-            current_time = reference_time
-            while not self._queue.is_empty():
-                candidate = self._queue.peek()
-                if candidate is None:
-                    break
-                # Heap invariant, enforced by add(): every enqueued job has a concrete fire_at.
-                assert candidate.fire_at is not None
-                if candidate.fire_at > current_time:
-                    break
-
-                due_jobs.append(self._queue.pop())
-                current_time = date_utils.now()
-
-            upcoming = self._queue.peek()
-            next_run = upcoming.fire_at if upcoming else None
+            queue = self._queue
+            if isinstance(queue, TimingWheel):
+                due_jobs = queue.pop_due(reference_time.timestamp_nanos())
+                next_ns = queue.next_due_ns()
+                next_run = (
+                    None if next_ns is None else ZonedDateTime.from_timestamp_nanos(next_ns, tz=reference_time.tz)
+                )
+            else:
+                due_jobs = self._pop_due_from_heap(queue, reference_time)
+                upcoming = queue.peek()
+                next_run = upcoming.fire_at if upcoming else None
 
         if due_jobs:
             self.logger.debug("Dequeued %d due jobs", len(due_jobs))
 
         return due_jobs, next_run
 
+    def _pop_due_from_heap(self, queue: "HeapQueue[Job]", reference_time: ZonedDateTime) -> "list[Job]":
+        due_jobs: list[Job] = []
+        current_time = reference_time
+        while not queue.is_empty():
+            candidate = queue.peek()
+            if candidate is None:
+                break
+            # Heap invariant, enforced by add(): every enqueued job has a concrete fire_at.
+            assert candidate.fire_at is not None
+            if candidate.fire_at > current_time:
+                break
+
+            due_jobs.append(queue.pop())
+            current_time = date_utils.now()
+        return due_jobs
+
     async def remove_owner(self, owner: str) -> "list[Job]":
         """Remove all jobs belonging to the given owner. Returns the removed jobs."""
         async with self._lock:
-            removed = self._queue.remove_where(lambda job: job.owner_id == owner)
+            removed = self._queue.remove_group(owner)
 
         if removed:
             self.logger.debug("Removed %d jobs for owner '%s'", len(removed), owner)
@@ -1126,7 +1275,20 @@ class _ScheduledJobQueue(Resource):
 
 @dataclass
 class HeapQueue(Generic[T]):
+    """Binary min-heap that tracks each item's position, so any item can leave in O(log n).
+
+    Items are ordered by ``<`` and identified by identity. ``_positions`` maps ``id(item)`` to
+    the item's index in ``_queue`` and is kept current by every sift, which lets ``remove_item``
+    find its target without a scan and repair the heap locally instead of re-heapifying.
+
+    When ``group_key`` is given, items are also indexed by that key (the owner, for jobs), and
+    ``remove_group`` removes one group's ``k`` items in O(k log n) without visiting the rest.
+    """
+
+    group_key: Callable[[T], Hashable] | None = None
     _queue: list[T] = field(default_factory=list)
+    _positions: dict[int, int] = field(default_factory=dict)
+    _groups: dict[Hashable, dict[int, T]] = field(default_factory=dict)
 
     def __iter__(self) -> Iterator[T]:
         """Iterate over all items in the queue (unordered)."""
@@ -1135,13 +1297,32 @@ class HeapQueue(Generic[T]):
     def __len__(self) -> int:
         return len(self._queue)
 
+    def __contains__(self, item: object) -> bool:
+        """Check whether ``item`` itself (by identity) is in the queue."""
+        return id(item) in self._positions
+
     def push(self, job: T) -> None:
-        """Push a job onto the queue."""
-        heapq.heappush(self._queue, job)  # pyright: ignore[reportArgumentType]
+        """Push a job onto the queue.
+
+        Pushing an item that is already queued does not add it twice: it is moved to the slot its
+        current ordering calls for instead.
+        """
+        index = self._positions.get(id(job))
+        if index is not None:
+            self._restore(index)
+            return
+
+        self._queue.append(job)
+        self._positions[id(job)] = len(self._queue) - 1
+        if self.group_key is not None:
+            self._groups.setdefault(self.group_key(job), {})[id(job)] = job
+        self._sift_up(len(self._queue) - 1)
 
     def pop(self) -> T:
         """Pop the next job from the queue."""
-        return heapq.heappop(self._queue)  # pyright: ignore[reportArgumentType]
+        if not self._queue:
+            raise IndexError("pop from an empty HeapQueue")
+        return self._remove_at(0)
 
     def peek(self) -> T | None:
         """Peek at the next job without removing it.
@@ -1156,7 +1337,10 @@ class HeapQueue(Generic[T]):
         return not self._queue
 
     def remove_where(self, predicate: Callable[[T], bool]) -> list[T]:
-        """Remove all items matching the predicate, returning the removed items."""
+        """Remove all items matching the predicate, returning the removed items.
+
+        Visits every item; prefer ``remove_group`` when the items to drop share a group key.
+        """
         if not self._queue:
             return []
 
@@ -1169,11 +1353,28 @@ class HeapQueue(Generic[T]):
                 remaining.append(item)
 
         if removed:
-            self._queue = remaining
-            heapq.heapify(self._queue)  # pyright: ignore[reportArgumentType]
+            self._rebuild(remaining)
 
         return removed
 
+    def remove_group(self, key: Hashable) -> list[T]:
+        """Remove every item whose ``group_key`` is ``key``, returning the removed items.
+
+        Raises:
+            ValueError: If the queue was created without a ``group_key``.
+        """
+        if self.group_key is None:
+            raise ValueError("remove_group requires a HeapQueue created with a group_key")
+
+        members = self._groups.get(key)
+        if not members:
+            return []
+
+        removed = list(members.values())
+        for item in removed:
+            self._remove_at(self._positions[id(item)])
+        return removed
+
     def remove_item(self, item: T) -> bool:
         """Remove a specific item from the queue if present, by identity.
 
@@ -1184,9 +1385,80 @@ class HeapQueue(Generic[T]):
         ``__eq__``-based lookup would raise ``AttributeError`` reading the missing field;
         identity comparison never touches it.
         """
-        for index, candidate in enumerate(self._queue):
-            if candidate is item:
-                del self._queue[index]
-                heapq.heapify(self._queue)  # pyright: ignore[reportArgumentType]
-                return True
-        return False
+        index = self._positions.get(id(item))
+        if index is None:
+            return False
+        self._remove_at(index)
+        return True
+
+    def _remove_at(self, index: int) -> T:
+        """Remove and return the item at ``index``, moving the last item into its slot."""
+        queue = self._queue
+        item = queue[index]
+        last = queue.pop()
+        del self._positions[id(item)]
+        if self.group_key is not None:
+            key = self.group_key(item)
+            members = self._groups[key]
+            del members[id(item)]
+            if not members:
+                del self._groups[key]
+
+        if last is not item:
+            queue[index] = last
+            self._positions[id(last)] = index
+            self._restore(index)
+        return item
+
+    def _rebuild(self, items: list[T]) -> None:
+        """Replace the contents with ``items`` and re-establish every index."""
+        heapq.heapify(items)  # pyright: ignore[reportArgumentType]
+        self._queue = items
+        self._positions = {id(item): index for index, item in enumerate(items)}
+        self._groups = {}
+        if self.group_key is not None:
+            for item in items:
+                self._groups.setdefault(self.group_key(item), {})[id(item)] = item
+
+    def _restore(self, index: int) -> None:
+        """Move the item at ``index`` up or down until the heap property holds around it."""
+        if index > 0 and self._queue[index] < self._queue[(index - 1) // 2]:  # pyright: ignore[reportOperatorIssue]
+            self._sift_up(index)
+        else:
+            self._sift_down(index)
+
+    def _sift_up(self, index: int) -> None:
+        queue = self._queue
+        positions = self._positions
+        item = queue[index]
+        while index > 0:
+            parent_index = (index - 1) // 2
+            parent = queue[parent_index]
+            if not item < parent:  # pyright: ignore[reportOperatorIssue]
+                break
+            queue[index] = parent
+            positions[id(parent)] = index
+            index = parent_index
+        queue[index] = item
+        positions[id(item)] = index
+
+    def _sift_down(self, index: int) -> None:
+        queue = self._queue
+        positions = self._positions
+        size = len(queue)
+        item = queue[index]
+        while True:
+            child_index = 2 * index + 1
+            if child_index >= size:
+                break
+            right_index = child_index + 1
+            if right_index < size and queue[right_index] < queue[child_index]:  # pyright: ignore[reportOperatorIssue]
+                child_index = right_index
+            child = queue[child_index]
+            if not child < item:  # pyright: ignore[reportOperatorIssue]
+                break
+            queue[index] = child
+            positions[id(child)] = index
+            index = child_index
+        queue[index] = item
+        positions[id(item)] = index
@@ -0,0 +1,220 @@
+"""Copy-on-write entity-state cache with a per-domain index, used as ``StateProxy.states``.
+
+The cache is published as a series of immutable ``StateSnapshot`` versions. A snapshot groups
+states by domain, and a write copies only the affected domain's bucket plus the small
+``domain -> bucket`` table before swapping in the new version. Readers — including sync apps
+on worker threads — take the current snapshot with a single attribute read and then never
+need a lock or a defensive copy: nothing they hold is ever mutated.
+
+Every stored state also carries a revision: the version of the snapshot that last changed it.
+Typed-model caches key on it, so an unchanged entity is recognised with one lookup instead of a
+content comparison.
+"""
+
+from collections.abc import Iterator, Mapping, MutableMapping
+from itertools import chain, count
+from logging import getLogger
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+from hassette.utils.hass_utils import split_entity_id
+
+if TYPE_CHECKING:
+    from hassette.events import HassStateDict
+
+LOGGER = getLogger(__name__)
+
+_EMPTY_DOMAIN: Mapping[str, "HassStateDict"] = MappingProxyType({})
+
+# Versions are drawn from one process-wide counter so they stay monotonic even when a
+# StateIndex is replaced wholesale (e.g. by a test assigning ``StateProxy.states``).
+_versions = count(1)
+
+
+class StateSnapshot(Mapping[str, "HassStateDict"]):
+    """One immutable version of the state cache, ``entity_id -> state``.
+
+    Entity IDs that are not ``<domain>.<object_id>`` are kept in a bucket no domain query can
+    reach, matching the old full scan, which skipped them with a warning.
+    """
+
+    __slots__ = ("_by_domain", "_len", "_revisions", "version")
+
+    version: int
+    """Increases with every published change to the cache."""
+
+    def __init__(
+        self,
+        by_domain: dict[str | None, dict[str, "HassStateDict"]],
+        revisions: dict[str | None, dict[str, int]],
+        length: int,
+    ) -> None:
+        self._by_domain = by_domain
+        self._revisions = revisions
+        self._len = length
+        self.version = next(_versions)
+
+    def domain(self, domain: str) -> Mapping[str, "HassStateDict"]:
+        """Return the ``entity_id -> state`` bucket for ``domain`` (empty if it has no entities).
+
+        The bucket belongs to this snapshot and is never modified, so it is safe to iterate
+        across ``await`` points or from another thread.
+        """
+        return self._by_domain.get(domain, _EMPTY_DOMAIN)
+
+    def revision(self, entity_id: str) -> int | None:
+        """Return the version at which ``entity_id``'s state last changed, or None if it is absent."""
+        bucket = self._revisions.get(_domain_key(entity_id))
+        if bucket is None:
+            return None
+        return bucket.get(entity_id)
+
+    def __getitem__(self, entity_id: str) -> "HassStateDict":
+        bucket = self._by_domain.get(_domain_key(entity_id))
+        if bucket is None:
+            raise KeyError(entity_id)
+        return bucket[entity_id]
+
+    def get(self, entity_id: str, default: Any = None) -> Any:
+        bucket = self._by_domain.get(_domain_key(entity_id))
+        if bucket is None:
+            return default
+        return bucket.get(entity_id, default)
+
+    def __contains__(self, entity_id: object) -> bool:
+        if not isinstance(entity_id, str):
+            return False
+        bucket = self._by_domain.get(_domain_key(entity_id))
+        return bucket is not None and entity_id in bucket
+
+    def __iter__(self) -> Iterator[str]:
+        return chain.from_iterable(self._by_domain.values())
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __repr__(self) -> str:
+        return f"StateSnapshot(version={self.version}, {self._len} entities, {len(self._by_domain)} domains)"
+
+
+class StateIndex(MutableMapping[str, "HassStateDict"]):
+    """The writable state cache: every change publishes a new ``StateSnapshot``.
+
+    Behaves like the plain dict ``StateProxy.states`` used to be, so direct writes (including the
+    test harness's ``seed_state``) go through the same copy-on-write path. Reads are served from
+    the current snapshot; use ``snapshot`` to pin one version for several reads.
+
+    Writes are meant for the event loop thread only; readers may be on any thread.
+    """
+
+    __slots__ = ("_snapshot",)
+
+    def __init__(self, states: Mapping[str, "HassStateDict"] | None = None) -> None:
+        self._snapshot = StateSnapshot({}, {}, 0)
+        if states:
+            self.replace(states)
+
+    @property
+    def snapshot(self) -> StateSnapshot:
+        """The current immutable version of the cache."""
+        return self._snapshot
+
+    def domain(self, domain: str) -> Mapping[str, "HassStateDict"]:
+        """Return the current snapshot's immutable bucket for ``domain``."""
+        return self._snapshot.domain(domain)
+
+    def revision(self, entity_id: str) -> int | None:
+        """Return the current revision of ``entity_id``'s state, or None if it is absent."""
+        return self._snapshot.revision(entity_id)
+
+    def replace(self, states: Mapping[str, "HassStateDict"]) -> None:
+        """Publish ``states`` as the whole cache in a single new version.
+
+        An entity whose new state equals the one already stored keeps the stored dict and its
+        revision, so a resynchronization that changes nothing leaves typed-model caches warm.
+        """
+        current = self._snapshot
+        by_domain: dict[str | None, dict[str, HassStateDict]] = {}
+        revisions: dict[str | None, dict[str, int]] = {}
+        snapshot = StateSnapshot(by_domain, revisions, len(states))
+        for entity_id, state in states.items():
+            key = _domain_key_for_write(entity_id)
+            old_state = current._by_domain.get(key, _EMPTY_DOMAIN).get(entity_id)
+            if old_state is not None and (old_state is state or old_state == state):
+                state = old_state
+                revision = current._revisions[key][entity_id]
+            else:
+                revision = snapshot.version
+            by_domain.setdefault(key, {})[entity_id] = state
+            revisions.setdefault(key, {})[entity_id] = revision
+        self._snapshot = snapshot
+
+    def __getitem__(self, entity_id: str) -> "HassStateDict":
+        return self._snapshot[entity_id]
+
+    def get(self, entity_id: str, default: Any = None) -> Any:
+        return self._snapshot.get(entity_id, default)
+
+    def __contains__(self, entity_id: object) -> bool:
+        return entity_id in self._snapshot
+
+    def __setitem__(self, entity_id: str, state: "HassStateDict") -> None:
+        current = self._snapshot
+        key = _domain_key_for_write(entity_id)
+        bucket = dict(current._by_domain.get(key, _EMPTY_DOMAIN))
+        added = entity_id not in bucket
+        bucket[entity_id] = state
+        by_domain = dict(current._by_domain)
+        by_domain[key] = bucket
+        revision_bucket = dict(current._revisions.get(key, {}))
+        revisions = dict(current._revisions)
+        revisions[key] = revision_bucket
+        snapshot = StateSnapshot(by_domain, revisions, current._len + added)
+        revision_bucket[entity_id] = snapshot.version
+        self._snapshot = snapshot
+
+    def __delitem__(self, entity_id: str) -> None:
+        current = self._snapshot
+        key = _domain_key(entity_id)
+        old_bucket = current._by_domain.get(key)
+        if old_bucket is None or entity_id not in old_bucket:
+            raise KeyError(entity_id)
+        by_domain = dict(current._by_domain)
+        revisions = dict(current._revisions)
+        if len(old_bucket) == 1:
+            del by_domain[key]
+            del revisions[key]
+        else:
+            bucket = dict(old_bucket)
+            del bucket[entity_id]
+            by_domain[key] = bucket
+            revision_bucket = dict(revisions[key])
+            del revision_bucket[entity_id]
+            revisions[key] = revision_bucket
+        self._snapshot = StateSnapshot(by_domain, revisions, current._len - 1)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._snapshot)
+
+    def __len__(self) -> int:
+        return len(self._snapshot)
+
+    def clear(self) -> None:
+        self._snapshot = StateSnapshot({}, {}, 0)
+
+    def __repr__(self) -> str:
+        return f"StateIndex({self._snapshot!r})"
+
+
+def _domain_key(entity_id: str) -> str | None:
+    try:
+        return split_entity_id(entity_id)[0]
+    except ValueError:
+        return None
+
+
+def _domain_key_for_write(entity_id: str) -> str | None:
+    key = _domain_key(entity_id)
+    if key is None:
+        LOGGER.warning("State for entity %s has invalid 'entity_id' value", entity_id)
+    return key
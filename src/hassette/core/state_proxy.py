@@ -8,19 +8,21 @@ from typing import TYPE_CHECKING, Any, ClassVar
 from fair_async_rlock import FairAsyncRLock
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
 
+import hassette.utils.date_utils as date_utils
 from hassette.bus import Bus
 from hassette.core.api_resource import ApiResource
 from hassette.core.bus_service import BusService
+from hassette.core.entity_feed import STATE_CHANGED_EVENT_TYPE, EntityDiffFeed, make_state_change_event
 from hassette.core.scheduler_service import SchedulerService
+from hassette.core.state_index import StateIndex
 from hassette.events import RawStateChangeEvent
-from hassette.events.metadata import get_websocket_generation
+from hassette.events.metadata import get_websocket_generation, stamp_websocket_generation
 from hassette.exceptions import ResourceNotReadyError
 from hassette.resources.base import Resource
 from hassette.resources.lifecycle import mark_not_ready, mark_ready
 from hassette.scheduler import Job, Scheduler
 from hassette.types import Topic
 from hassette.types.types import LOG_LEVEL_TYPE
-from hassette.utils.hass_utils import extract_domain
 
 MAX_RETRY_ATTEMPTS = 5
 
@@ -106,7 +108,9 @@ class StateProxy(Resource):
     A full synchronization pass (``_run_synchronization``) fetches every entity's current state
     via ``Api.get_states_raw()`` and replays a per-generation journal of state-changed events
     observed while that fetch was in flight (``_JournalOperation`` / ``_ActiveSynchronization``),
-    so no update racing the bulk fetch is lost. On failure it retries with exponential backoff
+    so no update racing the bulk fetch is lost. With ``state_proxy_feed = "subscribe_entities"``
+    the fetch is replaced by the initial snapshot of a ``subscribe_entities`` subscription, whose
+    later diffs keep the cache current (see ``_subscribe_entity_feed``). On failure it retries with exponential backoff
     (``_schedule_retry`` / ``_compute_retry_delay``) unless polling is enabled, in which case the
     next scheduled poll (``load_cache``) is left to converge instead.
 
@@ -121,7 +125,6 @@ class StateProxy(Resource):
 
     depends_on: ClassVar[list[type[Resource]]] = [ApiResource, BusService, SchedulerService]
 
-    states: dict[str, "HassStateDict"]
     lock: FairAsyncRLock
     bus: Bus
     scheduler: Scheduler
@@ -136,7 +139,7 @@ class StateProxy(Resource):
             parent: The parent resource, if any.
         """
         super().__init__(hassette, parent=parent)
-        self.states = {}
+        self._states = StateIndex()
         self.lock = FairAsyncRLock()
         self.bus = self.add_child(Bus, priority=100)
         self.scheduler = self.add_child(Scheduler)
@@ -159,6 +162,17 @@ class StateProxy(Resource):
         # Bounds ERROR-level traceback logging during an extended connected-but-failing outage:
         # only the first failure per generation logs a full traceback, repeats downgrade to WARNING.
         self._last_logged_sync_failure_generation: int | None = None
+        self._entity_feed_enabled = hassette.config.state_proxy_feed == "subscribe_entities"
+        self._entity_feed: EntityDiffFeed | None = None
+
+    @property
+    def states(self) -> StateIndex:
+        """The state cache, ``entity_id -> state``, indexed by domain as well.
+
+        Every write publishes a new immutable ``StateSnapshot``; ``states.snapshot`` pins one
+        version for a consistent multi-key read; ``states.replace()`` swaps the whole cache.
+        """
+        return self._states
 
     @property
     def config_log_level(self) -> LOG_LEVEL_TYPE:
@@ -234,15 +248,18 @@ class StateProxy(Resource):
     async def subscribe_to_events(self) -> None:
         """Subscribe to state-changed events and websocket connect/disconnect observers.
 
-        Idempotent: a no-op if a state-changed subscription is already active.
+        Idempotent: a no-op if a state-changed subscription is already active. With the
+        ``subscribe_entities`` feed only the websocket observers are added — the feed itself is
+        opened by each synchronization.
         """
         if self.state_change_sub is not None:
             return
-        self.state_change_sub = await self.bus.on(
-            topic=Topic.HASS_EVENT_STATE_CHANGED,
-            handler=self.on_state_change,
-            name="hassette.state_proxy.on_state_change",
-        )
+        if not self._entity_feed_enabled:
+            self.state_change_sub = await self.bus.on(
+                topic=Topic.HASS_EVENT_STATE_CHANGED,
+                handler=self.on_state_change,
+                name="hassette.state_proxy.on_state_change",
+            )
         self.hassette.websocket_service.connected_observers.add(self._on_websocket_connected)
         self.hassette.websocket_service.disconnected_observers.add(self._on_websocket_disconnected)
 
@@ -252,6 +269,12 @@ class StateProxy(Resource):
             self.logger.warning("State proxy polling is disabled per configuration")
             return
 
+        if self._entity_feed_enabled:
+            # Every change reaches the cache through the subscribe_entities feed; there is nothing to poll for.
+            self.poll_job = None
+            self.logger.debug("State proxy polling is not used with the subscribe_entities feed")
+            return
+
         self.poll_job = await self.scheduler.run_every(
             self.load_cache,
             seconds=self.hassette.config.state_proxy_poll_interval_seconds,
@@ -300,6 +323,7 @@ class StateProxy(Resource):
             await asyncio.gather(self._sync_task, return_exceptions=True)
             self._sync_task = None
 
+        await self._close_entity_feed()
         self._active_sync = None
         self._pending_reconnect_generation = None
         self._synchronization_status = StateSynchronizationStatus.IDLE
@@ -312,7 +336,7 @@ class StateProxy(Resource):
         mark_not_ready(self, reason="Shutting down")
 
         async with self.lock:
-            self.states = {}
+            self.states.clear()
 
     @_retry_on_not_ready
     def get_state(self, entity_id: str) -> "HassStateDict | None":
@@ -355,6 +379,22 @@ class StateProxy(Resource):
         self._check_ready()
         return self.states.get(entity_id)
 
+    def get_state_revision(self, entity_id: str) -> int | None:
+        """Get the revision of an entity's cached state.
+
+        The revision changes whenever the entity's stored state does, and stays put otherwise
+        (including across a resynchronization that returns the same state), so it can key caches
+        derived from the state. It does not check readiness: an empty cache simply has no
+        revisions.
+
+        Args:
+            entity_id: The entity ID to look up (e.g., "light.kitchen").
+
+        Returns:
+            The revision if the entity is cached, None otherwise.
+        """
+        return self.states.revision(entity_id)
+
     def get_domain_states(self, domain: str) -> dict[str, "HassStateDict"]:
         """Get all cached states for a specific domain.
 
@@ -392,13 +432,11 @@ class StateProxy(Resource):
         """
         self._check_ready()
 
+        # Pinned now, so iteration sees one consistent version however long the consumer takes.
+        bucket = self.states.domain(domain)
+
         def iter_states() -> Generator[tuple[str, "HassStateDict"], Any, None]:
-            for eid, state in list(self.states.items()):
-                try:
-                    if extract_domain(eid) == domain:
-                        yield eid, state
-                except ValueError:
-                    self.logger.warning("State for entity %s has invalid 'entity_id' value", eid)
+            yield from bucket.items()
 
         return iter_states()
 
@@ -433,27 +471,93 @@ class StateProxy(Resource):
                 return
 
         self.logger.debug("State changed event for %s", entity_id)
-        async with self.lock:
-            if new_state_dict is None:
-                if entity_id in self.states:
-                    self.states.pop(entity_id)
-                    self._append_journal_operation(entity_id, None, event_generation)
-                    self.logger.debug("Removed state for %s", entity_id)
-                    return
-                self.logger.debug("Ignoring removal of unknown entity %s", entity_id)
+        if self._apply_state(entity_id, new_state_dict, event_generation) and new_state_dict is not None:
+            if old_state_dict is None:
+                self.logger.debug("Added state for %s", entity_id)
+            else:
+                self.logger.debug("Updated state for %s", entity_id)
+
+    def _apply_state(
+        self,
+        entity_id: str,
+        new_state_dict: "HassStateDict | None",
+        event_generation: int | None,
+    ) -> bool:
+        """Apply one entity's new state (None for a removal) to the cache.
+
+        Takes no lock: it never awaits, so it runs atomically on the event loop, and the
+        synchronization steps guarded by ``self.lock`` never await while holding it either. The
+        write publishes a new ``StateSnapshot``, which readers pick up without locking.
+
+        Returns:
+            True if the cache changed; False for an out-of-date update or the removal of an
+            unknown entity.
+        """
+        if new_state_dict is None:
+            if entity_id in self.states:
+                self.states.pop(entity_id)
                 self._append_journal_operation(entity_id, None, event_generation)
+                self.logger.debug("Removed state for %s", entity_id)
+                return True
+            self.logger.debug("Ignoring removal of unknown entity %s", entity_id)
+            self._append_journal_operation(entity_id, None, event_generation)
+            return False
+
+        if self._is_older_or_equal_state(self.states.get(entity_id), new_state_dict):
+            self.logger.debug("Ignoring out-of-date state update for %s", entity_id)
+            return False
+
+        self.states[entity_id] = new_state_dict
+        self._append_journal_operation(entity_id, new_state_dict, event_generation)
+        return True
+
+    async def _subscribe_entity_feed(self, generation: int) -> list["HassStateDict"]:
+        """Open a fresh ``subscribe_entities`` feed for ``generation`` and return its initial snapshot.
+
+        Any previous feed is closed first. The snapshot stands in for ``get_states_raw()`` in a
+        synchronization; every later message is applied to the cache as it arrives, and — when
+        some bus listener wants them — republished as synthesized ``state_changed`` events.
+        """
+        await self._close_entity_feed()
+        websocket_service = self.hassette.websocket_service
+        feed = self._entity_feed = EntityDiffFeed(generation)
+        snapshot: asyncio.Future[list[HassStateDict]] = self.hassette.loop.create_future()
+
+        async def on_message(message: dict[str, Any]) -> None:
+            if self._entity_feed is not feed:
+                return
+            received_at = date_utils.now()
+            changes = feed.apply(message)
+            if not snapshot.done():
+                snapshot.set_result(list(feed.states.values()))
+                return
+            if websocket_service.get_connected_generation() != feed.generation:
                 return
 
-            if self._is_older_or_equal_state(self.states.get(entity_id), new_state_dict):
-                self.logger.debug("Ignoring out-of-date state update for %s", entity_id)
+            applied = [
+                change for change in changes if self._apply_state(change.entity_id, change.new_state, feed.generation)
+            ]
+            if not applied or not self.hassette.bus_service.demands_event_type(STATE_CHANGED_EVENT_TYPE):
                 return
+            for change in applied:
+                event = make_state_change_event(change, received_at)
+                stamp_websocket_generation(event, feed.generation)
+                await self.hassette.send_event(event)
 
-            self.states[entity_id] = new_state_dict
-            self._append_journal_operation(entity_id, new_state_dict, event_generation)
-            if old_state_dict is None:
-                self.logger.debug("Added state for %s", entity_id)
-            else:
-                self.logger.debug("Updated state for %s", entity_id)
+        try:
+            feed.subscription_id = await websocket_service.subscribe_entities(on_message)
+            return await asyncio.wait_for(snapshot, timeout=websocket_service.resp_timeout_seconds)
+        except BaseException:
+            await self._close_entity_feed()
+            raise
+
+    async def _close_entity_feed(self) -> None:
+        """Drop the current ``subscribe_entities`` feed, unsubscribing if its connection is still up."""
+        feed, self._entity_feed = self._entity_feed, None
+        if feed is None or feed.subscription_id is None:
+            return
+        if self.hassette.websocket_service.get_connected_generation() == feed.generation:
+            await self.hassette.websocket_service.unsubscribe(feed.subscription_id)
 
     def _append_journal_operation(
         self,
@@ -477,6 +581,7 @@ class StateProxy(Resource):
         or to UNAVAILABLE otherwise.
         """
         await self._cancel_retry_task()
+        self._entity_feed = None
 
         sync_task = await self._detach_active_sync_task()
         if sync_task is not None:
@@ -648,7 +753,10 @@ class StateProxy(Resource):
             raise RuntimeError("StateProxy synchronization must run inside an asyncio task")
         baseline_states = await self._begin_synchronization(request_id=request_id, generation=generation, status=status)
         try:
-            raw_states = await self.hassette.api.get_states_raw()
+            if self._entity_feed_enabled:
+                raw_states = await self._subscribe_entity_feed(generation)
+            else:
+                raw_states = await self.hassette.api.get_states_raw()
             candidate_states = self._build_candidate_states(raw_states, baseline_states)
             await self._commit_candidate_states(
                 request_id=request_id,
@@ -758,7 +866,7 @@ class StateProxy(Resource):
                 else:
                     candidate_states[operation.entity_id] = operation.state
 
-            self.states = candidate_states
+            self.states.replace(candidate_states)
             self._cache_freshness = StateCacheFreshness.FRESH
             self._maintained_generation = generation
             self._retry_attempt = 0
@@ -4,7 +4,13 @@ import time
 from typing import TYPE_CHECKING, Any
 
 from hassette.const.misc import SECONDS_PER_HOUR
-from hassette.core.telemetry.helpers import handler_job_union_arms, row_to_dict, since_clause, source_tier_clause
+from hassette.core.telemetry.helpers import (
+    execution_stats_source,
+    handler_job_union_arms,
+    row_to_dict,
+    since_clause,
+    source_tier_clause,
+)
 from hassette.schemas.execution_models import ActivityFeedEntry, AppLastError, Execution
 from hassette.schemas.query_constants import DEFAULT_QUERY_LIMIT, DEFAULT_SPARKLINE_BUCKETS
 from hassette.types.types import QuerySourceTier
@@ -180,8 +186,9 @@ class ExecutionQueriesMixin:
     ) -> dict[str, list[tuple[int, int]]]:
         """Return bucketed ok/err counts per app_key for sparkline charts.
 
-        Queries the unified ``executions`` table and joins through
-        ``listeners``/``scheduled_jobs`` to resolve ``app_key``.
+        Queries ``execution_stats_source()`` and joins through ``listeners``/``scheduled_jobs``
+        to resolve ``app_key``. The sparkline bucket edges are passed as its ``boundaries``, so
+        a minute bucket is only used when it falls wholly inside one sparkline bucket.
 
         Returns:
             Dict mapping app_key to a list of ``(ok, err)`` tuples per bucket.
@@ -191,27 +198,30 @@ class ExecutionQueriesMixin:
 
         bucket_width = (now - since) / num_buckets
 
+        stats_source, stats_params = execution_stats_source(
+            since, now, boundaries=[since + i * bucket_width for i in range(1, num_buckets)]
+        )
+
         handler_select = """
-            SELECT l.app_key, e_h.status,
+            SELECT l.app_key, e_h.success_count, e_h.error_count + e_h.timed_out_count AS failure_count,
                 CAST((e_h.execution_start_ts - :since) / :bucket_width AS INTEGER) AS bucket_idx
         """
         job_select = """
-            SELECT sj.app_key, e_j.status,
+            SELECT sj.app_key, e_j.success_count, e_j.error_count + e_j.timed_out_count AS failure_count,
                 CAST((e_j.execution_start_ts - :since) / :bucket_width AS INTEGER) AS bucket_idx
         """
         union_fragment, union_params = handler_job_union_arms(
             handler_select,
             job_select,
-            extra_handler_where="AND e_h.execution_start_ts >= :since AND e_h.execution_start_ts < :now",
-            extra_job_where="AND e_j.execution_start_ts >= :since AND e_j.execution_start_ts < :now",
             since=None,
             source_tier=source_tier,
+            source=stats_source,
         )
 
         query = f"""
             SELECT app_key, bucket_idx,
-                SUM(CASE WHEN status = 'success' THEN 1 ELSE 0 END) AS ok,
-                SUM(CASE WHEN status IN ('error', 'timed_out') THEN 1 ELSE 0 END) AS err
+                SUM(success_count) AS ok,
+                SUM(failure_count) AS err
             FROM (
                 {union_fragment}
             ) combined
@@ -221,9 +231,9 @@ class ExecutionQueriesMixin:
 
         params: dict[str, Any] = {
             "since": since,
-            "now": now,
             "bucket_width": bucket_width,
             "num_buckets": num_buckets,
+            **stats_params,
             **union_params,
         }
 
@@ -295,17 +305,17 @@ class ExecutionQueriesMixin:
         """
         one_hour_ago = time.time() - SECONDS_PER_HOUR
         tier_clause, tier_params = source_tier_clause(source_tier, "e")
+        stats_source, stats_params = execution_stats_source(one_hour_ago)
 
         query = f"""
-            SELECT l.app_key, COUNT(e.rowid) AS invocation_count
-            FROM executions e
+            SELECT l.app_key, SUM(e.execution_count) AS invocation_count
+            FROM {stats_source} e
             JOIN listeners l ON l.id = e.listener_id
             WHERE e.kind = 'handler'
-              AND e.execution_start_ts >= :since
               {tier_clause}
             GROUP BY l.app_key
         """
-        params: dict[str, Any] = {"since": one_hour_ago, **tier_params}
+        params: dict[str, Any] = {**stats_params, **tier_params}
         async with self.execute(query, params) as cursor:
             rows = await cursor.fetchall()
         return {row[0]: int(row[1]) for row in rows}
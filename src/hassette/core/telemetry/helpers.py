@@ -4,6 +4,7 @@ Contains clause-builders, row converters, and the AppHealthAggregates dataclass
 used across registration_queries, execution_queries, and summary_queries.
 """
 
+import math
 import sqlite3
 from collections.abc import Iterable
 from dataclasses import dataclass
@@ -11,6 +12,7 @@ from typing import Any, assert_never
 
 import aiosqlite
 
+from hassette.core.telemetry.repository import ROLLUP_BUCKET_SECONDS
 from hassette.schemas.summary_models import AppHealthSummary
 from hassette.types.types import QuerySourceTier, is_framework_key
 
@@ -28,6 +30,36 @@ DEFAULT_LOG_RECORDS_LIMIT = 100
 DEFAULT_EXECUTION_LOG_LIMIT = 500
 """Default row cap for log records of a single execution (get_log_records_by_execution)."""
 
+# Columns of every execution_stats_source() arm. Each row stands for execution_count executions;
+# duration columns cover the non-skipped ones only, so averages divide total_duration_ms by
+# (execution_count - skipped_count).
+_STATS_BUCKET_SELECT = """
+    SELECT kind, listener_id, job_id, source_tier,
+        bucket_start_ts AS execution_start_ts, last_execution_ts,
+        execution_count, success_count, error_count, timed_out_count, cancelled_count,
+        skipped_count, di_failure_count, thread_leaked_count,
+        total_duration_ms, min_duration_ms, max_duration_ms
+    FROM execution_buckets
+"""
+_STATS_ROLLUP_SELECT = """
+    SELECT kind, listener_id, job_id, source_tier,
+        bucket_start_ts, bucket_start_ts,
+        execution_count, execution_count, 0, 0, 0,
+        0, 0, 0,
+        total_duration_ms, min_duration_ms, max_duration_ms
+    FROM execution_rollups
+"""
+_STATS_ROW_SELECT = """
+    SELECT kind, listener_id, job_id, source_tier,
+        execution_start_ts, execution_start_ts,
+        1, status = 'success', status = 'error', status = 'timed_out', status = 'cancelled',
+        status = 'skipped', is_di_failure != 0, thread_leaked != 0,
+        CASE WHEN status != 'skipped' THEN duration_ms ELSE 0.0 END,
+        CASE WHEN status != 'skipped' THEN duration_ms END,
+        CASE WHEN status != 'skipped' THEN duration_ms END
+    FROM executions
+"""
+
 # Exports the package's public constants plus the clause-builders shared by the query
 # mixins. The clause-builders keep their underscore prefix (package-internal, not for
 # callers outside hassette.core.telemetry); listing them here marks them as exported so
@@ -39,6 +71,7 @@ __all__ = [
     "STORAGE_ERRORS",
     "AppHealthAggregates",
     "build_app_summaries",
+    "execution_stats_source",
     "handler_job_union_arms",
     "row_to_dict",
     "since_clause",
@@ -50,8 +83,8 @@ __all__ = [
 class AppHealthAggregates:
     """Single-row aggregate result returned by ``get_app_health_aggregates()``.
 
-    All counts and averages are computed in a single query over the ``executions``
-    table - no per-item detail fetching or Python-side aggregation.
+    All counts and averages are computed in a single query over ``execution_stats_source()``
+    - no per-item detail fetching or Python-side aggregation.
     """
 
     total_invocations: int
@@ -107,6 +140,98 @@ def since_clause(since: float | None, timestamp_col: str) -> tuple[str, dict[str
     return (f"AND {timestamp_col} >= :since", {"since": since})
 
 
+def execution_stats_source(
+    since: float | None = None,
+    until: float | None = None,
+    *,
+    boundaries: Iterable[float] = (),
+) -> tuple[str, dict[str, float]]:
+    """Return a (subquery, params) tuple covering the executions in ``[since, until)``.
+
+    The subquery unions three arms of the same shape (see ``_STATS_BUCKET_SELECT``):
+
+    - ``execution_buckets`` rows for every whole minute inside the window,
+    - raw ``executions`` rows for the partial minutes at the window's edges, and for any
+      minute that a ``boundaries`` value splits,
+    - ``execution_rollups`` rows (successes without an executions row) whose bucket starts
+      inside the window.
+
+    Counts for executions with a row are therefore exact at any ``since``/``until``, while
+    reading O(minutes) bucket rows plus at most a few minutes of raw rows. Rolled-up successes
+    are placed at their bucket start, so the ones in a window's first partial minute are not
+    counted. Sum the count columns rather than ``COUNT(*)``.
+
+    Args:
+        since: Inclusive lower bound (Unix epoch float), or ``None`` for no lower bound.
+        until: Exclusive upper bound (Unix epoch float), or ``None`` for no upper bound.
+        boundaries: Timestamps the caller groups on (e.g. sparkline bucket edges). A minute
+            containing one is read from raw rows so each row lands on the correct side.
+
+    Returns:
+        A ``(sql_fragment, params)`` tuple. ``sql_fragment`` is a parenthesised subquery for
+        use as ``FROM {fragment} e``; its bind params are all prefixed ``stats_``.
+    """
+    width = ROLLUP_BUCKET_SECONDS
+    params: dict[str, float] = {}
+    bucket_where: list[str] = []
+    rollup_where: list[str] = []
+    raw_ranges: list[tuple[float, float]] = []
+
+    # [first_whole, last_whole) bounds the whole minutes inside the window; the partial
+    # minutes outside it are read from raw rows. An open end leaves its bound infinite.
+    first_whole = -math.inf
+    last_whole = math.inf
+    if since is not None:
+        first_whole = float(-(-math.ceil(since) // width) * width)
+        rollup_where.append("bucket_start_ts >= :stats_since")
+        params["stats_since"] = since
+    if until is not None:
+        last_whole = float(math.floor(until) // width * width)
+        rollup_where.append("bucket_start_ts < :stats_until")
+        params["stats_until"] = until
+
+    if since is not None and until is not None and first_whole >= last_whole:
+        # No whole minute inside the window: read all of it from raw rows.
+        raw_ranges.append((since, until))
+        bucket_where.append("0")
+    else:
+        if since is not None:
+            bucket_where.append("bucket_start_ts >= :stats_first_whole")
+            params["stats_first_whole"] = first_whole
+            if since < first_whole:
+                raw_ranges.append((since, first_whole))
+        if until is not None:
+            bucket_where.append("bucket_start_ts < :stats_last_whole")
+            params["stats_last_whole"] = last_whole
+            if last_whole < until:
+                raw_ranges.append((last_whole, until))
+        split_minutes = sorted(
+            {float(math.floor(b) // width * width) for b in boundaries if b % width and first_whole < b < last_whole}
+        )
+        for i, minute in enumerate(split_minutes):
+            params[f"stats_split_{i}"] = minute
+            raw_ranges.append((minute, minute + width))
+        if split_minutes:
+            names = ", ".join(f":stats_split_{i}" for i in range(len(split_minutes)))
+            bucket_where.append(f"bucket_start_ts NOT IN ({names})")
+
+    arms = [
+        _STATS_BUCKET_SELECT + (f"WHERE {' AND '.join(bucket_where)}" if bucket_where else ""),
+        _STATS_ROLLUP_SELECT + (f"WHERE {' AND '.join(rollup_where)}" if rollup_where else ""),
+    ]
+    if raw_ranges:
+        range_clauses = []
+        for i, (lo, hi) in enumerate(raw_ranges):
+            params[f"stats_raw_lo_{i}"] = lo
+            params[f"stats_raw_hi_{i}"] = hi
+            range_clauses.append(
+                f"(execution_start_ts >= :stats_raw_lo_{i} AND execution_start_ts < :stats_raw_hi_{i})"
+            )
+        arms.append(_STATS_ROW_SELECT + f"WHERE {' OR '.join(range_clauses)}")
+
+    return (f"({' UNION ALL '.join(arms)})", params)
+
+
 def handler_job_union_arms(
     handler_select: str,
     job_select: str,
@@ -116,6 +241,7 @@ def handler_job_union_arms(
     since: float | None = None,
     source_tier: QuerySourceTier = "app",
     instance_index: int | None = None,
+    source: str = "executions",
 ) -> tuple[str, dict[str, Any]]:
     """Build handler UNION ALL job SQL fragment with merged params.
 
@@ -144,6 +270,8 @@ def handler_job_union_arms(
             via ``extra_handler_where``/``extra_job_where``).
         source_tier: Filter by source tier.
         instance_index: When provided, restricts each arm to that instance only.
+        source: The table both arms read, or a subquery from ``execution_stats_source()``
+            (whose rows must then be counted by summing ``execution_count``).
 
     Returns:
         A ``(sql_fragment, params)`` tuple. ``sql_fragment`` is the two-arm ``UNION ALL``
@@ -166,7 +294,7 @@ def handler_job_union_arms(
 
     fragment = f"""
         {handler_select}
-        FROM executions e_h
+        FROM {source} e_h
         JOIN listeners l ON l.id = e_h.listener_id
         WHERE e_h.kind = 'handler'
           {extra_handler_where}
@@ -177,7 +305,7 @@ def handler_job_union_arms(
         UNION ALL
 
         {job_select}
-        FROM executions e_j
+        FROM {source} e_j
         JOIN scheduled_jobs sj ON sj.id = e_j.job_id
         WHERE e_j.kind = 'job'
           {extra_job_where}
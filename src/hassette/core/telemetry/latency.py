@@ -0,0 +1,94 @@
+"""Log-bucketed latency histograms for per-listener and per-job duration percentiles.
+
+``CommandExecutor`` keeps one ``LatencyHistogram`` per listener and job in memory, records every
+execution's duration into it, and periodically folds the counts into the ``latency_histograms``
+table (see ``015.sql``). The query side sums those stored counts per bucket index and rebuilds a
+histogram to read percentiles from, without touching the ``executions`` table.
+"""
+
+import math
+from collections.abc import Iterable
+
+LATENCY_MIN_MS = 0.01
+"""Upper bound of bucket 0; every duration at or below it lands there."""
+
+LATENCY_SUB_BUCKETS = 8
+"""Buckets per doubling of duration. Each bucket spans a factor of 2**(1/8), about 9%."""
+
+LATENCY_PERIOD_SECONDS = 3600
+"""Width of a ``latency_histograms`` period in seconds. Percentiles over a window resolve to it."""
+
+
+def latency_bucket_index(duration_ms: float) -> int:
+    """Return the histogram bucket index for ``duration_ms``."""
+    if duration_ms <= LATENCY_MIN_MS:
+        return 0
+    return 1 + math.floor(math.log2(duration_ms / LATENCY_MIN_MS) * LATENCY_SUB_BUCKETS)
+
+
+def latency_bucket_upper_ms(index: int) -> float:
+    """Return the upper bound in milliseconds of histogram bucket ``index``."""
+    return LATENCY_MIN_MS * 2 ** (index / LATENCY_SUB_BUCKETS)
+
+
+class LatencyHistogram:
+    """Duration histogram with logarithmically spaced buckets.
+
+    Memory grows with the number of distinct buckets hit, not with the number of samples: a
+    handler whose durations span 1ms to 10s touches about 110 buckets. A percentile is reported
+    as the upper bound of the bucket it falls in, so it overstates the true value by at most one
+    bucket width (about 9%), and never exceeds the largest recorded duration.
+    """
+
+    __slots__ = ("count", "counts", "max_ms")
+
+    counts: dict[int, int]
+    """Sample count per bucket index."""
+
+    count: int
+    """Total number of samples."""
+
+    max_ms: float
+    """Largest recorded duration in milliseconds, or 0.0 when empty."""
+
+    def __init__(self) -> None:
+        self.counts = {}
+        self.count = 0
+        self.max_ms = 0.0
+
+    @classmethod
+    def from_counts(cls, counts: Iterable[tuple[int, int]], max_ms: float | None = None) -> "LatencyHistogram":
+        """Build a histogram from ``(bucket_index, count)`` pairs, as summed from storage.
+
+        ``max_ms`` caps the reported percentiles; without it they are capped at the upper bound of
+        the highest populated bucket.
+        """
+        histogram = cls()
+        for index, count in counts:
+            histogram.counts[index] = histogram.counts.get(index, 0) + count
+            histogram.count += count
+        if max_ms is not None:
+            histogram.max_ms = max_ms
+        elif histogram.counts:
+            histogram.max_ms = latency_bucket_upper_ms(max(histogram.counts))
+        return histogram
+
+    def record(self, duration_ms: float) -> None:
+        """Add one sample."""
+        index = latency_bucket_index(duration_ms)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        if duration_ms > self.max_ms:
+            self.max_ms = duration_ms
+
+    def percentile(self, percent: float) -> float | None:
+        """Return the ``percent`` percentile in milliseconds, or None when the histogram is empty."""
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(self.count * percent / 100))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(latency_bucket_upper_ms(index), self.max_ms)
+        return self.max_ms
@@ -2,7 +2,8 @@
 
 from typing import TYPE_CHECKING, Any
 
-from hassette.core.telemetry.helpers import row_to_dict, since_clause, source_tier_clause
+from hassette.core.telemetry.helpers import execution_stats_source, row_to_dict, since_clause, source_tier_clause
+from hassette.core.telemetry.latency import LATENCY_PERIOD_SECONDS, LatencyHistogram
 from hassette.schemas.job_models import JobSummary
 from hassette.schemas.listener_models import ListenerSummary, SlowHandlerRecord
 from hassette.schemas.query_constants import DEFAULT_QUERY_LIMIT
@@ -15,6 +16,28 @@ if TYPE_CHECKING:
     import aiosqlite
 
 
+def _latency_since_clause(since: float | None) -> tuple[str, dict[str, Any]]:
+    """Return an ``AND lh.period_start_ts >= ...`` clause covering the hour that contains ``since``.
+
+    Histogram periods are whole hours, so a window starting mid-hour includes that hour's samples.
+    """
+    if since is None:
+        return "", {}
+    period_start = float(int(since) // LATENCY_PERIOD_SECONDS * LATENCY_PERIOD_SECONDS)
+    return "AND lh.period_start_ts >= :latency_since", {"latency_since": period_start}
+
+
+def _with_percentiles(row: dict[str, Any], latency: dict[int, list[tuple[int, int]]], id_key: str) -> dict[str, Any]:
+    """Add ``p50``/``p90``/``p99_duration_ms`` to a summary row from its summed histogram counts."""
+    counts = latency.get(row[id_key])
+    if counts:
+        histogram = LatencyHistogram.from_counts(counts, max_ms=row.get("max_duration_ms"))
+        row["p50_duration_ms"] = histogram.percentile(50)
+        row["p90_duration_ms"] = histogram.percentile(90)
+        row["p99_duration_ms"] = histogram.percentile(99)
+    return row
+
+
 class RegistrationQueriesMixin:
     """Listener/job registration-summary query methods, mixed into TelemetryQueryService."""
 
@@ -22,6 +45,14 @@ class RegistrationQueriesMixin:
         # Provided by TelemetryQueryService; declared for type narrowing within the mixin.
         execute: "Callable[..., AbstractAsyncContextManager[aiosqlite.Cursor]]"
 
+    async def _latency_counts(self, query: str, params: dict[str, Any]) -> dict[int, list[tuple[int, int]]]:
+        """Run a ``(owner_id, bucket_index, sample_count)`` histogram query and group it by owner."""
+        counts: dict[int, list[tuple[int, int]]] = {}
+        async with self.execute(query, params) as cursor:
+            for owner_id, bucket_index, sample_count in await cursor.fetchall():
+                counts.setdefault(owner_id, []).append((bucket_index, sample_count))
+        return counts
+
     async def get_listener_summary(
         self,
         app_key: str | None = None,
@@ -43,10 +74,8 @@ class RegistrationQueriesMixin:
             source_tier: Filter listeners by source tier.
         """
         tier_clause, tier_params = source_tier_clause(source_tier, "l")
-        since_join_clause, since_params = since_clause(since, "e.execution_start_ts")
-        since_err_clause, _ = since_clause(since, "e_err.execution_start_ts")
-
-        join_condition = f"e.listener_id = l.id {since_join_clause}"
+        since_err_clause, since_params = since_clause(since, "e_err.execution_start_ts")
+        stats_source, stats_params = execution_stats_source(since)
 
         if app_key is not None:
             where_clause = "l.app_key = :app_key AND l.instance_index = :instance_index"
@@ -55,10 +84,11 @@ class RegistrationQueriesMixin:
                 "instance_index": instance_index if instance_index is not None else 0,
                 **tier_params,
                 **since_params,
+                **stats_params,
             }
         else:
             where_clause = "1=1"
-            params = {**tier_params, **since_params}
+            params = {**tier_params, **since_params, **stats_params}
 
         query = f"""
             WITH ranked_errors AS (
@@ -89,23 +119,23 @@ class RegistrationQueriesMixin:
                 l.entity_id,
                 l.mode,
                 l.backpressure,
-                COUNT(e.rowid) AS total_invocations,
-                SUM(CASE WHEN e.status = 'success' THEN 1 ELSE 0 END) AS successful,
-                SUM(CASE WHEN e.status = 'error' THEN 1 ELSE 0 END) AS failed,
-                SUM(CASE WHEN e.is_di_failure = 1 THEN 1 ELSE 0 END) AS di_failures,
-                SUM(CASE WHEN e.status = 'cancelled' THEN 1 ELSE 0 END) AS cancelled,
-                SUM(CASE WHEN e.status = 'timed_out' THEN 1 ELSE 0 END) AS timed_out,
-                SUM(CASE WHEN e.thread_leaked = 1 THEN 1 ELSE 0 END) AS thread_leaked,
-                COALESCE(SUM(e.duration_ms), 0.0) AS total_duration_ms,
-                COALESCE(AVG(e.duration_ms), 0.0) AS avg_duration_ms,
-                MIN(e.duration_ms) AS min_duration_ms,
-                MAX(e.duration_ms) AS max_duration_ms,
-                MAX(e.execution_start_ts) AS last_invoked_at,
+                COALESCE(SUM(e.execution_count), 0) AS total_invocations,
+                COALESCE(SUM(e.success_count), 0) AS successful,
+                COALESCE(SUM(e.error_count), 0) AS failed,
+                COALESCE(SUM(e.di_failure_count), 0) AS di_failures,
+                COALESCE(SUM(e.cancelled_count), 0) AS cancelled,
+                COALESCE(SUM(e.timed_out_count), 0) AS timed_out,
+                COALESCE(SUM(e.thread_leaked_count), 0) AS thread_leaked,
+                COALESCE(SUM(e.total_duration_ms), 0.0) AS total_duration_ms,
+                COALESCE(SUM(e.total_duration_ms) / SUM(e.execution_count), 0.0) AS avg_duration_ms,
+                MIN(e.min_duration_ms) AS min_duration_ms,
+                MAX(e.max_duration_ms) AS max_duration_ms,
+                MAX(e.last_execution_ts) AS last_invoked_at,
                 last_err.error_type AS last_error_type,
                 last_err.error_message AS last_error_message,
                 last_err.error_traceback AS last_error_traceback
             FROM listeners l
-            LEFT JOIN executions e ON {join_condition} AND e.kind = 'handler'
+            LEFT JOIN {stats_source} e ON e.listener_id = l.id AND e.kind = 'handler'
             LEFT JOIN ranked_errors last_err ON last_err.listener_id = l.id AND last_err.rn = 1
             WHERE {where_clause}
             AND l.removed_at IS NULL
@@ -114,7 +144,24 @@ class RegistrationQueriesMixin:
         """
         async with self.execute(query, params) as cursor:
             rows = await cursor.fetchall()
-        return [ListenerSummary.model_validate(row_to_dict(row)) for row in rows]
+
+        latency_clause, latency_params = _latency_since_clause(since)
+        latency = await self._latency_counts(
+            f"""
+            SELECT lh.listener_id, lh.bucket_index, SUM(lh.sample_count)
+            FROM latency_histograms lh
+            JOIN listeners l ON l.id = lh.listener_id
+            WHERE {where_clause}
+            AND l.removed_at IS NULL
+            {tier_clause}
+            {latency_clause}
+            GROUP BY lh.listener_id, lh.bucket_index
+            """,
+            {**params, **latency_params},
+        )
+        return [
+            ListenerSummary.model_validate(_with_percentiles(row_to_dict(row), latency, "listener_id")) for row in rows
+        ]
 
     async def get_job_summary(
         self,
@@ -137,10 +184,8 @@ class RegistrationQueriesMixin:
             source_tier: Filter jobs by source tier.
         """
         tier_clause, tier_params = source_tier_clause(source_tier, "sj")
-        since_join_clause, since_params = since_clause(since, "e.execution_start_ts")
-        since_err_clause, _ = since_clause(since, "e_err.execution_start_ts")
-
-        join_condition = f"e.job_id = sj.id {since_join_clause}"
+        since_err_clause, since_params = since_clause(since, "e_err.execution_start_ts")
+        stats_source, stats_params = execution_stats_source(since)
 
         if app_key is not None:
             where_clause = "sj.app_key = :app_key AND sj.instance_index = :instance_index"
@@ -149,10 +194,11 @@ class RegistrationQueriesMixin:
                 "instance_index": instance_index if instance_index is not None else 0,
                 **tier_params,
                 **since_params,
+                **stats_params,
             }
         else:
             where_clause = "1=1"
-            params = {**tier_params, **since_params}
+            params = {**tier_params, **since_params, **stats_params}
 
         query = f"""
             WITH ranked_errors AS (
@@ -183,24 +229,24 @@ class RegistrationQueriesMixin:
                 sj.human_description,
                 sj.schedule_status,
                 sj.schedule_status_reason,
-                COUNT(e.rowid) AS total_executions,
-                SUM(CASE WHEN e.status = 'success' THEN 1 ELSE 0 END) AS successful,
-                SUM(CASE WHEN e.status = 'error' THEN 1 ELSE 0 END) AS failed,
-                SUM(CASE WHEN e.status = 'cancelled' THEN 1 ELSE 0 END) AS cancelled,
-                SUM(CASE WHEN e.status = 'timed_out' THEN 1 ELSE 0 END) AS timed_out,
-                SUM(CASE WHEN e.status = 'skipped' THEN 1 ELSE 0 END) AS skipped,
-                SUM(CASE WHEN e.thread_leaked = 1 THEN 1 ELSE 0 END) AS thread_leaked,
-                MAX(e.execution_start_ts) AS last_executed_at,
-                COALESCE(SUM(e.duration_ms), 0.0) AS total_duration_ms,
-                COALESCE(AVG(CASE WHEN e.status != 'skipped' THEN e.duration_ms END), 0.0) AS avg_duration_ms,
-                MIN(CASE WHEN e.status != 'skipped' THEN e.duration_ms END) AS min_duration_ms,
-                MAX(CASE WHEN e.status != 'skipped' THEN e.duration_ms END) AS max_duration_ms,
+                COALESCE(SUM(e.execution_count), 0) AS total_executions,
+                COALESCE(SUM(e.success_count), 0) AS successful,
+                COALESCE(SUM(e.error_count), 0) AS failed,
+                COALESCE(SUM(e.cancelled_count), 0) AS cancelled,
+                COALESCE(SUM(e.timed_out_count), 0) AS timed_out,
+                COALESCE(SUM(e.skipped_count), 0) AS skipped,
+                COALESCE(SUM(e.thread_leaked_count), 0) AS thread_leaked,
+                MAX(e.last_execution_ts) AS last_executed_at,
+                COALESCE(SUM(e.total_duration_ms), 0.0) AS total_duration_ms,
+                COALESCE(SUM(e.total_duration_ms) / SUM(e.execution_count - e.skipped_count), 0.0) AS avg_duration_ms,
+                MIN(e.min_duration_ms) AS min_duration_ms,
+                MAX(e.max_duration_ms) AS max_duration_ms,
                 last_err.error_type AS last_error_type,
                 last_err.error_message AS last_error_message,
                 last_err.execution_start_ts AS last_error_ts,
                 last_err.error_traceback AS last_error_traceback
             FROM scheduled_jobs sj
-            LEFT JOIN executions e ON {join_condition} AND e.kind = 'job'
+            LEFT JOIN {stats_source} e ON e.job_id = sj.id AND e.kind = 'job'
             LEFT JOIN ranked_errors last_err ON last_err.job_id = sj.id AND last_err.rn = 1
             WHERE {where_clause}
             AND sj.removed_at IS NULL
@@ -210,7 +256,23 @@ class RegistrationQueriesMixin:
         """
         async with self.execute(query, params) as cursor:
             rows = await cursor.fetchall()
-        return [JobSummary.model_validate(row_to_dict(row)) for row in rows]
+
+        latency_clause, latency_params = _latency_since_clause(since)
+        latency = await self._latency_counts(
+            f"""
+            SELECT lh.job_id, lh.bucket_index, SUM(lh.sample_count)
+            FROM latency_histograms lh
+            JOIN scheduled_jobs sj ON sj.id = lh.job_id
+            WHERE {where_clause}
+            AND sj.removed_at IS NULL
+            AND sj.retired_at IS NULL
+            {tier_clause}
+            {latency_clause}
+            GROUP BY lh.job_id, lh.bucket_index
+            """,
+            {**params, **latency_params},
+        )
+        return [JobSummary.model_validate(_with_percentiles(row_to_dict(row), latency, "job_id")) for row in rows]
 
     async def get_slow_handlers(
         self,
@@ -2,8 +2,10 @@
 
 import sqlite3
 import time
+from bisect import bisect_left
 from logging import Logger, getLogger
-from typing import TYPE_CHECKING, Any
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Literal
 
 from hassette.config.classes import AppManifest
 from hassette.core.execution_record import ExecutionRecord
@@ -17,6 +19,7 @@ if TYPE_CHECKING:
     import aiosqlite
 
     from hassette.core.database_service import DatabaseService
+    from hassette.core.telemetry.latency import LatencyHistogram
 
 
 # The reconciliation query builders interpolate ``table`` and ``history_fk`` directly into
@@ -25,6 +28,40 @@ if TYPE_CHECKING:
 _RECONCILE_TABLES = frozenset({"listeners", "scheduled_jobs"})
 _RECONCILE_FK_COLUMNS = frozenset({"listener_id", "job_id"})
 
+ROLLUP_BUCKET_SECONDS = 60
+"""Width of an ``execution_rollups`` and ``execution_buckets`` bucket in seconds (see 014.sql)."""
+
+# Upper bounds of the execution_rollups histogram columns; longer durations count in gt_10s_count.
+_ROLLUP_HISTOGRAM_BOUNDS_MS = (1.0, 10.0, 100.0, 1_000.0, 10_000.0)
+_ROLLUP_KEY_COLUMNS = ("kind", "listener_id", "job_id", "session_id", "source_tier", "bucket_start_ts")
+_ROLLUP_HISTOGRAM_COLUMNS = (
+    "le_1ms_count",
+    "le_10ms_count",
+    "le_100ms_count",
+    "le_1s_count",
+    "le_10s_count",
+    "gt_10s_count",
+)
+_ROLLUP_COLUMNS = (
+    *_ROLLUP_KEY_COLUMNS,
+    "execution_count",
+    "total_duration_ms",
+    "min_duration_ms",
+    "max_duration_ms",
+    *_ROLLUP_HISTOGRAM_COLUMNS,
+)
+
+# latency_histograms upserts, one per FK column's partial unique index (015.sql).
+_LATENCY_UPSERT_SQL = {
+    kind: (
+        f"INSERT INTO latency_histograms (kind, {fk_column}, period_start_ts, bucket_index, sample_count) "
+        "VALUES (?, ?, ?, ?, ?) "
+        f"ON CONFLICT ({fk_column}, period_start_ts, bucket_index) WHERE {fk_column} IS NOT NULL "
+        "DO UPDATE SET sample_count = sample_count + excluded.sample_count"
+    )
+    for kind, fk_column in (("handler", "listener_id"), ("job", "job_id"))
+}
+
 
 def execution_insert_params(record: ExecutionRecord) -> dict[str, Any]:
     """Build the named-parameter dict for an executions INSERT.
@@ -78,6 +115,96 @@ _EXECUTION_INSERT_SQL = (
     f"VALUES ({', '.join(f':{c}' for c in _EXECUTION_INSERT_COLUMNS)})"
 )
 
+# The batch path binds positional rows instead of named-parameter dicts: every column is a
+# record attribute of the same name, so one C-level attrgetter call reads a whole row.
+# sqlite3 binds bool as the integer 0/1, matching execution_insert_params' explicit casts.
+_EXECUTION_ROW_SQL = (
+    f"INSERT INTO executions ({', '.join(_EXECUTION_INSERT_COLUMNS)}) "
+    f"VALUES ({', '.join('?' for _ in _EXECUTION_INSERT_COLUMNS)})"
+)
+_execution_row = attrgetter(*_EXECUTION_INSERT_COLUMNS)
+_SESSION_ID_INDEX = _EXECUTION_INSERT_COLUMNS.index("session_id")
+
+
+def _rollup_upsert_sql(fk_column: str) -> str:
+    """Build the execution_rollups upsert that merges into the bucket keyed by ``fk_column``.
+
+    Each FK column has its own partial unique index (013.sql), so the conflict target repeats
+    that index's WHERE clause.
+    """
+    merges = [
+        "execution_count = execution_count + excluded.execution_count",
+        "total_duration_ms = total_duration_ms + excluded.total_duration_ms",
+        "min_duration_ms = MIN(min_duration_ms, excluded.min_duration_ms)",
+        "max_duration_ms = MAX(max_duration_ms, excluded.max_duration_ms)",
+        *(f"{column} = {column} + excluded.{column}" for column in _ROLLUP_HISTOGRAM_COLUMNS),
+    ]
+    return (
+        f"INSERT INTO execution_rollups ({', '.join(_ROLLUP_COLUMNS)}) "
+        f"VALUES ({', '.join('?' for _ in _ROLLUP_COLUMNS)}) "
+        f"ON CONFLICT ({fk_column}, bucket_start_ts, session_id) WHERE {fk_column} IS NOT NULL "
+        f"DO UPDATE SET {', '.join(merges)}"
+    )
+
+
+_ROLLUP_UPSERT_SQL = {"handler": _rollup_upsert_sql("listener_id"), "job": _rollup_upsert_sql("job_id")}
+
+
+def execution_insert_row(record: ExecutionRecord, session_id: int | None = None) -> tuple[Any, ...]:
+    """Build the positional parameter row for an executions INSERT, in column order.
+
+    Args:
+        record: The unified execution record to convert.
+        session_id: Session to record when ``record.session_id`` is None.
+
+    Returns:
+        A tuple ready for ``db.executemany()`` with the positional INSERT statement.
+    """
+    row = _execution_row(record)
+    if record.session_id is None:
+        return (*row[:_SESSION_ID_INDEX], session_id, *row[_SESSION_ID_INDEX + 1 :])
+    return row
+
+
+def execution_rollup_rows(
+    records: list[ExecutionRecord], session_id: int | None = None
+) -> dict[str, list[tuple[Any, ...]]]:
+    """Fold rolled-up records into one execution_rollups row per listener or job, session and bucket.
+
+    Args:
+        records: Successful execution records counted in rollup buckets rather than as rows.
+        session_id: Session to record when a record's own session_id is None.
+
+    Returns:
+        Positional rows in ``_ROLLUP_COLUMNS`` order, keyed by execution kind (each kind has its
+        own upsert statement).
+    """
+    buckets: dict[tuple[Any, ...], list[Any]] = {}
+    for record in records:
+        duration = record.duration_ms
+        bucket_start = int(record.execution_start_ts) // ROLLUP_BUCKET_SECONDS * ROLLUP_BUCKET_SECONDS
+        key = (
+            record.kind,
+            record.listener_id,
+            record.job_id,
+            record.session_id if record.session_id is not None else session_id,
+            record.source_tier,
+            float(bucket_start),
+        )
+        values = buckets.get(key)
+        if values is None:
+            values = buckets[key] = [0, 0.0, duration, duration, *(0 for _ in _ROLLUP_HISTOGRAM_COLUMNS)]
+        values[0] += 1
+        values[1] += duration
+        values[2] = min(values[2], duration)
+        values[3] = max(values[3], duration)
+        values[4 + bisect_left(_ROLLUP_HISTOGRAM_BOUNDS_MS, duration)] += 1
+
+    rows: dict[str, list[tuple[Any, ...]]] = {"handler": [], "job": []}
+    for key, values in buckets.items():
+        rows[key[0]].append((*key, *values))
+    return rows
+
 
 def _is_fk_violation(exc: sqlite3.IntegrityError) -> bool:
     """Return True if the IntegrityError is a foreign key constraint violation.
@@ -540,6 +667,35 @@ class TelemetryRepository:
         )
         await db.commit()
 
+    async def mark_job_statuses(self, updates: list[tuple[int, str, str | None]]) -> None:
+        """Persist several ``Job.transition_to()`` status changes in one transaction.
+
+        The batch form of ``mark_job_status``, used when the scheduler dispatches many jobs
+        that fell due together.
+
+        Args:
+            updates: ``(db_id, status, reason)`` tuples, as for ``mark_job_status``.
+        """
+        if not updates:
+            return
+
+        db = self._db_service.db
+
+        try:
+            await db.execute("BEGIN")
+            await db.executemany(
+                "UPDATE scheduled_jobs SET schedule_status = :schedule_status, "
+                "schedule_status_reason = :schedule_status_reason WHERE id = :id",
+                [
+                    {"schedule_status": status, "schedule_status_reason": reason, "id": db_id}
+                    for db_id, status, reason in updates
+                ],
+            )
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+
     async def mark_listener_cancelled(self, db_id: int) -> None:
         """Set ``removed_at`` to the current epoch time for the given listener row.
 
@@ -724,27 +880,67 @@ class TelemetryRepository:
                 exc_info=True,
             )
 
-    async def persist_execution_batch(self, records: list[ExecutionRecord]) -> None:
+    async def persist_execution_batch(self, records: list[ExecutionRecord], *, session_id: int | None = None) -> None:
         """Write a batch of unified execution records to the executions table.
 
+        Records flagged ``rollup`` are merged into their ``execution_rollups`` buckets instead, in
+        the same transaction.
+
         Args:
-            records: Execution records to insert. All must have session_id set.
+            records: Execution records to insert.
+            session_id: Session recorded for every record whose own session_id is None.
+                Every record must have one or the other.
         """
         if not records:
             return
 
         db = self._db_service.db
+        rows = [execution_insert_row(r, session_id) for r in records if not r.rollup]
+        rollups = execution_rollup_rows([r for r in records if r.rollup], session_id)
 
         try:
             await db.execute("BEGIN")
-            params_list = [execution_insert_params(r) for r in records]
-            await db.executemany(_EXECUTION_INSERT_SQL, params_list)
+            if rows:
+                await db.executemany(_EXECUTION_ROW_SQL, rows)
+            for kind, rollup_rows in rollups.items():
+                if rollup_rows:
+                    await db.executemany(_ROLLUP_UPSERT_SQL[kind], rollup_rows)
             await db.commit()
         except Exception:
             await db.rollback()
             raise
 
-    async def persist_execution_batch_with_fk_fallback(self, records: list[ExecutionRecord]) -> int:
+    async def persist_latency_histograms(
+        self, histograms: dict[tuple[Literal["handler", "job"], int], "LatencyHistogram"], period_start_ts: float
+    ) -> None:
+        """Add in-memory latency histograms to their ``latency_histograms`` period rows.
+
+        Args:
+            histograms: Histograms keyed by ``(kind, listener_id or job_id)``.
+            period_start_ts: Start of the ``LATENCY_PERIOD_SECONDS`` period the counts belong to.
+        """
+        rows: dict[Literal["handler", "job"], list[tuple[Any, ...]]] = {"handler": [], "job": []}
+        for (kind, entity_id), histogram in histograms.items():
+            rows[kind].extend(
+                (kind, entity_id, period_start_ts, index, count) for index, count in histogram.counts.items()
+            )
+        if not any(rows.values()):
+            return
+
+        db = self._db_service.db
+        try:
+            await db.execute("BEGIN")
+            for kind, kind_rows in rows.items():
+                if kind_rows:
+                    await db.executemany(_LATENCY_UPSERT_SQL[kind], kind_rows)
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+
+    async def persist_execution_batch_with_fk_fallback(
+        self, records: list[ExecutionRecord], *, session_id: int | None = None
+    ) -> int:
         """Insert execution records row-by-row with FK violation fallback (best-effort per record).
 
         Called by ``CommandExecutor.handle_fk_violation`` after a batch INSERT already
@@ -755,6 +951,10 @@ class TelemetryRepository:
         Atomicity is best-effort per record: if an individual record fails even after FK
         nulling, it is silently dropped and remaining records are still committed.
 
+        ``session_id`` fills in records without one, as in ``persist_execution_batch``.
+        Rolled-up records are written as executions rows here, so one whose listener or job
+        row is gone is kept as an orphan row like any other record.
+
         Returns the number of records that were dropped (failed even with null FK).
         """
         db = self._db_service.db
@@ -768,6 +968,8 @@ class TelemetryRepository:
 
             for record in records:
                 params = execution_insert_params(record)
+                if params["session_id"] is None:
+                    params["session_id"] = session_id
                 fk_field = "listener_id" if record.kind == "handler" else "job_id"
                 if await _insert_row_with_fk_fallback(db, params, fk_field, LOGGER):
                     dropped += 1
@@ -11,8 +11,8 @@ from hassette.core.telemetry.helpers import (
     STORAGE_ERRORS,
     AppHealthAggregates,
     build_app_summaries,
+    execution_stats_source,
     row_to_dict,
-    since_clause,
     source_tier_clause,
 )
 from hassette.exceptions import TelemetryUnavailableError
@@ -49,8 +49,9 @@ class SummaryQueriesMixin:
     ) -> AppHealthAggregates:
         """Return a single-row aggregate of handler and job health metrics for one app instance.
 
-        Uses a single query against ``executions`` with two CTE arms (handler_agg, job_agg).
-        SQLite does not support ``FILTER``; uses ``SUM(CASE WHEN kind='handler' ...)`` instead.
+        Uses a single query against ``execution_stats_source()`` (per-minute buckets plus the
+        raw rows at the window's edge) with conditional sums per kind. SQLite does not support
+        ``FILTER``; uses ``SUM(CASE WHEN kind='handler' ...)`` instead.
 
         Args:
             app_key: The app key to filter by.
@@ -60,30 +61,32 @@ class SummaryQueriesMixin:
             source_tier: Filter by source tier.
         """
         tier_e_clause, tier_params = source_tier_clause(source_tier, "e")
-        since_sql, since_params = since_clause(since, "e.execution_start_ts")
+        stats_source, stats_params = execution_stats_source(since)
 
         params: dict[str, Any] = {
             "app_key": app_key,
             "instance_index": instance_index,
             **tier_params,
-            **since_params,
+            **stats_params,
         }
 
-        # SQLite has no FILTER clause; use SUM(CASE WHEN kind='handler' THEN 1 ELSE 0 END) pattern.
+        # SQLite has no FILTER clause; use SUM(CASE WHEN kind='handler' THEN ... END) pattern.
         query = f"""
             WITH agg AS (
                 SELECT
-                    SUM(CASE WHEN e.kind = 'handler' THEN 1 ELSE 0 END) AS total_invocations,
-                    SUM(CASE WHEN e.kind = 'handler' AND e.status = 'error' THEN 1 ELSE 0 END) AS handler_errors,
-                    SUM(CASE WHEN e.kind = 'handler' AND e.status = 'timed_out' THEN 1 ELSE 0 END) AS handler_timed_out,
-                    AVG(CASE WHEN e.kind = 'handler' THEN e.duration_ms END) AS handler_avg_duration_ms,
-                    SUM(CASE WHEN e.kind = 'job' THEN 1 ELSE 0 END) AS total_executions,
-                    SUM(CASE WHEN e.kind = 'job' AND e.status = 'error' THEN 1 ELSE 0 END) AS job_errors,
-                    SUM(CASE WHEN e.kind = 'job' AND e.status = 'timed_out' THEN 1 ELSE 0 END) AS job_timed_out,
-                    AVG(CASE WHEN e.kind = 'job' AND e.status != 'skipped'
-                        THEN e.duration_ms END) AS job_avg_duration_ms,
-                    MAX(e.execution_start_ts) AS last_activity
-                FROM executions e
+                    SUM(CASE WHEN e.kind = 'handler' THEN e.execution_count ELSE 0 END) AS total_invocations,
+                    SUM(CASE WHEN e.kind = 'handler' THEN e.error_count ELSE 0 END) AS handler_errors,
+                    SUM(CASE WHEN e.kind = 'handler' THEN e.timed_out_count ELSE 0 END) AS handler_timed_out,
+                    SUM(CASE WHEN e.kind = 'handler' THEN e.total_duration_ms END)
+                        / SUM(CASE WHEN e.kind = 'handler' THEN e.execution_count END) AS handler_avg_duration_ms,
+                    SUM(CASE WHEN e.kind = 'job' THEN e.execution_count ELSE 0 END) AS total_executions,
+                    SUM(CASE WHEN e.kind = 'job' THEN e.error_count ELSE 0 END) AS job_errors,
+                    SUM(CASE WHEN e.kind = 'job' THEN e.timed_out_count ELSE 0 END) AS job_timed_out,
+                    SUM(CASE WHEN e.kind = 'job' THEN e.total_duration_ms END)
+                        / SUM(CASE WHEN e.kind = 'job'
+                            THEN e.execution_count - e.skipped_count END) AS job_avg_duration_ms,
+                    MAX(e.last_execution_ts) AS last_activity
+                FROM {stats_source} e
                 LEFT JOIN listeners l ON l.id = e.listener_id AND e.kind = 'handler'
                 LEFT JOIN scheduled_jobs sj ON sj.id = e.job_id AND e.kind = 'job'
                 WHERE (
@@ -94,7 +97,6 @@ class SummaryQueriesMixin:
                      AND sj.removed_at IS NULL)
                 )
                 {tier_e_clause}
-                {since_sql}
             )
             SELECT * FROM agg
         """
@@ -132,10 +134,11 @@ class SummaryQueriesMixin:
         since: float | None = None,
         source_tier: QuerySourceTier = "app",
     ) -> dict[str, AppHealthSummary]:
-        """Return per-app health summaries via 4 batch SQL queries against executions.
+        """Return per-app health summaries via 4 batch SQL queries.
 
         Registration counts (handler_count, job_count) still use ``active_*`` views.
-        Activity counts query the unified ``executions`` table.
+        Activity counts query ``execution_stats_source()`` (per-minute buckets plus the raw
+        rows at the window's edge) rather than every executions row.
 
         Args:
             since: When provided, restrict activity counts to records with
@@ -155,14 +158,13 @@ class SummaryQueriesMixin:
             case _ as unreachable:
                 assert_never(unreachable)
 
-        # Each call binds the same param keys (:source_tier / :since) regardless of alias,
+        # Each call binds the same param key (:source_tier) regardless of alias,
         # so only the first params dict is kept; the rest are discarded as _.
         tier_e_handler_clause, tier_params = source_tier_clause(source_tier, "e_h")
         tier_e_job_clause, _ = source_tier_clause(source_tier, "e_j")
         tier_l_clause, _ = source_tier_clause(source_tier, "l")
         tier_sj_clause, _ = source_tier_clause(source_tier, "sj")
-        since_h_clause, since_params = since_clause(since, "e_h.execution_start_ts")
-        since_j_clause, _ = since_clause(since, "e_j.execution_start_ts")
+        stats_source, stats_params = execution_stats_source(since)
 
         # Count distinct handler/job identities across all instances, not listener rows.
         # Each instance of a multi-instance app registers its own rows under the same
@@ -184,33 +186,31 @@ class SummaryQueriesMixin:
         listener_act_query = f"""
             SELECT
                 l.app_key,
-                COUNT(e_h.rowid) AS total_invocations,
-                SUM(CASE WHEN e_h.status = 'error' THEN 1 ELSE 0 END) AS total_errors,
-                SUM(CASE WHEN e_h.status = 'timed_out' THEN 1 ELSE 0 END) AS total_timed_out,
-                COALESCE(AVG(e_h.duration_ms), 0.0) AS avg_duration_ms,
-                MAX(e_h.execution_start_ts) AS last_listener_activity_ts
+                COALESCE(SUM(e_h.execution_count), 0) AS total_invocations,
+                COALESCE(SUM(e_h.error_count), 0) AS total_errors,
+                COALESCE(SUM(e_h.timed_out_count), 0) AS total_timed_out,
+                COALESCE(SUM(e_h.total_duration_ms) / SUM(e_h.execution_count), 0.0) AS avg_duration_ms,
+                MAX(e_h.last_execution_ts) AS last_listener_activity_ts
             FROM listeners l
-            LEFT JOIN executions e_h ON e_h.listener_id = l.id AND e_h.kind = 'handler'
+            LEFT JOIN {stats_source} e_h ON e_h.listener_id = l.id AND e_h.kind = 'handler'
                 {tier_e_handler_clause}
-                {since_h_clause}
             WHERE 1=1 {tier_l_clause}
             GROUP BY l.app_key
         """
         job_act_query = f"""
             SELECT
                 sj.app_key,
-                COUNT(e_j.rowid) AS total_executions,
-                SUM(CASE WHEN e_j.status = 'error' THEN 1 ELSE 0 END) AS total_job_errors,
-                SUM(CASE WHEN e_j.status = 'timed_out' THEN 1 ELSE 0 END) AS total_job_timed_out,
-                MAX(e_j.execution_start_ts) AS last_job_activity_ts
+                COALESCE(SUM(e_j.execution_count), 0) AS total_executions,
+                COALESCE(SUM(e_j.error_count), 0) AS total_job_errors,
+                COALESCE(SUM(e_j.timed_out_count), 0) AS total_job_timed_out,
+                MAX(e_j.last_execution_ts) AS last_job_activity_ts
             FROM scheduled_jobs sj
-            LEFT JOIN executions e_j ON e_j.job_id = sj.id AND e_j.kind = 'job'
+            LEFT JOIN {stats_source} e_j ON e_j.job_id = sj.id AND e_j.kind = 'job'
                 {tier_e_job_clause}
-                {since_j_clause}
             WHERE 1=1 {tier_sj_clause}
             GROUP BY sj.app_key
         """
-        act_params: dict[str, Any] = {**tier_params, **since_params}
+        act_params: dict[str, Any] = {**tier_params, **stats_params}
 
         try:
             async with asyncio.timeout(self.hassette.config.database.read_timeout_seconds), self._snapshot_lock:
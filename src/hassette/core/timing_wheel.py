@@ -0,0 +1,309 @@
+"""Hierarchical timing wheel, an alternative to the scheduler's job heap.
+
+A heap keeps every job totally ordered, so each insert, cancel and expiry costs O(log n) and a
+due batch is drained one pop at a time. A timing wheel only orders jobs as finely as it has to:
+time is cut into ticks, and each level of the wheel has ``WHEEL_SLOTS`` slots covering
+``WHEEL_SLOTS`` times the span of a slot one level down. A job goes into the lowest level whose
+current rotation contains its expiry tick, so insert and cancel are O(1) dict operations. When
+time reaches a higher-level slot, that slot's jobs are redistributed ("cascaded") into the lower
+levels, and when it reaches a level-0 slot, the whole slot expires as one batch.
+
+Slots record the absolute expiry tick of each job, so a job whose expiry is beyond the top
+level's rotation waits in an overflow bucket and is re-placed each time the top level wraps.
+"""
+
+from collections.abc import Callable, Hashable, Iterator
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+WHEEL_BITS = 6
+"""log2 of the number of slots per level."""
+
+WHEEL_SLOTS = 1 << WHEEL_BITS
+"""Slots per level."""
+
+WHEEL_LEVELS = 6
+"""Levels below the overflow bucket: 64**6 ticks, about 2.2 years at a 1 ms tick."""
+
+_SLOT_MASK = WHEEL_SLOTS - 1
+_READY = -1
+_OVERFLOW = WHEEL_LEVELS
+
+
+class TimingWheel(Generic[T]):
+    """Hierarchical timing wheel of items keyed by an expiry time in nanoseconds.
+
+    Offers the subset of ``HeapQueue``'s interface that does not depend on total order —
+    ``push``, ``remove_item``, ``remove_group``, ``remove_where``, iteration and ``len`` — and
+    replaces ``peek``/``pop`` with ``pop_due`` and ``next_due_ns``, which work a tick at a time.
+
+    Items are identified by identity. An item is due once ``pop_due`` is called with a
+    reference time at or past the end of the tick holding its expiry, so a due item is never
+    early and at most one tick late.
+    """
+
+    _now_tick: int | None
+    """The tick the wheel has advanced to; set by the first ``push`` or ``pop_due``."""
+
+    _slots: list[list[dict[int, T]]]
+    """``WHEEL_LEVELS`` levels of ``WHEEL_SLOTS`` slots, each mapping ``id(item)`` to the item."""
+
+    _occupied: list[int]
+    """Per level, a bitmask of the slots that hold at least one item."""
+
+    _ready: dict[int, T]
+    """Items whose expiry tick had already been reached when they were placed."""
+
+    _overflow: dict[int, T]
+    """Items expiring beyond the top level's current rotation."""
+
+    _entries: dict[int, tuple[T, int, int, int]]
+    """``id(item) -> (item, expiry tick, level, slot)``; level is ``_READY`` or ``_OVERFLOW`` off the wheel."""
+
+    _groups: dict[Hashable, dict[int, T]]
+    """``group_key`` value -> the items with that key."""
+
+    def __init__(
+        self,
+        *,
+        fire_key: Callable[[T], int],
+        tick_ns: int,
+        group_key: Callable[[T], Hashable] | None = None,
+    ) -> None:
+        """Create an empty wheel.
+
+        Args:
+            fire_key: Returns an item's expiry time as nanoseconds since the epoch.
+            tick_ns: Resolution of the wheel in nanoseconds.
+            group_key: Optional key indexing items for ``remove_group``.
+
+        Raises:
+            ValueError: If ``tick_ns`` is not positive.
+        """
+        if tick_ns <= 0:
+            raise ValueError(f"tick_ns must be positive, got {tick_ns}")
+
+        self.fire_key = fire_key
+        self.tick_ns = tick_ns
+        self.group_key = group_key
+        self._now_tick = None
+        self._slots = [[{} for _ in range(WHEEL_SLOTS)] for _ in range(WHEEL_LEVELS)]
+        self._occupied = [0] * WHEEL_LEVELS
+        self._ready = {}
+        self._overflow = {}
+        self._entries = {}
+        self._groups = {}
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterate over all items in the wheel (unordered)."""
+        return (entry[0] for entry in self._entries.values())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, item: object) -> bool:
+        """Check whether ``item`` itself (by identity) is in the wheel."""
+        return id(item) in self._entries
+
+    def is_empty(self) -> bool:
+        """Check if the wheel is empty."""
+        return not self._entries
+
+    def push(self, item: T) -> None:
+        """Add an item to the wheel.
+
+        Pushing an item that is already in the wheel does not add it twice: it is moved to the
+        slot its current expiry calls for instead.
+        """
+        if id(item) in self._entries:
+            self._discard(id(item))
+
+        expiry = -(-self.fire_key(item) // self.tick_ns)
+        if self._now_tick is None:
+            self._now_tick = expiry - 1
+        if self.group_key is not None:
+            self._groups.setdefault(self.group_key(item), {})[id(item)] = item
+        self._place(item, expiry)
+
+    def remove_item(self, item: T) -> bool:
+        """Remove a specific item from the wheel if present, by identity."""
+        if id(item) not in self._entries:
+            return False
+        self._discard(id(item))
+        self._ungroup(item)
+        return True
+
+    def remove_group(self, key: Hashable) -> list[T]:
+        """Remove every item whose ``group_key`` is ``key``, returning the removed items.
+
+        Raises:
+            ValueError: If the wheel was created without a ``group_key``.
+        """
+        if self.group_key is None:
+            raise ValueError("remove_group requires a TimingWheel created with a group_key")
+
+        members = self._groups.pop(key, None)
+        if not members:
+            return []
+
+        for item_id in members:
+            self._discard(item_id)
+        return list(members.values())
+
+    def remove_where(self, predicate: Callable[[T], bool]) -> list[T]:
+        """Remove all items matching the predicate, returning the removed items."""
+        removed = [entry[0] for entry in self._entries.values() if predicate(entry[0])]
+        for item in removed:
+            self._discard(id(item))
+            self._ungroup(item)
+        return removed
+
+    def pop_due(self, reference_ns: int) -> list[T]:
+        """Advance the wheel to ``reference_ns`` and remove every item due by then.
+
+        Args:
+            reference_ns: The current time, in nanoseconds since the epoch.
+
+        Returns:
+            The due items, ordered by ``<``.
+        """
+        target = reference_ns // self.tick_ns
+        if self._now_tick is None:
+            self._now_tick = target
+            return []
+
+        due: list[T] = []
+        while (event_tick := self._next_event_tick()) is not None and event_tick <= target:
+            self._advance_to(event_tick, due)
+        # no slot changes state between the last event and the target
+        self._now_tick = max(self._now_tick, target)
+
+        if self._ready:
+            for item_id, item in list(self._ready.items()):
+                if self._entries[item_id][1] <= target:
+                    due.append(item)
+                    del self._ready[item_id]
+
+        for item in due:
+            del self._entries[id(item)]
+            self._ungroup(item)
+
+        due.sort()  # pyright: ignore[reportCallIssue, reportArgumentType]
+        return due
+
+    def next_due_ns(self) -> int | None:
+        """Return when ``pop_due`` next has work to do, in nanoseconds since the epoch.
+
+        This is the end of the tick the earliest item expires in, or the moment a higher-level
+        slot has to be cascaded, whichever comes first; a cascade may turn out to expire
+        nothing. Returns None if the wheel is empty.
+        """
+        next_tick = self._next_event_tick()
+        if self._ready:
+            ready_tick = min(self._entries[item_id][1] for item_id in self._ready)
+            next_tick = ready_tick if next_tick is None else min(next_tick, ready_tick)
+        return None if next_tick is None else next_tick * self.tick_ns
+
+    def _place(self, item: T, expiry: int) -> None:
+        """Put ``item`` in the lowest level whose current rotation contains ``expiry``."""
+        now_tick = self._now_tick
+        assert now_tick is not None
+        item_id = id(item)
+
+        if expiry <= now_tick:
+            self._ready[item_id] = item
+            self._entries[item_id] = (item, expiry, _READY, 0)
+            return
+
+        level = ((expiry ^ now_tick).bit_length() - 1) // WHEEL_BITS
+        if level >= WHEEL_LEVELS:
+            self._overflow[item_id] = item
+            self._entries[item_id] = (item, expiry, _OVERFLOW, 0)
+            return
+
+        slot = (expiry >> (WHEEL_BITS * level)) & _SLOT_MASK
+        self._slots[level][slot][item_id] = item
+        self._occupied[level] |= 1 << slot
+        self._entries[item_id] = (item, expiry, level, slot)
+
+    def _discard(self, item_id: int) -> None:
+        """Take an item out of its slot and the entry table (but not its group)."""
+        _item, _expiry, level, slot = self._entries.pop(item_id)
+        if level == _READY:
+            del self._ready[item_id]
+        elif level == _OVERFLOW:
+            del self._overflow[item_id]
+        else:
+            bucket = self._slots[level][slot]
+            del bucket[item_id]
+            if not bucket:
+                self._occupied[level] &= ~(1 << slot)
+
+    def _ungroup(self, item: T) -> None:
+        if self.group_key is None:
+            return
+        key = self.group_key(item)
+        members = self._groups[key]
+        del members[id(item)]
+        if not members:
+            del self._groups[key]
+
+    def _next_event_tick(self) -> int | None:
+        """Return the next tick at which a slot expires or cascades, or None if the wheel is idle.
+
+        Every occupied slot lies ahead of the current position of its level, and anything a
+        level holds comes before anything the level above holds, so the first occupied slot found
+        walking up from level 0 is the next event.
+        """
+        now_tick = self._now_tick
+        if now_tick is None:
+            return None
+
+        for level, occupied in enumerate(self._occupied):
+            if not occupied:
+                continue
+            shift = WHEEL_BITS * level
+            position = (now_tick >> shift) & _SLOT_MASK
+            ahead = occupied & ~((2 << position) - 1)
+            if ahead:
+                slot = (ahead & -ahead).bit_length() - 1
+                rotation = (now_tick >> (shift + WHEEL_BITS)) << (shift + WHEEL_BITS)
+                return rotation | (slot << shift)
+
+        if self._overflow:
+            top_shift = WHEEL_BITS * WHEEL_LEVELS
+            return ((now_tick >> top_shift) + 1) << top_shift
+        return None
+
+    def _advance_to(self, tick: int, due: list[T]) -> None:
+        """Move the wheel to the event at ``tick``, cascading and expiring the slots it reaches."""
+        previous = self._now_tick
+        assert previous is not None
+        self._now_tick = tick
+
+        top_shift = WHEEL_BITS * WHEEL_LEVELS
+        if self._overflow and (previous >> top_shift) != (tick >> top_shift):
+            overflow, self._overflow = self._overflow, {}
+            for item in overflow.values():
+                self._place(item, self._entries[id(item)][1])
+
+        for level in range(WHEEL_LEVELS - 1, 0, -1):
+            shift = WHEEL_BITS * level
+            if (previous >> shift) == (tick >> shift):
+                continue
+            slot = (tick >> shift) & _SLOT_MASK
+            bucket = self._slots[level][slot]
+            if not bucket:
+                continue
+            self._slots[level][slot] = {}
+            self._occupied[level] &= ~(1 << slot)
+            for item in bucket.values():
+                self._place(item, self._entries[id(item)][1])
+
+        slot = tick & _SLOT_MASK
+        bucket = self._slots[0][slot]
+        if bucket:
+            self._slots[0][slot] = {}
+            self._occupied[0] &= ~(1 << slot)
+            due.extend(bucket.values())
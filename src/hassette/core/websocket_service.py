@@ -5,6 +5,7 @@ import time
 import traceback
 import typing
 from contextlib import AsyncExitStack, suppress
+from dataclasses import dataclass
 from itertools import count
 from typing import Any, ClassVar, cast
 
@@ -28,8 +29,11 @@ from hassette.core.early_drop_policy import (
     is_early_drop,
     log_resilience_budget,
 )
+from hassette.core.event_subscriptions import EventTypeSubscriptions, wanted_subscriptions
 from hassette.core.observer_list import ObserverList
 from hassette.core.retry_policy import MAX_RETRY_ATTEMPTS
+from hassette.core.telemetry.latency import LatencyHistogram
+from hassette.core.ws_json import WS_JSON_DECODERS, WsJsonDecoder
 from hassette.events import HassetteSimpleEvent, RawStateChangeEvent, create_event_from_hass
 from hassette.events.metadata import stamp_websocket_generation
 from hassette.exceptions import (
@@ -83,6 +87,44 @@ RETRYABLE = (
 # full call stack down into asyncio internals.
 INVALID_TRANSITION_TRACE_LIMIT = 3
 
+# Event types always subscribed in "per_event_type" mode. StateProxy's state_changed listener can
+# register after the first connect, and its cache must never miss a change in that window.
+BASELINE_EVENT_TYPES = frozenset({"state_changed"})
+
+# Event types carried by StateProxy's subscribe_entities feed when ``state_proxy_feed`` selects it.
+# StateProxy synthesizes them from the entity diffs, so the raw events are neither subscribed to
+# nor dispatched.
+ENTITY_FEED_EVENT_TYPES = frozenset({"state_changed"})
+
+
+@dataclass(frozen=True)
+class WsCommandStats:
+    """Snapshot of request/reply command traffic, from ``WebsocketService.command_stats()``."""
+
+    in_flight: int
+    """Commands sent and awaiting a response right now."""
+
+    peak_in_flight: int
+    """Highest ``in_flight`` seen since the service started."""
+
+    waiting: int
+    """Commands waiting for a free slot in the ``max_inflight_commands`` window."""
+
+    completed: int
+    """Commands that received a response, successful or an HA error."""
+
+    timed_out: int
+    """Commands that hit their response timeout, counted per attempt."""
+
+    latency_p50_ms: float | None
+    """Median send-to-response latency in milliseconds, or None before the first response."""
+
+    latency_p99_ms: float | None
+    """99th percentile send-to-response latency in milliseconds, or None before the first response."""
+
+    latency_max_ms: float
+    """Slowest send-to-response latency in milliseconds, or 0.0 before the first response."""
+
 
 class WebsocketService(Service):
     restart_spec: ClassVar[RestartSpec] = RestartSpec(
@@ -101,12 +143,18 @@ class WebsocketService(Service):
     _session: aiohttp.ClientSession | None
     """HTTP client session for making requests."""
 
-    _ws: aiohttp.ClientWebSocketResponse | None
+    _ws: aiohttp.ClientWebSocketResponse[bool] | None
     """WebSocket connection."""
 
     _response_futures: dict[int, asyncio.Future[Any]]
     """Mapping of message IDs to futures for awaiting responses."""
 
+    _command_slots: asyncio.Semaphore
+    """In-flight window for request/reply commands, sized by ``websocket.max_inflight_commands``."""
+
+    _command_latency: LatencyHistogram
+    """Send-to-response latency of every answered command."""
+
     _seq: typing.Iterator[int]
     """Iterator for generating unique message IDs."""
 
@@ -116,6 +164,21 @@ class WebsocketService(Service):
     _subscription_ids: set[int]
     """Set of active subscription IDs."""
 
+    _json_decoder: WsJsonDecoder
+    """Decoder for incoming TEXT frames, selected by ``websocket.json_decoder``."""
+
+    _event_subscriptions: EventTypeSubscriptions
+    """Per-event-type subscription IDs, used when ``event_subscription_mode`` is ``"per_event_type"``."""
+
+    _event_subscriptions_lock: asyncio.Lock
+    """Serializes reconciliation of per-event-type subscriptions."""
+
+    _event_subscriptions_task: asyncio.Task | None
+    """Background task reconciling per-event-type subscriptions after a listener change."""
+
+    _subscription_handlers: "dict[int, Callable[[dict[str, Any]], typing.Awaitable[None]]]"
+    """Handlers for subscriptions whose messages bypass the event bus, keyed by subscription ID."""
+
     _connect_lock: asyncio.Lock
     """Lock to prevent concurrent connection attempts."""
 
@@ -135,9 +198,21 @@ class WebsocketService(Service):
         self._session = None
         self._ws = None
         self._response_futures = {}
+        self._command_slots = asyncio.Semaphore(hassette.config.websocket.max_inflight_commands)
+        self._command_latency = LatencyHistogram()
+        self._commands_waiting = 0
+        self._commands_timed_out = 0
+        self._peak_in_flight = 0
         self._seq = count(1)
         self._recv_task = None
         self._subscription_ids = set()
+        self._json_decoder = WS_JSON_DECODERS[hassette.config.websocket.json_decoder]
+        self._filter_event_types = hassette.config.websocket.event_subscription_mode == "per_event_type"
+        self._event_subscriptions = EventTypeSubscriptions()
+        self._event_subscriptions_lock = asyncio.Lock()
+        self._event_subscriptions_task = None
+        self._subscription_handlers = {}
+        self._entity_feed_enabled = hassette.config.state_proxy_feed == "subscribe_entities"
         self._connect_lock = asyncio.Lock()
         self._send_ready_event = asyncio.Event()
         self._connected_event = asyncio.Event()
@@ -164,6 +239,8 @@ class WebsocketService(Service):
         a fatal shutdown before later waves (e.g. WebApiService) ever start. serve() begins
         the actual connection loop afterward.
         """
+        if self._filter_event_types:
+            self.hassette.bus_service.add_event_types_observer(self._on_event_types_changed)
         mark_ready(self, reason="WebSocket service initialized")
 
     @property
@@ -313,6 +390,8 @@ class WebsocketService(Service):
         return next(self._seq)
 
     async def before_shutdown(self) -> None:
+        if self._filter_event_types:
+            self.hassette.bus_service.remove_event_types_observer(self._on_event_types_changed)
         await self._notify_disconnected_observers()
         await self.send_connection_lost_event()
 
@@ -406,7 +485,10 @@ class WebsocketService(Service):
 
         try:
             self._ws = await session.ws_connect(
-                self.url, heartbeat=self.heartbeat_interval_seconds, ssl=self.hassette.config.verify_ssl
+                self.url,
+                heartbeat=self.heartbeat_interval_seconds,
+                ssl=self.hassette.config.verify_ssl,
+                decode_text=self._json_decoder.decode_text,
             )
         except ClientConnectorError as exc:
             if exc.__cause__ and isinstance(exc.__cause__, ConnectionRefusedError):
@@ -415,6 +497,12 @@ class WebsocketService(Service):
 
         self.logger.debug("Connected to WebSocket at %s", self.url)
         await self.authenticate()
+        if self.hassette.config.websocket.coalesce_messages:
+            # Must be the first message after auth. The reply is not awaited: an HA too old to know
+            # the command answers with an error result that nothing is waiting on.
+            await self._ws.send_json(
+                {"id": self.get_next_message_id(), "type": "supported_features", "features": {"coalesce_messages": 1}}
+            )
 
     async def start_recv_and_subscribe(self) -> asyncio.Task:
         """Spawn the recv loop, open private send capability, subscribe, then advertise readiness.
@@ -429,7 +517,10 @@ class WebsocketService(Service):
         recv_task.add_done_callback(self._handle_recv_task_done)
 
         self._send_ready_event.set()
-        self._subscription_ids.add(await self.subscribe_events())
+        if self._filter_event_types:
+            await self.sync_event_subscriptions()
+        else:
+            self._subscription_ids.add(await self.subscribe_events())
         self._connected_generation = next(self._generation_seq)
         self.set_connection_state(ConnectionState.CONNECTED)
 
@@ -479,6 +570,10 @@ class WebsocketService(Service):
         """
         self._send_ready_event.clear()
 
+        if self._event_subscriptions_task is not None:
+            self._event_subscriptions_task.cancel()
+            self._event_subscriptions_task = None
+
         if self._recv_task is not None:
             self._recv_task.cancel()
             with suppress(Exception):
@@ -497,6 +592,8 @@ class WebsocketService(Service):
                     fut.set_exception(RetryableConnectionClosedError("WebSocket disconnected"))
         self._response_futures.clear()
         self._subscription_ids.clear()
+        self._event_subscriptions.clear()
+        self._subscription_handlers.clear()
         self._ws = None
         self._recv_task = None
 
@@ -529,36 +626,85 @@ class WebsocketService(Service):
         while True:
             await self.raw_recv()
 
+    def command_stats(self) -> WsCommandStats:
+        """Return in-flight depth and response latency of request/reply commands."""
+        latency = self._command_latency
+        return WsCommandStats(
+            in_flight=len(self._response_futures),
+            peak_in_flight=self._peak_in_flight,
+            waiting=self._commands_waiting,
+            completed=latency.count,
+            timed_out=self._commands_timed_out,
+            latency_p50_ms=latency.percentile(50),
+            latency_p99_ms=latency.percentile(99),
+            latency_max_ms=latency.max_ms,
+        )
+
     async def send_and_await_response(
-        self, payload: dict[str, Any], msg_id: int, *, allow_pre_ready: bool = False
+        self,
+        payload: dict[str, Any],
+        msg_id: int,
+        *,
+        allow_pre_ready: bool = False,
+        timeout: float | None = None,
     ) -> Any:
         """Register a response future for msg_id, send payload, and await the reply.
 
+        Commands are pipelined: any number of callers may have a command on the wire at once,
+        each correlated to its reply by ``msg_id``, up to ``websocket.max_inflight_commands``.
+        A caller beyond that waits for a slot. Setup traffic (``allow_pre_ready``) bypasses the
+        window so a full window can never stall a reconnect.
+
         Registers the future before sending so a fast reply arriving before ``send_json``
         returns is never dropped. Always pops the future from ``_response_futures`` on
-        exit — success, timeout, or any other exception.
+        exit — success, timeout, cancellation, or any other exception.
 
         Args:
             payload: The JSON payload to send. Must already include ``"id": msg_id``.
             msg_id: The message id used to correlate the response future.
             allow_pre_ready: Whether to use the private pre-readiness send path for setup traffic.
+            timeout: Deadline in seconds covering the slot wait, the send, and the reply. Defaults
+                to ``resp_timeout_seconds``.
 
         Returns:
             The response payload once ``respond_if_necessary`` resolves the future.
 
         Raises:
-            TimeoutError: If no response arrives within ``resp_timeout_seconds``.
+            TimeoutError: If no response arrives before the deadline.
         """
+        try:
+            async with asyncio.timeout(self.resp_timeout_seconds if timeout is None else timeout):
+                if allow_pre_ready:
+                    return await self._send_and_await_reply(payload, msg_id, allow_pre_ready=True)
+                self._commands_waiting += 1
+                try:
+                    await self._command_slots.acquire()
+                finally:
+                    self._commands_waiting -= 1
+                try:
+                    return await self._send_and_await_reply(payload, msg_id, allow_pre_ready=False)
+                finally:
+                    self._command_slots.release()
+        except TimeoutError:
+            self._commands_timed_out += 1
+            raise
+
+    async def _send_and_await_reply(self, payload: dict[str, Any], msg_id: int, *, allow_pre_ready: bool) -> Any:
         fut = self.hassette.loop.create_future()
         self._response_futures[msg_id] = fut
+        self._peak_in_flight = max(self._peak_in_flight, len(self._response_futures))
+        sent_at = time.monotonic()
         try:
             if allow_pre_ready:
                 await self._send_json_when_socket_live(**payload)
             else:
                 await self.send_json(**payload)
-            return await asyncio.wait_for(fut, timeout=self.resp_timeout_seconds)
+            return await fut
         finally:
             self._response_futures.pop(msg_id, None)
+            # Replies only: a timeout, cancellation, or disconnect leaves no latency sample.
+            if fut.done() and not fut.cancelled() and not isinstance(fut.exception(), ConnectionClosedError):
+                self._command_latency.record((time.monotonic() - sent_at) * 1000)
 
     async def subscribe_events(self, event_type: str | None = None) -> int:
         """Subscribe to HA events; returns the subscription ID HA confirmed.
@@ -604,6 +750,120 @@ class WebsocketService(Service):
 
         return await subscribe_with_retry()
 
+    async def sync_event_subscriptions(self) -> None:
+        """Bring the per-event-type HA subscriptions in line with what registered listeners need.
+
+        New subscriptions are opened before stale ones are retired, so no event type is ever
+        uncovered; ``EventTypeSubscriptions.accepts`` discards the duplicates delivered while both
+        are live. Repeats until the wanted set stops changing, since listeners may come and go
+        while subscribe requests are in flight.
+        """
+        async with self._event_subscriptions_lock:
+            while True:
+                if self._entity_feed_enabled:
+                    wanted = wanted_subscriptions(
+                        self.hassette.bus_service.required_event_types(), (), excluded=ENTITY_FEED_EVENT_TYPES
+                    )
+                else:
+                    wanted = wanted_subscriptions(
+                        self.hassette.bus_service.required_event_types(), BASELINE_EVENT_TYPES
+                    )
+                to_subscribe, to_retire = self._event_subscriptions.diff(wanted)
+                if not to_subscribe and not to_retire:
+                    return
+
+                for event_type in to_subscribe:
+                    sid = await self.subscribe_events(event_type)
+                    self._event_subscriptions.record(event_type, sid)
+                    self._subscription_ids.add(sid)
+
+                for event_type in to_retire:
+                    sid = self._event_subscriptions.retire(event_type)
+                    if sid is None:
+                        continue
+                    self._subscription_ids.discard(sid)
+                    with suppress(Exception):
+                        await self._send_json_when_socket_live(type="unsubscribe_events", subscription=sid)
+
+                self.logger.debug(
+                    "Event subscriptions updated: +%s -%s (now %s)",
+                    to_subscribe,
+                    to_retire,
+                    sorted(self._event_subscriptions.event_types, key=str),
+                )
+
+    async def subscribe_entities(
+        self,
+        handler: "Callable[[dict[str, Any]], typing.Awaitable[None]]",
+        *,
+        entity_ids: list[str] | None = None,
+    ) -> int:
+        """Open a ``subscribe_entities`` subscription whose messages go to ``handler``.
+
+        The handler is registered before the request is sent, because HA delivers the initial
+        snapshot right behind the confirmation. Messages bypass the event bus; the handler
+        receives the ``event`` body of each one. Unlike ``subscribe_events`` there is no retry:
+        callers own the subscription and decide how to recover.
+
+        Args:
+            handler: Coroutine function awaited with each message body, on the receive loop.
+            entity_ids: Entities to restrict the subscription to, or None for every entity.
+
+        Returns:
+            The subscription ID, to pass to ``unsubscribe``.
+
+        Raises:
+            FailedMessageError: If HA rejects the subscription or does not answer in time.
+        """
+        payload: dict[str, Any] = {"type": "subscribe_entities"}
+        if entity_ids is not None:
+            payload["entity_ids"] = entity_ids
+
+        msg_id = self.get_next_message_id()
+        self._subscription_handlers[msg_id] = handler
+        try:
+            await self.send_and_await_response({**payload, "id": msg_id}, msg_id)
+        except TimeoutError:
+            self._subscription_handlers.pop(msg_id, None)
+            raise FailedMessageError(
+                f"subscribe_entities response timed out after {self.resp_timeout_seconds}s"
+            ) from None
+        except BaseException:
+            self._subscription_handlers.pop(msg_id, None)
+            raise
+        self._subscription_ids.add(msg_id)
+        return msg_id
+
+    async def unsubscribe(self, subscription_id: int) -> None:
+        """Stop a subscription opened by ``subscribe_entities`` (best-effort)."""
+        self._subscription_handlers.pop(subscription_id, None)
+        if subscription_id not in self._subscription_ids:
+            return
+        self._subscription_ids.discard(subscription_id)
+        with suppress(Exception):
+            await self._send_json_when_socket_live(type="unsubscribe_events", subscription=subscription_id)
+
+    def _on_event_types_changed(self) -> None:
+        """Schedule a subscription sync after listeners changed the set of needed event types.
+
+        While disconnected there is nothing to do: the next connect subscribes from scratch.
+        """
+        if not self._send_ready_event.is_set():
+            return
+        if self._event_subscriptions_task is not None and not self._event_subscriptions_task.done():
+            # The running sync re-reads the wanted set after every pass.
+            return
+        self._event_subscriptions_task = self.task_bucket.spawn(
+            self._sync_event_subscriptions_in_background(), name="ws:sync_event_subscriptions"
+        )
+
+    async def _sync_event_subscriptions_in_background(self) -> None:
+        try:
+            await self.sync_event_subscriptions()
+        except Exception as exc:
+            # A connection drop mid-sync is healed by the reconnect, which resubscribes from scratch.
+            self.logger.warning("Failed to update event subscriptions: %s", exc)
+
     async def cleanup(self) -> None:
         """Cleanup resources after the WebSocket connection is closed."""
         self.set_connection_state(ConnectionState.DISCONNECTED)
@@ -622,6 +882,8 @@ class WebsocketService(Service):
                 with suppress(Exception):
                     await self.send_json(type="unsubscribe_events", subscription=sid)
             self._subscription_ids.clear()
+            self._event_subscriptions.clear()
+        self._subscription_handlers.clear()
 
         self._send_ready_event.clear()
 
@@ -649,13 +911,15 @@ class WebsocketService(Service):
 
         await super().cleanup()
 
-    async def send_and_wait(self, **data: Any) -> dict[str, Any]:
+    async def send_and_wait(self, *, response_timeout: float | None = None, **data: Any) -> dict[str, Any]:
         """Send a message and wait for a response.
 
         Retries on transient failures (timeouts) with exponential backoff,
         matching the retry behavior of the REST API layer.
 
         Args:
+            response_timeout: Deadline in seconds for each attempt, including any wait for a slot
+                in the in-flight window. Defaults to ``websocket.response_timeout_seconds``.
             **data: The data to send as a JSON payload.
 
         Returns:
@@ -682,11 +946,10 @@ class WebsocketService(Service):
                 data["id"] = msg_id = self.get_next_message_id()
 
             try:
-                return await self.send_and_await_response(data, msg_id)
+                return await self.send_and_await_response(data, msg_id, timeout=response_timeout)
             except TimeoutError:
-                raise FailedMessageError(
-                    f"Response timed out after {self.resp_timeout_seconds}s (data: {data})"
-                ) from None
+                timeout = self.resp_timeout_seconds if response_timeout is None else response_timeout
+                raise FailedMessageError(f"Response timed out after {timeout}s (data: {data})") from None
 
         return await send_with_retry()
 
@@ -790,11 +1053,17 @@ class WebsocketService(Service):
 
         if msg_type == WSMsgType.TEXT:
             try:
-                data = json.loads(raw) if raw else {}
+                data = self._json_decoder.loads(raw) if raw else {}
             except json.JSONDecodeError:
                 self.logger.exception("Invalid JSON received: %s", raw)
                 return
 
+            if isinstance(data, list):
+                # A coalesced frame (see ``websocket.coalesce_messages``) carries several messages.
+                for message in data:
+                    await self.dispatch(message)
+                return
+
             await self.dispatch(data)
             return
 
@@ -825,6 +1094,16 @@ class WebsocketService(Service):
         try:
             match data.get("type"):
                 case "event":
+                    handler = self._subscription_handlers.get(data.get("id"))  # pyright: ignore[reportArgumentType]
+                    if handler is not None:
+                        await handler(data["event"])
+                        return
+                    if self._entity_feed_enabled and data["event"].get("event_type") in ENTITY_FEED_EVENT_TYPES:
+                        # StateProxy synthesizes these from its subscribe_entities feed.
+                        return
+                    if self._filter_event_types and not self._event_subscriptions.accepts(data.get("id")):
+                        # Delivered by a subscription being replaced; its successor covers the event.
+                        return
                     await self.dispatch_hass_event(cast("HassEventEnvelopeDict", data))
                 case "result":
                     self.respond_if_necessary(data)
@@ -0,0 +1,59 @@
+"""Pluggable JSON decoders for Home Assistant websocket frames.
+
+``WebsocketService`` decodes every TEXT frame it receives, which makes JSON parsing one of the
+recv loop's hottest paths on a busy instance. The decoder is selected by
+``websocket.json_decoder``; every implementation satisfies ``WsJsonDecoder`` so the receive path
+and its tests stay decoder-agnostic.
+"""
+
+import json
+import typing
+from typing import Any, ClassVar
+
+import orjson
+
+from hassette.types.types import WsJsonDecoderName
+
+
+class WsJsonDecoder(typing.Protocol):
+    """Decodes one websocket TEXT frame payload into Python objects.
+
+    Implementations raise ``json.JSONDecodeError`` (or a subclass) on malformed input.
+    """
+
+    name: ClassVar[WsJsonDecoderName]
+    """Config name of the decoder."""
+
+    decode_text: ClassVar[bool]
+    """Whether aiohttp should decode TEXT frames to ``str`` before they reach ``loads``. False
+    hands over the raw UTF-8 bytes, skipping the bytes → str → parse round-trip."""
+
+    def loads(self, raw: str | bytes) -> Any: ...
+
+
+class OrjsonDecoder:
+    """Decodes frames with ``orjson``, straight from the raw frame bytes."""
+
+    name: ClassVar[WsJsonDecoderName] = "orjson"
+    decode_text: ClassVar[bool] = False
+
+    def loads(self, raw: str | bytes) -> Any:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch one type.
+        return orjson.loads(raw)
+
+
+class StdlibJsonDecoder:
+    """Decodes frames with the standard library ``json`` module."""
+
+    name: ClassVar[WsJsonDecoderName] = "json"
+    decode_text: ClassVar[bool] = True
+
+    def loads(self, raw: str | bytes) -> Any:
+        return json.loads(raw)
+
+
+WS_JSON_DECODERS: dict[WsJsonDecoderName, WsJsonDecoder] = {
+    OrjsonDecoder.name: OrjsonDecoder(),
+    StdlibJsonDecoder.name: StdlibJsonDecoder(),
+}
+"""Available decoders, keyed by ``websocket.json_decoder`` name."""
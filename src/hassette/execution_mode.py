@@ -114,13 +114,24 @@ class ExecutionModeGuard:
             return self.run_queued(run_and_track)
 
     def run_single(self, run_and_track: RunAndTrack) -> Outcome:
-        if self.is_running():
-            self.suppressed += 1
-            LOGGER.debug("single-mode listener busy; suppressing re-fire (suppressed=%d)", self.suppressed)
+        if self.suppress_if_running():
             return Outcome.SUPPRESSED
         self.current_task = run_and_track()
         return Outcome.RAN
 
+    def suppress_if_running(self) -> bool:
+        """Count a suppressed trigger and return True if an invocation is still running.
+
+        ``run_single``'s busy check, also callable without the lock so a ``single`` trigger can be
+        dropped before any task is spawned for it. A trigger that passes is checked again under
+        the lock when it reaches ``run``.
+        """
+        if not self.is_running():
+            return False
+        self.suppressed += 1
+        LOGGER.debug("single-mode listener busy; suppressing re-fire (suppressed=%d)", self.suppressed)
+        return True
+
     async def run_restart(self, run_and_track: RunAndTrack) -> Outcome:
         task = self.current_task
         if task is not None and not task.done():
@@ -0,0 +1,63 @@
+-- Migration 013: execution_rollups -- per-minute buckets for successes without an executions row.
+--
+-- In the "sampled" and "aggregated" telemetry modes (DatabaseConfig.telemetry_mode and friends)
+-- a successful execution may skip its executions row. It is counted here instead: one row per
+-- listener or job, session and minute, holding the count, duration sum/min/max, and a
+-- log-decade duration histogram. Errors, timeouts and cancellations always keep their own
+-- executions row, so every rollup row counts successes only.
+--
+-- listener_id/job_id cascade on delete: a rollup has no meaning once its listener or job row
+-- is gone, unlike an executions row, which survives as an orphan via ON DELETE SET NULL.
+--
+-- One partial unique index per FK column is the upsert target. A single UNIQUE index over
+-- (listener_id, job_id, ...) would never conflict, because SQLite treats NULLs as distinct.
+
+CREATE TABLE execution_rollups (
+    id                    INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind                  TEXT    NOT NULL CHECK (kind IN ('handler', 'job')),
+    listener_id           INTEGER REFERENCES listeners(id) ON DELETE CASCADE,
+    job_id                INTEGER REFERENCES scheduled_jobs(id) ON DELETE CASCADE,
+    session_id            INTEGER NOT NULL REFERENCES sessions(id),
+    source_tier           TEXT    NOT NULL DEFAULT 'app'
+        CHECK (source_tier IN ('app', 'framework')),
+    bucket_start_ts       REAL    NOT NULL,
+    execution_count       INTEGER NOT NULL CHECK (execution_count > 0),
+    total_duration_ms     REAL    NOT NULL CHECK (total_duration_ms >= 0.0),
+    min_duration_ms       REAL    NOT NULL CHECK (min_duration_ms >= 0.0),
+    max_duration_ms       REAL    NOT NULL CHECK (max_duration_ms >= 0.0),
+    le_1ms_count          INTEGER NOT NULL DEFAULT 0,
+    le_10ms_count         INTEGER NOT NULL DEFAULT 0,
+    le_100ms_count        INTEGER NOT NULL DEFAULT 0,
+    le_1s_count           INTEGER NOT NULL DEFAULT 0,
+    le_10s_count          INTEGER NOT NULL DEFAULT 0,
+    gt_10s_count          INTEGER NOT NULL DEFAULT 0,
+    CHECK ((listener_id IS NOT NULL) + (job_id IS NOT NULL) = 1)
+);
+
+CREATE UNIQUE INDEX idx_rollup_listener_bucket
+    ON execution_rollups(listener_id, bucket_start_ts, session_id)
+    WHERE listener_id IS NOT NULL;
+CREATE UNIQUE INDEX idx_rollup_job_bucket
+    ON execution_rollups(job_id, bucket_start_ts, session_id)
+    WHERE job_id IS NOT NULL;
+CREATE INDEX idx_rollup_time ON execution_rollups(bucket_start_ts);
+
+-- execution_stats: executions rows and rollup buckets in one shape, for the summary queries.
+-- Each executions row counts once; each rollup row counts execution_count successes. Sum
+-- execution_count (not COUNT(*)) and divide total_duration_ms by it for averages. A future
+-- rebuild of executions or execution_rollups must drop and recreate this view (see 012.sql).
+CREATE VIEW execution_stats AS
+    SELECT
+        kind, listener_id, job_id, session_id, source_tier, status, execution_start_ts,
+        1 AS execution_count,
+        duration_ms AS total_duration_ms,
+        duration_ms AS min_duration_ms,
+        duration_ms AS max_duration_ms,
+        is_di_failure, thread_leaked
+    FROM executions
+    UNION ALL
+    SELECT
+        kind, listener_id, job_id, session_id, source_tier, 'success', bucket_start_ts,
+        execution_count, total_duration_ms, min_duration_ms, max_duration_ms,
+        0, 0
+    FROM execution_rollups;
@@ -0,0 +1,179 @@
+-- Migration 014: execution_buckets -- per-minute aggregates of the executions rows.
+--
+-- The app-health, app-summary, sparkline and listener/job summary queries used to aggregate
+-- every executions row in their window on every request. execution_buckets holds one row per
+-- listener or job and minute, with per-status counts, DI-failure and thread-leak counts, the
+-- latest start time, and duration sum/min/max (skipped executions contribute to the counts
+-- only). The summary queries read buckets for the whole minutes inside their window and raw
+-- executions rows only for the partial minutes at its edges (see execution_stats_source in
+-- core/telemetry/helpers.py).
+--
+-- The buckets are maintained by the two AFTER INSERT triggers below, so the upsert runs in the
+-- same transaction as the executions insert on every write path -- the batched
+-- persist_execution_batch insert, its per-record FK fallback, and direct inserts alike.
+-- Buckets are never decremented: retention ages them out on their own bucket_start_ts, the
+-- same way it ages out executions rows. Successes that skip their executions row (the
+-- sampled/aggregated telemetry modes) stay in execution_rollups, not here.
+--
+-- The bucket expression CAST(CAST(ts AS INTEGER) / 60 * 60 AS REAL) matches
+-- ROLLUP_BUCKET_SECONDS in core/telemetry/repository.py. A future rebuild of executions must
+-- recreate both triggers; a rebuild of execution_buckets must recreate its indexes.
+--
+-- This migration also drops the execution_stats view from 013: the summary queries now build
+-- their source from execution_buckets, execution_rollups and the edge executions rows.
+
+DROP VIEW execution_stats;
+
+CREATE TABLE execution_buckets (
+    id                    INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind                  TEXT    NOT NULL CHECK (kind IN ('handler', 'job')),
+    listener_id           INTEGER REFERENCES listeners(id) ON DELETE CASCADE,
+    job_id                INTEGER REFERENCES scheduled_jobs(id) ON DELETE CASCADE,
+    source_tier           TEXT    NOT NULL DEFAULT 'app'
+        CHECK (source_tier IN ('app', 'framework')),
+    bucket_start_ts       REAL    NOT NULL,
+    last_execution_ts     REAL    NOT NULL,
+    execution_count       INTEGER NOT NULL CHECK (execution_count > 0),
+    success_count         INTEGER NOT NULL DEFAULT 0,
+    error_count           INTEGER NOT NULL DEFAULT 0,
+    timed_out_count       INTEGER NOT NULL DEFAULT 0,
+    cancelled_count       INTEGER NOT NULL DEFAULT 0,
+    skipped_count         INTEGER NOT NULL DEFAULT 0,
+    di_failure_count      INTEGER NOT NULL DEFAULT 0,
+    thread_leaked_count   INTEGER NOT NULL DEFAULT 0,
+    total_duration_ms     REAL    NOT NULL DEFAULT 0.0 CHECK (total_duration_ms >= 0.0),
+    min_duration_ms       REAL,
+    max_duration_ms       REAL,
+    CHECK ((listener_id IS NOT NULL) + (job_id IS NOT NULL) = 1)
+);
+
+-- Backfill from the executions rows already on disk, so summaries over existing history are
+-- unchanged by the upgrade.
+INSERT INTO execution_buckets (
+    kind, listener_id, job_id, source_tier, bucket_start_ts, last_execution_ts,
+    execution_count, success_count, error_count, timed_out_count, cancelled_count,
+    skipped_count, di_failure_count, thread_leaked_count,
+    total_duration_ms, min_duration_ms, max_duration_ms
+)
+SELECT
+    MIN(kind), listener_id, job_id, MIN(source_tier),
+    CAST(CAST(execution_start_ts AS INTEGER) / 60 * 60 AS REAL),
+    MAX(execution_start_ts),
+    COUNT(*),
+    SUM(status = 'success'),
+    SUM(status = 'error'),
+    SUM(status = 'timed_out'),
+    SUM(status = 'cancelled'),
+    SUM(status = 'skipped'),
+    SUM(is_di_failure != 0),
+    SUM(thread_leaked != 0),
+    TOTAL(CASE WHEN status != 'skipped' THEN duration_ms END),
+    MIN(CASE WHEN status != 'skipped' THEN duration_ms END),
+    MAX(CASE WHEN status != 'skipped' THEN duration_ms END)
+FROM executions
+WHERE listener_id IS NOT NULL OR job_id IS NOT NULL
+GROUP BY listener_id, job_id, CAST(CAST(execution_start_ts AS INTEGER) / 60 * 60 AS REAL);
+
+-- One partial unique index per FK column is the upsert target (see 013.sql for why).
+CREATE UNIQUE INDEX idx_bucket_listener_time
+    ON execution_buckets(listener_id, bucket_start_ts)
+    WHERE listener_id IS NOT NULL;
+CREATE UNIQUE INDEX idx_bucket_job_time
+    ON execution_buckets(job_id, bucket_start_ts)
+    WHERE job_id IS NOT NULL;
+CREATE INDEX idx_bucket_time ON execution_buckets(bucket_start_ts);
+
+-- MIN()/MAX() with a NULL argument return NULL, so the duration bounds COALESCE each side
+-- first: a bucket that has only seen skipped executions keeps NULL bounds until a timed one
+-- arrives.
+CREATE TRIGGER trg_exec_bucket_listener
+AFTER INSERT ON executions
+WHEN NEW.listener_id IS NOT NULL
+BEGIN
+    INSERT INTO execution_buckets (
+        kind, listener_id, source_tier, bucket_start_ts, last_execution_ts,
+        execution_count, success_count, error_count, timed_out_count, cancelled_count,
+        skipped_count, di_failure_count, thread_leaked_count,
+        total_duration_ms, min_duration_ms, max_duration_ms
+    ) VALUES (
+        NEW.kind, NEW.listener_id, NEW.source_tier,
+        CAST(CAST(NEW.execution_start_ts AS INTEGER) / 60 * 60 AS REAL),
+        NEW.execution_start_ts,
+        1,
+        NEW.status = 'success',
+        NEW.status = 'error',
+        NEW.status = 'timed_out',
+        NEW.status = 'cancelled',
+        NEW.status = 'skipped',
+        NEW.is_di_failure != 0,
+        NEW.thread_leaked != 0,
+        CASE WHEN NEW.status != 'skipped' THEN NEW.duration_ms ELSE 0.0 END,
+        CASE WHEN NEW.status != 'skipped' THEN NEW.duration_ms END,
+        CASE WHEN NEW.status != 'skipped' THEN NEW.duration_ms END
+    )
+    ON CONFLICT (listener_id, bucket_start_ts) WHERE listener_id IS NOT NULL DO UPDATE SET
+        last_execution_ts = MAX(last_execution_ts, excluded.last_execution_ts),
+        execution_count = execution_count + 1,
+        success_count = success_count + excluded.success_count,
+        error_count = error_count + excluded.error_count,
+        timed_out_count = timed_out_count + excluded.timed_out_count,
+        cancelled_count = cancelled_count + excluded.cancelled_count,
+        skipped_count = skipped_count + excluded.skipped_count,
+        di_failure_count = di_failure_count + excluded.di_failure_count,
+        thread_leaked_count = thread_leaked_count + excluded.thread_leaked_count,
+        total_duration_ms = total_duration_ms + excluded.total_duration_ms,
+        min_duration_ms = MIN(
+            COALESCE(min_duration_ms, excluded.min_duration_ms),
+            COALESCE(excluded.min_duration_ms, min_duration_ms)
+        ),
+        max_duration_ms = MAX(
+            COALESCE(max_duration_ms, excluded.max_duration_ms),
+            COALESCE(excluded.max_duration_ms, max_duration_ms)
+        );
+END;
+
+CREATE TRIGGER trg_exec_bucket_job
+AFTER INSERT ON executions
+WHEN NEW.job_id IS NOT NULL
+BEGIN
+    INSERT INTO execution_buckets (
+        kind, job_id, source_tier, bucket_start_ts, last_execution_ts,
+        execution_count, success_count, error_count, timed_out_count, cancelled_count,
+        skipped_count, di_failure_count, thread_leaked_count,
+        total_duration_ms, min_duration_ms, max_duration_ms
+    ) VALUES (
+        NEW.kind, NEW.job_id, NEW.source_tier,
+        CAST(CAST(NEW.execution_start_ts AS INTEGER) / 60 * 60 AS REAL),
+        NEW.execution_start_ts,
+        1,
+        NEW.status = 'success',
+        NEW.status = 'error',
+        NEW.status = 'timed_out',
+        NEW.status = 'cancelled',
+        NEW.status = 'skipped',
+        NEW.is_di_failure != 0,
+        NEW.thread_leaked != 0,
+        CASE WHEN NEW.status != 'skipped' THEN NEW.duration_ms ELSE 0.0 END,
+        CASE WHEN NEW.status != 'skipped' THEN NEW.duration_ms END,
+        CASE WHEN NEW.status != 'skipped' THEN NEW.duration_ms END
+    )
+    ON CONFLICT (job_id, bucket_start_ts) WHERE job_id IS NOT NULL DO UPDATE SET
+        last_execution_ts = MAX(last_execution_ts, excluded.last_execution_ts),
+        execution_count = execution_count + 1,
+        success_count = success_count + excluded.success_count,
+        error_count = error_count + excluded.error_count,
+        timed_out_count = timed_out_count + excluded.timed_out_count,
+        cancelled_count = cancelled_count + excluded.cancelled_count,
+        skipped_count = skipped_count + excluded.skipped_count,
+        di_failure_count = di_failure_count + excluded.di_failure_count,
+        thread_leaked_count = thread_leaked_count + excluded.thread_leaked_count,
+        total_duration_ms = total_duration_ms + excluded.total_duration_ms,
+        min_duration_ms = MIN(
+            COALESCE(min_duration_ms, excluded.min_duration_ms),
+            COALESCE(excluded.min_duration_ms, min_duration_ms)
+        ),
+        max_duration_ms = MAX(
+            COALESCE(max_duration_ms, excluded.max_duration_ms),
+            COALESCE(excluded.max_duration_ms, max_duration_ms)
+        );
+END;
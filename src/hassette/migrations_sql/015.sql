@@ -0,0 +1,29 @@
+-- Migration 015: latency_histograms -- per-listener/job duration histograms.
+--
+-- CommandExecutor records every execution's duration into an in-memory log-bucketed histogram
+-- per listener and job (core/telemetry/latency.py) and periodically folds the counts in here:
+-- one row per listener or job, hourly period, and histogram bucket index. Percentile queries sum
+-- sample_count per bucket index over a window and rebuild the histogram, so p50/p90/p99 never
+-- scan the executions table.
+--
+-- listener_id/job_id cascade on delete, like execution_rollups (013.sql). One partial unique
+-- index per FK column is the upsert target.
+
+CREATE TABLE latency_histograms (
+    id                    INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind                  TEXT    NOT NULL CHECK (kind IN ('handler', 'job')),
+    listener_id           INTEGER REFERENCES listeners(id) ON DELETE CASCADE,
+    job_id                INTEGER REFERENCES scheduled_jobs(id) ON DELETE CASCADE,
+    period_start_ts       REAL    NOT NULL,
+    bucket_index          INTEGER NOT NULL CHECK (bucket_index >= 0),
+    sample_count          INTEGER NOT NULL CHECK (sample_count > 0),
+    CHECK ((listener_id IS NOT NULL) + (job_id IS NOT NULL) = 1)
+);
+
+CREATE UNIQUE INDEX idx_latency_listener_period
+    ON latency_histograms(listener_id, period_start_ts, bucket_index)
+    WHERE listener_id IS NOT NULL;
+CREATE UNIQUE INDEX idx_latency_job_period
+    ON latency_histograms(job_id, period_start_ts, bucket_index)
+    WHERE job_id IS NOT NULL;
+CREATE INDEX idx_latency_period ON latency_histograms(period_start_ts);
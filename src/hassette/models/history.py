@@ -1,9 +1,15 @@
+import math
+from array import array
 from collections.abc import Sequence
+from dataclasses import dataclass, field
 from typing import Any
 
 from pydantic import BaseModel
 from whenever import Instant
 
+HISTORY_CHUNK_SIZE = 1000
+"""Default number of rows per chunk yielded by the streaming history methods."""
+
 
 class HistoryEntry(BaseModel):
     """A single history entry for an entity."""
@@ -17,6 +23,45 @@ class HistoryEntry(BaseModel):
     last_updated: Instant
 
 
+@dataclass(slots=True)
+class HistoryColumns:
+    """One entity's history as parallel arrays, for numeric sensors.
+
+    Each row becomes one ``float`` per array (8 bytes each), instead of a dict or ``HistoryEntry``.
+    States that are not numbers (``unavailable``, ``unknown``, ...) are stored as NaN so gaps stay
+    visible at their timestamps.
+    """
+
+    entity_id: str
+
+    timestamps: array = field(default_factory=lambda: array("d"))
+    """``last_changed`` of each row, as Unix epoch seconds."""
+
+    values: array = field(default_factory=lambda: array("d"))
+    """Each row's state as a float, or NaN when the state is not numeric."""
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def append(self, row: dict[str, Any]) -> None:
+        """Append a normalized history row."""
+        self.timestamps.append(Instant.parse_iso(row["last_changed"]).timestamp_nanos() / 1e9)
+        try:
+            self.values.append(float(row["state"]))
+        except (TypeError, ValueError):
+            self.values.append(math.nan)
+
+
+def merge_history_entry(base_entry: dict[str, Any], delta_entry: dict[str, Any]) -> dict[str, Any]:
+    """Fill the keys a ``minimal_response`` row leaves out from the entity's first row."""
+    # if we have the same set of keys then we don't need to use the base entries
+    # as we already have everything we need
+    # this happens when minimal_response is not set
+    if base_entry.keys() == delta_entry.keys():
+        return delta_entry
+    return base_entry.copy() | delta_entry
+
+
 def normalize_history(entries: Any) -> list[list[dict[str, Any]]]:
     if not isinstance(entries, Sequence) or not all(isinstance(e, list) for e in entries):
         entries = [entries]  # Wrap in a list if not already a list of lists
@@ -27,21 +72,9 @@ def normalize_history(entries: Any) -> list[list[dict[str, Any]]]:
         if not entity_history:
             continue
 
-        normalized_list = []
-
         # Use the first entry as the base for later updates
         base_entry = entity_history[0]
-
-        for delta_entry in entity_history:
-            # if we have the same set of keys then we don't need to use the base entries
-            # as we already have everything we need
-            # this happens when minimal_response is not set
-            if set(base_entry.keys()) == set(delta_entry.keys()):
-                normalized_list.append(delta_entry)
-                continue
-
-            merged = base_entry.copy() | delta_entry
-            normalized_list.append(merged)
+        normalized_list = [merge_history_entry(base_entry, delta_entry) for delta_entry in entity_history]
 
         if normalized_list:
             normalized_entries.append(normalized_list)
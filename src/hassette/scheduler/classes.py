@@ -1,20 +1,16 @@
 import typing
 from dataclasses import dataclass, field
-from datetime import UTC, datetime
 from enum import StrEnum
 from logging import getLogger
 from typing import Any
 
-from croniter import croniter
 from whenever import ZonedDateTime
 
-import hassette.utils.date_utils as date_utils
 from hassette.execution_mode import ExecutionModeGuard
+from hassette.scheduler.cron import compile_cron
 from hassette.types.enums import ExecutionMode
 from hassette.types.types import SourceTier
 
-MAX_CRON_ITERATIONS = 10_000
-
 if typing.TYPE_CHECKING:
     import asyncio
     from collections.abc import Callable
@@ -72,9 +68,8 @@ class CronTrigger:
     def __init__(self, cron_expression: str, start: ZonedDateTime | None = None):
         self.cron_expression = cron_expression
         self.start = start
-        # Validate expression eagerly at construction time
-        base = start or date_utils.now()
-        croniter(cron_expression, base.to_stdlib(), ret_type=datetime)
+        # Compiling validates the expression eagerly at construction time
+        self._compiled = compile_cron(cron_expression)
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, CronTrigger):
@@ -100,76 +95,20 @@ class CronTrigger:
         return self._next_after(previous_run, current_time)
 
     def _next_after(self, anchor: ZonedDateTime, current_time: ZonedDateTime) -> ZonedDateTime:
-        cron = croniter(self.cron_expression, anchor.to_stdlib(), ret_type=datetime)
-        # Normalise current_time to UTC so the ``next_time > current_dt`` comparison below is
-        # unambiguous around DST transitions. During fall-back, ``current_time`` may carry
-        # fold=0 (pre-transition, CDT) while croniter returns fold=1 wall-clock values (CST).
-        # Without UTC normalisation, the CST occurrence appears UTC-earlier than the CDT
-        # anchor and the loop skips the ambiguous slot entirely.
-        current_dt_utc = current_time.to_stdlib().astimezone(UTC)
-        ambiguous_ticks_skipped = 0
-        # Bounded iteration — avoids O(N) spin for sub-second crons after long downtime.
-        # 10,000 iterations covers ~2.7 hours of per-second crons, which is generous.
-        for _ in range(MAX_CRON_ITERATIONS):
-            next_time = cron.get_next()
-            if next_time.astimezone(UTC) > current_dt_utc:
-                result = self._dst_safe_from_dt(next_time)
-                # Log when DST disambiguation is actually relevant: either the returned
-                # tick itself is ambiguous (fold=1 was meaningful), or we traversed
-                # ambiguous ticks on the way here. Logs the dispatched result (post-
-                # disambiguation) to avoid printing a wall-clock string that differs from
-                # the instant actually scheduled.
-                returned_is_ambiguous = self._is_fall_back_ambiguous(next_time)
-                if ambiguous_ticks_skipped or returned_is_ambiguous:
-                    LOGGER.info(
-                        "CronTrigger(%s): DST fall-back disambiguation — %d ambiguous tick(s) "
-                        "traversed; returning %s (fold=1, post-transition)",
-                        self.cron_expression,
-                        ambiguous_ticks_skipped + (1 if returned_is_ambiguous else 0),
-                        result,
-                    )
-                return result
-            # Only count ticks we actually skipped past — the tick that exits the loop is
-            # handled above.
-            if self._is_fall_back_ambiguous(next_time):
-                ambiguous_ticks_skipped += 1
-        # Too many iterations — skip ahead from current time.
-        # Re-anchor croniter in the *original* timezone so cron expressions like
-        # "0 9 * * *" still fire at 09:00 local time, not 09:00 UTC.
-        LOGGER.warning(
-            "CronTrigger(%s) exceeded %d iterations catching up, skipping ahead from current_time",
-            self.cron_expression,
-            MAX_CRON_ITERATIONS,
-        )
-        skip_ahead_dt = current_time.to_stdlib()
-        cron = croniter(self.cron_expression, skip_ahead_dt, ret_type=datetime)
-        next_time = cron.get_next()
-        return self._dst_safe_from_dt(next_time)
-
-    @staticmethod
-    def _is_fall_back_ambiguous(dt: datetime) -> bool:
-        """Return True when ``dt``'s wall-clock time occurs twice (fall-back ambiguity)."""
-        return dt.replace(fold=0).astimezone(UTC) != dt.replace(fold=1).astimezone(UTC)
-
-    @staticmethod
-    def _dst_safe_from_dt(dt: datetime) -> ZonedDateTime:
-        """Convert a croniter-produced datetime to ZonedDateTime with DST disambiguation.
-
-        Uses ``fold=1`` (post-transition / "later" occurrence) to handle:
-        - **Fall-back (fold/repeated time):** prefers the second (post-transition) occurrence.
-          The caller is responsible for logging when ambiguity is encountered (see
-          ``_next_after``), which emits a single summary per call instead of per-tick spam.
-        - **Spring-forward (gap/skipped time):** croniter already advances past the gap, so
-          ``fold=1`` and ``fold=0`` produce the same result for non-gap times.
-
-        Args:
-            dt: A timezone-aware datetime produced by ``croniter.get_next()`` with a
-                ``ZoneInfo``-backed tzinfo.
-
-        Returns:
-            A ``ZonedDateTime`` with DST disambiguation applied.
-        """
-        return ZonedDateTime(dt.replace(fold=1))
+        # The first grid tick after the anchor that is also after current_time is simply the
+        # first tick after the later of the two, so a long catch-up costs no more than a
+        # regular reschedule. Comparing instants (not wall clocks) keeps this unambiguous
+        # around DST transitions; the search itself runs in the anchor's timezone so that
+        # "0 9 * * *" keeps firing at 09:00 local time.
+        moment = max(anchor, current_time).to_tz(anchor.tz)
+        result, ambiguous = self._compiled.next_after(moment)
+        if ambiguous:
+            LOGGER.info(
+                "CronTrigger(%s): DST fall-back disambiguation — returning %s (fold=1, post-transition)",
+                self.cron_expression,
+                result,
+            )
+        return result
 
 
 @dataclass(order=True)
@@ -0,0 +1,205 @@
+"""Compiled cron expressions shared by every ``CronTrigger`` with the same expression.
+
+``croniter`` parses its expression every time an iterator is built and then walks the schedule
+one occurrence at a time. A trigger only ever needs "the first occurrence after this instant",
+so the expression is expanded once into the sorted values each field allows, and the next
+occurrence is found by field arithmetic on the wall clock: skip to the next allowed month, day,
+hour, minute and second in turn. The cost does not depend on how far back the previous run was,
+so catching up after downtime takes as long as any other reschedule.
+
+Expressions using ``croniter`` extensions that do not reduce to plain value sets (``L``, ``#``,
+a year field, ...) keep a ``CompiledCron`` that asks ``croniter`` for the same answer.
+"""
+
+from bisect import bisect_right
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache
+from typing import NamedTuple
+
+from croniter import croniter
+from whenever import PlainDateTime, ZonedDateTime
+
+CRON_CACHE_MAX_SIZE = 1_024
+"""Distinct cron expressions kept compiled at once."""
+
+CRON_SEARCH_YEARS = 8
+"""How many years ahead field arithmetic searches before handing the expression to croniter.
+
+Eight years spans every leap-day and weekday combination a plain expression can ask for.
+"""
+
+_ONE_DAY = timedelta(days=1)
+
+
+class NextOccurrence(NamedTuple):
+    """The next occurrence of a cron expression."""
+
+    at: ZonedDateTime
+    """The occurrence, disambiguated to the later instant when its wall-clock time is ambiguous."""
+
+    ambiguous: bool
+    """Whether the wall-clock time occurs twice on that day (a DST fall-back)."""
+
+
+class CompiledCron:
+    """A cron expression expanded once into the values each of its fields allows.
+
+    Follows croniter's semantics: 5 fields (``minute hour day-of-month month day-of-week``) or 6
+    with seconds last, Sunday as 0 or 7, and a day matching when either the day-of-month or the
+    day-of-week field matches if both are restricted.
+    """
+
+    __slots__ = (
+        "_days",
+        "_has_seconds",
+        "_hours",
+        "_minutes",
+        "_months",
+        "_plain",
+        "_seconds",
+        "_weekdays",
+        "expression",
+    )
+
+    expression: str
+
+    def __init__(self, expression: str) -> None:
+        """Expand ``expression``.
+
+        Raises:
+            ValueError: If the expression is not a valid cron expression.
+        """
+        self.expression = expression
+        fields, nth_weekdays = croniter.expand(expression)
+
+        self._plain = False
+        if nth_weekdays or len(fields) not in (5, 6) or not all(_is_plain(field) for field in fields):
+            # croniter-only syntax: every lookup goes through croniter
+            return
+
+        self._plain = True
+        minutes, hours, days, months, weekdays, *seconds = fields
+        self._minutes = _values(minutes, 0, 59)
+        self._hours = _values(hours, 0, 23)
+        self._months = _values(months, 1, 12)
+        self._seconds = _values(seconds[0], 0, 59) if seconds else (0,)
+        self._has_seconds = bool(seconds)
+        # None: the field is unrestricted
+        self._days = None if days == ["*"] else frozenset(_values(days, 1, 31))
+        self._weekdays = None if weekdays == ["*"] else frozenset(_values(weekdays, 0, 6))
+
+    def next_after(self, moment: ZonedDateTime) -> NextOccurrence:
+        """Return the first occurrence strictly after ``moment``, in ``moment``'s timezone.
+
+        Occurrences are wall-clock times. One that falls in a DST gap moves forward by the length
+        of the gap, and one that occurs twice resolves to its later (post-transition) instant.
+        """
+        if self._plain:
+            after = moment.to_plain()
+            later = after.assume_tz(moment.tz, disambiguate="later")
+            if later != moment:
+                # ``moment`` is in the first pass of a repeated hour, so that hour's wall times
+                # (which resolve to their second pass) are still ahead of it. Search from the
+                # same instant on the later offset and skip wall times that resolve before it.
+                after = moment.to_fixed_offset(later.offset).to_plain()
+            after = after.to_stdlib()
+            while (wall := self._next_wall_time(after)) is not None:
+                plain = PlainDateTime(wall.year, wall.month, wall.day, wall.hour, wall.minute, wall.second)
+                at = plain.assume_tz(moment.tz, disambiguate="later")
+                if at > moment:
+                    earlier = plain.assume_tz(moment.tz, disambiguate="earlier")
+                    return NextOccurrence(at, earlier != at and at.to_plain() == earlier.to_plain())
+                after = wall
+
+        next_time = croniter(self.expression, moment.to_stdlib(), ret_type=datetime).get_next()
+        ambiguous = next_time.replace(fold=0).astimezone(UTC) != next_time.replace(fold=1).astimezone(UTC)
+        return NextOccurrence(ZonedDateTime(next_time.replace(fold=1)), ambiguous)
+
+    def _next_wall_time(self, after: datetime) -> datetime | None:
+        """Return the first naive wall-clock time strictly after ``after`` that the fields allow."""
+        if self._has_seconds:
+            current = after.replace(microsecond=0) + timedelta(seconds=1)
+        else:
+            current = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        last_year = after.year + CRON_SEARCH_YEARS
+
+        while current.year <= last_year:
+            if current.month not in self._months:
+                month = _next_value(self._months, current.month)
+                if month is None:
+                    current = datetime(current.year + 1, self._months[0], 1)
+                else:
+                    current = datetime(current.year, month, 1)
+                continue
+
+            if not self._day_matches(current):
+                current = datetime(current.year, current.month, current.day) + _ONE_DAY
+                continue
+
+            if current.hour not in self._hours:
+                hour = _next_value(self._hours, current.hour)
+                day_start = datetime(current.year, current.month, current.day)
+                current = day_start + (timedelta(hours=hour) if hour is not None else _ONE_DAY)
+                continue
+
+            if current.minute not in self._minutes:
+                minute = _next_value(self._minutes, current.minute)
+                hour_start = current.replace(minute=0, second=0)
+                current = hour_start + timedelta(hours=1) if minute is None else hour_start.replace(minute=minute)
+                continue
+
+            if current.second not in self._seconds:
+                second = _next_value(self._seconds, current.second)
+                minute_start = current.replace(second=0)
+                current = minute_start + timedelta(minutes=1) if second is None else minute_start.replace(second=second)
+                continue
+
+            return current
+
+        return None
+
+    def _day_matches(self, moment: datetime) -> bool:
+        """Return True if ``moment``'s date passes the day-of-month and day-of-week fields.
+
+        An unrestricted field never matches on its own, so with one field restricted only that
+        field decides, and with both restricted either one is enough.
+        """
+        days, weekdays = self._days, self._weekdays
+        if days is None and weekdays is None:
+            return True
+        # datetime counts Monday as 0, cron counts Sunday as 0
+        return (days is not None and moment.day in days) or (
+            weekdays is not None and (moment.weekday() + 1) % 7 in weekdays
+        )
+
+    def __repr__(self) -> str:
+        return f"CompiledCron({self.expression!r})"
+
+
+@lru_cache(maxsize=CRON_CACHE_MAX_SIZE)
+def compile_cron(expression: str) -> CompiledCron:
+    """Return the shared ``CompiledCron`` for ``expression``, compiling it on first use.
+
+    Raises:
+        ValueError: If the expression is not a valid cron expression.
+    """
+    return CompiledCron(expression)
+
+
+def _is_plain(field: Sequence[object]) -> bool:
+    """Return True if croniter expanded ``field`` to ``*`` or to plain integers."""
+    return field == ["*"] or all(isinstance(value, int) for value in field)
+
+
+def _values(field: Sequence[object], low: int, high: int) -> tuple[int, ...]:
+    """Return the sorted values a plain field allows, spelling out ``*`` as ``low..high``."""
+    if field == ["*"]:
+        return tuple(range(low, high + 1))
+    return tuple(sorted({value for value in field if isinstance(value, int)}))
+
+
+def _next_value(values: tuple[int, ...], current: int) -> int | None:
+    """Return the smallest allowed value greater than ``current``, or None."""
+    index = bisect_right(values, current)
+    return values[index] if index < len(values) else None
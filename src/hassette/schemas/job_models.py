@@ -89,6 +89,13 @@ class JobSummary(BaseModel):
     """Minimum execution duration in milliseconds. None means no executions; 0.0 means executed in under 1ms."""
     max_duration_ms: float | None = None
     """Maximum execution duration in milliseconds. None means no executions; 0.0 means executed in under 1ms."""
+    p50_duration_ms: float | None = None
+    """Median execution duration from the ``latency_histograms`` table, or None when nothing is recorded.
+    Read to histogram-bucket precision (within about 9%) over whole hours; see ``core/telemetry/latency.py``."""
+    p90_duration_ms: float | None = None
+    """90th percentile execution duration; same source and precision as ``p50_duration_ms``."""
+    p99_duration_ms: float | None = None
+    """99th percentile execution duration; same source and precision as ``p50_duration_ms``."""
     mode: ExecutionMode = DEFAULT_OVERLAP_MODE
     """Resolved overlap mode for this job. Persisted at registration; sourced from the DB column
     ``scheduled_jobs.mode``."""
@@ -57,6 +57,13 @@ class ListenerSummary(BaseModel):
     avg_duration_ms: float
     min_duration_ms: float | None = None
     max_duration_ms: float | None = None
+    p50_duration_ms: float | None = None
+    """Median invocation duration from the ``latency_histograms`` table, or None when nothing is recorded.
+    Read to histogram-bucket precision (within about 9%) over whole hours; see ``core/telemetry/latency.py``."""
+    p90_duration_ms: float | None = None
+    """90th percentile invocation duration; same source and precision as ``p50_duration_ms``."""
+    p99_duration_ms: float | None = None
+    """99th percentile invocation duration; same source and precision as ``p50_duration_ms``."""
     last_invoked_at: float | None
     last_error_type: str | None
     last_error_message: str | None
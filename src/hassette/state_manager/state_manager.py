@@ -5,7 +5,7 @@ from typing import Generic, NamedTuple
 
 from frozendict import deepfreeze, frozendict
 
-from hassette.conversion import STATE_REGISTRY, StateKey
+from hassette.conversion import STATE_REGISTRY, TYPED_STATE_CACHE, StateKey, convert_state_dicts_to_model
 from hassette.exceptions import EntityNotInViewError, RegistryNotReadyError
 from hassette.models import states
 from hassette.models.states import BaseState
@@ -61,6 +61,8 @@ class DomainStates(Mapping[str, StateT]):
     without needing to make direct calls to the Home Assistant API.
 
     Accessed states are automatically validated against the provided model and cached for efficient repeated access.
+    Validated models are shared process-wide through ``TYPED_STATE_CACHE``, so an unchanged entity is converted once
+    no matter how many apps read it.
 
     Implements ``collections.abc.Mapping`` — ``keys()``, ``values()``, and ``items()`` return re-iterable views
     (not one-shot iterators), and ``for entity_id in domain_states`` yields entity ID strings, matching Python
@@ -106,6 +108,18 @@ class DomainStates(Mapping[str, StateT]):
         self._cache: dict[str, CacheValue[StateT]] = {}
 
     def _validate_or_return_from_cache(self, entity_id: str, state: "HassStateDict") -> StateT:
+        # The state's revision plus the dict's identity pin the shared model; this is the path
+        # every read of an unchanged entity takes.
+        revision = self._state_proxy.get_state_revision(entity_id)
+        shared = TYPED_STATE_CACHE.get(entity_id, revision, self._model, state)
+        if shared is not None:
+            return typing.cast("StateT", shared)
+
+        model = self._validate_or_return_from_local_cache(entity_id, state)
+        TYPED_STATE_CACHE.put(entity_id, revision, self._model, state, model)
+        return model
+
+    def _validate_or_return_from_local_cache(self, entity_id: str, state: "HassStateDict") -> StateT:
         last_updated: str | None = state.get("last_updated")
 
         cached = self._cache.get(entity_id)
@@ -127,6 +141,41 @@ class DomainStates(Mapping[str, StateT]):
         self._cache[entity_id] = CacheValue(last_updated=last_updated, frozen_state=frozen_state, model=validated)
         return validated
 
+    def _convert_uncached(self) -> None:
+        """Bulk-validate the states in this view that have no validated model yet.
+
+        Runs before ``to_dict`` so a cold view costs one Pydantic call instead of one per entity.
+        Entities whose local cache entry is still current are skipped without touching
+        ``TYPED_STATE_CACHE``. Results land in both caches, where ``_validate_or_return_from_cache``
+        finds them; states that fail are left alone and go through the single-state path, which
+        reports the error.
+        """
+        uncached: list[tuple[str, int | None, HassStateDict]] = []
+        for entity_id, state in self._state_proxy.yield_domain_states(self._domain):
+            if self._predicate is not None and not self._predicate(state):
+                continue
+            cached = self._cache.get(entity_id)
+            last_updated = state.get("last_updated")
+            if cached is not None and last_updated is not None and cached.last_updated == last_updated:
+                continue
+            revision = self._state_proxy.get_state_revision(entity_id)
+            if TYPED_STATE_CACHE.get(entity_id, revision, self._model, state) is None:
+                uncached.append((entity_id, revision, state))
+
+        if len(uncached) < 2:
+            return
+
+        validated = convert_state_dicts_to_model([state for _, _, state in uncached], self._model)
+        for (entity_id, revision, state), model in zip(uncached, validated, strict=True):
+            if model is None:
+                continue
+            self._cache[entity_id] = CacheValue(
+                last_updated=state.get("last_updated"),
+                frozen_state=deepfreeze(state),
+                model=typing.cast("StateT", model),
+            )
+            TYPED_STATE_CACHE.put(entity_id, revision, self._model, state, model)
+
     def _validate_if_member(self, entity_id: str, state: "HassStateDict") -> StateT | None:
         """Return the validated model if entity_id/state is a member of this view, else None.
 
@@ -158,7 +207,10 @@ class DomainStates(Mapping[str, StateT]):
             This method will iterate over all states in the domain and validate them,
             which may be expensive for large domains. Consider using the iterator
             returned by `__iter__` for lazy evaluation if performance is a concern.
+            States not validated yet are validated in bulk first, one Pydantic call
+            for the whole domain.
         """
+        self._convert_uncached()
         return dict(self)
 
     def __iter__(self) -> Iterator[str]:
@@ -442,8 +494,16 @@ class StateManager(Resource):
         if state_dict is None:
             return None
 
+        revision = self._state_proxy.get_state_revision(entity_id)
         try:
-            return self.hassette.state_registry.try_convert_state(state_dict, entity_id)
+            # Looked up under the class the registry resolves for the domain, so a hit is shared
+            # with that domain's DomainStates. A fallback conversion is cached under BaseState and
+            # so is re-attempted on the next call, as before.
+            state_class = self.hassette.state_registry.resolve(domain=entity_id.split(".", 1)[0]) or BaseState
+            cached = TYPED_STATE_CACHE.get(entity_id, revision, state_class, state_dict)
+            if cached is not None:
+                return cached
+            converted = self.hassette.state_registry.try_convert_state(state_dict, entity_id)
         except Exception as exc:
             LOGGER.error(
                 "Failed to convert state for entity '%s': %s",
@@ -453,6 +513,9 @@ class StateManager(Resource):
             )
             return None
 
+        TYPED_STATE_CACHE.put(entity_id, revision, type(converted), state_dict, converted)
+        return converted
+
     def anybody_home(self) -> bool:
         """Return True if at least one tracked person is home.
 
@@ -129,6 +129,7 @@ def make_execution_record(
     attempt_number: int = 1,
     args_json: str = "[]",
     kwargs_json: str = "{}",
+    rollup: bool = False,
 ) -> ExecutionRecord:
     """Build a frozen ExecutionRecord with deterministic defaults (no wall-clock reads).
 
@@ -160,6 +161,7 @@ def make_execution_record(
         attempt_number=attempt_number,
         args_json=args_json,
         kwargs_json=kwargs_json,
+        rollup=rollup,
     )
 
 
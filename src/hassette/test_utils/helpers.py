@@ -53,8 +53,9 @@ SETTLE_SECONDS = 0.05
 class FakeStateReader:
     """Minimal dict-backed implementation of the StateReader protocol.
 
-    Holds states keyed by entity_id and answers the two members StateReader
-    declares: get_state, yield_domain_states.
+    Holds states keyed by entity_id and answers the three members StateReader
+    declares: get_state, get_state_revision, yield_domain_states. It does not
+    track revisions, so get_state_revision always returns None.
     """
 
     def __init__(self, states: "dict[str, HassStateDict]") -> None:
@@ -63,6 +64,9 @@ class FakeStateReader:
     def get_state(self, entity_id: str) -> "HassStateDict | None":
         return self.states.get(entity_id)
 
+    def get_state_revision(self, entity_id: str) -> int | None:
+        return None
+
     def yield_domain_states(self, domain: str) -> "Generator[tuple[str, HassStateDict], Any, None]":
         for eid, state in self.states.items():
             if eid.startswith(f"{domain}."):
@@ -68,6 +68,7 @@ def make_mock_hassette(
         - ``.bus_service.get_listeners_by_owner``: :class:`~unittest.mock.Mock` returning ``[]``
         - ``.bus_service.register_removal_callback``: :class:`~unittest.mock.Mock`
         - ``.bus_service.deregister_removal_callback``: :class:`~unittest.mock.Mock`
+        - ``.bus_service.has_listeners``: :class:`~unittest.mock.Mock` returning ``False``
         - ``.app_handler.get``: :class:`~unittest.mock.Mock` returning ``None`` (no app running)
         - ``.app_bootstrap_coordinator.is_released``: :class:`~unittest.mock.Mock` returning ``True``
         - ``.app_bootstrap_coordinator.wait_released``: :class:`~unittest.mock.AsyncMock` returning
@@ -139,6 +140,7 @@ def make_mock_hassette(
     hassette.bus_service.get_listeners_by_owner = Mock(return_value=[])
     hassette.bus_service.register_removal_callback = Mock()
     hassette.bus_service.deregister_removal_callback = Mock()
+    hassette.bus_service.has_listeners = Mock(return_value=False)
 
     # App handler stubs — get() is synchronous; return None (no app running by default)
     hassette.app_handler.get = Mock(return_value=None)
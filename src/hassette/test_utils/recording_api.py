@@ -10,6 +10,8 @@ fidelity should use a full integration test with a live HA connection.
 
 import copy
 import inspect
+from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
 from difflib import get_close_matches
 from enum import StrEnum
 from typing import TYPE_CHECKING, Any, ClassVar, Never, Protocol, runtime_checkable
@@ -49,7 +51,7 @@ from hassette.models.helpers import (
     UpdateInputTextParams,
     UpdateTimerParams,
 )
-from hassette.models.history import HistoryEntry
+from hassette.models.history import HISTORY_CHUNK_SIZE, HistoryColumns, HistoryEntry
 from hassette.models.services import ServiceResponse
 from hassette.models.states.base import BaseState, Context
 from hassette.resources.base import Resource
@@ -234,6 +236,7 @@ class ApiProtocol(Protocol):
         event_data: dict[str, Any] | None = None,
     ) -> dict[str, Any]: ...
     async def delete_entity(self, entity_id: str) -> None: ...
+    def batch(self) -> AbstractAsyncContextManager[None]: ...
     async def notify(
         self,
         message: str,
@@ -279,6 +282,33 @@ class ApiProtocol(Protocol):
         minimal_response: bool = False,
         no_attributes: bool = False,
     ) -> dict[str, list[HistoryEntry]]: ...
+    def iter_history(
+        self,
+        entity_ids: str | list[str],
+        start_time: PlainDateTime | ZonedDateTime | Date | str,
+        end_time: PlainDateTime | ZonedDateTime | Date | str | None = None,
+        significant_changes_only: bool = False,
+        minimal_response: bool = False,
+        no_attributes: bool = False,
+        chunk_size: int = HISTORY_CHUNK_SIZE,
+    ) -> AsyncIterator[tuple[str, list[HistoryEntry]]]: ...
+    def iter_history_raw(
+        self,
+        entity_ids: str | list[str],
+        start_time: PlainDateTime | ZonedDateTime | Date | str,
+        end_time: PlainDateTime | ZonedDateTime | Date | str | None = None,
+        significant_changes_only: bool = False,
+        minimal_response: bool = False,
+        no_attributes: bool = False,
+        chunk_size: int = HISTORY_CHUNK_SIZE,
+    ) -> AsyncIterator[tuple[str, list[dict[str, Any]]]]: ...
+    async def get_history_columns(
+        self,
+        entity_ids: str | list[str],
+        start_time: PlainDateTime | ZonedDateTime | Date | str,
+        end_time: PlainDateTime | ZonedDateTime | Date | str | None = None,
+        significant_changes_only: bool = False,
+    ) -> dict[str, HistoryColumns]: ...
     async def get_logbook(
         self,
         entity_id: str,
@@ -734,6 +764,11 @@ class RecordingApi(Resource):
         )
         return {}
 
+    @asynccontextmanager
+    async def batch(self) -> AsyncIterator[None]:
+        """Match ``Api.batch()``; calls inside the block are still recorded one by one, as made."""
+        yield
+
     def _get_raw_state(self, entity_id: str) -> "HassStateDict":
         """Look up raw state dict from the proxy, raising EntityNotFoundError if absent."""
         raw = self._state_proxy.states.get(entity_id)
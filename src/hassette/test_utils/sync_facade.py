@@ -20,7 +20,7 @@ from hassette.api.helpers import HelperDomain
 from hassette.const.misc import FalseySentinel
 from hassette.exceptions import EntityNotFoundError
 from hassette.models.entities.base import BaseEntity
-from hassette.models.history import HistoryEntry
+from hassette.models.history import HistoryColumns, HistoryEntry
 from hassette.models.services import ServiceResponse
 from hassette.models.states.base import BaseState, Context
 from hassette.test_utils.api_call import ApiCall
@@ -325,6 +325,15 @@ class RecordingSyncFacade:  # pyright: ignore[reportUnusedClass]
     ) -> dict[str, list[HistoryEntry]]:
         raise NotImplementedError(STUB_MSG_GENERIC.format(name="get_histories"))
 
+    def get_history_columns(
+        self,
+        entity_ids: str | list[str],
+        start_time: PlainDateTime | ZonedDateTime | Date | str,
+        end_time: PlainDateTime | ZonedDateTime | Date | str | None = None,
+        significant_changes_only: bool = False,
+    ) -> dict[str, HistoryColumns]:
+        raise NotImplementedError(STUB_MSG_GENERIC.format(name="get_history_columns"))
+
     def get_logbook(
         self,
         entity_id: str,
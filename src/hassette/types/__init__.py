@@ -31,6 +31,7 @@ from .types import (
     StateT,
     StateValueT,
     SyncHandler,
+    TelemetryMode,
     TriggerProtocol,
     framework_display_name,
     is_framework_key,
@@ -66,6 +67,7 @@ __all__ = [
     "StateT",
     "StateValueT",
     "SyncHandler",
+    "TelemetryMode",
     "Topic",
     "TriggerProtocol",
     "framework_display_name",
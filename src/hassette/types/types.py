@@ -63,6 +63,14 @@ class CliFormat:
 SourceTier = Literal["app", "framework"]
 """Identifies whether a telemetry record originates from a user app or the framework itself."""
 
+TelemetryMode = Literal["full", "sampled", "aggregated"]
+"""How successful executions are recorded: one ``executions`` row each (``"full"``), a row for a
+sample of them (``"sampled"``), or none (``"aggregated"``). Successes without a row are counted in
+``execution_rollups``; errors, timeouts and cancellations always get a row."""
+
+WsJsonDecoderName = Literal["orjson", "json"]
+"""Names accepted by ``websocket.json_decoder``."""
+
 IfExistsPolicy = Literal["error", "skip", "replace"]
 """Collision policy for listener/job registration when a matching name already exists."""
 
@@ -270,13 +278,15 @@ class SchedulerServiceProtocol(Protocol):
 class StateReader(Protocol):
     """Read-only protocol for the state-proxy surface consumed by StateManager and DomainStates.
 
-    Describes the two members state-manager consumers call on the state proxy.
+    Describes the three members state-manager consumers call on the state proxy.
     StateProxy satisfies this protocol structurally — no changes to the
     concrete class are required.
     """
 
     def get_state(self, entity_id: str) -> "HassStateDict | None": ...
 
+    def get_state_revision(self, entity_id: str) -> int | None: ...
+
     def yield_domain_states(self, domain: str) -> "Generator[tuple[str, HassStateDict], Any, None]": ...
 
 
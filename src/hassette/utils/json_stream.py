@@ -0,0 +1,162 @@
+"""Incremental decoding of large nested JSON arrays.
+
+Home Assistant's history endpoint answers with one JSON array holding an array of state rows per
+entity (``[[{...}, ...], [{...}, ...]]``). Decoding that body in one piece holds the whole text and
+the whole decoded tree in memory at once. ``NestedArrayScanner`` instead walks the body as it
+arrives and cuts out one row (an object nested two levels deep) at a time, so memory stays bounded
+by the largest row plus one network chunk.
+
+Runs of consecutive rows nested at most two levels deep (every row of a ``minimal_response``
+history, and most rows with attributes) are matched by one regex and decoded by one ``orjson`` call.
+Anything else falls back to walking the structural bytes (brackets, braces, and quotes) one at a
+time until the row closes.
+"""
+
+import re
+from collections.abc import AsyncIterable, AsyncIterator
+from typing import Any
+
+import orjson
+
+_STRUCTURAL = re.compile(rb'[\[\]{}"]')
+"""Bytes that change nesting or start a string, outside of a string."""
+
+_STRING_SPECIAL = re.compile(rb'["\\]')
+"""Bytes that end a string or escape the next byte, inside a string."""
+
+_OPEN = frozenset(b"[{")
+
+
+def _rows_pattern() -> re.Pattern[bytes]:
+    # Possessive quantifiers throughout a row: JSON has one parse, so a failed match (a row cut off
+    # at the end of the buffer) fails fast instead of retrying every split of every token.
+    string = rb'"(?:[^"\\]++|\\.)*+"'
+    plain = rb'[^{}\[\]"]++'
+    level = rb"(?:" + plain + rb"|" + string + rb")*+"
+    for _ in range(2):  # each pass allows one more level of nesting inside a row
+        container = rb"(?:\{" + level + rb"\}|\[" + level + rb"\])"
+        level = rb"(?:" + plain + rb"|" + string + rb"|" + container + rb")*+"
+    row = rb"\{" + level + rb"\}"
+    return re.compile(row + rb"(?:\s*,\s*" + row + rb")*")
+
+
+_ROW_RUN = _rows_pattern()
+"""A comma-separated run of complete rows, each nested at most two levels deep."""
+
+
+class NestedArrayScanner:
+    """Cut the rows out of a ``[[row, ...], ...]`` JSON document fed in arbitrary chunks.
+
+    A row is any object that is an element of an inner array. Each inner array is a group, numbered
+    from 0 in document order. A flat top-level array of objects (``[row, ...]``) is treated as a
+    single group 0, matching how ``normalize_history`` wraps it.
+    """
+
+    def __init__(self) -> None:
+        self._buf = bytearray()
+        self._pos = 0
+        """Next unscanned offset in ``_buf``."""
+
+        self._depth = 0
+        self._in_string = False
+        self._row_start: int | None = None
+        """Offset of the ``{`` opening the row being cut out, while inside one."""
+
+        self._row_depth = 0
+        """Depth at which the current row's object opened; the row ends when depth returns to it."""
+
+        self._group = -1
+        self._done = False
+
+    @property
+    def done(self) -> bool:
+        """True once the closing bracket of the top-level array has been seen."""
+        return self._done
+
+    def feed(self, data: bytes) -> list[tuple[int, Any]]:
+        """Scan another chunk of the document and return the rows it completed.
+
+        Returns:
+            ``(group index, decoded row)`` pairs in document order.
+
+        Raises:
+            ValueError: If the document is not an array, or a row is not valid JSON.
+        """
+        self._buf += data
+        rows: list[tuple[int, Any]] = []
+        buf, pos, end = self._buf, self._pos, len(self._buf)
+
+        while pos < end and not self._done:
+            if self._in_string:
+                match = _STRING_SPECIAL.search(buf, pos)
+                if match is None:
+                    pos = end
+                    break
+                pos = match.start()
+                if buf[pos] == 0x5C:  # backslash: skip the escaped byte, which may be in the next chunk
+                    if pos + 1 >= end:
+                        break
+                    pos += 2
+                    continue
+                self._in_string = False
+                pos += 1
+                continue
+
+            match = _STRUCTURAL.search(buf, pos)
+            if match is None:
+                pos = end
+                break
+            pos = match.start()
+            char = buf[pos]
+
+            if char == 0x22:  # quote
+                self._in_string = True
+            elif char in _OPEN:
+                if self._depth == 0 and char != 0x5B:
+                    raise ValueError("Expected a JSON array")
+                if self._row_start is None and char == 0x7B and self._depth in (1, 2):
+                    if self._depth == 1:  # flat [row, ...] document
+                        self._group = max(self._group, 0)
+                    run = _ROW_RUN.match(buf, pos)
+                    if run is not None:
+                        decoded = orjson.loads(b"[" + buf[pos : run.end()] + b"]")
+                        rows.extend((self._group, row) for row in decoded)
+                        pos = run.end()
+                        continue
+                    self._row_start = pos
+                    self._row_depth = self._depth + 1
+                elif self._row_start is None and char == 0x5B and self._depth == 1:
+                    self._group += 1
+                self._depth += 1
+            else:
+                if self._row_start is not None and self._depth == self._row_depth:
+                    rows.append((self._group, orjson.loads(bytes(buf[self._row_start : pos + 1]))))
+                    self._row_start = None
+                self._depth -= 1
+                if self._depth == 0:
+                    self._done = True
+            pos += 1
+
+        # Drop everything already consumed; only a row still being cut out has to be kept.
+        keep_from = pos if self._row_start is None else self._row_start
+        del buf[:keep_from]
+        self._pos = pos - keep_from
+        if self._row_start is not None:
+            self._row_start = 0
+        return rows
+
+
+async def iter_nested_array_rows(chunks: AsyncIterable[bytes]) -> AsyncIterator[tuple[int, Any]]:
+    """Yield ``(group index, decoded row)`` pairs from a ``[[row, ...], ...]`` body as it streams in.
+
+    Raises:
+        ValueError: If the body is not an array, a row is not valid JSON, or the body ends early.
+    """
+    scanner = NestedArrayScanner()
+    async for chunk in chunks:
+        for row in scanner.feed(chunk):
+            yield row
+        if scanner.done:
+            return
+    if not scanner.done:
+        raise ValueError("JSON array ended before its closing bracket")
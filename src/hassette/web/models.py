@@ -347,6 +347,9 @@ class ListenerWithSummary(BaseModel):
     avg_duration_ms: float = 0.0
     min_duration_ms: float | None = None
     max_duration_ms: float | None = None
+    p50_duration_ms: float | None = None
+    p90_duration_ms: float | None = None
+    p99_duration_ms: float | None = None
     total_duration_ms: float = 0.0
     predicate_description: str | None = None
     human_description: str | None = None
@@ -4,7 +4,7 @@ import asyncio
 import inspect
 from types import SimpleNamespace
 from typing import TYPE_CHECKING
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
@@ -23,6 +23,7 @@ from hassette.event_handling.predicates import (
 )
 from hassette.events.base import Event
 from hassette.test_utils import create_call_service_event, create_state_change_event, wait_for
+from hassette.test_utils.helpers import settle
 
 if TYPE_CHECKING:
     from hassette.bus import Bus
@@ -563,6 +564,29 @@ async def test_throttled_dispatch_drops_events_through_executor(hassette_with_bu
     assert cmd.listener_id is not None
 
 
+async def test_rate_limited_events_spawn_no_dispatch_task(hassette_with_bus: "HassetteHarness") -> None:
+    """Throttle drops and debounce coalescing are settled while matching, before any dispatch task."""
+    hassette = hassette_with_bus
+    handled: list[str] = []
+
+    def handler(event: Event) -> None:
+        handled.append(event.payload)
+
+    await hassette.bus.on(topic="custom.admit_throttle", handler=handler, throttle=5.0, name="admit_throttle")
+    await hassette.bus.on(topic="custom.admit_debounce", handler=handler, debounce=0.05, name="admit_debounce")
+
+    bus_service = hassette.bus_service
+    with patch.object(bus_service.task_bucket, "spawn", wraps=bus_service.task_bucket.spawn) as spawn:
+        for i in range(5):
+            await hassette.send_event(Event(topic="custom.admit_throttle", payload=f"t{i}"))
+            await hassette.send_event(Event(topic="custom.admit_debounce", payload=f"d{i}"))
+
+        await wait_for(lambda: sorted(handled) == ["d4", "t0"], desc="throttled and debounced handlers ran")
+
+    dispatch_tasks = [c for c in spawn.call_args_list if c.kwargs.get("name") == "bus:dispatch_listener"]
+    assert len(dispatch_tasks) == 1, "only the first throttled event should need a dispatch task"
+
+
 async def test_internal_dispatch_with_debounce_coalesces_events(hassette_with_bus: "HassetteHarness") -> None:
     """Non-app listener (db_id=None) with debounce coalesces rapid events.
 
@@ -692,17 +716,16 @@ async def test_cancel_during_debounce_prevents_handler_fire(hassette_with_bus: "
 
     # Send an event to start the debounce timer
     await hassette.send_event(Event(topic="custom.cancel_debounce", payload="test"))
-    # Wait until the debounce task is actually sleeping
-    await wait_for(lambda: rate_limiter._debounce_task is not None, desc="debounce task spawned")
+    # Wait until the debounce timer is actually armed
+    await wait_for(lambda: rate_limiter._debounce_handle is not None, desc="debounce timer armed")
 
     # Cancel the rate limiter while debounce is sleeping
     rate_limiter.cancel()
 
-    # Wait until the debounce task has been cancelled and cleared
-    await wait_for(
-        lambda: rate_limiter._debounce_task is None or rate_limiter._debounce_task.done(),
-        desc="debounce task cancelled or completed",
-    )
+    # The pending timer is dropped immediately; no handler task was ever spawned
+    assert rate_limiter._debounce_handle is None
+    assert rate_limiter._debounce_task is None
+    await settle(0.6)
 
     assert not handler_fired, "Handler should not fire after rate limiter cancellation"
 
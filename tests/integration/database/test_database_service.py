@@ -89,7 +89,10 @@ async def test_fresh_db_creates_all_tables(initialized_fresh_service: DatabaseSe
         assert tables == [
             "app_manifests",
             "blocking_events",
+            "execution_buckets",
+            "execution_rollups",
             "executions",
+            "latency_histograms",
             "listeners",
             "log_records",
             "scheduled_jobs",
@@ -99,8 +102,11 @@ async def test_fresh_db_creates_all_tables(initialized_fresh_service: DatabaseSe
         cursor = conn.execute("SELECT name FROM sqlite_master WHERE type='index' AND name LIKE 'idx_%'")
         indexes = sorted(row[0] for row in cursor.fetchall())
         # 001.sql defines 13 idx_* indexes (2 listeners, 2 scheduled_jobs, 6 executions, 3 log_records);
-        # 004.sql adds 3 more (idx_be_ts, idx_be_app_ts, idx_be_session) → 16 total.
-        assert len(indexes) == 16
+        # 004.sql adds 3 more (idx_be_ts, idx_be_app_ts, idx_be_session); 013.sql adds 3
+        # (idx_rollup_listener_bucket, idx_rollup_job_bucket, idx_rollup_time); 014.sql adds 3
+        # (idx_bucket_listener_time, idx_bucket_job_time, idx_bucket_time); 015.sql adds 3
+        # (idx_latency_listener_period, idx_latency_job_period, idx_latency_period) → 25 total.
+        assert len(indexes) == 25
         assert "idx_listeners_app" in indexes
         assert "idx_listeners_natural" in indexes
         assert "idx_scheduled_jobs_app" in indexes
@@ -117,6 +123,9 @@ async def test_fresh_db_creates_all_tables(initialized_fresh_service: DatabaseSe
         assert "idx_be_ts" in indexes
         assert "idx_be_app_ts" in indexes
         assert "idx_be_session" in indexes
+        assert "idx_rollup_listener_bucket" in indexes
+        assert "idx_rollup_job_bucket" in indexes
+        assert "idx_rollup_time" in indexes
 
         # No uq_* unique indexes in the unified schema (natural-key uniqueness is
         # handled by idx_listeners_natural / idx_scheduled_jobs_natural); execution_id
@@ -410,6 +419,140 @@ async def test_drain_on_shutdown(service: DatabaseService) -> None:
     assert service._db is None, "Database connection should be closed after shutdown"
 
 
+async def block_write_worker(service: DatabaseService) -> asyncio.Event:
+    """Occupy the write worker with a gated write so later writes pile up; set the returned event to release it."""
+    gate = asyncio.Event()
+    started = asyncio.Event()
+
+    async def gated() -> None:
+        started.set()
+        await gate.wait()
+
+    service.enqueue(gated())
+    await started.wait()
+    return gate
+
+
+async def insert_session(service: DatabaseService, marker: str, *, fail: bool = False) -> bool:
+    """Insert a session row tagged with ``marker`` in its own BEGIN/commit, as queued writes do.
+
+    Returns whether the write ran inside a write group.
+    """
+    db = service.db
+    grouped = service._group_db is not None
+    now = time.time()
+    try:
+        await db.execute("BEGIN")
+        await db.execute(
+            "INSERT INTO sessions (started_at, last_heartbeat_at, status, error_message) VALUES (?, ?, 'stopped', ?)",
+            (now, now, marker),
+        )
+        if fail:
+            raise ValueError(f"write {marker} failed")
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+    return grouped
+
+
+async def session_markers(service: DatabaseService) -> set[str]:
+    cursor = await service.read_db.execute("SELECT error_message FROM sessions WHERE error_message IS NOT NULL")
+    return {row[0] for row in await cursor.fetchall()}
+
+
+async def test_write_backlog_commits_as_group(initialized_service: DatabaseService) -> None:
+    """Writes waiting behind a busy worker run together in one transaction and all persist."""
+    gate = await block_write_worker(initialized_service)
+    tasks = [
+        asyncio.create_task(initialized_service.submit(insert_session(initialized_service, f"g{i}"))) for i in range(5)
+    ]
+    await asyncio.sleep(0)
+
+    gate.set()
+    results = await asyncio.wait_for(asyncio.gather(*tasks), timeout=5.0)
+
+    assert results == [True] * 5
+    assert {f"g{i}" for i in range(5)} <= await session_markers(initialized_service)
+
+
+async def test_write_group_isolates_failing_write(initialized_service: DatabaseService) -> None:
+    """A write that raises inside a group is rolled back alone; the rest of the group commits."""
+    gate = await block_write_worker(initialized_service)
+    ok_before = asyncio.create_task(initialized_service.submit(insert_session(initialized_service, "before")))
+    failing = asyncio.create_task(initialized_service.submit(insert_session(initialized_service, "bad", fail=True)))
+    ok_after = asyncio.create_task(initialized_service.submit(insert_session(initialized_service, "after")))
+    await asyncio.sleep(0)
+
+    gate.set()
+    with pytest.raises(ValueError, match="write bad failed"):
+        await asyncio.wait_for(failing, timeout=5.0)
+    assert await ok_before is True
+    assert await ok_after is True
+
+    markers = await session_markers(initialized_service)
+    assert {"before", "after"} <= markers
+    assert "bad" not in markers
+
+
+async def test_exclusive_write_runs_outside_group(initialized_service: DatabaseService) -> None:
+    """An exclusive write is never grouped, even when it is queued between groupable writes."""
+    gate = await block_write_worker(initialized_service)
+    first = asyncio.create_task(initialized_service.submit(insert_session(initialized_service, "first")))
+    second = asyncio.create_task(initialized_service.submit(insert_session(initialized_service, "second")))
+    exclusive = asyncio.create_task(
+        initialized_service.submit(insert_session(initialized_service, "exclusive"), exclusive=True)
+    )
+    third = asyncio.create_task(initialized_service.submit(insert_session(initialized_service, "third")))
+    await asyncio.sleep(0)
+
+    gate.set()
+    results = await asyncio.wait_for(asyncio.gather(first, second, exclusive, third), timeout=5.0)
+
+    assert results == [True, True, False, False]
+    assert {"first", "second", "exclusive", "third"} <= await session_markers(initialized_service)
+
+
+async def restart_write_worker(service: DatabaseService, *, target_ms: float) -> None:
+    """Restart the write worker so it picks up a new write_group_target_ms."""
+    service.hassette.config.database.write_group_target_ms = target_ms
+    assert service._db_worker_task is not None
+    service._db_worker_task.cancel()
+    await asyncio.gather(service._db_worker_task, return_exceptions=True)
+    service._db_worker_task = asyncio.create_task(service.db_write_worker())
+
+
+async def test_write_group_limit_grows_with_backlog(initialized_service: DatabaseService) -> None:
+    """Groups that finish within target while writes remain double the group limit."""
+    # A generous target keeps the assertion independent of machine load.
+    await restart_write_worker(initialized_service, target_ms=60_000.0)
+    gate = await block_write_worker(initialized_service)
+    for i in range(100):
+        initialized_service.enqueue(insert_session(initialized_service, f"b{i}"))
+
+    gate.set()
+    await asyncio.wait_for(initialized_service._db_write_queue.join(), timeout=5.0)
+
+    assert initialized_service._write_group_limit > 8
+
+
+async def test_write_group_limit_shrinks_when_over_target(initialized_service: DatabaseService) -> None:
+    """A group that runs past write_group_target_ms halves the group limit."""
+    await restart_write_worker(initialized_service, target_ms=1.0)
+
+    async def slow_write() -> None:
+        await asyncio.sleep(0.005)
+
+    gate = await block_write_worker(initialized_service)
+    for _ in range(8):
+        initialized_service.enqueue(slow_write())
+
+    gate.set()
+    await asyncio.wait_for(initialized_service._db_write_queue.join(), timeout=5.0)
+
+    assert initialized_service._write_group_limit == 4
+
+
 async def test_read_db_property_works_after_init(initialized_service: DatabaseService) -> None:
     """read_db property returns the read-only connection after initialization."""
     conn = initialized_service.read_db
@@ -448,7 +591,7 @@ async def test_enqueue_drops_task_on_queue_full(initialized_service: DatabaseSer
 
     # Put items directly so we don't trigger the put_nowait path yet
     for i in range(max_size):
-        await queue.put((gated_coro(i), None))
+        await queue.put((gated_coro(i), None, False))
 
     # Now queue is full — enqueue() should log an error and return without raising
     dropped_coro_executed = False
@@ -479,7 +622,7 @@ async def test_enqueue_logs_backlog_warning_at_100_multiple(initialized_service:
 
     # Fill 99 slots directly (bypassing enqueue's logging) so the next enqueue hits depth 100
     for _ in range(99):
-        await queue.put((gated_coro(), None))
+        await queue.put((gated_coro(), None, False))
 
     # The 100th item via enqueue() should trigger the depth warning
     with patch.object(initialized_service, "logger") as mock_logger:
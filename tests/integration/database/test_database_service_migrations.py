@@ -95,6 +95,54 @@ EXPECTED_TABLES = {
         "kwargs_json",
         "thread_leaked",
     },
+    "execution_rollups": {
+        "id",
+        "kind",
+        "listener_id",
+        "job_id",
+        "session_id",
+        "source_tier",
+        "bucket_start_ts",
+        "execution_count",
+        "total_duration_ms",
+        "min_duration_ms",
+        "max_duration_ms",
+        "le_1ms_count",
+        "le_10ms_count",
+        "le_100ms_count",
+        "le_1s_count",
+        "le_10s_count",
+        "gt_10s_count",
+    },
+    "execution_buckets": {
+        "id",
+        "kind",
+        "listener_id",
+        "job_id",
+        "source_tier",
+        "bucket_start_ts",
+        "last_execution_ts",
+        "execution_count",
+        "success_count",
+        "error_count",
+        "timed_out_count",
+        "cancelled_count",
+        "skipped_count",
+        "di_failure_count",
+        "thread_leaked_count",
+        "total_duration_ms",
+        "min_duration_ms",
+        "max_duration_ms",
+    },
+    "latency_histograms": {
+        "id",
+        "kind",
+        "listener_id",
+        "job_id",
+        "period_start_ts",
+        "bucket_index",
+        "sample_count",
+    },
     "log_records": {
         "id",
         # dup-ignore-start: mirrors LOG_RECORD_COLUMNS in src/hassette/core/database_service.py
@@ -1,6 +1,6 @@
 """Integration tests for telemetry query helper functions and source_tier scoping behavior."""
 
-from hassette.core.telemetry.helpers import source_tier_clause
+from hassette.core.telemetry.helpers import execution_stats_source, source_tier_clause
 from hassette.core.telemetry.query_service import TelemetryQueryService
 
 from .helpers import DbFixture, insert_execution, insert_invocation, insert_job, insert_listener
@@ -38,6 +38,40 @@ class TestSourceTierClause:
             source_tier_clause("app", alias)
 
 
+class TestExecutionStatsSource:
+    def test_unbounded_window_reads_no_raw_rows(self) -> None:
+        """Without since/until every execution is in a whole-minute bucket."""
+        fragment, params = execution_stats_source()
+        assert "FROM executions" not in fragment
+        assert params == {}
+
+    def test_partial_minutes_are_read_raw(self) -> None:
+        """The partial minutes at each edge of the window come from executions rows."""
+        _, params = execution_stats_source(6_000_030.0, 6_000_150.0)
+        assert params["stats_first_whole"] == 6_000_060.0
+        assert params["stats_last_whole"] == 6_000_120.0
+        assert (params["stats_raw_lo_0"], params["stats_raw_hi_0"]) == (6_000_030.0, 6_000_060.0)
+        assert (params["stats_raw_lo_1"], params["stats_raw_hi_1"]) == (6_000_120.0, 6_000_150.0)
+
+    def test_minute_aligned_window_reads_no_raw_rows(self) -> None:
+        """A window on minute boundaries is covered by buckets alone."""
+        fragment, _ = execution_stats_source(6_000_000.0, 6_000_120.0, boundaries=[6_000_060.0])
+        assert "FROM executions" not in fragment
+
+    def test_split_minute_is_excluded_from_buckets(self) -> None:
+        """A boundary inside a whole minute moves that minute to the raw arm."""
+        fragment, params = execution_stats_source(6_000_000.0, 6_000_180.0, boundaries=[6_000_090.0])
+        assert params["stats_split_0"] == 6_000_060.0
+        assert (params["stats_raw_lo_0"], params["stats_raw_hi_0"]) == (6_000_060.0, 6_000_120.0)
+        assert "NOT IN (:stats_split_0)" in fragment
+
+    def test_window_inside_one_minute_skips_buckets(self) -> None:
+        """A window with no whole minute is read entirely from executions rows."""
+        _, params = execution_stats_source(6_000_010.0, 6_000_050.0)
+        assert (params["stats_raw_lo_0"], params["stats_raw_hi_0"]) == (6_000_010.0, 6_000_050.0)
+        assert "stats_first_whole" not in params
+
+
 class TestGetAllAppSummariesFrameworkTier:
     async def test_get_all_app_summaries_framework_tier(
         self, query_service: TelemetryQueryService, db: DbFixture
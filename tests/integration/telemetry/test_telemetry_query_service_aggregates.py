@@ -2,7 +2,8 @@
 
 Covers get_all_app_summaries, cross-session/retired-row behaviour, source-tier
 clause helpers, DI failure flags, slow-handler left-join, job summary, activity
-feed, and health check.
+feed, health check, rollup buckets in the summaries, the per-minute execution
+buckets the summaries read, and the latency-histogram percentiles.
 """
 
 import time
@@ -10,8 +11,11 @@ import time
 import pytest
 
 from hassette.const.misc import SECONDS_PER_DAY
+from hassette.core.telemetry.latency import LatencyHistogram
 from hassette.core.telemetry.query_service import TelemetryQueryService
+from hassette.core.telemetry.repository import TelemetryRepository
 from hassette.schemas.summary_models import AppHealthSummary
+from hassette.test_utils.factories import make_execution_record
 
 from .helpers import (
     BASE_TS,
@@ -466,6 +470,113 @@ class TestGetAllAppSummariesSourceTier:
         assert summary.total_errors == 0
 
 
+class TestRollupsInSummaries:
+    async def test_rolled_up_successes_count_in_every_summary(
+        self, query_service: TelemetryQueryService, db: DbFixture
+    ) -> None:
+        """Successes counted in execution_rollups show up alongside executions rows."""
+        db_svc, session_id = db
+        listener_id = await insert_listener(db_svc, app_key="my_app", handler_method="on_a")
+        now = time.time()
+        await insert_invocation(
+            db_svc, listener_id, session_id, status="error", duration_ms=40.0, execution_start_ts=now
+        )
+        await TelemetryRepository(db_svc).persist_execution_batch(
+            [
+                make_execution_record(
+                    listener_id=listener_id,
+                    session_id=session_id,
+                    execution_start_ts=now,
+                    duration_ms=duration_ms,
+                    execution_id=None,
+                    rollup=True,
+                )
+                for duration_ms in (10.0, 20.0, 50.0)
+            ]
+        )
+
+        listener = await only_row(query_service.get_listener_summary(app_key="my_app"))
+        assert listener.total_invocations == 4
+        assert listener.successful == 3
+        assert listener.failed == 1
+        assert listener.avg_duration_ms == pytest.approx(30.0)
+        assert listener.min_duration_ms == pytest.approx(10.0)
+        assert listener.max_duration_ms == pytest.approx(50.0)
+
+        summary = (await query_service.get_all_app_summaries())["my_app"]
+        assert summary.total_invocations == 4
+        assert summary.total_errors == 1
+        assert summary.avg_duration_ms == pytest.approx(30.0)
+
+        health = await query_service.get_app_health_aggregates("my_app", 0)
+        assert health.total_invocations == 4
+        assert health.handler_errors == 1
+
+        buckets = await query_service.get_per_app_activity_buckets(now - 60, now + 60, num_buckets=1)
+        assert buckets["my_app"] == [(3, 1)]
+
+
+class TestExecutionBuckets:
+    async def test_whole_minutes_are_read_from_buckets(
+        self, query_service: TelemetryQueryService, db: DbFixture
+    ) -> None:
+        """Summaries count whole minutes from execution_buckets, not the executions rows."""
+        db_svc, session_id = db
+        listener_id = await insert_listener(db_svc, app_key="my_app", handler_method="on_a")
+        job_id = await insert_job(db_svc, app_key="my_app", job_name="job_a")
+        base_ts = 6_000_000.0  # minute-aligned
+        await insert_invocation(db_svc, listener_id, session_id, duration_ms=10.0, execution_start_ts=base_ts + 1.0)
+        await insert_invocation(
+            db_svc, listener_id, session_id, status="error", duration_ms=30.0, execution_start_ts=base_ts + 30.0
+        )
+        await insert_invocation(db_svc, listener_id, session_id, duration_ms=20.0, execution_start_ts=base_ts + 61.0)
+        await insert_execution(db_svc, job_id, session_id, duration_ms=40.0, execution_start_ts=base_ts + 5.0)
+        await insert_execution(
+            db_svc, job_id, session_id, status="skipped", duration_ms=0.0, execution_start_ts=base_ts + 6.0
+        )
+
+        # Drop the rows: only the trigger-maintained buckets remain to be counted.
+        await db_svc.db.execute("DELETE FROM executions")
+        await db_svc.db.commit()
+
+        summary = (await query_service.get_all_app_summaries())["my_app"]
+        assert summary.total_invocations == 3
+        assert summary.total_errors == 1
+        assert summary.avg_duration_ms == pytest.approx(20.0)
+        assert summary.total_executions == 2
+        assert summary.last_activity_ts == base_ts + 61.0
+
+        listener = await only_row(query_service.get_listener_summary(app_key="my_app"))
+        assert listener.min_duration_ms == pytest.approx(10.0)
+        assert listener.max_duration_ms == pytest.approx(30.0)
+
+        job = await only_row(query_service.get_job_summary(app_key="my_app"))
+        assert job.skipped == 1
+        assert job.avg_duration_ms == pytest.approx(40.0)
+        assert job.min_duration_ms == pytest.approx(40.0)
+
+    async def test_partial_minutes_at_window_edges_are_exact(
+        self, query_service: TelemetryQueryService, db: DbFixture
+    ) -> None:
+        """Executions in a window's partial minutes are counted from their rows, to the second."""
+        db_svc, session_id = db
+        listener_id = await insert_listener(db_svc, app_key="my_app", handler_method="on_a")
+        base_ts = 6_000_000.0  # minute-aligned
+        for offset in (10.0, 50.0, 70.0, 130.0):
+            await insert_invocation(db_svc, listener_id, session_id, execution_start_ts=base_ts + offset)
+
+        summary = (await query_service.get_all_app_summaries(since=base_ts + 30.0))["my_app"]
+        assert summary.total_invocations == 3
+
+        health = await query_service.get_app_health_aggregates("my_app", 0, since=base_ts + 30.0)
+        assert health.total_invocations == 3
+
+        # Window [30, 100) split at 65: the minute [60, 120) straddles the edge, so 70 must
+        # still land in the second sparkline bucket.
+        buckets = await query_service.get_per_app_activity_buckets(base_ts + 30.0, base_ts + 100.0, num_buckets=2)
+        assert buckets["my_app"] == [(1, 0), (1, 0)]
+
+
 class TestDiFailureFlag:
     async def test_di_failure_flag_query(self, query_service: TelemetryQueryService, db: DbFixture) -> None:
         """is_di_failure=1 records are counted as di_failures in get_listener_summary."""
@@ -539,3 +650,46 @@ class TestGetSlowHandlersLeftJoin:
         rows = await query_service.get_slow_handlers(threshold_ms=100.0)
         assert len(rows) == 1
         assert rows[0].duration_ms == pytest.approx(500.0)
+
+
+class TestLatencyPercentiles:
+    async def test_summaries_report_percentiles_from_latency_histograms(
+        self, query_service: TelemetryQueryService, db: DbFixture
+    ) -> None:
+        """Listener and job summaries read p50/p90/p99 from the stored histograms, per window."""
+        db_svc, _ = db
+        listener_id = await insert_listener(db_svc, app_key="my_app", handler_method="on_a")
+        job_id = await insert_job(db_svc, app_key="my_app", job_name="job_a")
+        idle_listener_id = await insert_listener(db_svc, app_key="my_app", handler_method="on_b")
+        old_period, period = 7_196_400.0, 7_200_000.0  # consecutive hours
+
+        slow = LatencyHistogram()
+        for _ in range(10):
+            slow.record(5_000.0)
+        recent = LatencyHistogram()
+        for _ in range(95):
+            recent.record(10.0)
+        for _ in range(5):
+            recent.record(200.0)
+        job = LatencyHistogram()
+        job.record(40.0)
+
+        repo = TelemetryRepository(db_svc)
+        await repo.persist_latency_histograms({("handler", listener_id): slow}, old_period)
+        await repo.persist_latency_histograms({("handler", listener_id): recent, ("job", job_id): job}, period)
+
+        listeners = {row.listener_id: row for row in await query_service.get_listener_summary(app_key="my_app")}
+        assert listeners[listener_id].p50_duration_ms == pytest.approx(10.0, rel=0.1)
+        assert listeners[listener_id].p99_duration_ms == pytest.approx(5_000.0, rel=0.1)
+        assert listeners[idle_listener_id].p99_duration_ms is None
+
+        # A window starting mid-hour covers that whole hour but not the earlier one.
+        windowed = {
+            row.listener_id: row
+            for row in await query_service.get_listener_summary(app_key="my_app", since=period + 1_800.0)
+        }
+        assert windowed[listener_id].p90_duration_ms == pytest.approx(10.0, rel=0.1)
+        assert windowed[listener_id].p99_duration_ms == pytest.approx(200.0, rel=0.1)
+
+        job_summary = await only_row(query_service.get_job_summary(app_key="my_app"))
+        assert job_summary.p50_duration_ms == pytest.approx(40.0, rel=0.1)
@@ -1,4 +1,5 @@
 import json
+import math
 from pathlib import Path
 from unittest.mock import patch
 
@@ -88,3 +89,52 @@ async def test_minimal_history_differs_if_not_normalized(hassette_with_mock_api:
     assert history_with_minimal_flag != history_without_minimal_flag, (
         "Minimal and normal history responses should differ"
     )
+
+
+async def test_iter_history_streams_chunks_matching_get_histories(
+    hassette_with_mock_api: tuple[Api, SimpleTestServer],
+) -> None:
+    """iter_history yields per-entity chunks that add up to what get_histories returns."""
+    api_client, mock_server = hassette_with_mock_api
+
+    path, qs = SimpleTestServer.make_history_path(["light.entryway", "light.office"], START, END, minimal=True)
+    mock_server.expect("GET", path, qs, json=history_minimal_raw, status=200)
+    mock_server.expect("GET", path, qs, json=history_minimal_raw, status=200)
+
+    expected = await api_client.get_histories(["light.entryway", "light.office"], START, END, minimal_response=True)
+
+    chunks = [
+        chunk
+        async for chunk in api_client.iter_history(
+            ["light.entryway", "light.office"], START, END, minimal_response=True, chunk_size=4
+        )
+    ]
+
+    assert all(0 < len(entries) <= 4 for _, entries in chunks)
+    streamed: dict[str, list] = {}
+    for entity_id, entries in chunks:
+        streamed.setdefault(entity_id, []).extend(entries)
+    assert streamed == expected
+
+
+async def test_get_history_columns_packs_numeric_states(hassette_with_mock_api: tuple[Api, SimpleTestServer]) -> None:
+    """get_history_columns requests a minimal, attribute-free history and stores NaN for non-numeric states."""
+    api_client, mock_server = hassette_with_mock_api
+    body = [
+        [
+            {"entity_id": "sensor.temp", "state": "21.5", "last_changed": "2025-06-30T05:00:00+00:00"},
+            {"state": "unavailable", "last_changed": "2025-06-30T05:00:01.500000+00:00"},
+            {"state": "22", "last_changed": "2025-06-30T05:00:03+00:00"},
+        ]
+    ]
+    path, qs = SimpleTestServer.make_history_path(["sensor.temp"], START, END, minimal=True)
+    mock_server.expect("GET", path, qs + "&no_attributes=true", json=body, status=200)
+
+    columns = await api_client.get_history_columns("sensor.temp", START, END)
+
+    temp = columns["sensor.temp"]
+    assert len(temp) == 3
+    assert [t - temp.timestamps[0] for t in temp.timestamps] == [0.0, 1.5, 3.0]
+    assert temp.values[0] == 21.5
+    assert math.isnan(temp.values[1])
+    assert temp.values[2] == 22.0
@@ -1,5 +1,6 @@
 import asyncio
 from dataclasses import dataclass
+from unittest.mock import patch
 
 import pytest
 
@@ -137,13 +138,14 @@ class TestDebounceLogic:
         await limiter.call(make_handler("first"))
         # timing: mid-debounce assertion — must be within the 0.2s window
         await asyncio.sleep(0.1)
-        assert limiter._debounce_task is not None, "Debounce task should be created"
-        assert not limiter._debounce_task.done(), "Debounce task should still be pending"
+        assert limiter._debounce_handle is not None, "Debounce timer should be armed"
+        assert limiter._debounce_task is None, "No task should exist until the timer fires"
 
         await limiter.call(make_handler("second"))
         # timing: mid-debounce assertion — must be within the 0.2s window
         await asyncio.sleep(0.1)
-        assert not limiter._debounce_task.done(), "Debounce task should still be pending"
+        assert limiter._debounce_handle is not None, "Debounce timer should still be pending"
+        assert calls == []
 
         await limiter.call(make_handler("third"))
 
@@ -154,21 +156,22 @@ class TestDebounceLogic:
     async def test_debounce_handler_cancelled_error_propagates(self, bucket: TaskBucket):
         """CancelledError during handler execution must propagate (not be suppressed).
 
-        Debounce reset (cancel during sleep) should be silent, but handler cancellation
+        Debounce reset (a newer call replacing the pending handler) is silent, but handler cancellation
         (e.g., shutdown) should propagate so telemetry can record it as 'cancelled'.
         """
+        tasks: list[asyncio.Task] = []
 
         async def handler_that_gets_cancelled():
+            task = asyncio.current_task()
+            assert task is not None
+            tasks.append(task)
             raise asyncio.CancelledError()
 
         limiter = RateLimiter(bucket, debounce=0.01)
         await limiter.call(handler_that_gets_cancelled)
 
-        # Capture task reference before done_callback clears it
-        task = limiter._debounce_task
-        assert task is not None
-
-        await wait_for(lambda: task.done(), desc="debounce task completed")
+        await wait_for(lambda: bool(tasks) and tasks[0].done(), desc="debounce task completed")
+        task = tasks[0]
 
         # The task should show as cancelled (CancelledError propagated out of delayed_call)
         assert task.done()
@@ -188,18 +191,38 @@ class TestDebounceLogic:
 
         # First call starts debounce
         await limiter.call(make_handler("first"))
-        first_task = limiter._debounce_task
-        assert first_task is not None
+        first_handle = limiter._debounce_handle
+        assert first_handle is not None
 
-        # Second call cancels first (debounce reset)
+        # Second call replaces the first handler and reuses the pending timer (debounce reset)
         await limiter.call(make_handler("second"))
-        await asyncio.sleep(0)  # Let cancellation propagate
+        await asyncio.sleep(0)
 
-        # First task should be cancelled silently (no crash)
-        assert first_task.cancelled() or first_task.done()
+        assert limiter._debounce_handle is first_handle
+        assert limiter._debounce_task is None
 
         await wait_for(lambda: calls == ["second"], desc="debounce fired")
 
+    async def test_debounce_spawns_one_task_per_window(self, bucket: TaskBucket):
+        """A burst of calls spawns a single task when the window closes, not one per call."""
+        calls: list[int] = []
+
+        def make_handler(index: int):
+            async def handler():
+                calls.append(index)
+
+            return handler
+
+        limiter = RateLimiter(bucket, debounce=0.05)
+        with patch.object(bucket, "spawn", wraps=bucket.spawn) as spawn:
+            for index in range(50):
+                await limiter.call(make_handler(index))
+                await asyncio.sleep(0.002)
+
+            await wait_for(lambda: calls == [49], desc="debounce fired")
+
+        spawn.assert_called_once()
+
 
 class TestRateLimiterCancel:
     """Test RateLimiter.cancel() for cleanup on listener removal."""
@@ -213,10 +236,10 @@ class TestRateLimiterCancel:
 
         limiter = RateLimiter(bucket, debounce=0.5)
         await limiter.call(handler)
-        assert limiter._debounce_task is not None
+        assert limiter._debounce_handle is not None
 
         limiter.cancel()
-        assert limiter._debounce_task is None
+        assert limiter._debounce_handle is None
 
         await settle(0.6)
         assert calls == [], "Handler should not fire after cancel"
@@ -7,7 +7,7 @@ import pytest
 from hassette.config.config import HassetteConfig
 from hassette.core.state_proxy import StateCacheFreshness, StateProxy, StateSynchronizationStatus
 from hassette.events import RawStateChangeEvent
-from hassette.events.metadata import stamp_websocket_generation
+from hassette.events.metadata import get_websocket_generation, stamp_websocket_generation
 from hassette.exceptions import ResourceNotReadyError
 from hassette.resources.lifecycle import mark_ready
 from hassette.test_utils import (
@@ -16,6 +16,7 @@ from hassette.test_utils import (
     make_full_state_change_event,
     make_light_state_dict,
     make_mock_hassette,
+    make_switch_state_dict,
 )
 from hassette.test_utils.config import TEST_TOTAL_TIMEOUT_SECONDS
 from hassette.test_utils.ws_mocks import configure_ready_websocket_mock
@@ -330,7 +331,7 @@ async def test_obsolete_generation_sync_cannot_publish_freshness_or_capability()
 
 
 async def test_obsolete_generation_failure_cannot_publish_freshness(state_proxy: StateProxy) -> None:
-    state_proxy.states = {"light.kitchen": make_light_state_dict("light.kitchen", "on")}
+    state_proxy.states.replace({"light.kitchen": make_light_state_dict("light.kitchen", "on")})
     assert state_proxy.cache_freshness == StateCacheFreshness.FRESH
 
     snapshot_entered, release_snapshot, failing_get_states_raw = gated_get_states_raw_factory(
@@ -350,8 +351,34 @@ async def test_obsolete_generation_failure_cannot_publish_freshness(state_proxy:
     assert state_proxy.maintained_generation == 1
 
 
+async def test_domain_queries_follow_synchronization_and_state_events(state_proxy: StateProxy) -> None:
+    assert await state_proxy.wait_initial_state_capability(timeout=SYNC_WAIT_TIMEOUT) is True
+    state_proxy.hassette.api.get_states_raw.return_value = [
+        make_light_state_dict("light.kitchen", "on"),
+        make_switch_state_dict("switch.fan", "off"),
+    ]
+    await state_proxy.load_cache()
+
+    assert set(state_proxy.get_domain_states("light")) == {"light.kitchen"}
+
+    await state_proxy.on_state_change(
+        with_websocket_generation(
+            make_full_state_change_event("light.porch", None, make_light_state_dict("light.porch", "on")), 1
+        )
+    )
+    await state_proxy.on_state_change(
+        with_websocket_generation(
+            make_full_state_change_event("light.kitchen", state_proxy.states["light.kitchen"], None), 1
+        )
+    )
+
+    assert set(state_proxy.get_domain_states("light")) == {"light.porch"}
+    assert set(state_proxy.get_domain_states("switch")) == {"switch.fan"}
+    assert state_proxy.get_domain_states("climate") == {}
+
+
 async def test_obsolete_generation_state_event_cannot_overwrite_fresh_cache(state_proxy: StateProxy) -> None:
-    state_proxy.states = {"light.kitchen": make_light_state_dict("light.kitchen", "on")}
+    state_proxy.states.replace({"light.kitchen": make_light_state_dict("light.kitchen", "on")})
     assert state_proxy.cache_freshness == StateCacheFreshness.FRESH
 
     state_proxy.hassette.websocket_service.get_connected_generation.return_value = 2
@@ -372,10 +399,12 @@ async def test_obsolete_generation_state_event_cannot_overwrite_fresh_cache(stat
 
 
 async def test_journaled_updates_and_tombstones_win_over_snapshot(state_proxy: StateProxy) -> None:
-    state_proxy.states = {
-        "light.kitchen": make_light_state_dict("light.kitchen", "off", last_updated="2024-01-01T00:00:00+00:00"),
-        "light.garage": make_light_state_dict("light.garage", "on", last_updated="2024-01-01T00:00:00+00:00"),
-    }
+    state_proxy.states.replace(
+        {
+            "light.kitchen": make_light_state_dict("light.kitchen", "off", last_updated="2024-01-01T00:00:00+00:00"),
+            "light.garage": make_light_state_dict("light.garage", "on", last_updated="2024-01-01T00:00:00+00:00"),
+        }
+    )
     await state_proxy.on_disconnect()
     state_proxy.hassette.websocket_service.get_connected_generation.return_value = 2
 
@@ -409,9 +438,9 @@ async def test_journaled_updates_and_tombstones_win_over_snapshot(state_proxy: S
 
 
 async def test_pre_sync_state_event_does_not_overwrite_reconnect_snapshot(state_proxy: StateProxy) -> None:
-    state_proxy.states = {
-        "light.kitchen": make_light_state_dict("light.kitchen", "off", last_updated="2024-01-01T00:00:00+00:00")
-    }
+    state_proxy.states.replace(
+        {"light.kitchen": make_light_state_dict("light.kitchen", "off", last_updated="2024-01-01T00:00:00+00:00")}
+    )
     stale_event = with_websocket_generation(
         make_full_state_change_event(
             "light.kitchen",
@@ -441,9 +470,9 @@ async def test_pre_sync_state_event_does_not_overwrite_reconnect_snapshot(state_
 
 
 async def test_fresher_snapshot_replaces_older_cached_state(state_proxy: StateProxy) -> None:
-    state_proxy.states = {
-        "light.kitchen": make_light_state_dict("light.kitchen", "off", last_updated="2024-01-01T00:00:00+00:00")
-    }
+    state_proxy.states.replace(
+        {"light.kitchen": make_light_state_dict("light.kitchen", "off", last_updated="2024-01-01T00:00:00+00:00")}
+    )
     state_proxy.hassette.api.get_states_raw = AsyncMock(
         return_value=[make_light_state_dict("light.kitchen", "on", last_updated="2024-01-01T00:00:01+00:00")]
     )
@@ -569,7 +598,7 @@ async def test_poll_enabled_initial_failure_converges_through_next_poll() -> Non
 
 
 async def test_poll_enabled_reconnect_failure_converges_through_next_poll(state_proxy: StateProxy) -> None:
-    state_proxy.states = {"light.kitchen": make_light_state_dict("light.kitchen", "on")}
+    state_proxy.states.replace({"light.kitchen": make_light_state_dict("light.kitchen", "on")})
     state_proxy.poll_job = Mock()
     await state_proxy.on_disconnect()
 
@@ -601,7 +630,7 @@ async def test_poll_enabled_reconnect_failure_converges_through_next_poll(state_
 
 
 async def test_duplicate_reconnect_waiters_do_not_retry_immediately_after_failure(state_proxy: StateProxy) -> None:
-    state_proxy.states = {"light.kitchen": make_light_state_dict("light.kitchen", "on")}
+    state_proxy.states.replace({"light.kitchen": make_light_state_dict("light.kitchen", "on")})
     await state_proxy.on_disconnect()
     state_proxy.hassette.websocket_service.get_connected_generation.return_value = 2
     snapshot_entered, release_snapshot, failing_snapshot = gated_get_states_raw_factory(error=RuntimeError("boom"))
@@ -749,3 +778,92 @@ async def test_state_proxy_starts_with_api_mock_websocket_service_spec(
         harness.with_api_mock().with_state_proxy(require_initial_state_capability=False)
     ) as started:
         assert started.state_proxy.state_change_sub is not None
+
+
+def build_entity_feed_state_proxy(initial: dict[str, object]) -> tuple[StateProxy, list]:
+    """A StateProxy on the subscribe_entities feed whose handler is captured instead of wired to HA.
+
+    Each subscription immediately delivers ``initial`` as its snapshot. Returns the proxy and the
+    list the subscription handlers are appended to.
+    """
+    proxy = build_state_proxy()
+    proxy._entity_feed_enabled = True
+    websocket_service = proxy.hassette.websocket_service
+    websocket_service.resp_timeout_seconds = SYNC_WAIT_TIMEOUT
+    websocket_service.unsubscribe = AsyncMock()
+    proxy.hassette.bus_service.demands_event_type = Mock(return_value=True)
+    handlers: list = []
+
+    async def subscribe_entities(handler) -> int:
+        handlers.append(handler)
+        proxy.hassette.loop.call_soon(asyncio.ensure_future, handler({"a": initial}))
+        return len(handlers)
+
+    websocket_service.subscribe_entities = AsyncMock(side_effect=subscribe_entities)
+    return proxy, handlers
+
+
+async def test_entity_feed_snapshot_seeds_cache_without_rest_or_bus_listener() -> None:
+    proxy, handlers = build_entity_feed_state_proxy({"light.kitchen": {"s": "on", "a": {}, "c": "c1", "lc": 1.0}})
+
+    await proxy.on_initialize()
+    assert await proxy.wait_initial_state_capability(timeout=SYNC_WAIT_TIMEOUT) is True
+
+    assert len(handlers) == 1
+    assert proxy.state_change_sub is None
+    assert proxy.poll_job is None
+    proxy.hassette.api.get_states_raw.assert_not_awaited()
+    assert proxy.get_state_once("light.kitchen")["state"] == "on"
+    proxy.hassette.send_event.assert_not_awaited()
+
+    await proxy.on_shutdown()
+
+
+async def test_entity_feed_diffs_update_cache_and_publish_events() -> None:
+    proxy, handlers = build_entity_feed_state_proxy({"light.kitchen": {"s": "on", "a": {}, "c": "c1", "lc": 1.0}})
+    await proxy.on_initialize()
+    assert await proxy.wait_initial_state_capability(timeout=SYNC_WAIT_TIMEOUT) is True
+
+    await handlers[0]({"c": {"light.kitchen": {"+": {"s": "off", "lc": 2.0}}}, "r": []})
+    await handlers[0]({"r": ["light.kitchen"]})
+
+    assert proxy.get_state_once("light.kitchen") is None
+    events = [call.args[0] for call in proxy.hassette.send_event.await_args_list]
+    assert [
+        (e.payload.data.entity_id, e.payload.data.new_state and e.payload.data.new_state["state"]) for e in events
+    ] == [
+        ("light.kitchen", "off"),
+        ("light.kitchen", None),
+    ]
+    assert all(get_websocket_generation(e) == 1 for e in events)
+
+    await proxy.on_shutdown()
+    proxy.hassette.websocket_service.unsubscribe.assert_awaited_once_with(1)
+
+
+async def test_entity_feed_skips_events_nobody_listens_for() -> None:
+    proxy, handlers = build_entity_feed_state_proxy({"light.kitchen": {"s": "on", "a": {}, "c": "c1", "lc": 1.0}})
+    proxy.hassette.bus_service.demands_event_type.return_value = False
+    await proxy.on_initialize()
+    assert await proxy.wait_initial_state_capability(timeout=SYNC_WAIT_TIMEOUT) is True
+
+    await handlers[0]({"c": {"light.kitchen": {"+": {"s": "off", "lc": 2.0}}}})
+
+    assert proxy.get_state_once("light.kitchen")["state"] == "off"
+    proxy.hassette.send_event.assert_not_awaited()
+
+    await proxy.on_shutdown()
+
+
+async def test_entity_feed_from_superseded_subscription_is_ignored() -> None:
+    proxy, handlers = build_entity_feed_state_proxy({"light.kitchen": {"s": "on", "a": {}, "c": "c1", "lc": 1.0}})
+    await proxy.on_initialize()
+    assert await proxy.wait_initial_state_capability(timeout=SYNC_WAIT_TIMEOUT) is True
+
+    await proxy.on_disconnect()
+    await handlers[0]({"c": {"light.kitchen": {"+": {"s": "off", "lc": 2.0}}}})
+
+    assert proxy.states["light.kitchen"]["state"] == "on"
+    proxy.hassette.send_event.assert_not_awaited()
+
+    await proxy.on_shutdown()
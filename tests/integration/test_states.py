@@ -6,9 +6,11 @@ typed getters, and DomainStates helper class.
 
 from copy import deepcopy
 from typing import TYPE_CHECKING
+from unittest.mock import patch
 
 import pytest
 
+import hassette.state_manager.state_manager as state_manager_module
 from hassette.models import states
 from hassette.state_manager import DomainStates, StateManager
 from hassette.test_utils import (
@@ -451,6 +453,25 @@ class TestStatesIntegration:
             # The cache should already be populated from the previous iteration
             assert len(light_manager._cache) == i + 1
 
+    async def test_to_dict_bulk_validates_into_view_cache(self, hassette_with_state_proxy: "HassetteHarness") -> None:
+        """to_dict validates a cold view in one bulk call and fills the view's cache."""
+        hassette = hassette_with_state_proxy
+
+        for entity_id, state in [("light.bulk_1", "on"), ("light.bulk_2", "off")]:
+            await send_and_wait(hassette, entity_id, None, make_light_state_dict(entity_id, state))
+
+        light_manager = StateManager(hassette.hassette, parent=hassette.hassette).light
+
+        with patch(
+            "hassette.state_manager.state_manager.convert_state_dicts_to_model",
+            wraps=state_manager_module.convert_state_dicts_to_model,
+        ) as bulk:
+            result = light_manager.to_dict()
+
+        bulk.assert_called_once()
+        assert {"light.bulk_1", "light.bulk_2"} <= result.keys()
+        assert {"light.bulk_1", "light.bulk_2"} <= light_manager._cache.keys()
+
 
 class TestStateManagerGenericAccess:
     """Tests for StateManager.get() generic access method."""
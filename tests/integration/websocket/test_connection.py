@@ -99,6 +99,28 @@ async def test_raw_recv_dispatches_text_payload(
     dispatch_mock.assert_awaited_once_with({"type": "result", "id": 1})
 
 
+async def test_raw_recv_dispatches_each_message_in_a_coalesced_frame(
+    monkeypatch: pytest.MonkeyPatch, websocket_service: WebsocketService
+) -> None:
+    """A JSON array frame is split and each message dispatched in order."""
+    fake_ws = build_fake_ws()
+    fake_message = SimpleNamespace(
+        type=WSMsgType.TEXT, data='[{"type": "result", "id": 1}, {"type": "event", "id": 2}]'
+    )
+    fake_ws.receive = AsyncMock(return_value=fake_message)
+    websocket_service._ws = fake_ws
+
+    dispatch_mock = AsyncMock()
+    monkeypatch.setattr(websocket_service, "dispatch", dispatch_mock)
+
+    await websocket_service.raw_recv()
+
+    assert [c.args[0] for c in dispatch_mock.await_args_list] == [
+        {"type": "result", "id": 1},
+        {"type": "event", "id": 2},
+    ]
+
+
 async def test_raw_recv_raises_when_socket_closed(websocket_service: WebsocketService) -> None:
     """Raise when the websocket reports it has already closed."""
     websocket_service._ws = build_fake_ws(is_closed=True)
@@ -144,6 +166,38 @@ async def test_connect_ws_sets_ws_and_authenticates(websocket_service: Websocket
     websocket_service.authenticate.assert_awaited_once()
 
 
+async def test_connect_ws_enables_message_coalescing_after_auth(
+    monkeypatch: pytest.MonkeyPatch, websocket_service: WebsocketService
+) -> None:
+    """connect_ws sends supported_features right after auth when coalesce_messages is on."""
+    fake_ws = build_fake_ws()
+    fake_session = MagicMock()
+    fake_session.ws_connect = AsyncMock(return_value=fake_ws)
+    websocket_service.authenticate = AsyncMock()
+    monkeypatch.setattr(websocket_service.hassette.config.websocket, "coalesce_messages", True)
+
+    await websocket_service.connect_ws(fake_session)
+
+    payload = fake_ws.send_json.await_args.args[0]
+    assert payload["type"] == "supported_features"
+    assert payload["features"] == {"coalesce_messages": 1}
+
+
+async def test_connect_ws_skips_supported_features_when_disabled(
+    monkeypatch: pytest.MonkeyPatch, websocket_service: WebsocketService
+) -> None:
+    """With coalesce_messages off nothing is sent after auth."""
+    fake_ws = build_fake_ws()
+    fake_session = MagicMock()
+    fake_session.ws_connect = AsyncMock(return_value=fake_ws)
+    websocket_service.authenticate = AsyncMock()
+    monkeypatch.setattr(websocket_service.hassette.config.websocket, "coalesce_messages", False)
+
+    await websocket_service.connect_ws(fake_session)
+
+    fake_ws.send_json.assert_not_awaited()
+
+
 async def test_connect_ws_wraps_connection_refused(websocket_service: WebsocketService) -> None:
     """connect_ws converts ClientConnectorError with ConnectionRefusedError cause to CouldNotFindHomeAssistantError."""
     fake_session = MagicMock()
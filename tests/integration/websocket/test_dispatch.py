@@ -4,6 +4,7 @@ Complements test_connection.py (connection/auth), test_reconnect.py (disconnect/
 and test_subscribe_events_retry.py.
 """
 
+import asyncio
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, Mock
 
@@ -196,6 +197,62 @@ async def test_send_and_wait_no_retry_on_ha_error(websocket_service: WebsocketSe
     assert websocket_service.send_json.call_count == 1
 
 
+async def test_send_and_wait_honours_per_call_response_timeout(
+    websocket_service: WebsocketService, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """response_timeout overrides the configured deadline for a single call."""
+    monkeypatch.setattr(websocket_module, "MAX_RETRY_ATTEMPTS", 1)
+    monkeypatch.setattr(websocket_service.hassette.config.websocket, "response_timeout_seconds", 60)
+    websocket_service.send_json = AsyncMock(return_value=None)
+
+    with pytest.raises(FailedMessageError, match=r"timed out after 0\.01s"):
+        await websocket_service.send_and_wait(type="slow", response_timeout=0.01)
+
+    assert websocket_service.command_stats().timed_out == 1
+    assert websocket_service._response_futures == {}
+
+
+async def test_send_and_wait_caps_in_flight_commands(websocket_service: WebsocketService) -> None:
+    """Callers beyond the in-flight window wait for a slot instead of sending."""
+    websocket_service._command_slots = asyncio.Semaphore(2)
+    websocket_service.send_json = AsyncMock(return_value=None)
+
+    tasks = [asyncio.ensure_future(websocket_service.send_and_wait(type="get_states")) for _ in range(3)]
+    await asyncio.sleep(0)
+
+    stats = websocket_service.command_stats()
+    assert (stats.in_flight, stats.waiting) == (2, 1)
+
+    while not all(task.done() for task in tasks):
+        for fut in list(websocket_service._response_futures.values()):
+            if not fut.done():
+                fut.set_result({"ok": True})
+        await asyncio.sleep(0)
+
+    assert [task.result() for task in tasks] == [{"ok": True}] * 3
+    stats = websocket_service.command_stats()
+    assert (stats.in_flight, stats.waiting, stats.completed, stats.peak_in_flight) == (0, 0, 3, 2)
+    assert stats.latency_p50_ms is not None
+
+
+async def test_cancelled_send_and_wait_frees_its_slot(websocket_service: WebsocketService) -> None:
+    """Cancelling a caller removes its response future and releases its window slot."""
+    websocket_service._command_slots = asyncio.Semaphore(1)
+    websocket_service.send_json = AsyncMock(return_value=None)
+
+    task = asyncio.ensure_future(websocket_service.send_and_wait(type="get_states"))
+    await asyncio.sleep(0)
+    assert len(websocket_service._response_futures) == 1
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert websocket_service._response_futures == {}
+    assert not websocket_service._command_slots.locked()
+    assert websocket_service.command_stats().completed == 0
+
+
 async def test_respond_if_necessary_sets_result(websocket_service: WebsocketService) -> None:
     """Fulfill waiting futures when result payloads indicate success."""
     pending_future = websocket_service.hassette.loop.create_future()
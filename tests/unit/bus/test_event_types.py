@@ -0,0 +1,113 @@
+"""Unit tests for topic → HA event type mapping and the router's event-type demand tracking."""
+
+import pytest
+
+from hassette.bus.event_types import ALL_EVENT_TYPES, EventTypeDemand, topic_event_type
+from hassette.bus.router import Router
+from hassette.test_utils.helpers import create_listener
+
+
+class TestTopicEventType:
+    @pytest.mark.parametrize(
+        ("topic", "expected"),
+        [
+            ("hass.event.state_changed", "state_changed"),
+            ("hass.event.state_changed.light.kitchen", "state_changed"),
+            ("hass.event.state_changed.light.*", "state_changed"),
+            ("hass.event.call_service", "call_service"),
+            ("hass.event.custom_event", "custom_event"),
+            ("hass.event.*", ALL_EVENT_TYPES),
+            ("hass.event.state_*", ALL_EVENT_TYPES),
+            ("hass.*", ALL_EVENT_TYPES),
+            ("hass*", ALL_EVENT_TYPES),
+            ("*", ALL_EVENT_TYPES),
+            ("?ass.event.state_changed", ALL_EVENT_TYPES),
+            ("hassette.event.app_state_changed", None),
+            ("hassette.*", None),
+            ("hass.event.", None),
+            ("state_changed", None),
+        ],
+    )
+    def test_topic_event_type(self, topic: str, expected: str | None) -> None:
+        assert topic_event_type(topic) == expected
+
+
+class TestEventTypeDemand:
+    def test_required_tracks_added_topics(self) -> None:
+        demand = EventTypeDemand()
+        demand.add("hass.event.state_changed.light.kitchen")
+        demand.add("hass.event.call_service")
+        demand.add("hassette.event.app_state_changed")
+
+        assert demand.required() == frozenset({"state_changed", "call_service"})
+
+    def test_wildcard_topic_requires_everything(self) -> None:
+        demand = EventTypeDemand()
+        demand.add("hass.event.call_service")
+        demand.add("hass.event.*")
+
+        assert demand.required() is None
+
+        demand.discard("hass.event.*")
+        assert demand.required() == frozenset({"call_service"})
+
+    def test_event_type_kept_until_last_topic_discarded(self) -> None:
+        demand = EventTypeDemand()
+        demand.add("hass.event.state_changed.light.kitchen")
+        demand.add("hass.event.state_changed.light.hall")
+
+        demand.discard("hass.event.state_changed.light.kitchen")
+        assert demand.required() == frozenset({"state_changed"})
+
+        demand.discard("hass.event.state_changed.light.hall")
+        assert demand.required() == frozenset()
+
+    def test_revision_changes_only_when_required_set_changes(self) -> None:
+        demand = EventTypeDemand()
+        start = demand.revision
+
+        demand.add("hass.event.state_changed.light.kitchen")
+        after_first = demand.revision
+        demand.add("hass.event.state_changed.light.hall")
+        demand.add("hassette.event.app_state_changed")
+
+        assert after_first != start
+        assert demand.revision == after_first
+
+    def test_discard_unknown_topic_is_noop(self) -> None:
+        demand = EventTypeDemand()
+        demand.discard("hass.event.call_service")
+
+        assert demand.required() == frozenset()
+        assert demand.revision == 0
+
+
+class TestRouterRequiredEventTypes:
+    def test_router_demand_follows_topic_buckets(self) -> None:
+        router = Router()
+        kitchen = create_listener(topic="hass.event.state_changed.light.kitchen", owner_id="a")
+        kitchen_again = create_listener(topic="hass.event.state_changed.light.kitchen", owner_id="b")
+        services = create_listener(topic="hass.event.call_service", owner_id="b")
+
+        router.add_route(kitchen.topic, kitchen)
+        router.add_route(kitchen_again.topic, kitchen_again)
+        router.add_route(services.topic, services)
+        assert router.required_event_types() == frozenset({"state_changed", "call_service"})
+
+        router.remove_listener_by_id(kitchen.topic, kitchen.listener_id)
+        assert router.required_event_types() == frozenset({"state_changed", "call_service"})
+
+        router.clear_owner("b")
+        assert router.required_event_types() == frozenset()
+
+    def test_router_glob_topic_demands_all_event_types(self) -> None:
+        router = Router()
+        everything = create_listener(topic="hass.*", owner_id="a")
+
+        router.add_route(everything.topic, everything)
+        assert router.required_event_types() is None
+
+        revision = router.event_types_revision
+        router.remove_listener_by_id(everything.topic, everything.listener_id)
+        assert router.required_event_types() == frozenset()
+        assert router.event_types_revision != revision
@@ -91,6 +91,23 @@ class TestSingleMode:
         assert tracker2.completed == 1
         assert guard.suppressed == 0
 
+    async def test_suppress_if_running_counts_without_a_trigger(self) -> None:
+        """The pre-dispatch busy check suppresses only while an invocation runs."""
+        gate = asyncio.Event()
+        tracker = Tracker(gate)
+        guard = ExecutionModeGuard(ExecutionMode.SINGLE)
+        assert guard.suppress_if_running() is False
+
+        await guard.run(tracker.make_run_and_track())
+        await settle()
+        assert guard.suppress_if_running() is True
+        assert guard.suppressed == 1
+
+        gate.set()
+        await settle()
+        assert guard.suppress_if_running() is False
+        assert guard.suppressed == 1
+
 
 class TestRestartMode:
     async def test_second_trigger_cancels_first(self) -> None:
@@ -0,0 +1,123 @@
+"""Unit tests for GlobIndex, the prefix trie backing Router glob resolution."""
+
+from fnmatch import fnmatchcase
+
+import pytest
+
+from hassette.bus.glob_index import GlobIndex, literal_prefix_segments
+
+
+class TestLiteralPrefixSegments:
+    @pytest.mark.parametrize(
+        ("pattern", "expected"),
+        [
+            ("hass.event.state_changed.light.*", ["hass", "event", "state_changed", "light"]),
+            ("hass.event.state_changed.light.?itchen", ["hass", "event", "state_changed", "light"]),
+            ("hass.*", ["hass"]),
+            ("*", []),
+            ("state_changed/*", []),
+            ("hass.event.[cs]*", ["hass", "event"]),
+        ],
+    )
+    def test_literal_prefix(self, pattern: str, expected: list[str]) -> None:
+        assert literal_prefix_segments(pattern) == expected
+
+
+class TestGlobIndexMatch:
+    PATTERNS = (
+        "*",
+        "hass.*",
+        "hass.event.state_changed.*",
+        "hass.event.state_changed.light.*",
+        "hass.event.state_changed.sensor.*",
+        "hass.event.state_changed.light.?itchen",
+        "hass.event.[cs]*",
+        "hassette.*",
+        "light.?itchen",
+        "state_changed/*",
+    )
+    TOPICS = (
+        "hass.event.state_changed",
+        "hass.event.state_changed.light.kitchen",
+        "hass.event.state_changed.light.*",
+        "hass.event.state_changed.sensor.power",
+        "hass.event.call_service",
+        "hassette.event.service_status",
+        "light.kitchen",
+        "state_changed/light.kitchen",
+        "other",
+        "",
+    )
+
+    @pytest.mark.parametrize("topic", TOPICS)
+    def test_matches_same_patterns_as_fnmatch(self, topic: str) -> None:
+        """Every topic resolves to exactly the patterns a linear fnmatch scan would find."""
+        index = GlobIndex()
+        for pattern in self.PATTERNS:
+            index.add(pattern)
+
+        expected = {p for p in self.PATTERNS if fnmatchcase(topic, p)}
+
+        assert set(index.match(topic)) == expected
+
+    def test_star_spans_dots(self) -> None:
+        """A trailing ``*`` keeps fnmatch semantics and matches across dot boundaries."""
+        index = GlobIndex()
+        index.add("hass.*")
+
+        assert index.match("hass.event.state_changed.light.kitchen") == ["hass.*"]
+
+    def test_literal_prefix_must_match_whole_segment(self) -> None:
+        """A literal segment does not match a topic segment it is only a prefix of."""
+        index = GlobIndex()
+        index.add("hass.event.*")
+
+        assert index.match("hass.eventful.x") == []
+
+
+class TestGlobIndexMutation:
+    def test_add_is_idempotent(self) -> None:
+        index = GlobIndex()
+        index.add("hass.*")
+        index.add("hass.*")
+
+        assert len(index) == 1
+        assert index.match("hass.x") == ["hass.*"]
+
+    def test_discard_removes_pattern(self) -> None:
+        index = GlobIndex()
+        index.add("hass.event.*")
+        index.add("hass.*")
+
+        index.discard("hass.event.*")
+
+        assert "hass.event.*" not in index
+        assert index.match("hass.event.x") == ["hass.*"]
+        assert len(index) == 1
+
+    def test_discard_prunes_empty_nodes(self) -> None:
+        index = GlobIndex()
+        index.add("a.b.c.*")
+
+        index.discard("a.b.c.*")
+
+        assert len(index) == 0
+        assert index._root.children == {}
+
+    def test_discard_keeps_shared_prefix_nodes(self) -> None:
+        index = GlobIndex()
+        index.add("a.b.*")
+        index.add("a.b.c.*")
+
+        index.discard("a.b.c.*")
+
+        assert index.match("a.b.c.d") == ["a.b.*"]
+
+    def test_discard_unknown_pattern_is_noop(self) -> None:
+        index = GlobIndex()
+        index.add("a.*")
+
+        index.discard("b.*")
+        index.discard("a.b.*")
+
+        assert list(index) == ["a.*"]
@@ -8,7 +8,7 @@ factory the integration tests rely on.
 
 import asyncio
 from collections.abc import Mapping
-from typing import Any
+from typing import Any, NoReturn
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -163,6 +163,56 @@ class TestHandlerInvokerDispatch:
         invoke_fn.assert_not_awaited()
 
 
+class TestHandlerInvokerAdmit:
+    # admit() runs before any dispatch task exists, so make_invoke_fn is only ever called for a
+    # debounced handler that fires; the tests that don't debounce pass one that must not be used.
+    @staticmethod
+    def unused_invoke_fn() -> NoReturn:
+        raise AssertionError("make_invoke_fn should not be called at admit time")
+
+    def test_admit_plain_listener(self) -> None:
+        invoker = make_invoker(options=ListenerOptions(mode="parallel"))
+        assert invoker.admit(self.unused_invoke_fn) is True
+
+    def test_admit_rejects_fired_once_listener(self) -> None:
+        invoker = make_invoker(options=ListenerOptions(once=True, mode="parallel"))
+        assert invoker.admit(self.unused_invoke_fn) is True
+        invoker.mark_fired()
+        assert invoker.admit(self.unused_invoke_fn) is False
+
+    async def test_admit_applies_throttle(self) -> None:
+        """The throttle window opens on the first admitted event and drops the rest."""
+        invoker = make_invoker(options=ListenerOptions(throttle=60.0, mode="parallel"))
+        assert invoker.admit(self.unused_invoke_fn) is True
+        assert invoker.admit(self.unused_invoke_fn) is False
+
+    async def test_dispatch_after_admit_skips_rate_limiter(self) -> None:
+        """An admitted event is not throttled a second time by dispatch()."""
+        invoker = make_invoker(options=ListenerOptions(throttle=60.0, mode="parallel"))
+        invoke_fn = AsyncMock()
+        assert invoker.admit(self.unused_invoke_fn) is True
+        await invoker.dispatch(invoke_fn, admitted=True)
+        invoke_fn.assert_awaited_once()
+
+    async def test_admit_takes_over_debounced_event(self) -> None:
+        """Debounce settles the event at admit time: no dispatch task, one pending timer."""
+        invoker = make_invoker(options=ListenerOptions(debounce=60.0, mode="parallel"))
+        assert invoker.admit(self.unused_invoke_fn) is False
+        assert invoker.rate_limiter is not None
+        assert invoker.rate_limiter._debounce_handle is not None
+        invoker.cancel()
+
+    async def test_admit_suppresses_busy_single_listener(self) -> None:
+        invoker = make_invoker(options=ListenerOptions(mode="single"))
+        running = asyncio.create_task(asyncio.Event().wait())
+        invoker.guard.current_task = running
+        try:
+            assert invoker.admit(self.unused_invoke_fn) is False
+            assert invoker.guard.suppressed == 1
+        finally:
+            running.cancel()
+
+
 class TestHandlerInvokerInvoke:
     async def test_invoke_calls_handler(self) -> None:
         called = False
@@ -258,3 +258,168 @@ class TestRouterGetListenersByOwner:
 
         assert l1 in result
         assert l2 not in result
+
+
+class TestRouterTopicCache:
+    def test_repeated_lookup_returns_equal_results(self) -> None:
+        """A cached lookup returns the same listeners as the first resolution."""
+        router = Router()
+        exact = create_listener(topic="hass.event.state_changed.light.kitchen", owner_id="o1")
+        glob = create_listener(topic="hass.event.state_changed.light.*", owner_id="o2")
+        router.add_route(exact.topic, exact)
+        router.add_route(glob.topic, glob)
+
+        first = router.get_topic_listeners("hass.event.state_changed.light.kitchen")
+        second = router.get_topic_listeners("hass.event.state_changed.light.kitchen")
+
+        assert first == second == [exact, glob]
+
+    def test_returned_list_is_a_copy(self) -> None:
+        """Mutating a returned list does not corrupt the cached resolution."""
+        router = Router()
+        listener = create_listener(topic="state_changed")
+        router.add_route("state_changed", listener)
+
+        router.get_topic_listeners("state_changed").clear()
+
+        assert router.get_topic_listeners("state_changed") == [listener]
+
+    def test_add_route_invalidates_cached_topic(self) -> None:
+        """A glob added after a topic was cached is visible on the next lookup."""
+        router = Router()
+        assert router.get_topic_listeners("hass.event.state_changed.light.kitchen") == []
+
+        glob = create_listener(topic="hass.event.state_changed.*")
+        router.add_route(glob.topic, glob)
+
+        assert router.get_topic_listeners("hass.event.state_changed.light.kitchen") == [glob]
+
+    def test_remove_route_invalidates_cached_topic(self) -> None:
+        """Removing the last glob listener drops it from cached topics and the glob index."""
+        router = Router()
+        glob = create_listener(topic="hass.event.*")
+        router.add_route(glob.topic, glob)
+        assert router.get_topic_listeners("hass.event.call_service") == [glob]
+
+        router.remove_listener_by_id(glob.topic, glob.listener_id)
+
+        assert router.get_topic_listeners("hass.event.call_service") == []
+        assert "hass.event.*" not in router.globs
+        assert "hass.event.*" not in router._glob_index
+
+    def test_clear_owner_invalidates_cached_topic(self) -> None:
+        """clear_owner drops glob listeners from previously cached topics."""
+        router = Router()
+        glob = create_listener(topic="hass.event.*", owner_id="owner1")
+        router.add_route(glob.topic, glob)
+        assert router.get_topic_listeners("hass.event.call_service") == [glob]
+
+        router.clear_owner("owner1")
+
+        assert router.get_topic_listeners("hass.event.call_service") == []
+        assert "hass.event.*" not in router._glob_index
+
+    def test_equal_priority_keeps_exact_then_glob_registration_order(self) -> None:
+        """Ties keep the exact-first, then glob-registration-order tie-break."""
+        router = Router()
+        broad = create_listener(topic="hass.*", owner_id="broad")
+        narrow = create_listener(topic="hass.event.state_changed.light.*", owner_id="narrow")
+        exact = create_listener(topic="hass.event.state_changed.light.kitchen", owner_id="exact")
+        router.add_route(broad.topic, broad)
+        router.add_route(narrow.topic, narrow)
+        router.add_route(exact.topic, exact)
+
+        result = router.get_topic_listeners("hass.event.state_changed.light.kitchen")
+
+        assert result == [exact, broad, narrow]
+
+
+class TestRouterTopicSnapshot:
+    def test_snapshot_is_shared_until_invalidated(self) -> None:
+        """Repeated lookups return the very same tuple object."""
+        router = Router()
+        listener = create_listener(topic="state_changed")
+        router.add_route("state_changed", listener)
+
+        first = router.topic_snapshot("state_changed")
+
+        assert first == (listener,)
+        assert router.topic_snapshot("state_changed") is first
+
+    def test_exact_route_change_keeps_unrelated_snapshots(self) -> None:
+        """Adding an exact route only drops the snapshot for that topic."""
+        router = Router()
+        router.add_route("a.b", create_listener(topic="a.b", owner_id="o1"))
+        unrelated = router.topic_snapshot("a.b")
+
+        router.add_route("c.d", create_listener(topic="c.d", owner_id="o2"))
+
+        assert router.topic_snapshot("a.b") is unrelated
+
+    def test_glob_route_change_drops_only_matching_snapshots(self) -> None:
+        """Adding a glob route drops snapshots for topics it matches and keeps the rest."""
+        router = Router()
+        light = router.topic_snapshot("hass.event.state_changed.light.kitchen")
+        sensor = router.topic_snapshot("hass.event.state_changed.sensor.power")
+
+        glob = create_listener(topic="hass.event.state_changed.light.*")
+        router.add_route(glob.topic, glob)
+
+        assert router.topic_snapshot("hass.event.state_changed.sensor.power") is sensor
+        assert router.topic_snapshot("hass.event.state_changed.light.kitchen") is not light
+        assert router.topic_snapshot("hass.event.state_changed.light.kitchen") == (glob,)
+
+
+class TestRouterDispatchPlan:
+    ROUTES = (
+        "hass.event.state_changed.light.kitchen",
+        "hass.event.state_changed.light.*",
+        "hass.event.state_changed",
+    )
+
+    def test_plan_groups_by_route_and_dedupes_first_route_wins(self) -> None:
+        """A listener reachable from several routes is attributed to the most specific one."""
+        router = Router()
+        exact = create_listener(topic=self.ROUTES[0], owner_id="exact")
+        broad = create_listener(topic="hass.event.state_changed.*", owner_id="broad", priority=5)
+        domain = create_listener(topic=self.ROUTES[1], owner_id="domain")
+        base = create_listener(topic=self.ROUTES[2], owner_id="base")
+        for listener in (exact, broad, domain, base):
+            router.add_route(listener.topic, listener)
+
+        plan = router.dispatch_plan(self.ROUTES)
+
+        # The domain glob also matches the concrete entity topic, so it lands on route 0 too.
+        assert plan == (
+            (self.ROUTES[0], broad),
+            (self.ROUTES[0], exact),
+            (self.ROUTES[0], domain),
+            (self.ROUTES[2], base),
+        )
+
+    def test_plan_is_reused_while_routes_unchanged(self) -> None:
+        router = Router()
+        listener = create_listener(topic=self.ROUTES[1])
+        router.add_route(listener.topic, listener)
+
+        first = router.dispatch_plan(self.ROUTES)
+
+        assert router.dispatch_plan(self.ROUTES) is first
+
+    def test_plan_rebuilt_after_route_change(self) -> None:
+        """A route change affecting any of the plan's routes yields a fresh plan."""
+        router = Router()
+        domain = create_listener(topic=self.ROUTES[1], owner_id="domain")
+        router.add_route(domain.topic, domain)
+        first = router.dispatch_plan(self.ROUTES)
+
+        base = create_listener(topic=self.ROUTES[2], owner_id="base")
+        router.add_route(base.topic, base)
+        second = router.dispatch_plan(self.ROUTES)
+
+        assert second is not first
+        assert second == ((self.ROUTES[0], domain), (self.ROUTES[2], base))
+
+        router.remove_listener_by_id(domain.topic, domain.listener_id)
+
+        assert router.dispatch_plan(self.ROUTES) == ((self.ROUTES[2], base),)
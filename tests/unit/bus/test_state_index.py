@@ -0,0 +1,150 @@
+"""Unit tests for static-constraint pre-indexing of state_changed listeners."""
+
+import itertools
+
+import pytest
+
+from hassette import P
+from hassette.bus.bus import build_state_preds
+from hassette.bus.state_index import (
+    UNCONSTRAINED,
+    StateIndexCache,
+    StatePlanIndex,
+    StaticStateConstraints,
+    extract_state_constraints,
+)
+from hassette.const import MISSING_VALUE, NOT_PROVIDED
+from hassette.event_handling import conditions as C
+from hassette.test_utils.helpers import create_listener, create_state_change_event
+
+ROUTE = "hass.event.state_changed.light.kitchen"
+
+
+def state_listener(entity_id: str, *, changed_to=NOT_PROVIDED, changed_from=NOT_PROVIDED, where=None, owner="o"):
+    """Build a listener with the same predicate chain Bus.on_state_change produces."""
+    preds, _ = build_state_preds(entity_id, changed=True, changed_from=changed_from, changed_to=changed_to)
+    if where is not None:
+        preds.append(where)
+    return create_listener(topic=f"hass.event.state_changed.{entity_id}", owner_id=owner, where=preds)
+
+
+class TestExtractStateConstraints:
+    def test_none_predicate_is_unconstrained(self) -> None:
+        assert extract_state_constraints(None) is UNCONSTRAINED
+
+    def test_on_state_change_chain(self) -> None:
+        listener = state_listener("light.kitchen", changed_to="on", changed_from="off")
+
+        assert extract_state_constraints(listener.predicate) == StaticStateConstraints(
+            entity_id="light.kitchen", new_state="on", old_state="off"
+        )
+
+    def test_glob_entity_is_not_a_constraint(self) -> None:
+        listener = state_listener("light.*", changed_to="on")
+
+        assert extract_state_constraints(listener.predicate) == StaticStateConstraints(new_state="on")
+
+    def test_callable_condition_is_not_a_constraint(self) -> None:
+        listener = state_listener("light.kitchen", changed_to=C.IsIn(["on", "off"]))
+
+        assert extract_state_constraints(listener.predicate) == StaticStateConstraints(entity_id="light.kitchen")
+
+    def test_unhashable_literal_is_not_a_constraint(self) -> None:
+        assert extract_state_constraints(P.StateTo(["on"])) is UNCONSTRAINED
+
+    def test_domain_literal_is_extracted(self) -> None:
+        assert extract_state_constraints(P.DomainMatches("light")) == StaticStateConstraints(domain="light")
+
+    def test_constraints_under_any_of_are_ignored(self) -> None:
+        """Disjunctions are opaque: neither branch is a necessary condition."""
+        predicate = P.AnyOf((P.StateTo("on"), P.StateTo("off")))
+
+        assert extract_state_constraints(predicate) is UNCONSTRAINED
+
+    def test_nested_all_of_is_flattened(self) -> None:
+        predicate = P.AllOf((P.AllOf((P.EntityMatches("light.kitchen"),)), P.StateTo("on")))
+
+        assert extract_state_constraints(predicate) == StaticStateConstraints(entity_id="light.kitchen", new_state="on")
+
+    def test_arbitrary_callable_is_unconstrained(self) -> None:
+        assert extract_state_constraints(lambda _ev: True) is UNCONSTRAINED
+
+
+class TestStatePlanIndex:
+    def test_candidates_keep_only_admissible_listeners_in_plan_order(self) -> None:
+        to_on = state_listener("light.kitchen", changed_to="on", owner="to_on")
+        to_off = state_listener("light.kitchen", changed_to="off", owner="to_off")
+        any_change = state_listener("light.kitchen", owner="any")
+        custom = state_listener("light.kitchen", where=lambda _ev: True, owner="custom")
+        from_off = state_listener("light.kitchen", changed_to="on", changed_from="off", owner="from_off")
+        from_on = state_listener("light.kitchen", changed_to="on", changed_from="on", owner="from_on")
+        entries = tuple((ROUTE, listener) for listener in (to_on, to_off, any_change, custom, from_off, from_on))
+
+        index = StatePlanIndex(entries)
+
+        assert [listener for _, listener in index.candidates("light.kitchen", "off", "on")] == [
+            to_on,
+            any_change,
+            custom,
+            from_off,
+        ]
+
+    def test_all_unconstrained_returns_plan_itself(self) -> None:
+        entries = ((ROUTE, create_listener(topic=ROUTE)),)
+
+        assert StatePlanIndex(entries).candidates("light.kitchen", "off", "on") is entries
+
+    def test_unhashable_new_state_only_admits_listeners_without_state_literal(self) -> None:
+        to_on = state_listener("light.kitchen", changed_to="on", owner="to_on")
+        any_change = state_listener("light.kitchen", owner="any")
+        index = StatePlanIndex(((ROUTE, to_on), (ROUTE, any_change)))
+
+        assert index.candidates("light.kitchen", "off", ["on"]) == ((ROUTE, any_change),)
+
+    @pytest.mark.parametrize(
+        ("old_value", "new_value"),
+        list(itertools.product(["on", "off", "unavailable", None], ["on", "off", "unavailable", None])),
+    )
+    def test_never_drops_a_matching_listener(self, old_value, new_value) -> None:
+        """Narrowing is exact: a listener is a candidate iff its static constraints admit the event."""
+        listeners = [
+            state_listener("light.kitchen", changed_to="on", owner="a"),
+            state_listener("light.kitchen", changed_to="off", changed_from="on", owner="b"),
+            state_listener("light.kitchen", changed_from="unavailable", owner="c"),
+            state_listener("light.other", changed_to="on", owner="d"),
+            state_listener("light.*", changed_to="on", owner="e"),
+            state_listener("light.kitchen", changed_to=MISSING_VALUE, owner="f"),
+            state_listener("light.kitchen", where=P.DomainMatches("switch"), owner="g"),
+        ]
+        entries = tuple((ROUTE, listener) for listener in listeners)
+        event = create_state_change_event(entity_id="light.kitchen", old_value=old_value, new_value=new_value)
+        data = event.payload.data
+
+        candidates = StatePlanIndex(entries).candidates(data.entity_id, data.old_state_value, data.new_state_value)
+
+        matching = {listener.listener_id for listener in listeners if listener.matches(event)}
+        candidate_ids = {listener.listener_id for _, listener in candidates}
+        assert matching <= candidate_ids
+
+
+class TestStateIndexCache:
+    def test_index_reused_for_same_plan_and_rebuilt_for_new_plan(self) -> None:
+        cache = StateIndexCache()
+        to_on = state_listener("light.kitchen", changed_to="on", owner="to_on")
+        entries = ((ROUTE, to_on),)
+
+        assert cache.candidates((ROUTE,), entries, "light.kitchen", "off", "on") == entries
+        first_index = cache._indexes[(ROUTE,)]
+        assert cache.candidates((ROUTE,), entries, "light.kitchen", "on", "off") == ()
+        assert cache._indexes[(ROUTE,)] is first_index
+
+        new_entries = ((ROUTE, to_on), (ROUTE, state_listener("light.kitchen", owner="any")))
+        cache.candidates((ROUTE,), new_entries, "light.kitchen", "on", "off")
+
+        assert cache._indexes[(ROUTE,)] is not first_index
+
+    def test_empty_plan_short_circuits(self) -> None:
+        cache = StateIndexCache()
+
+        assert cache.candidates((ROUTE,), (), "light.kitchen", "off", "on") == ()
+        assert cache._indexes == {}
@@ -125,6 +125,7 @@ def make_api() -> Api:
     hassette_mock = MagicMock()
     hassette_mock.config.logging.api = "INFO"
     hassette_mock.config.forgotten_await_behavior = None
+    hassette_mock.config.call_service_coalesce_window_seconds = 0.0
 
     api = Api.__new__(Api)
     api.hassette = hassette_mock
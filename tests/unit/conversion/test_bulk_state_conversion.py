@@ -0,0 +1,36 @@
+"""Tests for converting many raw state dicts at once."""
+
+from hassette.conversion import STATE_REGISTRY, convert_state_dicts_to_model
+from hassette.models.states import BaseState, LightState, SwitchState
+from hassette.test_utils import make_light_state_dict, make_switch_state_dict
+
+
+def test_failed_entries_are_none_and_the_rest_still_validate() -> None:
+    states = [
+        make_light_state_dict("light.kitchen", "on", brightness=10),
+        make_light_state_dict("light.broken", "on", brightness="very"),
+        make_light_state_dict("light.office", "off"),
+    ]
+
+    kitchen, broken, office = convert_state_dicts_to_model(states, LightState)
+
+    assert isinstance(kitchen, LightState)
+    assert kitchen.entity_id == "light.kitchen"
+    assert broken is None
+    assert isinstance(office, LightState)
+    assert office.entity_id == "light.office"
+
+
+def test_try_convert_states_matches_per_item_conversion() -> None:
+    states = [
+        make_light_state_dict("light.kitchen", "on", brightness=10),
+        make_switch_state_dict("switch.fan", "off"),
+        make_light_state_dict("light.broken", "on", brightness="very"),
+        make_light_state_dict("light.office", "unavailable"),
+    ]
+
+    converted = STATE_REGISTRY.try_convert_states(states)
+
+    assert [type(s) for s in converted] == [LightState, SwitchState, BaseState, LightState]
+    assert converted == [STATE_REGISTRY.try_convert_state(s) for s in states]
+    assert converted[3].is_unavailable
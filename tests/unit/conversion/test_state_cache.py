@@ -0,0 +1,100 @@
+"""Tests for the process-wide typed-state cache and the paths that share it."""
+
+from unittest.mock import patch
+
+from hassette.conversion import ANNOTATION_CONVERTER, STATE_REGISTRY, TYPED_STATE_CACHE, TypedStateCache
+from hassette.events.hass.hass import TypedStateChangeEvent
+from hassette.models.states import BaseState, LightState
+from hassette.state_manager.state_manager import DomainStates
+from hassette.test_utils import FakeStateReader, make_full_state_change_event, make_light_state_dict
+
+
+def test_hit_requires_the_same_state_object() -> None:
+    cache = TypedStateCache()
+    state = make_light_state_dict("light.kitchen", "on")
+    model = STATE_REGISTRY.coerce_and_construct(LightState, state, "light.kitchen")
+
+    cache.put("light.kitchen", 3, LightState, state, model)
+
+    assert cache.get("light.kitchen", 3, LightState, state) is model
+    assert cache.get("light.kitchen", 3, LightState, dict(state)) is None
+    assert cache.get("light.kitchen", 4, LightState, state) is None
+    assert cache.get("light.kitchen", 3, BaseState, state) is None
+
+
+def test_new_revision_replaces_the_entry_in_place() -> None:
+    cache = TypedStateCache()
+    old_state = make_light_state_dict("light.kitchen", "off")
+    new_state = make_light_state_dict("light.kitchen", "on")
+    new_model = STATE_REGISTRY.coerce_and_construct(LightState, new_state, "light.kitchen")
+
+    old_model = STATE_REGISTRY.coerce_and_construct(LightState, old_state, "light.kitchen")
+    cache.put("light.kitchen", 1, LightState, old_state, old_model)
+    cache.put("light.kitchen", 2, LightState, new_state, new_model)
+
+    assert len(cache) == 1
+    assert cache.get("light.kitchen", 1, LightState, old_state) is None
+    assert cache.get("light.kitchen", 2, LightState, new_state) is new_model
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    cache = TypedStateCache(maxsize=2)
+    states = {eid: make_light_state_dict(eid, "on") for eid in ("light.a", "light.b", "light.c")}
+    models = {eid: STATE_REGISTRY.coerce_and_construct(LightState, s, eid) for eid, s in states.items()}
+
+    cache.put("light.a", 1, LightState, states["light.a"], models["light.a"])
+    cache.put("light.b", 1, LightState, states["light.b"], models["light.b"])
+    cache.get("light.a", 1, LightState, states["light.a"])
+    cache.put("light.c", 1, LightState, states["light.c"], models["light.c"])
+
+    assert len(cache) == 2
+    assert cache.get("light.b", 1, LightState, states["light.b"]) is None
+    assert cache.get("light.a", 1, LightState, states["light.a"]) is models["light.a"]
+
+
+class RevisionedReader(FakeStateReader):
+    """FakeStateReader that reports a fixed revision for every entity."""
+
+    def get_state_revision(self, entity_id: str) -> int | None:
+        return 7
+
+
+def test_domain_states_share_models_across_instances() -> None:
+    reader = RevisionedReader({"light.kitchen": make_light_state_dict("light.kitchen", "on")})
+
+    with patch.object(STATE_REGISTRY, "coerce_and_construct", wraps=STATE_REGISTRY.coerce_and_construct) as spy:
+        first = DomainStates(reader, LightState)["light.kitchen"]
+        second = DomainStates(reader, LightState)["light.kitchen"]
+
+    assert first is second
+    assert spy.call_count == 1
+
+
+def test_typed_event_conversion_reuses_models_across_listeners() -> None:
+    old_state = make_light_state_dict("light.kitchen", "off")
+    new_state = make_light_state_dict("light.kitchen", "on")
+    event = make_full_state_change_event("light.kitchen", old_state, new_state)
+
+    first = ANNOTATION_CONVERTER.convert(event, TypedStateChangeEvent[LightState])
+    second = ANNOTATION_CONVERTER.convert(event, TypedStateChangeEvent[LightState])
+
+    assert first.payload.data.new_state is second.payload.data.new_state
+    assert first.payload.data.old_state is second.payload.data.old_state
+    assert isinstance(first.payload.data.new_state, LightState)
+
+
+def test_event_burst_does_not_evict_domain_entries() -> None:
+    reader = RevisionedReader({"light.kitchen": make_light_state_dict("light.kitchen", "on")})
+    warm = DomainStates(reader, LightState)["light.kitchen"]
+    entries = len(TYPED_STATE_CACHE)
+
+    for i in range(50):
+        old_state = make_light_state_dict(f"light.burst_{i}", "off")
+        new_state = make_light_state_dict(f"light.burst_{i}", "on")
+        event = make_full_state_change_event(f"light.burst_{i}", old_state, new_state)
+        ANNOTATION_CONVERTER.convert(event, TypedStateChangeEvent[LightState])
+
+    assert len(TYPED_STATE_CACHE) == entries
+    with patch.object(STATE_REGISTRY, "coerce_and_construct", wraps=STATE_REGISTRY.coerce_and_construct) as spy:
+        assert DomainStates(reader, LightState)["light.kitchen"] is warm
+    assert spy.call_count == 0
@@ -96,6 +96,31 @@ CREATE TABLE executions (
     execution_id          TEXT UNIQUE
 );
 
+CREATE TABLE execution_rollups (
+    id                    INTEGER PRIMARY KEY AUTOINCREMENT,
+    listener_id           INTEGER REFERENCES listeners(id) ON DELETE CASCADE,
+    job_id                INTEGER REFERENCES scheduled_jobs(id) ON DELETE CASCADE,
+    bucket_start_ts       REAL NOT NULL,
+    execution_count       INTEGER NOT NULL DEFAULT 1
+);
+
+CREATE TABLE execution_buckets (
+    id                    INTEGER PRIMARY KEY AUTOINCREMENT,
+    listener_id           INTEGER REFERENCES listeners(id) ON DELETE CASCADE,
+    job_id                INTEGER REFERENCES scheduled_jobs(id) ON DELETE CASCADE,
+    bucket_start_ts       REAL NOT NULL,
+    execution_count       INTEGER NOT NULL DEFAULT 1
+);
+
+CREATE TABLE latency_histograms (
+    id                    INTEGER PRIMARY KEY AUTOINCREMENT,
+    listener_id           INTEGER REFERENCES listeners(id) ON DELETE CASCADE,
+    job_id                INTEGER REFERENCES scheduled_jobs(id) ON DELETE CASCADE,
+    period_start_ts       REAL NOT NULL,
+    bucket_index          INTEGER NOT NULL,
+    sample_count          INTEGER NOT NULL
+);
+
 CREATE TABLE blocking_events (
     id               INTEGER PRIMARY KEY AUTOINCREMENT,
     session_id       INTEGER REFERENCES sessions(id),
@@ -260,6 +285,9 @@ def make_executor(*, error_handler_timeout: float = 5.0) -> CommandExecutor:
     executor._last_capacity_warn_ts = 0.0
     executor._last_unowned_warn_ts = None
     executor._timeout_warn_timestamps = {}
+    executor._latency = {}
+    executor._next_latency_flush = 0.0
+    executor._completion_observers = ()
     executor.repository = MagicMock()
     executor.hassette = hassette
     executor._logger = MagicMock()
@@ -299,6 +327,9 @@ def init_executor(queue_max: int = 10) -> CommandExecutor:
     executor._last_capacity_warn_ts = None
     executor._last_unowned_warn_ts = None
     executor._timeout_warn_timestamps = {}
+    executor._latency = {}
+    executor._next_latency_flush = 0.0
+    executor._completion_observers = ()
     executor.repository = MagicMock()
     executor.repository.persist_batch = MagicMock()
     executor.hassette = MagicMock()
@@ -499,11 +530,13 @@ def make_scheduler_service(
 
     svc._job_queue = MagicMock()
     svc._job_queue.add = AsyncMock(return_value=None)
+    svc._job_queue.add_many = AsyncMock(return_value=None)
     svc._job_queue.remove_job = AsyncMock(return_value=True)
 
     svc._executor = MagicMock()
     svc._executor.execute = AsyncMock()
     svc._executor.mark_job_status = AsyncMock()
+    svc._executor.mark_job_statuses = AsyncMock()
 
     svc.task_bucket = MagicMock()
     svc.task_bucket.make_async_adapter = MagicMock(side_effect=lambda fn: fn)
@@ -213,6 +213,51 @@ async def test_drop_newest_multiple_drops_increment_counter() -> None:
     svc._dispatch_semaphore.release()
 
 
+async def test_drop_newest_drop_does_not_open_throttle_window() -> None:
+    """A throttled event shed by the saturated gate leaves the throttle window closed.
+
+    Otherwise the dropped event would also hold off the next event for a full window, so the
+    listener could miss both.
+    """
+    svc = make_bus_service(max_concurrent_dispatches=1)
+    await svc._dispatch_semaphore.acquire()
+
+    now = 100.0
+    listener = create_listener(
+        topic="test.topic",
+        name="throttled_dropper",
+        throttle=10.0,
+        backpressure=BackpressurePolicy.DROP_NEWEST,
+        clock=lambda: now,
+    )
+    svc.router.add_route(listener.topic, listener)
+
+    dispatched = 0
+
+    async def counting_dispatch(_route, _event, _listener) -> None:
+        nonlocal dispatched
+        dispatched += 1
+
+    svc._dispatch = counting_dispatch
+
+    await asyncio.wait_for(svc.dispatch("test.topic", make_mock_event()), timeout=TEST_TIMEOUT)
+    assert listener.invoker.backpressure_dropped == 1
+
+    # Same instant, slot now free: the event is within what would have been the dropped
+    # event's window, but must still be admitted.
+    svc._dispatch_semaphore.release()
+    await asyncio.wait_for(svc.dispatch("test.topic", make_mock_event()), timeout=TEST_TIMEOUT)
+    await svc.await_dispatch_idle(timeout=TEST_TIMEOUT)
+
+    assert dispatched == 1
+
+    # The admitted event did open a window, so the next one inside it is throttled.
+    await asyncio.wait_for(svc.dispatch("test.topic", make_mock_event()), timeout=TEST_TIMEOUT)
+    await svc.await_dispatch_idle(timeout=TEST_TIMEOUT)
+
+    assert dispatched == 1
+
+
 async def test_drop_newest_dispatches_normally_when_not_saturated() -> None:
     """A DROP_NEWEST listener dispatches normally when the semaphore is free."""
     svc = make_bus_service(max_concurrent_dispatches=10)
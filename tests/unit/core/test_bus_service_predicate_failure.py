@@ -136,12 +136,12 @@ class TestDispatchPredicateRecordingIsolation:
             raise ValueError("pred boom")
 
         listener = create_listener(where=raising_pred)
-        bs.router.get_topic_listeners.return_value = [listener]
+        bs.router.dispatch_plan.return_value = (("test.pred", listener),)
         event = Event(topic="test.pred", payload=SimpleNamespace())
 
         with (
             patch.object(bs, "_record_predicate_failure", side_effect=RuntimeError("record crash")),
-            patch.object(bs, "expand_topics", return_value=["test.pred"]),
+            patch.object(bs, "expand_topics", return_value=("test.pred",)),
         ):
             await bs.dispatch("test.pred", event)
 
@@ -5,6 +5,7 @@ Tests cover:
 - ``is_dispatch_idle`` — returns True when ``_dispatch_idle_event`` is set,
   False when it is cleared.
 - ``dispatch_pending_count`` — returns the current value of ``_dispatch_pending``.
+- ``has_listeners`` — True only when a listener matches the topic exactly or by glob.
 
 These properties are the recommended public surface for drain helpers and test
 infrastructure. The tests verify that they delegate to the correct private fields
@@ -18,6 +19,7 @@ import pytest
 
 from hassette.core.bus_service import BusService
 from hassette.test_utils import make_mock_hassette
+from hassette.test_utils.helpers import create_listener
 
 
 @pytest.fixture
@@ -132,3 +134,14 @@ def test_on_dispatch_done(
 
     assert bus_service._dispatch_pending == expected_pending
     assert bus_service._dispatch_idle_event.is_set() is expected_idle_set
+
+
+def test_has_listeners_matches_exact_and_glob_routes(bus_service: BusService) -> None:
+    """has_listeners reflects exact and glob subscriptions, and registrations after a cached miss."""
+    topic = "hassette.event.execution_completed"
+    assert bus_service.has_listeners(topic) is False
+
+    bus_service.router.add_route("hassette.event.*", create_listener(topic="hassette.event.*"))
+
+    assert bus_service.has_listeners(topic) is True
+    assert bus_service.has_listeners("hass.event.state_changed") is False
@@ -1,4 +1,4 @@
-"""Tests for CommandExecutor._execute() source_tier branching and build_record()."""
+"""Tests for CommandExecutor._execute() source_tier branching, build_record() and telemetry modes."""
 
 import time
 from unittest.mock import AsyncMock, MagicMock
@@ -148,3 +148,138 @@ class TestBuildRecordTriggerMode:
         assert isinstance(record, ExecutionRecord)
         assert record.kind == "job"
         assert record.trigger_mode == expected
+
+
+def make_telemetry_executor(
+    *,
+    mode: str = "full",
+    framework_mode: str = "full",
+    sample_percent: float = 10.0,
+    overrides: dict[str, str] | None = None,
+) -> CommandExecutor:
+    """Build an executor whose database config carries the given telemetry modes."""
+    executor = make_executor()
+    database = executor.hassette.config.database
+    database.telemetry_mode = mode
+    database.framework_telemetry_mode = framework_mode
+    database.telemetry_sample_percent = sample_percent
+    database.telemetry_mode_overrides = overrides or {}
+    return executor
+
+
+def make_named_handler_cmd(source_tier: str = "app", *, listener_id: int | None = 1) -> MagicMock:
+    """Build an InvokeHandler mock whose listener is ``my_app``'s ``on_motion``."""
+    cmd = make_invoke_handler_cmd(source_tier=source_tier)
+    cmd.listener_id = listener_id
+    cmd.listener.identity.app_key = "my_app"
+    cmd.listener.identity.name = None
+    cmd.listener.identity.handler_short_name = "on_motion"
+    return cmd
+
+
+class TestTelemetryMode:
+    """Verify build_record() flags successes for rollup according to the telemetry mode."""
+
+    def test_full_mode_keeps_every_row(self) -> None:
+        executor = make_telemetry_executor()
+
+        record = executor.build_record(make_named_handler_cmd(), make_result(), time.time(), "exec-id")
+
+        assert record.rollup is False
+
+    def test_aggregated_mode_rolls_up_successes_only(self) -> None:
+        executor = make_telemetry_executor(mode="aggregated")
+        cmd = make_named_handler_cmd()
+
+        assert executor.build_record(cmd, make_result(), time.time(), "ok").rollup is True
+        for status in ("error", "timed_out", "cancelled"):
+            assert executor.build_record(cmd, make_result(status=status), time.time(), status).rollup is False
+
+    def test_unregistered_listener_keeps_its_row(self) -> None:
+        executor = make_telemetry_executor(mode="aggregated")
+
+        assert executor.rolls_up(make_named_handler_cmd(listener_id=None), "success") is False
+
+    @pytest.mark.parametrize(("sample_percent", "expected"), [(0.0, True), (100.0, False)])
+    def test_sampled_mode_keeps_the_sampled_share(self, sample_percent: float, expected: bool) -> None:
+        executor = make_telemetry_executor(mode="sampled", sample_percent=sample_percent)
+
+        assert executor.rolls_up(make_named_handler_cmd(), "success") is expected
+
+    def test_framework_tier_uses_its_own_default(self) -> None:
+        executor = make_telemetry_executor(framework_mode="aggregated")
+
+        assert executor.telemetry_mode(make_named_handler_cmd("framework")) == "aggregated"
+        assert executor.telemetry_mode(make_named_handler_cmd("app")) == "full"
+
+    def test_listener_override_beats_app_override(self) -> None:
+        executor = make_telemetry_executor(overrides={"my_app": "sampled", "my_app:on_motion": "aggregated"})
+        other = make_named_handler_cmd()
+        other.listener.identity.handler_short_name = "on_door"
+
+        assert executor.telemetry_mode(make_named_handler_cmd()) == "aggregated"
+        assert executor.telemetry_mode(other) == "sampled"
+
+    def test_job_override_uses_job_name(self) -> None:
+        executor = make_telemetry_executor(overrides={"my_app:nightly": "aggregated"})
+        cmd = make_cmd_execute_job(source_tier="app")
+        cmd.job = MagicMock()
+        cmd.job.app_key = "my_app"
+        cmd.job.name = "nightly"
+
+        assert executor.telemetry_mode(cmd) == "aggregated"
+
+
+class TestLatencyHistograms:
+    """Verify executions feed the per-listener/job latency histograms and flush_latency() persists them."""
+
+    async def test_execute_records_duration_per_listener_and_job(self) -> None:
+        executor = make_executor()
+
+        async def fn() -> None:
+            pass
+
+        job_cmd = make_cmd_execute_job(source_tier="app")
+        job_cmd.job = MagicMock()
+
+        await executor._execute(fn, make_invoke_handler_cmd(listener_id=7), lambda _: None, "a")
+        await executor._execute(fn, make_invoke_handler_cmd(listener_id=7), lambda _: None, "b")
+        await executor._execute(fn, job_cmd, lambda _: None, "c")
+
+        assert executor._latency[("handler", 7)].count == 2
+        assert executor._latency[("job", 1)].count == 1
+
+    def test_unregistered_listener_is_not_tracked(self) -> None:
+        executor = make_executor()
+
+        executor.record_latency(make_named_handler_cmd(listener_id=None), 5.0)
+
+        assert executor._latency == {}
+
+    async def test_flush_waits_for_interval_unless_forced(self) -> None:
+        executor = make_executor()
+        executor.hassette.config.database.latency_flush_interval_seconds = 60.0
+        executor.hassette.database_service.submit = AsyncMock()
+        executor._next_latency_flush = time.monotonic() + 60.0
+        executor.record_latency(make_named_handler_cmd(listener_id=3), 12.0)
+
+        await executor.flush_latency()
+        executor.hassette.database_service.submit.assert_not_called()
+
+        await executor.flush_latency(force=True)
+        executor.hassette.database_service.submit.assert_awaited_once()
+        histograms, period_start_ts = executor.repository.persist_latency_histograms.call_args.args
+        assert histograms[("handler", 3)].count == 1
+        assert period_start_ts % 3600 == 0
+        assert executor._latency == {}
+
+    async def test_failed_flush_drops_histograms_with_warning(self) -> None:
+        executor = make_executor()
+        executor.hassette.config.database.latency_flush_interval_seconds = 60.0
+        executor.hassette.database_service.submit = AsyncMock(side_effect=RuntimeError("db down"))
+        executor.record_latency(make_named_handler_cmd(listener_id=3), 12.0)
+
+        await executor.flush_latency()
+
+        assert executor._latency == {}
+        executor.logger.warning.assert_called_once()
@@ -101,7 +101,7 @@ async def test_flush_queue_handles_db_closed():
 
     executor.hassette.database_service.submit = fail_submit  # pyright: ignore[reportAttributeAccessIssue]
 
-    async def fake_persist(_recs):
+    async def fake_persist(_recs, **_kwargs):
         pass
 
     executor.repository.persist_execution_batch = fake_persist  # pyright: ignore[reportAttributeAccessIssue]
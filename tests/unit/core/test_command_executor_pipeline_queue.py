@@ -51,14 +51,14 @@ async def direct_submit(coro: Coroutine[Any, Any, Any]) -> Any:
     return await coro
 
 
-def raising_persist(exc: BaseException) -> Callable[[list[ExecutionRecord]], Coroutine[Any, Any, None]]:
+def raising_persist(exc: BaseException) -> Callable[..., Coroutine[Any, Any, None]]:
     """Build an async persist_execution_batch stand-in that always raises ``exc``.
 
     Several persist_batch() error-classification tests below differ only in which exception
     type/message they simulate.
     """
 
-    async def _persist(_recs: list[ExecutionRecord]) -> None:
+    async def _persist(_recs: list[ExecutionRecord], **_kwargs: Any) -> None:
         raise exc
 
     return _persist
@@ -170,7 +170,7 @@ async def test_id_none_records_persist():
 
     persist_calls: list[list[ExecutionRecord]] = []
 
-    async def fake_persist_batch(recs):
+    async def fake_persist_batch(recs, **_kwargs):
         persist_calls.append(list(recs))
 
     executor.repository.persist_execution_batch = fake_persist_batch  # pyright: ignore[reportAttributeAccessIssue]
@@ -250,11 +250,11 @@ async def test_integrity_error_row_by_row_fallback():
     records = [inv_good, inv_bad]
 
     # Simulate: batch call raises IntegrityError; FK fallback returns 1 dropped record
-    async def fake_persist_batch(recs):
+    async def fake_persist_batch(recs, **_kwargs):
         if len(recs) > 1:
             raise sqlite3.IntegrityError("FOREIGN KEY constraint failed")
 
-    async def fake_fk_fallback(_recs):
+    async def fake_fk_fallback(_recs, **_kwargs):
         return 1  # 1 record dropped
 
     executor.repository.persist_execution_batch = fake_persist_batch  # pyright: ignore[reportAttributeAccessIssue]
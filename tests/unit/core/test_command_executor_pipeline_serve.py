@@ -9,13 +9,14 @@ Tests cover:
 - serve() timer-based flush (#657)
 - record_blocking_event graceful handling when database_service is uninitialized
 - emit_completion_events warning for unowned (empty app_key) records
+- emit_completion_events fan-out to completion observers, and bus events only when subscribed
 """
 
 import asyncio
 import contextlib
 import time
 from collections.abc import Coroutine
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from hassette.core.block_io_guard import MonkeypatchEvent
@@ -24,6 +25,9 @@ from hassette.test_utils.factories import make_execution_record
 
 from .conftest import init_executor, make_invocation
 
+if TYPE_CHECKING:
+    from hassette.core.execution_record import ExecutionRecord
+
 
 async def run_serve_until(executor: CommandExecutor, stopper_coro: Coroutine[Any, Any, Any]) -> None:
     """Run executor.serve() alongside a background task that eventually sets shutdown_event,
@@ -259,3 +263,52 @@ async def test_emit_completion_events_unowned_warning_fires_after_rate_limit_win
         await CommandExecutor.emit_completion_events(executor, [unowned])
 
     assert executor._last_unowned_warn_ts == 130.0
+
+
+async def test_emit_completion_events_hands_app_batch_to_observers_once() -> None:
+    """Each observer receives the batch's app-tier records in a single call."""
+    executor = make_executor_with_send_event()
+    batches: list[list[ExecutionRecord]] = []
+    executor.add_completion_observer(batches.append)
+    executor.add_completion_observer(batches.append)  # duplicate registration is ignored
+
+    app_a = make_execution_record(app_key="my_app", source_tier="app", listener_id=1)
+    app_b = make_execution_record(app_key="my_app", source_tier="app", listener_id=2)
+    framework = make_execution_record(app_key="", source_tier="framework")
+    await executor.emit_completion_events([app_a, framework, app_b])
+
+    assert batches == [[app_a, app_b]]
+
+
+async def test_emit_completion_events_survives_failing_observer() -> None:
+    """A raising observer is logged and does not starve the observers after it."""
+    executor = make_executor_with_send_event()
+    batches: list[list[ExecutionRecord]] = []
+    executor.add_completion_observer(MagicMock(side_effect=RuntimeError("boom")))
+    executor.add_completion_observer(batches.append)
+
+    await executor.emit_completion_events([make_execution_record(app_key="my_app")])
+
+    assert len(batches) == 1
+    executor.logger.exception.assert_called_once()
+
+
+async def test_emit_completion_events_skips_bus_without_subscribers() -> None:
+    """No per-record bus event is built when nothing listens on the completion topic."""
+    executor = make_executor_with_send_event()
+    executor.hassette.bus_service.has_listeners.return_value = False
+
+    await executor.emit_completion_events([make_execution_record(app_key="my_app")] * 3)
+
+    executor.hassette.send_event.assert_not_awaited()
+
+
+async def test_removed_observer_is_not_called() -> None:
+    executor = make_executor_with_send_event()
+    observer = MagicMock()
+    executor.add_completion_observer(observer)
+    executor.remove_completion_observer(observer)
+
+    await executor.emit_completion_events([make_execution_record(app_key="my_app")])
+
+    observer.assert_not_called()
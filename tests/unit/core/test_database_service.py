@@ -217,8 +217,8 @@ async def test_close_remaining_queue_items_closes_coroutines_and_cancels_futures
         await worker_task
     initialized_service_with_worker._db_worker_task = None
 
-    queue.put_nowait((coro1, future1))
-    queue.put_nowait((coro2, future2))
+    queue.put_nowait((coro1, future1, False))
+    queue.put_nowait((coro2, future2, False))
 
     initialized_service_with_worker.close_remaining_queue_items(queue)
 
@@ -231,15 +231,15 @@ async def test_on_shutdown_closes_remaining_items_when_join_interrupted(
     service: DatabaseService,
 ) -> None:
     """When queue.join() is interrupted, remaining coroutines are closed in finally."""
-    queue: asyncio.Queue[tuple[object, asyncio.Future[object] | None]] = asyncio.Queue(maxsize=100)
+    queue: asyncio.Queue[tuple[object, asyncio.Future[object] | None, bool]] = asyncio.Queue(maxsize=100)
     service._db_write_queue = queue
 
     async def noop_coro() -> None:
         pass
 
     future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
-    queue.put_nowait((noop_coro(), future))
-    queue.put_nowait((noop_coro(), None))
+    queue.put_nowait((noop_coro(), future, False))
+    queue.put_nowait((noop_coro(), None, False))
 
     async def stuck_worker() -> None:
         await asyncio.Event().wait()
@@ -272,19 +272,25 @@ def test_retention_tables_contains_expected_tables() -> None:
     assert "job_executions" not in table_names
 
 
-def test_retention_tables_has_three_entries() -> None:
-    assert len(_RETENTION_TABLES) == 3
+def test_retention_tables_has_six_entries() -> None:
+    assert len(_RETENTION_TABLES) == 6
 
 
 def test_retention_tables_priority_ordering() -> None:
     by_table = {t.table: t for t in _RETENTION_TABLES}
     assert by_table["log_records"].priority < by_table["executions"].priority < by_table["blocking_events"].priority
+    assert by_table["execution_rollups"].priority == by_table["executions"].priority
+    assert by_table["execution_buckets"].priority == by_table["executions"].priority
+    assert by_table["latency_histograms"].priority == by_table["executions"].priority
 
 
 def test_retention_target_timestamp_columns() -> None:
     by_table = {t.table: t for t in _RETENTION_TABLES}
     assert by_table["log_records"].timestamp_col == "timestamp"
     assert by_table["executions"].timestamp_col == "execution_start_ts"
+    assert by_table["execution_rollups"].timestamp_col == "bucket_start_ts"
+    assert by_table["execution_buckets"].timestamp_col == "bucket_start_ts"
+    assert by_table["latency_histograms"].timestamp_col == "period_start_ts"
     assert by_table["blocking_events"].timestamp_col == "detected_ts"
 
 
@@ -0,0 +1,140 @@
+"""Unit tests for decoding Home Assistant ``subscribe_entities`` messages."""
+
+from datetime import UTC, datetime
+
+from whenever import Instant
+
+from hassette.core.entity_feed import (
+    STATE_CHANGED_EVENT_TYPE,
+    EntityDiffFeed,
+    StateChange,
+    apply_state_diff,
+    expand_compressed_state,
+    make_state_change_event,
+)
+from hassette.events.metadata import get_websocket_generation
+from hassette.types import Topic
+
+T0 = 1_700_000_000.0
+T1 = T0 + 5.5
+
+
+def iso(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, tz=UTC).isoformat()
+
+
+def compressed_light(state: str = "on", **extra) -> dict:
+    return {"s": state, "a": {"brightness": 200, "friendly_name": "Kitchen"}, "c": "ctx-1", "lc": T0, **extra}
+
+
+class TestExpandCompressedState:
+    def test_expands_abbreviated_keys(self) -> None:
+        state = expand_compressed_state("light.kitchen", compressed_light())
+
+        assert state == {
+            "entity_id": "light.kitchen",
+            "state": "on",
+            "attributes": {"brightness": 200, "friendly_name": "Kitchen"},
+            "context": {"id": "ctx-1", "parent_id": None, "user_id": None},
+            "last_changed": iso(T0),
+            "last_updated": iso(T0),
+        }
+
+    def test_last_updated_overrides_last_changed_when_present(self) -> None:
+        state = expand_compressed_state("light.kitchen", compressed_light(lu=T1))
+
+        assert state["last_changed"] == iso(T0)
+        assert state["last_updated"] == iso(T1)
+
+    def test_dict_context_is_merged(self) -> None:
+        state = expand_compressed_state("light.kitchen", compressed_light(c={"id": "ctx-2", "user_id": "u1"}))
+
+        assert state["context"] == {"id": "ctx-2", "parent_id": None, "user_id": "u1"}
+
+
+class TestApplyStateDiff:
+    def test_state_change_with_last_changed_moves_both_timestamps(self) -> None:
+        old = expand_compressed_state("light.kitchen", compressed_light())
+
+        new = apply_state_diff(old, {"+": {"s": "off", "lc": T1, "c": "ctx-2"}})
+
+        assert new["state"] == "off"
+        assert new["last_changed"] == new["last_updated"] == iso(T1)
+        assert new["context"]["id"] == "ctx-2"
+        assert new["attributes"] is old["attributes"]
+
+    def test_attribute_only_change_moves_last_updated(self) -> None:
+        old = expand_compressed_state("light.kitchen", compressed_light())
+
+        new = apply_state_diff(old, {"+": {"a": {"brightness": 50}, "lu": T1}, "-": {"a": ["friendly_name"]}})
+
+        assert new["state"] == "on"
+        assert new["attributes"] == {"brightness": 50}
+        assert new["last_changed"] == iso(T0)
+        assert new["last_updated"] == iso(T1)
+
+    def test_previous_state_is_not_mutated(self) -> None:
+        old = expand_compressed_state("light.kitchen", compressed_light())
+        before = {**old, "attributes": dict(old["attributes"]), "context": dict(old["context"])}
+
+        apply_state_diff(old, {"+": {"s": "off", "a": {"brightness": 1}, "lc": T1}, "-": {"a": ["friendly_name"]}})
+
+        assert old == before
+
+
+class TestEntityDiffFeed:
+    def test_snapshot_then_changes_then_removals(self) -> None:
+        feed = EntityDiffFeed(generation=3)
+
+        added = feed.apply({"a": {"light.kitchen": compressed_light(), "switch.fan": compressed_light("off")}})
+        assert [change.entity_id for change in added] == ["light.kitchen", "switch.fan"]
+        assert all(change.old_state is None for change in added)
+
+        changed = feed.apply({"c": {"light.kitchen": {"+": {"s": "off", "lc": T1}}}})
+        assert len(changed) == 1
+        assert changed[0].old_state is added[0].new_state
+        assert feed.states["light.kitchen"]["state"] == "off"
+
+        removed = feed.apply({"r": ["switch.fan"]})
+        assert removed == [StateChange("switch.fan", added[1].new_state, None)]
+        assert set(feed.states) == {"light.kitchen"}
+
+    def test_diff_for_unknown_entity_is_skipped(self) -> None:
+        feed = EntityDiffFeed(generation=1)
+
+        assert feed.apply({"c": {"light.ghost": {"+": {"s": "on"}}}, "r": ["light.ghost"]}) == []
+        assert feed.states == {}
+
+
+class TestMakeStateChangeEvent:
+    def test_update_event_carries_both_states(self) -> None:
+        feed = EntityDiffFeed(generation=1)
+        feed.apply({"a": {"light.kitchen": compressed_light()}})
+        (change,) = feed.apply({"c": {"light.kitchen": {"+": {"s": "off", "lc": T1, "c": "ctx-9"}}}})
+
+        event = make_state_change_event(change)
+
+        assert event.topic == Topic.HASS_EVENT_STATE_CHANGED
+        assert event.payload.event_type == STATE_CHANGED_EVENT_TYPE
+        assert event.payload.data.entity_id == "light.kitchen"
+        assert event.payload.data.old_state is change.old_state
+        assert event.payload.data.new_state is change.new_state
+        assert event.payload.context.id == "ctx-9"
+        assert event.payload.time_fired.timestamp_millis() == T1 * 1000
+        assert get_websocket_generation(event) is None
+
+    def test_removal_event_uses_old_context(self) -> None:
+        old = expand_compressed_state("light.kitchen", compressed_light())
+
+        event = make_state_change_event(StateChange("light.kitchen", old, None))
+
+        assert event.payload.data.new_state is None
+        assert event.payload.context.id == "ctx-1"
+
+    def test_removal_event_is_stamped_with_receive_time(self) -> None:
+        old = expand_compressed_state("light.kitchen", compressed_light())
+        received_at = Instant.from_timestamp(T1).to_tz("UTC")
+
+        event = make_state_change_event(StateChange("light.kitchen", old, None), received_at)
+
+        assert event.payload.time_fired == received_at
@@ -0,0 +1,76 @@
+"""Unit tests for HeapQueue's position and group indexes."""
+
+import pytest
+
+import hassette.utils.date_utils as date_utils
+from hassette.core.scheduler_service import HeapQueue
+from hassette.scheduler.classes import Job
+from hassette.test_utils.factories import make_scheduled_job
+
+
+def make_jobs() -> list[Job]:
+    now = date_utils.now()
+    return [
+        make_scheduled_job(name=f"job_{i}", owner_id=f"owner_{i % 3}", next_run=now.add(seconds=i)) for i in range(12)
+    ]
+
+
+def owner_of(job: Job) -> str:
+    return job.owner_id
+
+
+def assert_heap_consistent(queue: HeapQueue[Job]) -> None:
+    items = queue._queue
+    for index, item in enumerate(items):
+        assert queue._positions[id(item)] == index
+        if index:
+            assert not item < items[(index - 1) // 2]
+
+
+def test_pop_order_survives_interior_removals() -> None:
+    jobs = make_jobs()
+    queue: HeapQueue[Job] = HeapQueue(group_key=owner_of)
+    for job in reversed(jobs):
+        queue.push(job)
+
+    assert queue.remove_item(jobs[5]) is True
+    assert queue.remove_item(jobs[5]) is False
+    assert queue.remove_item(jobs[0]) is True
+    assert_heap_consistent(queue)
+
+    popped = [queue.pop() for _ in range(len(queue))]
+    assert popped == [job for job in jobs if job not in (jobs[0], jobs[5])]
+
+
+def test_remove_group_takes_only_that_owner() -> None:
+    jobs = make_jobs()
+    queue: HeapQueue[Job] = HeapQueue(group_key=owner_of)
+    for job in jobs:
+        queue.push(job)
+
+    removed = queue.remove_group("owner_1")
+
+    assert {id(job) for job in removed} == {id(job) for job in jobs if job.owner_id == "owner_1"}
+    assert all(job.owner_id != "owner_1" for job in queue)
+    assert queue.remove_group("owner_1") == []
+    assert_heap_consistent(queue)
+
+
+def test_push_of_queued_item_repositions_instead_of_duplicating() -> None:
+    jobs = make_jobs()
+    queue: HeapQueue[Job] = HeapQueue()
+    for job in jobs:
+        queue.push(job)
+
+    last = jobs[-1]
+    last.set_next_run(date_utils.now().add(seconds=-60))
+    queue.push(last)
+
+    assert len(queue) == len(jobs)
+    assert queue.peek() is last
+    assert_heap_consistent(queue)
+
+
+def test_remove_group_requires_group_key() -> None:
+    with pytest.raises(ValueError, match="group_key"):
+        HeapQueue().remove_group("owner_0")
@@ -0,0 +1,59 @@
+"""Tests for the log-bucketed LatencyHistogram behind per-listener/job duration percentiles."""
+
+import pytest
+
+from hassette.core.telemetry.latency import LatencyHistogram, latency_bucket_index, latency_bucket_upper_ms
+
+
+@pytest.mark.parametrize("duration_ms", [0.02, 0.5, 1.0, 37.0, 999.0, 12_345.6])
+def test_bucket_upper_bound_is_within_one_bucket_width(duration_ms: float) -> None:
+    upper = latency_bucket_upper_ms(latency_bucket_index(duration_ms))
+
+    assert duration_ms <= upper < duration_ms * 2 ** (1 / 8) * 1.000001
+
+
+def test_zero_and_tiny_durations_land_in_bucket_zero() -> None:
+    assert latency_bucket_index(0.0) == 0
+    assert latency_bucket_index(0.01) == 0
+
+
+def test_empty_histogram_has_no_percentiles() -> None:
+    assert LatencyHistogram().percentile(50) is None
+
+
+def test_percentiles_follow_the_distribution() -> None:
+    histogram = LatencyHistogram()
+    for _ in range(98):
+        histogram.record(10.0)
+    histogram.record(500.0)
+    histogram.record(2_000.0)
+
+    assert histogram.count == 100
+    assert histogram.percentile(50) == pytest.approx(10.0, rel=0.1)
+    assert histogram.percentile(99) == pytest.approx(500.0, rel=0.1)
+    assert histogram.percentile(100) == 2_000.0
+
+
+def test_percentile_never_exceeds_the_recorded_max() -> None:
+    histogram = LatencyHistogram()
+    histogram.record(10.0)
+
+    assert histogram.percentile(99) == 10.0
+
+
+def test_from_counts_merges_repeated_indices() -> None:
+    index = latency_bucket_index(10.0)
+
+    histogram = LatencyHistogram.from_counts([(index, 2), (index, 3)], max_ms=10.0)
+
+    assert histogram.count == 5
+    assert histogram.counts == {index: 5}
+    assert histogram.percentile(90) == 10.0
+
+
+def test_from_counts_without_max_caps_at_highest_bucket() -> None:
+    index = latency_bucket_index(10.0)
+
+    histogram = LatencyHistogram.from_counts([(index, 1)])
+
+    assert histogram.max_ms == latency_bucket_upper_ms(index)
@@ -44,6 +44,7 @@ def db_service(db: aiosqlite.Connection) -> DatabaseService:
     svc = DatabaseService.__new__(DatabaseService)
     svc.hassette = mock_hassette
     svc._db = db  # pyright: ignore[reportPrivateUsage]
+    svc._group_db = None  # pyright: ignore[reportPrivateUsage]
     return svc
 
 
@@ -180,6 +181,7 @@ class TestRestartPersistence:
             svc = DatabaseService.__new__(DatabaseService)
             svc.hassette = mock_hassette
             svc._db = db1  # pyright: ignore[reportPrivateUsage]
+            svc._group_db = None  # pyright: ignore[reportPrivateUsage]
             await svc._insert_log_records(records)  # pyright: ignore[reportPrivateUsage]
             await db1.commit()
 
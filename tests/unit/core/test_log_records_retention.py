@@ -71,6 +71,7 @@ def db_service_writer(db: aiosqlite.Connection) -> DatabaseService:
     svc = DatabaseService.__new__(DatabaseService)
     svc.hassette = mock_hassette
     svc._db = db  # pyright: ignore[reportPrivateUsage]
+    svc._group_db = None  # pyright: ignore[reportPrivateUsage]
     return svc
 
 
@@ -9,13 +9,11 @@ import pytest
 from hassette.core.app_handler import AppHandler
 from hassette.core.app_registry import AppRegistry
 from hassette.core.runtime_query_service import RuntimeQueryService
-from hassette.events.hassette import (
-    HassetteExecutionCompletedEvent,
-    HassetteServiceEvent,
-)
+from hassette.events.hassette import HassetteServiceEvent
 from hassette.schemas.app_snapshots import AppFullSnapshot, AppInstanceInfo, AppStatusSnapshot
 from hassette.schemas.domain_models import SystemStatus
 from hassette.test_utils import create_app_manifest
+from hassette.test_utils.factories import make_execution_record
 from hassette.test_utils.mock_hassette import make_mock_hassette
 from hassette.test_utils.web_manifest_helpers import make_manifest_db_row
 from hassette.types.enums import BlockReason, ResourceRole, ResourceStatus
@@ -366,15 +364,15 @@ class TestAppStatus:
 
 
 class TestCompletionPayloadEnrichment:
-    """app_key, instance_index, and kind are read directly from event payload."""
+    """app_key, instance_index, and kind are read directly from the execution record."""
 
     async def test_handler_payload_carries_app_identity(self, runtime: RuntimeQueryService) -> None:
         """app_key and instance_index from a handler execution are stored in the pending dict."""
         runtime.broadcast = AsyncMock()
-        ev = HassetteExecutionCompletedEvent.from_record(
+        ev = make_execution_record(
             kind="handler", listener_id=42, status="success", duration_ms=5.0, app_key="lights", instance_index=1
         )
-        await runtime.on_execution_completed(ev)
+        runtime.on_executions_completed([ev])
         assert runtime._pending_completions[0]["app_key"] == "lights"
         assert runtime._pending_completions[0]["instance_index"] == 1
         assert runtime._pending_completions[0]["kind"] == "handler"
@@ -383,22 +381,26 @@ class TestCompletionPayloadEnrichment:
     async def test_job_payload_carries_app_identity(self, runtime: RuntimeQueryService) -> None:
         """app_key and instance_index from a job execution are stored in the pending dict."""
         runtime.broadcast = AsyncMock()
-        ev = HassetteExecutionCompletedEvent.from_record(
-            kind="job", job_id=99, status="success", duration_ms=8.0, app_key="climate", instance_index=2
+        ev = make_execution_record(
+            kind="job",
+            listener_id=None,
+            job_id=99,
+            status="success",
+            duration_ms=8.0,
+            app_key="climate",
+            instance_index=2,
         )
-        await runtime.on_execution_completed(ev)
+        runtime.on_executions_completed([ev])
         assert runtime._pending_completions[0]["app_key"] == "climate"
         assert runtime._pending_completions[0]["instance_index"] == 2
         assert runtime._pending_completions[0]["kind"] == "job"
         assert runtime._pending_completions[0]["job_id"] == 99
 
-    async def test_payload_defaults_to_empty_app_key(self, runtime: RuntimeQueryService) -> None:
-        """Events without app_key default to empty string and zero index."""
+    async def test_unowned_record_keeps_empty_app_key(self, runtime: RuntimeQueryService) -> None:
+        """A record without an owning app passes through with empty app_key and zero index."""
         runtime.broadcast = AsyncMock()
-        ev = HassetteExecutionCompletedEvent.from_record(
-            kind="handler", listener_id=999, status="success", duration_ms=5.0
-        )
-        await runtime.on_execution_completed(ev)
+        ev = make_execution_record(kind="handler", listener_id=999, status="success", duration_ms=5.0, app_key="")
+        runtime.on_executions_completed([ev])
         assert runtime._pending_completions[0]["app_key"] == ""
         assert runtime._pending_completions[0]["instance_index"] == 0
 
@@ -407,7 +409,7 @@ class TestCompletionBatching:
     """Per-drain batching: all completions in one tick become one unified execution_completed message."""
 
     async def test_handler_completions_batched_into_one_message(self, runtime: RuntimeQueryService) -> None:
-        """Multiple handler execution events in the same tick emit one broadcast."""
+        """Multiple handler execution batches in the same tick emit one broadcast."""
         broadcast_calls: list[dict] = []
 
         async def fake_broadcast(msg: dict) -> None:
@@ -415,10 +417,10 @@ class TestCompletionBatching:
 
         runtime.broadcast = fake_broadcast
 
-        ev1 = HassetteExecutionCompletedEvent.from_record(
+        ev1 = make_execution_record(
             kind="handler", listener_id=1, status="success", duration_ms=10.0, app_key="my_app", instance_index=0
         )
-        ev2 = HassetteExecutionCompletedEvent.from_record(
+        ev2 = make_execution_record(
             kind="handler",
             listener_id=2,
             status="failed",
@@ -428,8 +430,8 @@ class TestCompletionBatching:
             error_type="ValueError",
         )
 
-        await runtime.on_execution_completed(ev1)
-        await runtime.on_execution_completed(ev2)
+        runtime.on_executions_completed([ev1])
+        runtime.on_executions_completed([ev2])
 
         # Flush should not have fired yet (still in the same tick)
         assert len(broadcast_calls) == 0
@@ -444,7 +446,7 @@ class TestCompletionBatching:
         assert msg["data"][1]["error_type"] == "ValueError"
 
     async def test_job_completions_batched_into_one_message(self, runtime: RuntimeQueryService) -> None:
-        """Multiple job execution events in the same tick emit one broadcast."""
+        """Multiple job execution batches in the same tick emit one broadcast."""
         broadcast_calls: list[dict] = []
 
         async def fake_broadcast(msg: dict) -> None:
@@ -452,15 +454,27 @@ class TestCompletionBatching:
 
         runtime.broadcast = fake_broadcast
 
-        ev1 = HassetteExecutionCompletedEvent.from_record(
-            kind="job", job_id=10, status="success", duration_ms=50.0, app_key="scheduler_app", instance_index=0
+        ev1 = make_execution_record(
+            kind="job",
+            listener_id=None,
+            job_id=10,
+            status="success",
+            duration_ms=50.0,
+            app_key="scheduler_app",
+            instance_index=0,
         )
-        ev2 = HassetteExecutionCompletedEvent.from_record(
-            kind="job", job_id=11, status="success", duration_ms=30.0, app_key="scheduler_app", instance_index=0
+        ev2 = make_execution_record(
+            kind="job",
+            listener_id=None,
+            job_id=11,
+            status="success",
+            duration_ms=30.0,
+            app_key="scheduler_app",
+            instance_index=0,
         )
 
-        await runtime.on_execution_completed(ev1)
-        await runtime.on_execution_completed(ev2)
+        runtime.on_executions_completed([ev1])
+        runtime.on_executions_completed([ev2])
 
         assert len(broadcast_calls) == 0
         msg = await assert_flushed_single_message(runtime, broadcast_calls)
@@ -471,10 +485,10 @@ class TestCompletionBatching:
         """After flush, _pending_completions is empty."""
         runtime.broadcast = AsyncMock()
 
-        ev = HassetteExecutionCompletedEvent.from_record(
+        ev = make_execution_record(
             kind="handler", listener_id=3, status="success", duration_ms=1.0, app_key="app", instance_index=0
         )
-        await runtime.on_execution_completed(ev)
+        runtime.on_executions_completed([ev])
         assert len(runtime._pending_completions) == 1
 
         await runtime.flush_completions()
@@ -495,15 +509,21 @@ class TestCompletionBatching:
 
         runtime.broadcast = fake_broadcast
 
-        handler_ev = HassetteExecutionCompletedEvent.from_record(
+        handler_ev = make_execution_record(
             kind="handler", listener_id=1, status="success", duration_ms=5.0, app_key="my_app", instance_index=0
         )
-        job_ev = HassetteExecutionCompletedEvent.from_record(
-            kind="job", job_id=10, status="success", duration_ms=8.0, app_key="my_app", instance_index=0
+        job_ev = make_execution_record(
+            kind="job",
+            listener_id=None,
+            job_id=10,
+            status="success",
+            duration_ms=8.0,
+            app_key="my_app",
+            instance_index=0,
         )
 
-        await runtime.on_execution_completed(handler_ev)
-        await runtime.on_execution_completed(job_ev)
+        runtime.on_executions_completed([handler_ev])
+        runtime.on_executions_completed([job_ev])
 
         # Single message containing both handler and job entries
         msg = await assert_flushed_single_message(runtime, broadcast_calls)
@@ -668,3 +668,69 @@ class TestPersistScheduleStatus:
         await svc.reschedule_job(job, new_time)
 
         svc._executor.mark_job_status.assert_awaited_once_with(7, "scheduled", None)
+
+
+class TestDispatchDueJobs:
+    """dispatch_due_jobs() shares one status write and one queue push across a due batch."""
+
+    async def test_batch_persists_once_and_requeues_once(self) -> None:
+        svc = make_scheduler_service()
+        spawned: list[str] = []
+
+        def _spawn(coro, *, name: str):
+            coro.close()
+            spawned.append(name)
+
+        svc.task_bucket.spawn = _spawn
+        future_time = date_utils.now().add(seconds=60)
+        recurring = make_scheduled_job(trigger=make_interval_trigger(next_returns=future_time), db_id=1)
+        exhausted = make_scheduled_job(trigger=make_interval_trigger(next_returns=None), db_id=2)
+        cancelled = make_scheduled_job(trigger=make_interval_trigger(next_returns=future_time), db_id=3)
+        cancelled._dequeued = True
+
+        await svc.dispatch_due_jobs([recurring, exhausted, cancelled])
+
+        svc._executor.mark_job_statuses.assert_awaited_once_with([(1, "scheduled", None), (2, "completed", None)])
+        svc._executor.mark_job_status.assert_not_called()
+        svc._job_queue.add_many.assert_awaited_once_with([recurring])
+        svc._job_queue.add.assert_not_called()
+        assert recurring.schedule_status is ScheduleStatus.SCHEDULED
+        assert exhausted.schedule_status is ScheduleStatus.COMPLETED
+        assert spawned == ["scheduler:run_dispatched_job"] * 2
+
+    async def test_failed_status_write_still_requeues(self) -> None:
+        svc = make_scheduler_service()
+        svc._executor.mark_job_statuses.side_effect = RuntimeError("db down")
+        future_time = date_utils.now().add(seconds=60)
+        jobs = [make_scheduled_job(trigger=make_interval_trigger(next_returns=future_time), db_id=i) for i in (1, 2)]
+
+        await svc.dispatch_due_jobs(jobs)
+
+        svc.logger.exception.assert_called_once()
+        svc._job_queue.add_many.assert_awaited_once_with(jobs)
+
+    async def test_add_many_skips_dequeued_jobs(self) -> None:
+        queue = _ScheduledJobQueue.__new__(_ScheduledJobQueue)
+        queue._lock = FairAsyncRLock()
+        queue._queue = HeapQueue()
+        queue.logger = MagicMock()
+        now = date_utils.now()
+        jobs = [make_scheduled_job(name=f"job_{i}", next_run=now.add(seconds=i + 1)) for i in range(3)]
+        jobs[1]._dequeued = True
+
+        await queue.add_many(jobs)
+
+        assert list(queue._queue) == [jobs[0], jobs[2]]
+
+    async def test_add_many_rejects_unscheduled_job_before_pushing(self) -> None:
+        queue = _ScheduledJobQueue.__new__(_ScheduledJobQueue)
+        queue._lock = FairAsyncRLock()
+        queue._queue = HeapQueue()
+        queue.logger = MagicMock()
+        scheduled = make_scheduled_job(next_run=date_utils.now().add(seconds=5))
+        waiting = make_scheduled_job(schedule_status=ScheduleStatus.WAITING)
+
+        with pytest.raises(ValueError, match="only SCHEDULED jobs"):
+            await queue.add_many([scheduled, waiting])
+
+        assert queue._queue.is_empty()
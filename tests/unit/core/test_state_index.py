@@ -0,0 +1,132 @@
+"""Unit tests for the copy-on-write, domain-indexed StateProxy cache."""
+
+from hassette.core.state_index import StateIndex
+from hassette.test_utils import make_light_state_dict, make_switch_state_dict
+
+
+def test_domain_bucket_tracks_writes_and_removals() -> None:
+    kitchen = make_light_state_dict("light.kitchen", "on")
+    index = StateIndex({"light.kitchen": kitchen, "switch.fan": make_switch_state_dict("switch.fan", "off")})
+
+    assert dict(index.domain("light")) == {"light.kitchen": kitchen}
+
+    porch = make_light_state_dict("light.porch", "off")
+    index["light.porch"] = porch
+    kitchen_off = make_light_state_dict("light.kitchen", "off")
+    index["light.kitchen"] = kitchen_off
+    assert dict(index.domain("light")) == {"light.kitchen": kitchen_off, "light.porch": porch}
+
+    del index["light.kitchen"]
+    index.pop("light.porch")
+    assert dict(index.domain("light")) == {}
+    assert set(index) == {"switch.fan"}
+
+
+def test_unknown_domain_is_empty_and_read_only() -> None:
+    bucket = StateIndex().domain("light")
+
+    assert len(bucket) == 0
+    assert not hasattr(bucket, "__setitem__")
+
+
+def test_invalid_entity_id_is_stored_but_not_indexed() -> None:
+    index = StateIndex()
+    index["not_an_entity"] = make_light_state_dict("light.kitchen", "on")
+
+    assert "not_an_entity" in index
+    assert len(index) == 1
+    del index["not_an_entity"]
+    assert len(index) == 0
+
+
+def test_clear_and_equality_with_plain_dict() -> None:
+    kitchen = make_light_state_dict("light.kitchen", "on")
+    index = StateIndex({"light.kitchen": kitchen})
+
+    assert index == {"light.kitchen": kitchen}
+    index.clear()
+    assert index == {}
+    assert len(index.domain("light")) == 0
+
+
+def test_writes_publish_new_snapshots_and_leave_old_ones_untouched() -> None:
+    kitchen = make_light_state_dict("light.kitchen", "on")
+    index = StateIndex({"light.kitchen": kitchen})
+    before = index.snapshot
+    before_lights = before.domain("light")
+
+    index["light.porch"] = make_light_state_dict("light.porch", "on")
+    del index["light.kitchen"]
+
+    assert dict(before) == {"light.kitchen": kitchen}
+    assert dict(before_lights) == {"light.kitchen": kitchen}
+    assert set(index.snapshot) == {"light.porch"}
+    assert index.snapshot.version > before.version
+
+
+def test_iteration_is_safe_while_writing() -> None:
+    index = StateIndex({f"light.l{i}": make_light_state_dict(f"light.l{i}", "on") for i in range(3)})
+
+    for entity_id in index.domain("light"):
+        index.pop(entity_id)
+        index[f"switch.{entity_id.split('.')[1]}"] = make_switch_state_dict("switch.x", "on")
+
+    assert len(index.domain("light")) == 0
+    assert len(index.domain("switch")) == 3
+
+
+def test_unchanged_domains_share_buckets_across_versions() -> None:
+    index = StateIndex({"switch.fan": make_switch_state_dict("switch.fan", "off")})
+    switches = index.domain("switch")
+
+    index["light.kitchen"] = make_light_state_dict("light.kitchen", "on")
+
+    assert index.domain("switch") is switches
+
+
+def test_replace_publishes_one_version() -> None:
+    index = StateIndex()
+    before = index.snapshot.version
+
+    index.replace({"light.kitchen": make_light_state_dict("light.kitchen", "on")})
+
+    assert index.snapshot.version > before
+    assert len(index) == 1
+
+
+def test_revision_moves_only_for_the_written_entity() -> None:
+    index = StateIndex(
+        {
+            "light.kitchen": make_light_state_dict("light.kitchen", "on"),
+            "switch.fan": make_switch_state_dict("switch.fan", "off"),
+        }
+    )
+    kitchen = index.revision("light.kitchen")
+    fan = index.revision("switch.fan")
+
+    index["light.kitchen"] = make_light_state_dict("light.kitchen", "off")
+
+    assert index.revision("light.kitchen") == index.snapshot.version
+    assert index.revision("light.kitchen") > kitchen
+    assert index.revision("switch.fan") == fan
+    assert index.revision("light.missing") is None
+
+    del index["light.kitchen"]
+
+    assert index.revision("light.kitchen") is None
+
+
+def test_replace_keeps_equal_states_and_their_revisions() -> None:
+    kitchen = make_light_state_dict("light.kitchen", "on", brightness=10)
+    index = StateIndex({"light.kitchen": kitchen})
+    revision = index.revision("light.kitchen")
+
+    index.replace({"light.kitchen": {**kitchen}, "switch.fan": make_switch_state_dict("switch.fan", "on")})
+
+    assert index["light.kitchen"] is kitchen
+    assert index.revision("light.kitchen") == revision
+    assert index.revision("switch.fan") == index.snapshot.version
+
+    index.replace({"light.kitchen": {**kitchen, "state": "off"}})
+
+    assert index.revision("light.kitchen") == index.snapshot.version
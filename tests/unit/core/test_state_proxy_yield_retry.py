@@ -11,6 +11,7 @@ import asyncio
 
 import pytest
 
+from hassette.core.state_index import StateIndex
 from hassette.core.state_proxy import StateCacheFreshness, StateProxy
 from hassette.exceptions import ResourceNotReadyError
 from hassette.resources.base import Resource
@@ -27,7 +28,7 @@ def stub_state_proxy() -> StateProxy:
     Resource.__init__(obj, hassette, parent=hassette)
     # Freshly-constructed Resource: ready_event is unset, so is_ready() is naturally
     # False — no need to patch the method. Empty states + not-ready is the cold-start path.
-    obj.states = {}
+    obj._states = StateIndex()
     obj._cache_freshness = StateCacheFreshness.UNAVAILABLE
     obj._ready_reason = "test cold start"
     # has_initial_state_capability() reads this event; a real StateProxy.__init__ always
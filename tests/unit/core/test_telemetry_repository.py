@@ -7,6 +7,7 @@ import aiosqlite
 import pytest
 
 from hassette.core.execution_record import ExecutionRecord
+from hassette.core.telemetry.latency import LatencyHistogram, latency_bucket_index
 from hassette.core.telemetry.repository import TelemetryRepository
 from hassette.test_utils.config import DEFAULT_TEST_APP_KEY
 from hassette.test_utils.factories import (
@@ -161,6 +162,121 @@ async def test_mark_job_status_updates_status_and_reason(
     )
 
 
+async def test_mark_job_statuses_updates_every_row(
+    telemetry_repo: TelemetryRepository,
+    telemetry_db: aiosqlite.Connection,
+) -> None:
+    """mark_job_statuses() writes each (status, reason) pair to its own row."""
+    first_id = await telemetry_repo.register_job(make_job_registration(job_name="first"))
+    second_id = await telemetry_repo.register_job(make_job_registration(job_name="second"))
+
+    await telemetry_repo.mark_job_statuses([(first_id, "scheduled", None), (second_id, "completed", "trigger_error")])
+
+    cursor = await telemetry_db.execute(
+        "SELECT id, schedule_status, schedule_status_reason FROM scheduled_jobs WHERE id IN (?, ?)",
+        (first_id, second_id),
+    )
+    rows = {row["id"]: (row["schedule_status"], row["schedule_status_reason"]) for row in await cursor.fetchall()}
+    assert rows == {first_id: ("scheduled", None), second_id: ("completed", "trigger_error")}
+
+
+async def test_persist_execution_batch_fills_missing_session_id(
+    telemetry_repo: TelemetryRepository,
+    telemetry_db: aiosqlite.Connection,
+    telemetry_session_id: int,
+) -> None:
+    """persist_execution_batch() records session_id for rows without one and keeps the rest."""
+    listener_id = await telemetry_repo.register_listener(make_listener_registration())
+    records = [
+        make_execution_record(listener_id=listener_id, session_id=None, execution_id="early", thread_leaked=True),
+        make_execution_record(listener_id=listener_id, session_id=telemetry_session_id, execution_id="late"),
+    ]
+
+    await telemetry_repo.persist_execution_batch(records, session_id=telemetry_session_id)
+
+    cursor = await telemetry_db.execute(
+        "SELECT execution_id, session_id, thread_leaked FROM executions ORDER BY execution_id"
+    )
+    rows = [tuple(row) for row in await cursor.fetchall()]
+    assert rows == [("early", telemetry_session_id, 1), ("late", telemetry_session_id, 0)]
+
+
+async def test_persist_execution_batch_rolls_up_flagged_successes(
+    telemetry_repo: TelemetryRepository,
+    telemetry_db: aiosqlite.Connection,
+    telemetry_session_id: int,
+) -> None:
+    """Rolled-up records merge into one bucket per listener and minute instead of inserting rows."""
+    listener_id = await telemetry_repo.register_listener(make_listener_registration())
+    minute = 1_700_000_040.0
+
+    def rolled_up(offset: float, duration_ms: float) -> ExecutionRecord:
+        return make_execution_record(
+            listener_id=listener_id,
+            session_id=telemetry_session_id,
+            execution_start_ts=minute + offset,
+            duration_ms=duration_ms,
+            execution_id=None,
+            rollup=True,
+        )
+
+    await telemetry_repo.persist_execution_batch(
+        [
+            rolled_up(1.0, 0.5),
+            rolled_up(2.0, 50.0),
+            make_execution_record(
+                listener_id=listener_id, session_id=telemetry_session_id, execution_start_ts=minute, status="error"
+            ),
+        ]
+    )
+    await telemetry_repo.persist_execution_batch([rolled_up(59.0, 20_000.0), rolled_up(61.0, 5.0)])
+
+    cursor = await telemetry_db.execute("SELECT status FROM executions")
+    assert [row["status"] for row in await cursor.fetchall()] == ["error"]
+    cursor = await telemetry_db.execute(
+        "SELECT bucket_start_ts, execution_count, total_duration_ms, min_duration_ms, max_duration_ms,"
+        " le_1ms_count, le_10ms_count, le_100ms_count, gt_10s_count"
+        " FROM execution_rollups ORDER BY bucket_start_ts"
+    )
+    rows = [tuple(row) for row in await cursor.fetchall()]
+    assert rows == [
+        (minute, 3, 20_050.5, 0.5, 20_000.0, 1, 0, 1, 1),
+        (minute + 60, 1, 5.0, 5.0, 5.0, 0, 1, 0, 0),
+    ]
+
+
+async def test_persist_latency_histograms_sums_counts_per_period_and_bucket(
+    telemetry_repo: TelemetryRepository,
+    telemetry_db: aiosqlite.Connection,
+) -> None:
+    """Histograms upsert one row per owner, period and bucket, adding to counts already stored."""
+    listener_id = await telemetry_repo.register_listener(make_listener_registration())
+    job_id = await telemetry_repo.register_job(make_job_registration())
+    period = 1_699_999_200.0
+
+    def histogram(*durations: float) -> LatencyHistogram:
+        h = LatencyHistogram()
+        for duration_ms in durations:
+            h.record(duration_ms)
+        return h
+
+    await telemetry_repo.persist_latency_histograms(
+        {("handler", listener_id): histogram(10.0, 10.0, 500.0), ("job", job_id): histogram(3.0)}, period
+    )
+    await telemetry_repo.persist_latency_histograms({("handler", listener_id): histogram(10.0)}, period)
+
+    cursor = await telemetry_db.execute(
+        "SELECT kind, listener_id, job_id, bucket_index, sample_count FROM latency_histograms"
+        " ORDER BY kind, bucket_index"
+    )
+    rows = [tuple(row) for row in await cursor.fetchall()]
+    assert rows == [
+        ("handler", listener_id, None, latency_bucket_index(10.0), 3),
+        ("handler", listener_id, None, latency_bucket_index(500.0), 1),
+        ("job", None, job_id, latency_bucket_index(3.0), 1),
+    ]
+
+
 async def test_reconcile_deletes_stale_without_history(
     telemetry_repo: TelemetryRepository,
     telemetry_db: aiosqlite.Connection,
@@ -0,0 +1,97 @@
+"""Unit tests for the timing-wheel scheduler queue backend."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from fair_async_rlock import FairAsyncRLock
+
+import hassette.utils.date_utils as date_utils
+from hassette.core.scheduler_service import _job_fire_ns, _job_owner, _ScheduledJobQueue
+from hassette.core.timing_wheel import WHEEL_BITS, WHEEL_LEVELS, TimingWheel
+from hassette.scheduler.classes import Job
+from hassette.test_utils.factories import make_scheduled_job
+
+TICK_NS = 100_000_000
+
+
+def make_wheel() -> TimingWheel[Job]:
+    return TimingWheel(fire_key=_job_fire_ns, tick_ns=TICK_NS, group_key=_job_owner)
+
+
+def test_jobs_expire_in_order_once_their_tick_has_passed() -> None:
+    # Job.set_next_run rounds to the second; a whole-second start keeps fire times exact
+    start = date_utils.now().round("second")
+    wheel = make_wheel()
+    wheel.pop_due(start.timestamp_nanos())
+    # spread across several wheel levels: seconds, minutes, and days out
+    offsets = [1, 2, 90, 3_600, 5 * 86_400]
+    jobs = [make_scheduled_job(name=f"job_{s}", next_run=start.add(seconds=s)) for s in reversed(offsets)]
+    for job in jobs:
+        wheel.push(job)
+
+    popped: list[Job] = []
+    for offset in offsets:
+        fire_ns = start.add(seconds=offset).timestamp_nanos()
+        assert wheel.pop_due(fire_ns - TICK_NS) == []
+        next_due = wheel.next_due_ns()
+        assert next_due is not None
+        assert next_due <= fire_ns
+        popped.extend(wheel.pop_due(fire_ns))
+
+    assert popped == sorted(jobs)
+    assert wheel.is_empty()
+    assert wheel.next_due_ns() is None
+
+
+def test_remove_item_and_group() -> None:
+    start = date_utils.now()
+    wheel = make_wheel()
+    jobs = [
+        make_scheduled_job(name=f"job_{i}", owner_id=f"owner_{i % 2}", next_run=start.add(seconds=i + 1))
+        for i in range(6)
+    ]
+    for job in jobs:
+        wheel.push(job)
+
+    assert wheel.remove_item(jobs[0]) is True
+    assert wheel.remove_item(jobs[0]) is False
+    removed = wheel.remove_group("owner_1")
+
+    assert {id(job) for job in removed} == {id(jobs[1]), id(jobs[3]), id(jobs[5])}
+    assert wheel.pop_due(start.add(seconds=60).timestamp_nanos()) == [jobs[2], jobs[4]]
+
+
+def test_far_future_job_waits_in_overflow() -> None:
+    wheel: TimingWheel[int] = TimingWheel(fire_key=lambda item: item, tick_ns=1)
+    wheel.pop_due(0)
+    far = 1 << (WHEEL_BITS * WHEEL_LEVELS + 1)
+    item = far + 5
+
+    wheel.push(item)
+
+    assert wheel.pop_due(far) == []
+    assert wheel.pop_due(far + 5) == [item]
+
+
+def test_rejects_non_positive_tick() -> None:
+    with pytest.raises(ValueError, match="tick_ns"):
+        TimingWheel(fire_key=_job_fire_ns, tick_ns=0)
+
+
+async def test_scheduled_job_queue_drains_the_wheel_backend() -> None:
+    queue = _ScheduledJobQueue.__new__(_ScheduledJobQueue)
+    queue._lock = FairAsyncRLock()
+    queue._queue = make_wheel()
+    queue.logger = MagicMock()
+
+    now = date_utils.now()
+    due = make_scheduled_job(name="due", next_run=now.add(seconds=-5))
+    later = make_scheduled_job(name="later", next_run=now.add(seconds=30))
+    await queue.add(due)
+    await queue.add(later)
+
+    due_jobs, next_run = await queue.pop_due_and_peek_next(now)
+
+    assert due_jobs == [due]
+    assert next_run is not None
+    assert now < next_run <= later.fire_at
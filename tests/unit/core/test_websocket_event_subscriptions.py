@@ -0,0 +1,266 @@
+"""Unit tests for WebsocketService's per-event-type subscription mode.
+
+Covers ``event_subscription_mode="per_event_type"``: subscribing to exactly the event types the
+bus needs, falling back to one unfiltered subscription for wildcard listeners, add-before-retire
+transitions, and dropping events delivered by subscriptions that are being replaced.
+"""
+
+import asyncio
+from itertools import count
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from hassette.core.event_subscriptions import EventTypeSubscriptions, wanted_subscriptions
+from hassette.core.websocket_service import BASELINE_EVENT_TYPES, WebsocketService
+from hassette.exceptions import FailedMessageError
+from hassette.test_utils import make_ws_hassette_stub
+
+
+@pytest.fixture
+def required_event_types() -> Mock:
+    return Mock(return_value=frozenset())
+
+
+@pytest.fixture
+async def websocket_service(required_event_types: Mock) -> WebsocketService:
+    """A per-event-type WebsocketService whose subscribe/unsubscribe traffic is recorded, not sent."""
+    hassette = make_ws_hassette_stub(sealed=False)
+    hassette.config.websocket.event_subscription_mode = "per_event_type"
+    hassette.bus_service.required_event_types = required_event_types
+    service = WebsocketService(hassette=hassette)
+
+    sub_ids = count(100)
+    service.traffic = []  # pyright: ignore[reportAttributeAccessIssue]
+
+    async def fake_subscribe(event_type: str | None = None) -> int:
+        sid = next(sub_ids)
+        service.traffic.append(("subscribe", event_type, sid))  # pyright: ignore[reportAttributeAccessIssue]
+        return sid
+
+    async def fake_send(**data) -> None:
+        service.traffic.append((data["type"], data.get("subscription")))  # pyright: ignore[reportAttributeAccessIssue]
+
+    service.subscribe_events = AsyncMock(side_effect=fake_subscribe)
+    service._send_json_when_socket_live = AsyncMock(side_effect=fake_send)
+    service._send_ready_event.set()
+    return service
+
+
+class TestWantedSubscriptions:
+    def test_baseline_is_always_included(self) -> None:
+        assert wanted_subscriptions(frozenset({"call_service"}), {"state_changed"}) == {"call_service", "state_changed"}
+
+    def test_none_means_single_unfiltered_subscription(self) -> None:
+        assert wanted_subscriptions(None, {"state_changed"}) == {None}
+
+
+class TestEventTypeSubscriptions:
+    def test_diff_orders_unfiltered_first_then_alphabetically(self) -> None:
+        subs = EventTypeSubscriptions()
+        subs.record("state_changed", 1)
+
+        to_subscribe, to_retire = subs.diff(frozenset({None, "call_service", "automation_triggered"}))
+
+        assert to_subscribe == [None, "automation_triggered", "call_service"]
+        assert to_retire == ["state_changed"]
+
+    def test_accepts_only_unfiltered_while_it_is_active(self) -> None:
+        subs = EventTypeSubscriptions()
+        subs.record("state_changed", 1)
+        subs.record(None, 2)
+
+        assert subs.accepts(2)
+        assert not subs.accepts(1)
+
+    def test_accepts_drops_retired_subscription(self) -> None:
+        subs = EventTypeSubscriptions()
+        subs.record("state_changed", 1)
+        subs.record("call_service", 2)
+
+        assert subs.retire("call_service") == 2
+        assert subs.accepts(1)
+        assert not subs.accepts(2)
+        assert subs.retire("call_service") is None
+
+
+class TestSyncEventSubscriptions:
+    async def test_subscribes_baseline_and_required_types(
+        self, websocket_service: WebsocketService, required_event_types: Mock
+    ) -> None:
+        required_event_types.return_value = frozenset({"call_service"})
+
+        await websocket_service.sync_event_subscriptions()
+
+        assert websocket_service.traffic == [  # pyright: ignore[reportAttributeAccessIssue]
+            ("subscribe", "call_service", 100),
+            ("subscribe", "state_changed", 101),
+        ]
+        assert websocket_service._subscription_ids == {100, 101}
+        assert websocket_service._event_subscriptions.event_types == {"call_service", *BASELINE_EVENT_TYPES}
+
+    async def test_sync_is_idempotent(self, websocket_service: WebsocketService) -> None:
+        await websocket_service.sync_event_subscriptions()
+        await websocket_service.sync_event_subscriptions()
+
+        assert websocket_service.subscribe_events.await_count == len(BASELINE_EVENT_TYPES)
+
+    async def test_dropped_type_is_unsubscribed(
+        self, websocket_service: WebsocketService, required_event_types: Mock
+    ) -> None:
+        required_event_types.return_value = frozenset({"call_service"})
+        await websocket_service.sync_event_subscriptions()
+
+        required_event_types.return_value = frozenset()
+        await websocket_service.sync_event_subscriptions()
+
+        assert websocket_service.traffic[-1] == ("unsubscribe_events", 100)  # pyright: ignore[reportAttributeAccessIssue]
+        assert websocket_service._subscription_ids == {101}
+
+    async def test_wildcard_listener_switches_to_unfiltered_before_retiring_typed(
+        self, websocket_service: WebsocketService, required_event_types: Mock
+    ) -> None:
+        await websocket_service.sync_event_subscriptions()
+        required_event_types.return_value = None
+
+        await websocket_service.sync_event_subscriptions()
+
+        assert websocket_service.traffic[1:] == [  # pyright: ignore[reportAttributeAccessIssue]
+            ("subscribe", None, 101),
+            ("unsubscribe_events", 100),
+        ]
+        assert websocket_service._subscription_ids == {101}
+
+    async def test_start_recv_and_subscribe_uses_per_type_subscriptions(
+        self, websocket_service: WebsocketService
+    ) -> None:
+        websocket_service.recv_loop = AsyncMock()
+        websocket_service._emit_readiness_event = AsyncMock()
+        websocket_service.send_connection_established_event = AsyncMock()
+
+        await websocket_service.start_recv_and_subscribe()
+
+        websocket_service.subscribe_events.assert_awaited_once_with("state_changed")
+        assert websocket_service._subscription_ids == {100}
+
+    async def test_partial_cleanup_forgets_per_type_subscriptions(self, websocket_service: WebsocketService) -> None:
+        await websocket_service.sync_event_subscriptions()
+
+        await websocket_service.partial_cleanup()
+
+        assert len(websocket_service._event_subscriptions) == 0
+        assert websocket_service._subscription_ids == set()
+
+
+class TestListenerChanges:
+    async def test_event_type_change_schedules_background_sync(
+        self, websocket_service: WebsocketService, required_event_types: Mock
+    ) -> None:
+        required_event_types.return_value = frozenset({"call_service"})
+
+        websocket_service._on_event_types_changed()
+        task = websocket_service._event_subscriptions_task
+        assert task is not None
+        await asyncio.wait_for(task, timeout=1)
+
+        assert websocket_service._event_subscriptions.event_types == {"call_service", "state_changed"}
+
+    async def test_event_type_change_ignored_while_disconnected(self, websocket_service: WebsocketService) -> None:
+        websocket_service._send_ready_event.clear()
+
+        websocket_service._on_event_types_changed()
+
+        assert websocket_service._event_subscriptions_task is None
+
+    async def test_sync_failure_is_logged_not_raised(self, websocket_service: WebsocketService) -> None:
+        websocket_service.subscribe_events = AsyncMock(side_effect=ConnectionError("socket gone"))
+
+        await websocket_service._sync_event_subscriptions_in_background()
+
+        assert len(websocket_service._event_subscriptions) == 0
+
+
+class TestDispatchFiltering:
+    async def test_events_from_retired_subscription_are_dropped(
+        self, websocket_service: WebsocketService, required_event_types: Mock
+    ) -> None:
+        required_event_types.return_value = frozenset({"call_service"})
+        await websocket_service.sync_event_subscriptions()
+        required_event_types.return_value = frozenset()
+        await websocket_service.sync_event_subscriptions()
+        websocket_service.dispatch_hass_event = AsyncMock()
+
+        await websocket_service.dispatch({"type": "event", "id": 100, "event": {}})
+        websocket_service.dispatch_hass_event.assert_not_awaited()
+
+        await websocket_service.dispatch({"type": "event", "id": 101, "event": {}})
+        websocket_service.dispatch_hass_event.assert_awaited_once()
+
+
+class TestEntityFeedMode:
+    """``state_proxy_feed="subscribe_entities"``: state_changed arrives through StateProxy's feed instead."""
+
+    @pytest.fixture
+    async def entity_feed_service(self, websocket_service: WebsocketService) -> WebsocketService:
+        websocket_service._entity_feed_enabled = True
+        return websocket_service
+
+    def test_excluded_types_are_never_wanted(self) -> None:
+        assert wanted_subscriptions(frozenset({"state_changed", "call_service"}), (), excluded={"state_changed"}) == {
+            "call_service"
+        }
+
+    async def test_state_changed_is_not_subscribed(
+        self, entity_feed_service: WebsocketService, required_event_types: Mock
+    ) -> None:
+        required_event_types.return_value = frozenset({"state_changed", "call_service"})
+
+        await entity_feed_service.sync_event_subscriptions()
+
+        assert entity_feed_service._event_subscriptions.event_types == {"call_service"}
+
+    async def test_raw_state_changed_events_are_dropped(self, entity_feed_service: WebsocketService) -> None:
+        entity_feed_service._filter_event_types = False
+        entity_feed_service.dispatch_hass_event = AsyncMock()
+
+        await entity_feed_service.dispatch({"type": "event", "id": 1, "event": {"event_type": "state_changed"}})
+        entity_feed_service.dispatch_hass_event.assert_not_awaited()
+
+        await entity_feed_service.dispatch({"type": "event", "id": 1, "event": {"event_type": "call_service"}})
+        entity_feed_service.dispatch_hass_event.assert_awaited_once()
+
+
+class TestSubscribeEntities:
+    async def test_messages_are_routed_to_handler_not_bus(self, websocket_service: WebsocketService) -> None:
+        handler = AsyncMock()
+        websocket_service.send_and_await_response = AsyncMock(return_value={"success": True})
+        websocket_service.dispatch_hass_event = AsyncMock()
+
+        sid = await websocket_service.subscribe_entities(handler, entity_ids=["light.kitchen"])
+        sent_payload = websocket_service.send_and_await_response.await_args.args[0]
+        assert sent_payload == {"type": "subscribe_entities", "entity_ids": ["light.kitchen"], "id": sid}
+
+        await websocket_service.dispatch({"type": "event", "id": sid, "event": {"a": {}}})
+
+        handler.assert_awaited_once_with({"a": {}})
+        websocket_service.dispatch_hass_event.assert_not_awaited()
+
+    async def test_failed_subscribe_drops_handler(self, websocket_service: WebsocketService) -> None:
+        websocket_service.send_and_await_response = AsyncMock(side_effect=TimeoutError)
+
+        with pytest.raises(FailedMessageError):
+            await websocket_service.subscribe_entities(AsyncMock())
+
+        assert websocket_service._subscription_handlers == {}
+
+    async def test_unsubscribe_stops_routing(self, websocket_service: WebsocketService) -> None:
+        handler = AsyncMock()
+        websocket_service.send_and_await_response = AsyncMock(return_value={"success": True})
+        sid = await websocket_service.subscribe_entities(handler)
+
+        await websocket_service.unsubscribe(sid)
+
+        assert ("unsubscribe_events", sid) in websocket_service.traffic  # pyright: ignore[reportAttributeAccessIssue]
+        assert sid not in websocket_service._subscription_ids
+        await websocket_service.dispatch({"type": "event", "id": sid, "event": {"a": {}}})
+        handler.assert_not_awaited()
@@ -0,0 +1,108 @@
+"""Correctness tests for the pluggable websocket JSON decoders.
+
+Every test runs against each decoder in ``WS_JSON_DECODERS`` so a new implementation inherits
+the full suite, including the receive-path wiring in ``WebsocketService.raw_recv``.
+"""
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aiohttp import WSMsgType
+
+from hassette.core.websocket_service import WebsocketService
+from hassette.core.ws_json import WS_JSON_DECODERS, OrjsonDecoder, StdlibJsonDecoder, WsJsonDecoder
+from hassette.test_utils import build_fake_ws, make_ws_hassette_stub
+
+EVENTS_DIR = Path(__file__).resolve().parents[2] / "data" / "events"
+
+
+def _recorded_frames() -> list[str]:
+    frames: list[str] = []
+    for path in sorted(EVENTS_DIR.glob("*.jsonl")):
+        frames.extend(line.strip().rstrip(",") for line in path.read_text().splitlines() if line.strip())
+    return frames
+
+
+@pytest.fixture(params=sorted(WS_JSON_DECODERS))
+def decoder_name(request: pytest.FixtureRequest) -> str:
+    return request.param
+
+
+@pytest.fixture
+def decoder(decoder_name: str) -> WsJsonDecoder:
+    return WS_JSON_DECODERS[decoder_name]
+
+
+class TestDecoderRegistry:
+    def test_registry_is_keyed_by_decoder_name(self) -> None:
+        assert set(WS_JSON_DECODERS) == {OrjsonDecoder.name, StdlibJsonDecoder.name}
+        for name, decoder in WS_JSON_DECODERS.items():
+            assert decoder.name == name
+
+    def test_orjson_takes_raw_bytes(self) -> None:
+        assert OrjsonDecoder.decode_text is False
+        assert StdlibJsonDecoder.decode_text is True
+
+
+class TestDecoderCorrectness:
+    def test_recorded_frames_match_stdlib(self, decoder: WsJsonDecoder) -> None:
+        frames = _recorded_frames()
+        assert frames, "recorded HA traffic fixture is missing"
+        for frame in frames:
+            assert decoder.loads(frame) == json.loads(frame)
+            assert decoder.loads(frame.encode()) == json.loads(frame)
+
+    def test_non_ascii_bytes(self, decoder: WsJsonDecoder) -> None:
+        raw = '{"friendly_name": "Küche ☀"}'.encode()
+        assert decoder.loads(raw) == {"friendly_name": "Küche ☀"}
+
+    @pytest.mark.parametrize("raw", ["{not json", b'{"type": "event"', "[1, 2,]"])
+    def test_malformed_input_raises_json_decode_error(self, decoder: WsJsonDecoder, raw: str | bytes) -> None:
+        with pytest.raises(json.JSONDecodeError):
+            decoder.loads(raw)
+
+
+class TestReceivePathWiring:
+    @pytest.fixture
+    def websocket_service(self, decoder_name: str) -> WebsocketService:
+        hassette = make_ws_hassette_stub(sealed=False)
+        hassette.config.websocket.json_decoder = decoder_name
+        return WebsocketService(hassette=hassette)
+
+    async def test_connect_requests_decoder_frame_type(
+        self, websocket_service: WebsocketService, decoder: WsJsonDecoder
+    ) -> None:
+        session = MagicMock()
+        session.ws_connect = AsyncMock(return_value=build_fake_ws())
+        websocket_service.authenticate = AsyncMock()
+
+        await websocket_service.connect_ws(session)
+
+        assert session.ws_connect.await_args.kwargs["decode_text"] is decoder.decode_text
+
+    async def test_raw_recv_dispatches_decoded_frame(
+        self, websocket_service: WebsocketService, decoder: WsJsonDecoder
+    ) -> None:
+        frame = _recorded_frames()[0]
+        payload: str | bytes = frame if decoder.decode_text else frame.encode()
+        fake_ws = build_fake_ws()
+        fake_ws.receive = AsyncMock(return_value=SimpleNamespace(type=WSMsgType.TEXT, data=payload))
+        websocket_service._ws = fake_ws
+        websocket_service.dispatch = AsyncMock()
+
+        await websocket_service.raw_recv()
+
+        websocket_service.dispatch.assert_awaited_once_with(json.loads(frame))
+
+    async def test_raw_recv_swallows_malformed_frame(self, websocket_service: WebsocketService) -> None:
+        fake_ws = build_fake_ws()
+        fake_ws.receive = AsyncMock(return_value=SimpleNamespace(type=WSMsgType.TEXT, data=b"{oops"))
+        websocket_service._ws = fake_ws
+        websocket_service.dispatch = AsyncMock()
+
+        await websocket_service.raw_recv()
+
+        websocket_service.dispatch.assert_not_awaited()
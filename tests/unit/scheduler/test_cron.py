@@ -0,0 +1,115 @@
+"""Tests for compiled cron expressions: field arithmetic must agree with croniter."""
+
+import random
+from datetime import UTC, datetime
+
+import pytest
+from croniter import croniter
+from whenever import ZonedDateTime
+
+from hassette.scheduler.cron import compile_cron
+
+from .conftest import zdt
+
+EXPRESSIONS = [
+    "* * * * *",
+    "*/15 * * * *",
+    "0 9 * * *",
+    "30 1 * * *",
+    "0 9 * * 1-5",
+    "0 0 29 2 *",
+    "0 12 1,15 * 0",
+    "5-10/2 3 * 1,6,12 *",
+    "0 9 31 * *",
+    "* * * * * */10",
+    "0 0 * * * 30",
+    "0 9 L * *",
+    "0 9 * * 1#2",
+]
+
+# Expressions whose next occurrence is always within the hour: croniter's daily and hourly jumps
+# land an hour off across spring-forward and drop gap times instead of moving them, so those are
+# pinned by the dedicated DST tests below instead.
+DST_EXPRESSIONS = [
+    "* * * * *",
+    "*/15 * * * *",
+    "0 * * * *",
+    "30 * * * *",
+    "* * * * * */10",
+    "15 1,2,3 * * *",
+    "*/20 1-3 * * *",
+]
+
+DST_TRANSITION_DAYS = [
+    pytest.param((2025, 3, 9), id="spring-forward"),
+    pytest.param((2025, 11, 2), id="fall-back"),
+]
+
+
+def croniter_next(expression: str, moment: ZonedDateTime) -> ZonedDateTime:
+    next_time = croniter(expression, moment.to_stdlib(), ret_type=datetime).get_next()
+    # fold=1: a repeated wall time resolves to its later instant, as CronTrigger always has
+    return ZonedDateTime(next_time.replace(fold=1))
+
+
+@pytest.mark.parametrize("expression", EXPRESSIONS)
+def test_next_after_matches_croniter(expression: str) -> None:
+    # UTC: croniter's own long jumps can land an hour off across a DST transition
+    compiled = compile_cron(expression)
+    rng = random.Random(expression)  # noqa: S311 — reproducible sample times, not security
+    start = ZonedDateTime(2024, 1, 1, tz="UTC")
+
+    for _ in range(200):
+        moment = start.add(seconds=rng.randrange(3 * 365 * 86_400))
+        assert compiled.next_after(moment).at == croniter_next(expression, moment), moment
+
+
+@pytest.mark.parametrize("day", DST_TRANSITION_DAYS)
+@pytest.mark.parametrize("expression", DST_EXPRESSIONS)
+def test_next_after_matches_croniter_across_dst(expression: str, day: tuple[int, int, int]) -> None:
+    compiled = compile_cron(expression)
+    start = ZonedDateTime(*day, tz="America/New_York")
+
+    for offset in range(0, 6 * 3_600, 397):  # midnight to 06:00, at uneven seconds
+        moment = start.add(seconds=offset)
+        if moment.to_plain().assume_tz(moment.tz, disambiguate="later") != moment:
+            continue  # first pass of the repeated hour, see test_first_pass_of_repeated_hour_...
+        assert compiled.next_after(moment).at == croniter_next(expression, moment), moment
+
+
+def test_first_pass_of_repeated_hour_still_reaches_its_later_instants() -> None:
+    # America/New_York repeats 01:00-02:00 on 2025-11-02; 01:05 EDT is before 01:00 EST
+    moment = ZonedDateTime(2025, 11, 2, 1, 5, tz="America/New_York", disambiguate="earlier")
+
+    result = compile_cron("*/15 * * * *").next_after(moment)
+
+    assert result.ambiguous is True
+    assert result.at.to_stdlib().astimezone(UTC) == datetime(2025, 11, 2, 6, 0, tzinfo=UTC)
+
+
+def test_wall_time_holds_across_dst_transitions() -> None:
+    result = compile_cron("0 9 31 * *").next_after(zdt(2026, 2, 18, 11, 0))
+
+    assert result.at == zdt(2026, 3, 31, 9, 0)
+
+
+def test_spring_forward_gap_moves_past_the_gap() -> None:
+    # America/Chicago skips 02:00-03:00 on 2025-03-09
+    result = compile_cron("30 2 * * *").next_after(zdt(2025, 3, 9, 0, 0))
+
+    assert result.at == zdt(2025, 3, 9, 3, 30)
+    assert result.ambiguous is False
+
+
+def test_fall_back_resolves_to_the_later_instant() -> None:
+    # America/Chicago repeats 01:00-02:00 on 2025-11-02
+    result = compile_cron("30 1 * * *").next_after(zdt(2025, 11, 2, 0, 30))
+
+    assert result.ambiguous is True
+    assert result.at.to_stdlib().astimezone(UTC) == datetime(2025, 11, 2, 7, 30, tzinfo=UTC)
+
+
+def test_compile_cron_is_shared_and_validates() -> None:
+    assert compile_cron("0 9 * * *") is compile_cron("0 9 * * *")
+    with pytest.raises(ValueError, match="columns"):
+        compile_cron("not a cron expression")
@@ -1,13 +1,11 @@
 """Tests for CronTrigger — the internal cron-expression engine backing Daily and Cron.
 
-Covers __eq__, __hash__, __str__, first_run_time/next_run_time delegation, and the
-MAX_CRON_ITERATIONS skip-ahead fallback in _next_after. DST disambiguation paths are
-already covered by tests/unit/test_triggers.py via Daily(); this file focuses on
-CronTrigger's own dunder/identity behavior and the iteration-bound fallback.
+Covers __eq__, __hash__, __str__, first_run_time/next_run_time delegation, and catching
+up after downtime in _next_after. DST disambiguation paths are already covered by
+tests/unit/test_triggers.py via Daily(); this file focuses on CronTrigger's own
+dunder/identity behavior and the catch-up path.
 """
 
-from unittest.mock import patch
-
 import pytest
 
 from hassette.scheduler.classes import CronTrigger
@@ -85,30 +83,26 @@ class TestCronTriggerRunTimes:
         assert result == zdt(2025, 8, 18, 9, 15, 0)
 
 
-class TestCronTriggerMaxIterationsFallback:
-    def test_exceeding_max_iterations_skips_ahead_from_current_time(self) -> None:
-        """When catching up would take more than MAX_CRON_ITERATIONS ticks, the loop
-        gives up and re-anchors from current_time instead of iterating forever.
-
-        Patches MAX_CRON_ITERATIONS to 5 so the test doesn't spin through 10k iterations.
+class TestCronTriggerCatchUp:
+    def test_long_downtime_returns_first_tick_after_current_time(self) -> None:
+        """After downtime spanning many ticks, the next run is the first tick after current_time,
+        not a backlog of missed ones.
         """
-        anchor = zdt(2025, 8, 18, 0, 0, 0)
-        current_time = anchor.add(minutes=10)
+        previous_run = zdt(2025, 8, 18, 0, 0, 0)
+        current_time = zdt(2025, 8, 25, 13, 7, 30)
+        trigger = CronTrigger("* * * * * */10")
 
-        with patch("hassette.scheduler.classes.MAX_CRON_ITERATIONS", 5):
-            trigger = CronTrigger("* * * * *", start=anchor)
-            result = trigger.first_run_time(current_time)
+        result = trigger.next_run_time(previous_run, current_time)
 
-        assert result > current_time
-        assert (result - current_time).total("seconds") <= 60
+        assert result == zdt(2025, 8, 25, 13, 7, 40)
 
-    def test_exceeding_max_iterations_result_is_timezone_correct(self) -> None:
-        """The skip-ahead result still carries the trigger's original timezone."""
-        anchor = zdt(2025, 8, 18, 0, 0, 0)
-        current_time = anchor.add(minutes=10)
+    def test_catch_up_result_is_timezone_correct(self) -> None:
+        """The catch-up result carries the anchor's timezone, even when current_time does not."""
+        previous_run = zdt(2025, 8, 18, 9, 0, 0)
+        current_time = zdt(2025, 8, 25, 12, 0, 0).to_tz("UTC")
+        trigger = CronTrigger("0 9 * * *")
 
-        with patch("hassette.scheduler.classes.MAX_CRON_ITERATIONS", 5):
-            trigger = CronTrigger("* * * * *", start=anchor)
-            result = trigger.first_run_time(current_time)
+        result = trigger.next_run_time(previous_run, current_time)
 
         assert result.tz == TZ
+        assert result == zdt(2025, 8, 26, 9, 0, 0)
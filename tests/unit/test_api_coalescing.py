@@ -0,0 +1,234 @@
+"""Unit tests for call_service coalescing and Api.batch().
+
+Tests cover:
+- Calls sharing domain, service, and service data inside the window go out as one message
+- Sequentially awaited calls are not merged by the window; batch() merges the same loop
+- Calls with different service data, non-entity targets, or return_response are not merged
+- A failed merged send raises in every merged caller
+- Cancelling one merged caller does not cancel the send for the others
+- batch() merges queued calls on exit, keeps first-call order, and raises send failures there
+- A zero window (the default) sends each call directly
+"""
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+
+from hassette.api.api import Api
+from hassette.api.coalescing import ServiceCallCoalescer, coalesce_key
+from hassette.exceptions import ConnectionClosedError
+from tests.unit.conftest import make_api
+
+WINDOW = 0.01
+
+
+@pytest.fixture(autouse=True)
+def _drain(drain_forgotten_await_handles: None) -> None:
+    """Drain dropped handles after each test (shared fixture in tests/unit/conftest.py)."""
+
+
+def make_coalescing_api(window: float = WINDOW) -> Api:
+    """make_api() with a coalescer spawning onto the running loop instead of a TaskBucket."""
+    api = make_api()
+    api.hassette.config.call_service_coalesce_window_seconds = window
+    api._coalescer = ServiceCallCoalescer(api.ws_send_json, asyncio.ensure_future)
+    return api
+
+
+def sent_payloads(api: Api) -> list[dict[str, Any]]:
+    """Return every payload passed to the mocked ws_send_json, in send order."""
+    return [call.kwargs for call in api.ws_send_json.await_args_list]  # pyright: ignore[reportAttributeAccessIssue]
+
+
+async def test_window_merges_matching_calls_into_one_message() -> None:
+    """turn_off across several lights in one window is sent as a single call_service."""
+    api = make_coalescing_api()
+
+    await asyncio.gather(*(api.turn_off(f"light.l{i}") for i in range(5)))
+
+    assert sent_payloads(api) == [
+        {
+            "type": "call_service",
+            "domain": "light",
+            "service": "turn_off",
+            "target": {"entity_id": [f"light.l{i}" for i in range(5)]},
+            "return_response": False,
+        }
+    ]
+
+
+async def test_window_does_not_merge_sequential_awaits() -> None:
+    """A loop awaiting each call waits out every window, so each call is its own message."""
+    api = make_coalescing_api()
+
+    for i in range(3):
+        await api.turn_off(f"light.l{i}")
+
+    assert [p["target"] for p in sent_payloads(api)] == [{"entity_id": f"light.l{i}"} for i in range(3)]
+
+    async with api.batch():
+        for i in range(3):
+            await api.turn_off(f"light.m{i}")
+
+    assert sent_payloads(api)[-1]["target"] == {"entity_id": [f"light.m{i}" for i in range(3)]}
+
+
+async def test_window_keeps_distinct_service_data_apart() -> None:
+    """Calls whose service data differ are sent as separate messages."""
+    api = make_coalescing_api()
+
+    await asyncio.gather(
+        api.turn_on("light.a", brightness=100),
+        api.turn_on("light.b", brightness=100),
+        api.turn_on("light.c", brightness=200),
+    )
+
+    targets = sorted((p["service_data"]["brightness"], p["target"]["entity_id"]) for p in sent_payloads(api))
+    assert targets == [(100, ["light.a", "light.b"]), (200, "light.c")]
+
+
+async def test_window_passes_unmergeable_calls_through() -> None:
+    """Area targets are sent directly and return_response calls still go through send_and_wait."""
+    api = make_coalescing_api()
+    api.ws_send_and_wait = AsyncMock(return_value={"context": {"id": "c1"}})
+
+    await api.call_service("light", "turn_on", target={"area_id": "kitchen"})
+    await api.call_service("weather", "get_forecasts", target={"entity_id": "weather.home"}, return_response=True)
+
+    assert sent_payloads(api) == [
+        {
+            "type": "call_service",
+            "domain": "light",
+            "service": "turn_on",
+            "target": {"area_id": "kitchen"},
+            "return_response": False,
+        }
+    ]
+    api.ws_send_and_wait.assert_awaited_once()  # pyright: ignore[reportAttributeAccessIssue]
+    assert api._coalescer.pending == 0
+
+
+async def test_window_failure_raises_in_every_merged_caller() -> None:
+    """A failed merged send reaches each caller's await."""
+    api = make_coalescing_api()
+    api.ws_send_json = AsyncMock(side_effect=ConnectionClosedError("gone"))
+    api._coalescer = ServiceCallCoalescer(api.ws_send_json, asyncio.ensure_future)
+
+    results = await asyncio.gather(api.turn_off("light.a"), api.turn_off("light.b"), return_exceptions=True)
+
+    assert [type(r) for r in results] == [ConnectionClosedError, ConnectionClosedError]
+    assert api.ws_send_json.await_count == 1
+
+
+async def test_cancelled_caller_does_not_cancel_the_merged_send() -> None:
+    """Cancelling one caller leaves its entity in the message and the other caller still completes."""
+    api = make_coalescing_api()
+
+    first = asyncio.ensure_future(api.turn_off("light.a"))
+    second = asyncio.ensure_future(api.turn_off("light.b"))
+    await asyncio.sleep(0)
+    first.cancel()
+    await second
+
+    assert first.cancelled()
+    assert [p["target"] for p in sent_payloads(api)] == [{"entity_id": ["light.a", "light.b"]}]
+
+
+async def test_zero_window_sends_each_call_directly() -> None:
+    """With coalescing disabled each call is its own message."""
+    api = make_coalescing_api(window=0.0)
+
+    await api.turn_off("light.a")
+    await api.turn_off("light.b")
+
+    assert [p["target"] for p in sent_payloads(api)] == [{"entity_id": "light.a"}, {"entity_id": "light.b"}]
+
+
+async def test_flush_all_sends_pending_groups_immediately() -> None:
+    """Shutdown flushes calls still inside their window instead of dropping them."""
+    api = make_coalescing_api(window=60.0)
+
+    caller = asyncio.ensure_future(api.turn_off("light.a"))
+    await asyncio.sleep(0)
+    await api._coalescer.flush_all()
+    await caller
+
+    assert [p["target"] for p in sent_payloads(api)] == [{"entity_id": "light.a"}]
+
+
+async def test_batch_merges_on_exit_in_first_call_order() -> None:
+    """Queued calls are held until the block exits, then merged and sent in first-call order."""
+    api = make_api()
+
+    async with api.batch():
+        await api.turn_off("light.a")
+        await api.fire_event("scene_started")
+        await api.call_service("light", "turn_on", target={"area_id": "hall"})
+        await api.turn_off("light.b")
+        await api.turn_off("light.a")
+        assert api.ws_send_json.await_count == 0  # pyright: ignore[reportAttributeAccessIssue]
+
+    assert [(p["service"], p["target"]) for p in sent_payloads(api)] == [
+        ("turn_off", {"entity_id": ["light.a", "light.b"]}),
+        ("turn_on", {"area_id": "hall"}),
+    ]
+    api.ws_send_and_wait.assert_awaited_once()  # pyright: ignore[reportAttributeAccessIssue]
+
+
+async def test_batch_raises_send_failures_on_exit() -> None:
+    """Every queued message is attempted; several failures are raised together."""
+    api = make_api()
+    api.ws_send_json = AsyncMock(side_effect=ConnectionClosedError("gone"))
+
+    async def scene() -> None:
+        async with api.batch():
+            await api.turn_off("light.a")
+            await api.turn_on("switch.b")
+
+    with pytest.raises(ExceptionGroup) as exc_info:
+        await scene()
+
+    assert len(exc_info.value.exceptions) == 2
+    assert api.ws_send_json.await_count == 2
+
+
+async def test_batch_sends_queued_calls_when_the_block_raises() -> None:
+    """The block's own exception propagates after the queued calls are sent."""
+    api = make_api()
+
+    async def scene() -> None:
+        async with api.batch():
+            await api.turn_off("light.a")
+            raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await scene()
+
+    assert [p["target"] for p in sent_payloads(api)] == [{"entity_id": "light.a"}]
+
+
+async def test_nested_batch_joins_the_outer_block() -> None:
+    """An inner batch() does not flush on its own exit."""
+    api = make_api()
+
+    async with api.batch():
+        async with api.batch():
+            await api.turn_off("light.a")
+        await api.turn_off("light.b")
+        assert api.ws_send_json.await_count == 0  # pyright: ignore[reportAttributeAccessIssue]
+
+    assert [p["target"] for p in sent_payloads(api)] == [{"entity_id": ["light.a", "light.b"]}]
+
+
+def test_coalesce_key_ignores_service_data_key_order() -> None:
+    """Service data dicts with the same items in a different order share a key."""
+    base = {"domain": "light", "service": "turn_on", "target": {"entity_id": "light.a"}}
+
+    first = coalesce_key({**base, "service_data": {"brightness": 1, "transition": 2}})
+    second = coalesce_key({**base, "service_data": {"transition": 2, "brightness": 1}})
+
+    assert first is not None
+    assert first == second
+    assert coalesce_key({**base, "service_data": {"when": object()}}) is None
@@ -120,7 +120,7 @@ INHERITED_LIFECYCLE_EXCLUSIONS: set[str] = {
 #:            on_initialize / on_shutdown — internal lifecycle hooks, not user API.
 #: Scheduler: on_initialize / on_shutdown — same.
 #: Api:       get_* / entity_exists / *rest_request /
-#:            ws_send_* / render_template / on_initialize
+#:            ws_send_* / render_template / on_initialize / on_shutdown
 #:            — all return data that is consumed immediately; a dropped coroutine
 #:            produces an AttributeError downstream (not silent). Also covers
 #:            infrastructure helpers not part of the public automation API.
@@ -132,6 +132,7 @@ DOCUMENTED_EXCLUSIONS: dict[type, set[str]] = {
     Api: {
         # Lifecycle
         "on_initialize",
+        "on_shutdown",
         # Data-returning query methods — fail loudly if dropped (AttributeError)
         "get_attribute",
         "get_calendar_events",
@@ -142,6 +143,7 @@ DOCUMENTED_EXCLUSIONS: dict[type, set[str]] = {
         "get_entity_or_none",
         "get_histories",
         "get_history",
+        "get_history_columns",
         "get_logbook",
         "get_notify_services",
         "get_panels",
@@ -26,6 +26,7 @@ from hassette.context import (
     HASSETTE_INSTANCE as HASSETTE_INSTANCE,
 )
 from hassette.context import set_global_hassette
+from hassette.core.state_index import StateIndex
 from hassette.core.state_proxy import StateProxy
 from hassette.resources.base import Resource
 from hassette.resources.lifecycle import mark_ready
@@ -249,7 +250,7 @@ class TestHarnessSeedState:
 
         # Install a minimal StateProxy directly on the mock hassette
         proxy = object.__new__(StateProxy)
-        proxy.states = {}  # pyright: ignore[reportAttributeAccessIssue]
+        proxy._states = StateIndex()  # pyright: ignore[reportAttributeAccessIssue]
         proxy.lock = FairAsyncRLock()  # pyright: ignore[reportAttributeAccessIssue]
         proxy.hassette = harness.hassette  # pyright: ignore[reportAttributeAccessIssue]
         harness.hassette._state_proxy = proxy
@@ -37,6 +37,9 @@ KNOWN_READ_METHODS: frozenset[str] = frozenset(
         "get_panels",
         "get_history",
         "get_histories",
+        "get_history_columns",
+        "iter_history",
+        "iter_history_raw",
         "get_logbook",
         "get_camera_image",
         "get_calendars",
@@ -392,6 +392,8 @@ class TestDbVersionMismatch:
         svc._consecutive_heartbeat_failures = 0
         svc._consecutive_size_triggers = 0
         svc._db_write_queue = None
+        svc._group_db = None
+        svc._write_group_limit = 1
         svc._db_worker_task = None
         svc.hassette = hassette_mock
         svc.logger = MagicMock()
@@ -9,7 +9,7 @@ from pathlib import Path
 
 import pytest
 from hassette_codegen.output import format_via_ruff
-from hassette_codegen.sync_facade.ast_utils import desync_docstring
+from hassette_codegen.sync_facade.ast_utils import desync_docstring, is_wrappable
 from hassette_codegen.sync_facade.recording import generate_sync_recording
 from hassette_codegen.sync_facade.recording_imports import (
     _collect_referenced_symbols,
@@ -396,3 +396,43 @@ async def foo(self):
 """
     )
     assert is_not_implemented_only(func) is False
+
+
+def test_is_wrappable_skips_async_context_managers() -> None:
+    """An ``@asynccontextmanager`` method (e.g. ``Api.batch``) is not wrapped as a sync facade call."""
+    plain = parse_func(
+        """async def get_config(self):
+    return {}
+"""
+    )
+    managed = ast.parse(
+        textwrap.dedent(
+            """@asynccontextmanager
+async def batch(self):
+    yield
+"""
+        )
+    ).body[0]
+
+    assert is_wrappable(plain) is True
+    assert is_wrappable(managed) is False
+
+
+def test_is_wrappable_skips_async_generators() -> None:
+    """An async generator method (e.g. ``Api.iter_history``) is not wrapped; a yield in a nested def does not count."""
+    generator = parse_func(
+        """async def iter_history(self):
+    async for chunk in self._stream():
+        yield chunk
+"""
+    )
+    nested = parse_func(
+        """async def get_config(self):
+    def rows():
+        yield 1
+    return list(rows())
+"""
+    )
+
+    assert is_wrappable(generator) is False
+    assert is_wrappable(nested) is True
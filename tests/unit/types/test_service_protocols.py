@@ -34,6 +34,7 @@ _SCHEDULER_SERVICE_PROTOCOL_MEMBERS = [
 
 _STATE_READER_MEMBERS = [
     "get_state",
+    "get_state_revision",
     "yield_domain_states",
 ]
 
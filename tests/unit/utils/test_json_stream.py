@@ -0,0 +1,79 @@
+"""Unit tests for NestedArrayScanner / iter_nested_array_rows.
+
+Covers:
+    - rows are cut out per group for every chunk size, including one byte at a time
+    - quotes, escapes, and brackets inside strings do not affect nesting
+    - nested objects and arrays inside a row stay part of that row
+    - a flat array of objects is treated as group 0; empty groups are skipped
+    - the buffer only retains the row currently being cut out
+    - non-array documents and truncated bodies raise ValueError
+"""
+
+import json
+from collections.abc import AsyncIterator
+
+import pytest
+
+from hassette.utils.json_stream import NestedArrayScanner, iter_nested_array_rows
+
+DOCUMENT = [
+    [
+        {"entity_id": "sensor.a", "state": "1.5", "attributes": {"unit": "°C", "tags": ["x", "]"]}},
+        {"state": 'say "hi" \\ {not a brace}', "last_changed": "2025-06-30T05:00:00+00:00"},
+    ],
+    [],
+    [{"entity_id": "sensor.b", "state": "[", "attributes": {"nested": {"deep": [{"a": 1}]}}}],
+]
+
+
+def feed_in_chunks(payload: bytes, size: int) -> list[tuple[int, object]]:
+    scanner = NestedArrayScanner()
+    rows: list[tuple[int, object]] = []
+    for start in range(0, len(payload), size):
+        rows.extend(scanner.feed(payload[start : start + size]))
+    assert scanner.done
+    return rows
+
+
+@pytest.mark.parametrize("size", [1, 2, 7, 64, 10_000])
+def test_rows_match_full_decode_for_any_chunk_size(size: int) -> None:
+    """Splitting the body at arbitrary points yields the same rows as decoding it whole."""
+    payload = json.dumps(DOCUMENT, indent=2).encode()
+
+    rows = feed_in_chunks(payload, size)
+
+    assert rows == [(0, DOCUMENT[0][0]), (0, DOCUMENT[0][1]), (2, DOCUMENT[2][0])]
+
+
+def test_flat_array_is_group_zero() -> None:
+    """A top-level array of objects is one group, as normalize_history treats it."""
+    payload = json.dumps([{"state": "on"}, {"state": "off"}]).encode()
+
+    assert feed_in_chunks(payload, 3) == [(0, {"state": "on"}), (0, {"state": "off"})]
+
+
+def test_buffer_keeps_only_the_open_row() -> None:
+    """Completed rows and skipped bytes are dropped from the buffer as the scan proceeds."""
+    scanner = NestedArrayScanner()
+
+    scanner.feed(b'[[{"state": "1"}, {"state": "2"}, {"sta')
+
+    assert bytes(scanner._buf) == b'{"sta'
+
+
+def test_non_array_document_raises() -> None:
+    with pytest.raises(ValueError, match="Expected a JSON array"):
+        NestedArrayScanner().feed(b'{"message": "error"}')
+
+
+async def test_truncated_body_raises() -> None:
+    """A body that ends before the closing bracket is reported instead of silently accepted."""
+
+    async def chunks() -> AsyncIterator[bytes]:
+        yield b'[[{"state": "1"}, {"sta'
+
+    async def consume() -> list[tuple[int, object]]:
+        return [row async for row in iter_nested_array_rows(chunks())]
+
+    with pytest.raises(ValueError, match="ended before"):
+        await consume()